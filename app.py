@@ -3,6 +3,7 @@ from flask_cors import CORS
 from flask_injector import FlaskInjector
 
 from config import (
+    add_commands,
     add_error_handlers,
     add_middlewares,
     add_routes,
@@ -27,6 +28,7 @@ def create_app(test_config: bool = False) -> Flask:
     add_middlewares(app)
     add_error_handlers(app)
     add_routes(app)
+    add_commands(app)
 
     create_upload_dirs_if_dont_exist(app)
 
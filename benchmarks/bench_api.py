@@ -0,0 +1,294 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from flask import Flask
+
+WORDS = [
+    'amor', 'guerra', 'tempo', 'noite', 'mar', 'cidade', 'sonho', 'sombra', 'vento', 'casa',
+    'jardim', 'segredo', 'rei', 'caminho', 'estrela', 'fogo', 'rio', 'silêncio', 'memória', 'lua',
+]  # fmt: skip
+GENRES = ['fábula', 'romance', 'ficção científica', 'fantasia', 'terror', 'biografia']
+KINDS = ['físico', 'e-book', 'audiolivro']
+PHOTO_FILENAME = 'bench.jpg'
+SAVED_BOOKS = 50
+
+path_factory = Callable[[random.Random, int], str]
+
+# The search paths are in their canonical form, otherwise they would be redirected
+SCENARIOS: dict[str, path_factory] = {
+    'books': lambda rng, books: '/books',
+    'books_without_relationships': lambda rng, books: '/books?include=',
+    'book_by_id': lambda rng, books: f'/books/{rng.randint(1, books)}',
+    'search': lambda rng, books: f'/search?q={rng.choice(WORDS[:10])}',
+    'search_filters': lambda rng, books: (
+        f'/search?q={rng.choice(WORDS[:10])}&genre={rng.randint(1, len(GENRES))}&min_price=50'
+    ),
+    'search_facets': lambda rng, books: (
+        f'/search?q={rng.choice(WORDS[:10])}&facets=book_genre,book_kind,price,release_year'
+    ),
+    'search_misspelled': lambda rng, books: '/search?q=cidadr',
+    'saved_books': lambda rng, books: '/books/saved',
+    'book_photo': lambda rng, books: f'/books/photos/{PHOTO_FILENAME}',
+}
+
+
+def create_bench_app(
+    database_uri: str, books: int, seed: int, upload_dir: str, reset_database: bool
+) -> Flask:
+    from sqlalchemy import insert, inspect
+
+    from app import create_app
+    from db import db
+    from model import Book, BookGenre, BookImg, BookKeyword, BookKind, Keyword, SavedBook, User
+    from utils.file.storage import ImageStorage
+    from utils.text import fold_text
+
+    os.environ['TEST_DATABASE_URI'] = database_uri
+    app = create_app(True)
+    app.config['BOOK_PHOTOS_UPLOAD_DIR'] = upload_dir
+    app.config['SQL_DEBUG_HEADER'] = False
+    rng = random.Random(seed)
+
+    with app.app_context():
+        table_names = inspect(db.engine).get_table_names()
+
+        # The seed replaces the tables, which must not happen to a database by mistake
+        if table_names and not reset_database:
+            raise SystemExit(
+                f'{db.engine.url.render_as_string()} already has tables ({", ".join(table_names)}), '
+                'pass --reset-database to drop them'
+            )
+
+        db.drop_all()
+        db.create_all()
+
+        db.session.execute(insert(BookGenre), [{'genre': genre} for genre in GENRES])
+        db.session.execute(insert(BookKind), [{'kind': kind} for kind in KINDS])
+        db.session.execute(insert(Keyword), [{'keyword': word} for word in WORDS])
+
+        names = [f'{rng.choice(WORDS)} {rng.choice(WORDS)} {i}'.capitalize() for i in range(books)]
+        db.session.execute(
+            insert(Book),
+            [
+                {
+                    'name': name,
+                    'name_normalized': fold_text(name),
+                    'price': round(rng.uniform(10, 300), 2),
+                    'author': f'Autor {rng.randint(1, books // 4 + 1)}',
+                    'release_year': rng.randint(1900, 2024),
+                    'id_kind': rng.randint(1, len(KINDS)),
+                    'id_genre': rng.randint(1, len(GENRES)),
+                }
+                for name in names
+            ],
+        )
+        db.session.execute(
+            insert(BookKeyword),
+            [
+                {'id_book': id_book, 'id_keyword': id_keyword}
+                for id_book in range(1, books + 1)
+                for id_keyword in rng.sample(range(1, len(WORDS) + 1), 3)
+            ],
+        )
+        db.session.execute(
+            insert(BookImg),
+            [
+                {'id_book': id_book, 'img_url': f'http://localhost/books/photos/{id_book}-{i}.jpg'}
+                for id_book in range(1, books + 1)
+                for i in range(2)
+            ],
+        )
+
+        user = User('bench_user', 'Senha@123', 'http://localhost/users/photos/bench.jpg')
+        db.session.add(user)
+        db.session.flush()
+        db.session.execute(
+            insert(SavedBook),
+            [
+                {'id_user': user.id, 'id_book': id_book}
+                for id_book in rng.sample(range(1, books + 1), min(SAVED_BOOKS, books))
+            ],
+        )
+        db.session.commit()
+
+        photo_path = ImageStorage.get_path(upload_dir, PHOTO_FILENAME)
+        os.makedirs(os.path.dirname(photo_path), exist_ok=True)
+
+        with open(photo_path, 'wb') as photo:
+            photo.write(rng.randbytes(100 * 1024))
+
+    return app
+
+
+def get_access_token(app: Flask) -> str:
+    from flask_jwt_extended import create_access_token
+
+    from db import db
+    from model import User
+
+    with app.app_context():
+        return create_access_token(db.session.get(User, 1))
+
+
+def run_scenario(
+    app: Flask,
+    create_path: path_factory,
+    books: int,
+    requests: int,
+    concurrency: int,
+    headers: dict[str, str],
+    seed: int,
+) -> dict[str, float]:
+    rng = random.Random(seed)
+    paths = [create_path(rng, books) for _ in range(requests)]
+
+    def timed_get(path: str) -> float:
+        start = time.perf_counter()
+        response = app.test_client().get(path, headers=headers)
+        response.close()
+        assert response.status_code == 200, f'{path}: {response.status_code}'
+
+        return time.perf_counter() - start
+
+    # The first requests fill the caches, like a running api has them
+    for path in paths[: max(concurrency, 5)]:
+        timed_get(path)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed_get, paths))
+    elapsed = time.perf_counter() - start
+
+    return {
+        'requests_per_second': requests / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': statistics.quantiles(latencies, n=100)[-1] * 1000,
+    }
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_result_key(result: dict[str, Any]) -> tuple[str, int, str]:
+    return result['database'], result['books'], result['scenario']
+
+
+def print_result(result: dict[str, Any], baseline: dict[tuple[str, int, str], Any]) -> None:
+    line = (
+        f'{result["database"]} books={result["books"]} {result["scenario"]}: '
+        f'{result["requests_per_second"]:.1f} req/s, '
+        f'p50={result["p50_ms"]:.2f}ms p99={result["p99_ms"]:.2f}ms'
+    )
+    previous = baseline.get(get_result_key(result))
+
+    if previous is not None:
+        line += (
+            f' ({result["requests_per_second"] / previous["requests_per_second"] - 1:+.0%} req/s, '
+            f'{result["p99_ms"] / previous["p99_ms"] - 1:+.0%} p99)'
+        )
+
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Throughput and latency of the main endpoints')
+    parser.add_argument('--books', type=int, nargs='+', default=[100, 1000])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument(
+        '--database-uri',
+        nargs='+',
+        default=[],
+        help='SQLAlchemy URIs of the databases to seed, besides a temporary SQLite one '
+        '(e.g. mysql+pymysql://root@127.0.0.1:3306/bench for a local MySQL or MariaDB)',
+    )
+    parser.add_argument(
+        '--reset-database',
+        action='store_true',
+        help='Drop the tables of the --database-uri databases that already have them',
+    )
+    parser.add_argument('--no-cache', action='store_true', help='Disable the response caches')
+    parser.add_argument('--output', help='JSON file to write the results to')
+    parser.add_argument('--compare', help='JSON file with the results to compare with')
+    args = parser.parse_args()
+
+    from sqlalchemy.engine import make_url
+
+    baseline = {}
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            baseline = {get_result_key(result): result for result in json.load(file)['results']}
+
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_uris = [f'sqlite:///{tmp_dir}/bench.db', *args.database_uri]
+
+        for database_uri in database_uris:
+            for i, books in enumerate(args.books):
+                # A database seeded by this run is seeded again for each catalog size
+                reset_database = args.reset_database or i > 0
+                app = create_bench_app(
+                    database_uri, books, args.seed, f'{tmp_dir}/uploads', reset_database
+                )
+
+                if args.no_cache:
+                    for cache in ('SEARCH_RESULTS', 'SEARCH_FACETS', 'COMPRESSION'):
+                        app.config[f'{cache}_CACHE_MAX_SIZE'] = 0
+
+                headers = {'Authorization': f'Bearer {get_access_token(app)}'}
+
+                for scenario in args.scenarios:
+                    result = {
+                        'database': make_url(database_uri).get_backend_name(),
+                        'books': books,
+                        'scenario': scenario,
+                        **run_scenario(
+                            app,
+                            SCENARIOS[scenario],
+                            books,
+                            args.requests,
+                            args.concurrency,
+                            headers,
+                            args.seed,
+                        ),
+                    }
+                    results.append(result)
+                    print_result(result, baseline)
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(
+                {
+                    'commit': get_commit(),
+                    'created_at': datetime.now(timezone.utc).isoformat(),
+                    'python': platform.python_version(),
+                    'args': vars(args),
+                    'results': results,
+                },
+                file,
+                indent=2,
+            )
+
+
+if __name__ == '__main__':
+    main()
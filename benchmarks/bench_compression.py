@@ -0,0 +1,97 @@
+import argparse
+import gzip
+import json
+import random
+import time
+from typing import Callable
+
+from flask import Flask
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def create_bench_app(books: int, seed: int) -> Flask:
+    from sqlalchemy import text
+
+    from app import create_app
+    from db import db
+
+    app = create_app(True)
+    rng = random.Random(seed)
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.execute(text("INSERT INTO book_genres (genre) VALUES ('fábula')"))
+        db.session.execute(text("INSERT INTO book_kinds (kind) VALUES ('físico')"))
+        db.session.execute(
+            text(
+                """
+                INSERT INTO books
+                (name, price, author, release_year, id_kind, id_genre)
+                VALUES (:name, :price, :author, :release_year, 1, 1)
+                """
+            ),
+            [
+                {
+                    'name': f'Livro {i} {rng.randbytes(6).hex()}',
+                    'price': round(rng.uniform(10, 300), 2),
+                    'author': f'Autor {rng.randint(1, books // 4 + 1)}',
+                    'release_year': rng.randint(1900, 2024),
+                }
+                for i in range(books)
+            ],
+        )
+        db.session.commit()
+
+    return app
+
+
+def get_encoders() -> dict[str, Callable[[bytes, int], bytes]]:
+    encoders = {'gzip': lambda data, level: gzip.compress(data, compresslevel=level, mtime=0)}
+
+    if brotli is not None:
+        encoders['br'] = lambda data, level: brotli.compress(data, quality=level)
+
+    if zstandard is not None:
+        encoders['zstd'] = lambda data, level: zstandard.ZstdCompressor(level=level).compress(data)
+
+    return encoders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='CPU time vs bytes saved per encoding and level')
+    parser.add_argument('--books', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    app = create_bench_app(args.books, args.seed)
+    body = app.test_client().get('/books', headers={'Accept-Encoding': 'identity'}).data
+    print(f'/books page: {len(body)} bytes, {len(json.loads(body)["data"])} books')
+
+    levels = {'gzip': [1, 6, 9], 'br': [1, 4, 11], 'zstd': [1, 3, 19]}
+
+    for encoding, encode in get_encoders().items():
+        for level in levels[encoding]:
+            start = time.process_time()
+            for _ in range(args.repeat):
+                compressed = encode(body, level)
+            cpu_ms = (time.process_time() - start) / args.repeat * 1000
+
+            print(
+                f'{encoding}:{level}: {len(compressed)} bytes '
+                f'({1 - len(compressed) / len(body):.0%} saved), {cpu_ms:.2f}ms cpu'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask
+
+LOGIN_DATA = {'username': 'bench_user', 'password': 'Senha@123'}
+
+
+def create_bench_app(password_hash_workers: int) -> Flask:
+    from app import create_app
+    from db import db
+    from model import User
+
+    app = create_app(True)
+    app.config['PASSWORD_HASH_WORKERS'] = password_hash_workers
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.add(User(LOGIN_DATA['username'], LOGIN_DATA['password'], 'bench.jpg'))
+        db.session.commit()
+
+    return app
+
+
+def timed_get(app: Flask, path: str) -> float:
+    start = time.perf_counter()
+    app.test_client().get(path)
+
+    return time.perf_counter() - start
+
+
+def login(app: Flask) -> None:
+    response = app.test_client().post('/auth/login', json=LOGIN_DATA)
+    assert response.status_code == 200
+
+
+def run(app: Flask, logins: int, concurrency: int) -> dict[str, float]:
+    catalog_latencies: list[float] = []
+    logins_finished = threading.Event()
+
+    def poll_catalog() -> None:
+        while not logins_finished.is_set():
+            catalog_latencies.append(timed_get(app, '/bookGenres'))
+
+    poller = threading.Thread(target=poll_catalog)
+    poller.start()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda _: login(app), range(logins)))
+    elapsed = time.perf_counter() - start
+
+    logins_finished.set()
+    poller.join()
+
+    return {
+        'logins_per_second': logins / elapsed,
+        'catalog_p50_ms': statistics.median(catalog_latencies) * 1000,
+        'catalog_p99_ms': statistics.quantiles(catalog_latencies, n=100)[-1] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Login throughput by password hash workers')
+    parser.add_argument('--logins', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 2, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ.setdefault('TEST_DATABASE_URI', f'sqlite:///{tmp_dir}/bench.db')
+
+        for workers in args.workers:
+            result = run(create_bench_app(workers), args.logins, args.concurrency)
+            print(
+                f'workers={workers}: {result["logins_per_second"]:.1f} logins/s, '
+                f'catalog p50={result["catalog_p50_ms"]:.1f}ms p99={result["catalog_p99_ms"]:.1f}ms'
+            )
+
+
+if __name__ == '__main__':
+    main()
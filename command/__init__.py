@@ -0,0 +1,4 @@
+from .keyword_command import keyword_cli
+from .name_command import name_cli
+from .photo_command import photo_cli
+from .profiling_command import profiling_cli
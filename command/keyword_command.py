@@ -0,0 +1,84 @@
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import bindparam, column, delete, func, select, table, update
+
+from db import db, insert_missing
+from model import Keyword
+
+keyword_cli = AppGroup('keywords', help='Manage the book keywords.')
+
+# The book keywords as they were before the keyword dictionary, with the new column added
+legacy_book_keywords = table(
+    'book_keywords', column('id'), column('id_book'), column('keyword'), column('id_keyword')
+)
+
+
+@keyword_cli.command('migrate', help='Link the free text book keywords to the keyword dictionary.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=None)
+def migrate_keywords(batch_size: int | None) -> None:
+    batch_size = batch_size or current_app.config['KEYWORDS_MIGRATION_BATCH_SIZE']
+    linked_rows = 0
+
+    while rows := _get_unlinked_rows(batch_size):
+        keywords = _get_or_create_keywords({keyword.strip().lower() for _, keyword in rows})
+        db.session.execute(
+            update(legacy_book_keywords)
+            .where(legacy_book_keywords.c.id == bindparam('b_id'))
+            .values(id_keyword=bindparam('b_id_keyword')),
+            [
+                {'b_id': id, 'b_id_keyword': keywords[keyword.strip().lower()]}
+                for id, keyword in rows
+            ],
+        )
+        db.session.commit()
+
+        linked_rows += len(rows)
+        click.echo(f'{linked_rows} book keywords linked')
+
+    removed_rows = _remove_duplicated_links()
+    click.echo(f'done ({linked_rows} book keywords linked, {removed_rows} duplicates removed)')
+
+
+def _get_unlinked_rows(batch_size: int) -> list[tuple[int, str]]:
+    query = (
+        select(legacy_book_keywords.c.id, legacy_book_keywords.c.keyword)
+        .where(legacy_book_keywords.c.id_keyword.is_(None))
+        .order_by(legacy_book_keywords.c.id)
+        .limit(batch_size)
+    )
+
+    return [(id, keyword) for id, keyword in db.session.execute(query)]
+
+
+def _get_or_create_keywords(words: set[str]) -> dict[str, int]:
+    query = select(Keyword.keyword, Keyword.id).where(Keyword.keyword.in_(words))
+    keywords = dict(db.session.execute(query).tuples().all())
+
+    if missing_words := words - set(keywords):
+        # Committed at once, so the query sees the keywords that the api saved meanwhile
+        insert_missing(
+            db.session, Keyword.__table__, [{'keyword': word} for word in sorted(missing_words)]
+        )
+        db.session.commit()
+        keywords = dict(db.session.execute(query).tuples().all())
+
+    # The database collation can match a keyword saved with other accents or case
+    for word in words - set(keywords):
+        keywords[word] = db.session.scalar(select(Keyword.id).filter_by(keyword=word))
+
+    return keywords
+
+
+def _remove_duplicated_links() -> int:
+    kept_rows = (
+        select(func.min(legacy_book_keywords.c.id).label('id'))
+        .group_by(legacy_book_keywords.c.id_book, legacy_book_keywords.c.id_keyword)
+        .subquery()
+    )
+    result = db.session.execute(
+        delete(legacy_book_keywords).where(legacy_book_keywords.c.id.not_in(select(kept_rows.c.id)))
+    )
+    db.session.commit()
+
+    return result.rowcount
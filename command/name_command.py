@@ -0,0 +1,67 @@
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import TableClause, bindparam, column, func, select, table, update
+
+from db import db
+from utils.text import fold_text
+
+name_cli = AppGroup('names', help='Manage the normalized book names and usernames.')
+
+# The tables between the schema expansion and the backfill, when the new columns may be null
+legacy_tables = (
+    table('books', column('id'), column('name'), column('name_normalized')),
+    table('users', column('id'), column('username'), column('username_normalized')),
+)
+
+
+@name_cli.command('normalize', help='Fill the normalized book names and usernames.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=None)
+def normalize_names(batch_size: int | None) -> None:
+    batch_size = batch_size or current_app.config['NAMES_NORMALIZATION_BATCH_SIZE']
+
+    for legacy_table in legacy_tables:
+        id_column, _, normalized_column = legacy_table.c
+        normalized_rows = 0
+
+        while rows := _get_unnormalized_rows(legacy_table, batch_size):
+            db.session.execute(
+                update(legacy_table)
+                .where(id_column == bindparam('b_id'))
+                .values({normalized_column.name: bindparam('b_normalized')}),
+                [{'b_id': id, 'b_normalized': fold_text(name)} for id, name in rows],
+            )
+            db.session.commit()
+
+            normalized_rows += len(rows)
+            click.echo(f'{normalized_rows} {legacy_table.name} normalized')
+
+        # The unique index can only be added after these are renamed
+        for normalized, count in _get_duplicated_names(legacy_table):
+            click.echo(f'{legacy_table.name}: {count} rows normalize to {normalized!r}')
+
+    click.echo('done')
+
+
+def _get_unnormalized_rows(legacy_table: TableClause, batch_size: int) -> list[tuple[int, str]]:
+    id_column, name_column, normalized_column = legacy_table.c
+    query = (
+        select(id_column, name_column)
+        .where(normalized_column.is_(None))
+        .order_by(id_column)
+        .limit(batch_size)
+    )
+
+    return [(id, name) for id, name in db.session.execute(query)]
+
+
+def _get_duplicated_names(legacy_table: TableClause) -> list[tuple[str, int]]:
+    normalized_column = legacy_table.c[2]
+    query = (
+        select(normalized_column, func.count())
+        .group_by(normalized_column)
+        .having(func.count() > 1)
+        .order_by(normalized_column)
+    )
+
+    return [(normalized, count) for normalized, count in db.session.execute(query)]
@@ -0,0 +1,119 @@
+import os
+import shutil
+import time
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import select
+
+from db import db
+from model import BookImg, User
+from utils.file.storage import ImageStorage
+
+photo_cli = AppGroup('photos', help='Manage the uploaded photos.')
+
+
+@photo_cli.command('shard', help='Move flat stored photos to the sharded layout.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=None)
+def shard_photos(batch_size: int | None) -> None:
+    batch_size = batch_size or current_app.config['PHOTOS_SHARD_BATCH_SIZE']
+
+    for upload_dir in _get_upload_dirs():
+        moved_files = 0
+
+        for moved_in_batch in ImageStorage.shard_flat_files(upload_dir, batch_size):
+            moved_files += moved_in_batch
+            click.echo(f'{upload_dir}: {moved_files} files moved')
+
+        click.echo(f'{upload_dir}: done ({moved_files} files moved)')
+
+
+@photo_cli.command('gc', help='Delete or quarantine photos not referenced by any book or user.')
+@click.option('--dry-run', is_flag=True, help='Only report the orphan photos.')
+@click.option('--quarantine', 'quarantine_dir', type=click.Path(file_okay=False), default=None)
+@click.option('--chunk-size', type=click.IntRange(min=1), default=None)
+@click.option('--min-age', type=click.IntRange(min=0), default=None, help='In seconds.')
+def collect_orphan_photos(
+    dry_run: bool, quarantine_dir: str | None, chunk_size: int | None, min_age: int | None
+) -> None:
+    chunk_size = chunk_size or current_app.config['PHOTOS_GC_CHUNK_SIZE']
+    min_age = current_app.config['PHOTOS_GC_MIN_AGE'] if min_age is None else min_age
+
+    # Photos are saved only after their row is committed, so any photo older than the
+    # start of the reference snapshot has its row in it. The min age covers clock skew.
+    modified_before = time.time() - min_age
+    references = _get_references_by_upload_dir(chunk_size)
+
+    if quarantine_dir is not None and not dry_run:
+        os.makedirs(quarantine_dir, exist_ok=True)
+
+    for upload_dir, referenced_filenames in references.items():
+        scanned_files = orphan_files = 0
+
+        for chunk in ImageStorage.list_files(upload_dir, chunk_size):
+            chunk = [path for path in chunk if not _is_in_dir(path, quarantine_dir)]
+            orphans = [
+                path
+                for path in chunk
+                if os.path.basename(path) not in referenced_filenames
+                and _was_modified_before(path, modified_before)
+            ]
+
+            if not dry_run:
+                for path in orphans:
+                    _remove_orphan(path, quarantine_dir)
+
+            scanned_files += len(chunk)
+            orphan_files += len(orphans)
+            click.echo(f'{upload_dir}: {scanned_files} files scanned, {orphan_files} orphans')
+
+        action = 'found' if dry_run else 'quarantined' if quarantine_dir else 'deleted'
+        click.echo(f'{upload_dir}: done ({orphan_files} orphans {action})')
+
+
+def _get_references_by_upload_dir(chunk_size: int) -> dict[str, set[str]]:
+    references: dict[str, set[str]] = {}
+    columns = (
+        ('USER_PHOTOS_UPLOAD_DIR', User.img_url),
+        ('BOOK_PHOTOS_UPLOAD_DIR', BookImg.img_url),
+    )
+
+    for config_key, column in columns:
+        query = select(column).execution_options(yield_per=chunk_size)
+        referenced_filenames = references.setdefault(current_app.config[config_key], set())
+        referenced_filenames.update(os.path.basename(url) for url in db.session.scalars(query))
+
+    db.session.rollback()
+
+    return references
+
+
+def _is_in_dir(path: str, dir: str | None) -> bool:
+    return dir is not None and os.path.abspath(path).startswith(os.path.abspath(dir) + os.sep)
+
+
+def _was_modified_before(path: str, timestamp: float) -> bool:
+    try:
+        return os.path.getmtime(path) < timestamp
+    except FileNotFoundError:
+        return False
+
+
+def _remove_orphan(path: str, quarantine_dir: str | None) -> None:
+    try:
+        if quarantine_dir is None:
+            os.remove(path)
+        else:
+            shutil.move(path, os.path.join(quarantine_dir, os.path.basename(path)))
+    except FileNotFoundError:
+        pass
+
+
+def _get_upload_dirs() -> list[str]:
+    upload_dirs = (
+        current_app.config['USER_PHOTOS_UPLOAD_DIR'],
+        current_app.config['BOOK_PHOTOS_UPLOAD_DIR'],
+    )
+
+    return list(dict.fromkeys(upload_dirs))
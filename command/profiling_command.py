@@ -0,0 +1,11 @@
+import click
+from flask.cli import AppGroup
+
+from utils.profiling import RequestProfiler
+
+profiling_cli = AppGroup('profiling', help='Profile the api requests.')
+
+
+@profiling_cli.command('token', help='Create a token to profile the requests that send it.')
+def create_profiling_token() -> None:
+    click.echo(RequestProfiler.create_token())
@@ -1,3 +1,4 @@
+from .commands import add_commands
 from .di import di_config
 from .error_handler import add_error_handlers
 from .init_setup import create_upload_dirs_if_dont_exist
@@ -1,8 +1,12 @@
+import os
+
 SECRET_KEY = 'key'
-SQLALCHEMY_DATABASE_URI = 'sqlite:///'
+SQLALCHEMY_DATABASE_URI = os.getenv('TEST_DATABASE_URI', 'sqlite:///')
 JWT_SECRET_KEY = 'key'
 JWT_TOKEN_LOCATION = ['headers']
 JWT_HEADER_TYPE = 'Bearer'
 TESTING = True
 USER_PHOTOS_UPLOAD_DIR = 'tests/uploads'
 BOOK_PHOTOS_UPLOAD_DIR = 'tests/uploads'
+PASSWORD_HASH_WORKERS = 0
+SQL_DEBUG_HEADER = True
@@ -12,3 +12,49 @@ RESPONSE_HEADERS = [
 USER_PHOTOS_MAX_SIZE = 5 * 1024 * 1024
 BOOK_PHOTOS_MAX_SIZE = 7 * 1024 * 1024
 BOOK_IMG_MAX_QTY = 5
+BOOK_MULTI_GET_MAX_IDS = 50
+PAGINATION_PER_PAGE = {
+    'books': {'default': 20, 'max': 500},
+    'searches': {'default': 20, 'max': 500},
+    'saved_books': {'default': 20, 'max': 500},
+    'book_genres': {'default': 20, 'max': 100},
+    'book_kinds': {'default': 20, 'max': 100},
+}
+REFERENCE_DATA_CACHE_TTL = 30
+SEARCH_CACHE_CONTROL = 'public, max-age=60'
+SEARCH_PRICE_FACET_BOUNDS = [25, 50, 100, 200]
+SEARCH_FACETS_CACHE_TTL = 60
+SEARCH_FACETS_CACHE_MAX_SIZE = 1000
+SEARCH_RESULTS_CACHE_TTL = 60
+SEARCH_RESULTS_CACHE_MAX_SIZE = 1000
+SEARCH_INDEX_TTL = 300
+SEARCH_FUZZY_MIN_SIMILARITY = 0.3
+PHOTOS_UPLOAD_DIR_DEPTH = 2
+PHOTOS_SHARD_BATCH_SIZE = 500
+PHOTOS_GC_CHUNK_SIZE = 1000
+PHOTOS_GC_MIN_AGE = 60 * 60
+KEYWORDS_MIGRATION_BATCH_SIZE = 1000
+NAMES_NORMALIZATION_BATCH_SIZE = 1000
+IMAGE_MAX_PIXELS = 50_000_000
+IMAGE_JPEG_MAX_SEGMENTS = 64
+PASSWORD_HASH_METHOD = 'scrypt:32768:8:1'
+PASSWORD_HASH_SALT_LENGTH = 16
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+JWT_USER_CACHE_TTL = 30
+JWT_USER_CACHE_MAX_SIZE = 10_000
+COMPRESSION_LEVELS = {'zstd': 3, 'br': 4, 'gzip': 6}
+COMPRESSION_MIMETYPES = ['application/json']
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSION_CACHE_TTL = 60
+COMPRESSION_CACHE_MAX_SIZE = 512
+SERVER_TIMING = True
+SQL_DEBUG_HEADER = False
+METRICS_LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+# Set it when the api runs in many worker processes, which share their metrics through it
+METRICS_MULTIPROCESS_DIR = os.getenv('METRICS_MULTIPROCESS_DIR')
+METRICS_MULTIPROCESS_FLUSH_INTERVAL = 5
+# Profiled requests are sampled or asked for with a token from the 'profiling token' command
+PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'false') == 'true'
+PROFILING_DIR = os.getenv('PROFILING_DIR', 'profiles')
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_TOKEN_MAX_AGE = 60 * 60
@@ -0,0 +1,10 @@
+from flask import Flask
+
+from command import keyword_cli, name_cli, photo_cli, profiling_cli
+
+
+def add_commands(app: Flask) -> None:
+    app.cli.add_command(photo_cli)
+    app.cli.add_command(keyword_cli)
+    app.cli.add_command(name_cli)
+    app.cli.add_command(profiling_cli)
@@ -32,6 +32,7 @@ from repository import (
     IBookKindRepository,
     IBookRepository,
     ISavedBookRepository,
+    ISearchIndexRepository,
     ISearchRepository,
     IUserRepository,
 )
@@ -42,6 +43,7 @@ from repository.impl import (
     BookKindRepository,
     BookRepository,
     SavedBookRepository,
+    SearchIndexRepository,
     SearchRepository,
     UserRepository,
 )
@@ -79,6 +81,7 @@ def di_config(binder: Binder) -> None:
     binder.bind(IBookKindRepository, to=BookKindRepository, scope=singleton)
     binder.bind(IBookRepository, to=BookRepository, scope=singleton)
     binder.bind(ISavedBookRepository, to=SavedBookRepository, scope=singleton)
+    binder.bind(ISearchIndexRepository, to=SearchIndexRepository, scope=singleton)
     binder.bind(ISearchRepository, to=SearchRepository, scope=singleton)
     binder.bind(IUserRepository, to=UserRepository, scope=singleton)
 
@@ -5,10 +5,39 @@ from werkzeug.exceptions import MethodNotAllowed, NotFound
 
 from db import db
 from exception import GeneralException
+from utils.compression import ResponseCompressor
+from utils.metrics import Metrics
+from utils.profiling import RequestProfiler
 from utils.response import ErrorResponse, NoContentResponse
+from utils.timing import RequestTiming
 
 
 def add_middlewares(app: Flask) -> None:
+    @app.before_request
+    def start_request_profiling() -> None:
+        RequestProfiler.start()
+
+    @app.before_request
+    def start_request_timing() -> None:
+        RequestTiming.start()
+
+    # The after request functions run in reverse order, so these run last
+    @app.after_request
+    def stop_request_profiling(response: Response) -> Response:
+        return RequestProfiler.stop(response)
+
+    @app.teardown_request
+    def discard_request_profiling(_: BaseException | None) -> None:
+        RequestProfiler.discard()
+
+    @app.after_request
+    def observe_request(response: Response) -> Response:
+        return Metrics.observe_request(response)
+
+    @app.after_request
+    def add_timing_headers(response: Response) -> Response:
+        return RequestTiming.add_headers(response)
+
     @app.before_request
     def check_db_connection() -> Response | None:
         try:
@@ -44,3 +73,7 @@ def add_middlewares(app: Flask) -> None:
     def check_options_request() -> Response | None:
         if request.method == 'OPTIONS':
             return NoContentResponse().json()
+
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        return ResponseCompressor.compress(response)
@@ -7,6 +7,7 @@ from view import (
     book_img_bp,
     book_keyword_bp,
     book_kind_bp,
+    metrics_bp,
     saved_book_bp,
     search_bp,
     user_bp,
@@ -23,3 +24,4 @@ def add_routes(app: Flask):
     app.register_blueprint(saved_book_bp, url_prefix='/books', name='saved_books')
     app.register_blueprint(search_bp, url_prefix='/search', name='searches')
     app.register_blueprint(user_bp, url_prefix='/users', name='users')
+    app.register_blueprint(metrics_bp, url_prefix='/metrics', name='metrics')
@@ -8,7 +8,7 @@ from model import BookKind
 
 class IBookKindController(ABC):
     @abstractmethod
-    def get_all_book_kinds(self, page: int) -> Pagination:
+    def get_all_book_kinds(self, page: int, per_page: int) -> Pagination:
         pass
 
     @abstractmethod
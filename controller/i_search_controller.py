@@ -1,11 +1,37 @@
 from abc import ABC, abstractmethod
+from typing import Any, Sequence
 
 from flask_sqlalchemy.pagination import Pagination
 
-from dto.input import SearchInputDTO
+from db import CursorPagination
+from dto.input import SearchInputDTO, SearchSuggestInputDTO
 
 
 class ISearchController(ABC):
     @abstractmethod
-    def search_books(self, page: int, input_dto: SearchInputDTO) -> Pagination:
+    def search_books(
+        self,
+        page: int,
+        per_page: int,
+        input_dto: SearchInputDTO,
+        relationships: Sequence[str] | None = None,
+        sort: str | None = None,
+        after: str | None = None,
+    ) -> Pagination | CursorPagination:
+        pass
+
+    @abstractmethod
+    def suggest_search_terms(self, input_dto: SearchSuggestInputDTO) -> list[str]:
+        pass
+
+    @abstractmethod
+    def get_search_facets(
+        self, input_dto: SearchInputDTO, facets: Sequence[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        pass
+
+    @abstractmethod
+    def get_search_correction(
+        self, input_dto: SearchInputDTO, pagination: Pagination | CursorPagination
+    ) -> str | None:
         pass
@@ -1,6 +1,9 @@
+from typing import Sequence
+
 from flask_sqlalchemy.pagination import Pagination
 from injector import inject
 
+from db import CursorPagination
 from dto.input import CreateBookInputDTO, UpdateBookInputDTO
 from model import Book
 from service import IBookService
@@ -13,11 +16,23 @@ class BookController(IBookController):
     def __init__(self, service: IBookService) -> None:
         self.service = service
 
-    def get_all_books(self, page: int) -> Pagination:
-        return self.service.get_all_books(page)
-
-    def get_book_by_id(self, id: str) -> Book:
-        return self.service.get_book_by_id(id)
+    def get_all_books(
+        self,
+        page: int,
+        per_page: int,
+        relationships: Sequence[str] | None = None,
+        sort: str | None = None,
+        after: str | None = None,
+    ) -> Pagination | CursorPagination:
+        return self.service.get_all_books(page, per_page, relationships, sort, after)
+
+    def get_book_by_id(self, id: str, relationships: Sequence[str] | None = None) -> Book:
+        return self.service.get_book_by_id(id, relationships)
+
+    def get_books_by_ids(
+        self, ids: Sequence[int], relationships: Sequence[str] | None = None
+    ) -> list[Book | None]:
+        return self.service.get_books_by_ids(ids, relationships)
 
     def create_book(self, input_dto: CreateBookInputDTO) -> Book:
         return self.service.create_book(input_dto)
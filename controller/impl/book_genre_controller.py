@@ -13,8 +13,8 @@ class BookGenreController(IBookGenreController):
     def __init__(self, service: IBookGenreService) -> None:
         self.service = service
 
-    def get_all_book_genres(self, page: int) -> Pagination:
-        return self.service.get_all_book_genres(page)
+    def get_all_book_genres(self, page: int, per_page: int) -> Pagination:
+        return self.service.get_all_book_genres(page, per_page)
 
     def get_book_genre_by_id(self, id: str) -> BookGenre:
         return self.service.get_book_genre_by_id(id)
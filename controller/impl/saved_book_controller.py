@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from flask_sqlalchemy.pagination import Pagination
 from injector import inject
 
@@ -12,8 +14,10 @@ class SavedBookController(ISavedBookController):
     def __init__(self, service: ISavedBookService) -> None:
         self.service = service
 
-    def get_all_saved_books(self, page: int) -> Pagination:
-        return self.service.get_all_saved_books(page)
+    def get_all_saved_books(
+        self, page: int, per_page: int, relationships: Sequence[str] | None = None
+    ) -> Pagination:
+        return self.service.get_all_saved_books(page, per_page, relationships)
 
     def save_book(self, id: str) -> Book:
         return self.service.save_book(id)
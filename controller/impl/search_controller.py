@@ -1,7 +1,10 @@
+from typing import Any, Sequence
+
 from flask_sqlalchemy.pagination import Pagination
 from injector import inject
 
-from dto.input import SearchInputDTO
+from db import CursorPagination
+from dto.input import SearchInputDTO, SearchSuggestInputDTO
 from service import ISearchService
 
 from .. import ISearchController
@@ -12,5 +15,26 @@ class SearchController(ISearchController):
     def __init__(self, service: ISearchService) -> None:
         self.service = service
 
-    def search_books(self, page: int, input_dto: SearchInputDTO) -> Pagination:
-        return self.service.search_books(page, input_dto)
+    def search_books(
+        self,
+        page: int,
+        per_page: int,
+        input_dto: SearchInputDTO,
+        relationships: Sequence[str] | None = None,
+        sort: str | None = None,
+        after: str | None = None,
+    ) -> Pagination | CursorPagination:
+        return self.service.search_books(page, per_page, input_dto, relationships, sort, after)
+
+    def suggest_search_terms(self, input_dto: SearchSuggestInputDTO) -> list[str]:
+        return self.service.suggest_search_terms(input_dto)
+
+    def get_search_facets(
+        self, input_dto: SearchInputDTO, facets: Sequence[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        return self.service.get_search_facets(input_dto, facets)
+
+    def get_search_correction(
+        self, input_dto: SearchInputDTO, pagination: Pagination | CursorPagination
+    ) -> str | None:
+        return self.service.get_search_correction(input_dto, pagination)
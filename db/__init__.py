@@ -1,3 +1,8 @@
+from .cursor_pagination import CursorPagination
 from .database import db
-from .i_db_session import IDbSession
+from .insert_missing import insert_missing
+from .list_pagination import ListPagination
 from .types import int_pk
+
+# The models depend on int_pk, so it must be available before IDbSession imports them
+from .i_db_session import IDbSession  # isort: skip
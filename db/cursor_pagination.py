@@ -0,0 +1,12 @@
+from typing import Any
+
+
+class CursorPagination:
+    def __init__(self, items: list[Any], *, per_page: int, next_cursor: str | None) -> None:
+        self.items = items
+        self.per_page = per_page
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
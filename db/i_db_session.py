@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Sequence, TypeVar
+from typing import Any, Mapping, Sequence, TypeVar
 
 from flask_sqlalchemy.pagination import Pagination
-from sqlalchemy import Select
+from sqlalchemy import Row, Select
 
+from exception.base import ApiException
 from model.base import Model
 
 TModel = TypeVar('TModel')
@@ -11,7 +12,7 @@ TModel = TypeVar('TModel')
 
 class IDbSession(ABC):
     @abstractmethod
-    def paginate(self, query: Select[tuple[TModel]], *, page: int) -> Pagination:
+    def paginate(self, query: Select[tuple[TModel]], *, page: int, per_page: int) -> Pagination:
         pass
 
     @abstractmethod
@@ -26,14 +27,54 @@ class IDbSession(ABC):
     def get_many(self, query: Select[tuple[TModel]]) -> Sequence[TModel]:
         pass
 
+    @abstractmethod
+    def get_rows(self, query: Select[Any]) -> Sequence[Row[Any]]:
+        pass
+
+    @abstractmethod
+    def exists(self, query: Select[Any]) -> bool:
+        pass
+
+    @abstractmethod
+    def count(self, query: Select[Any]) -> int:
+        pass
+
+    @abstractmethod
+    def attach(self, model: TModel) -> TModel:
+        pass
+
     @abstractmethod
     def update(self) -> None:
         pass
 
+    @abstractmethod
+    def update_unique(
+        self,
+        model: Model,
+        already_exists: ApiException,
+        unique_columns: Sequence[str],
+        missing_references: Mapping[str, ApiException] | None = None,
+    ) -> None:
+        pass
+
     @abstractmethod
     def add(self, model: Model) -> None:
         pass
 
+    @abstractmethod
+    def add_missing(self, model: type[Model], rows: Sequence[dict[str, Any]]) -> None:
+        pass
+
+    @abstractmethod
+    def add_unique(
+        self,
+        model: Model,
+        already_exists: ApiException,
+        unique_columns: Sequence[str],
+        missing_references: Mapping[str, ApiException] | None = None,
+    ) -> None:
+        pass
+
     @abstractmethod
     def delete(self, model: Model) -> None:
         pass
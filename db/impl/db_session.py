@@ -1,30 +1,37 @@
-from typing import Sequence, TypeVar
+import re
+from typing import Any, Mapping, Sequence, TypeVar
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.pagination import Pagination
 from injector import inject
-from sqlalchemy import Select
+from sqlalchemy import Row, Select, UniqueConstraint, func, select
+from sqlalchemy.exc import IntegrityError
 
 from exception import GeneralException
+from exception.base import ApiException
 from model.base import Model
 
-from .. import IDbSession
+from .. import IDbSession, insert_missing
 
 TModel = TypeVar('TModel')
 
 
 @inject
 class DbSession(IDbSession):
+    _mysql_duplicate_key = re.compile(r"for key '(?:[^'.]+\.)?(?P<index>[^'.]+)'")
+    _sqlite_unique_failed = 'UNIQUE constraint failed: '
+    _mysql_missing_reference = re.compile(r"FOREIGN KEY \(`(?P<column>[^`]+)`\)")
+
     def __init__(self, db: SQLAlchemy) -> None:
         self.db = db
 
-    def paginate(self, query: Select[tuple[TModel]], *, page: int) -> Pagination:
+    def paginate(self, query: Select[tuple[TModel]], *, page: int, per_page: int) -> Pagination:
         with self.db.session.no_autoflush:
             try:
                 return self.db.paginate(
                     query,
                     page=page,
-                    per_page=20,
+                    per_page=per_page,
                 )
             except Exception as e:
                 raise GeneralException.PaginationPageDoesntExist(page)
@@ -41,13 +48,124 @@ class DbSession(IDbSession):
         with self.db.session.no_autoflush:
             return self.db.session.execute(query).scalars().all()
 
+    def get_rows(self, query: Select[Any]) -> Sequence[Row[Any]]:
+        with self.db.session.no_autoflush:
+            return self.db.session.execute(query).all()
+
+    def exists(self, query: Select[Any]) -> bool:
+        with self.db.session.no_autoflush:
+            return bool(self.db.session.execute(select(query.exists())).scalar())
+
+    def count(self, query: Select[Any]) -> int:
+        # The ordering doesn't change the count, so it is dropped from the subquery
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+
+        with self.db.session.no_autoflush:
+            return self.db.session.execute(count_query).scalar_one()
+
+    def attach(self, model: TModel) -> TModel:
+        with self.db.session.no_autoflush:
+            return self.db.session.merge(model, load=False)
+
     def update(self) -> None:
         self.db.session.commit()
 
+    def update_unique(
+        self,
+        model: Model,
+        already_exists: ApiException,
+        unique_columns: Sequence[str],
+        missing_references: Mapping[str, ApiException] | None = None,
+    ) -> None:
+        self._commit_unique(model, already_exists, unique_columns, missing_references)
+
     def add(self, model: Model) -> None:
         self.db.session.add(model)
         self.db.session.commit()
 
+    def add_missing(self, model: type[Model], rows: Sequence[dict[str, Any]]) -> None:
+        # Committed with the rows that use them, so a request that fails doesn't leave them behind
+        insert_missing(self.db.session, model.__table__, rows)
+
+    def add_unique(
+        self,
+        model: Model,
+        already_exists: ApiException,
+        unique_columns: Sequence[str],
+        missing_references: Mapping[str, ApiException] | None = None,
+    ) -> None:
+        # The unique constraints check the duplicates, so there is no SELECT before the INSERT
+        # and two concurrent inserts of the same row can't both succeed
+        self.db.session.add(model)
+        self._commit_unique(model, already_exists, unique_columns, missing_references)
+
+    def _commit_unique(
+        self,
+        model: Model,
+        already_exists: ApiException,
+        unique_columns: Sequence[str],
+        missing_references: Mapping[str, ApiException] | None,
+    ) -> None:
+        try:
+            self.db.session.commit()
+        except IntegrityError as e:
+            self.db.session.rollback()
+
+            if self._is_unique_violation(e, model, unique_columns):
+                raise already_exists from e
+
+            missing_reference = self._get_missing_reference(e)
+
+            if missing_references is not None and missing_reference in missing_references:
+                raise missing_references[missing_reference] from e
+
+            raise
+
+    def _is_unique_violation(
+        self, error: IntegrityError, model: Model, unique_columns: Sequence[str]
+    ) -> bool:
+        message = str(error.orig)
+
+        # MySQL (error 1062) names the violated index last, prefixed by its table since 8.0.19.
+        # The unnamed unique indexes are named after their column, the others after their constraint
+        if error.orig.args[:1] == (1062,):
+            indexes = self._mysql_duplicate_key.findall(message)
+
+            return bool(indexes) and (
+                indexes[-1] in unique_columns
+                or indexes[-1] in self._get_unique_constraint_names(model, unique_columns)
+            )
+
+        # SQLite names the columns of the violated constraint as "table.column"
+        if message.startswith(self._sqlite_unique_failed):
+            failed_columns = message.removeprefix(self._sqlite_unique_failed).split(', ')
+
+            return all(
+                table == model.__tablename__ and column in unique_columns
+                for table, _, column in (name.partition('.') for name in failed_columns)
+            )
+
+        return False
+
+    def _get_missing_reference(self, error: IntegrityError) -> str | None:
+        # MySQL (error 1452) names the foreign key column whose row doesn't exist. SQLite doesn't
+        # name it, so its violations are raised as they are
+        if error.orig.args[:1] != (1452,):
+            return None
+
+        reference = self._mysql_missing_reference.search(str(error.orig))
+
+        return reference['column'] if reference is not None else None
+
+    def _get_unique_constraint_names(self, model: Model, unique_columns: Sequence[str]) -> set[str]:
+        return {
+            constraint.name
+            for constraint in model.__table__.constraints
+            if isinstance(constraint, UniqueConstraint)
+            and isinstance(constraint.name, str)
+            and set(constraint.columns.keys()) <= set(unique_columns)
+        }
+
     def delete(self, model: Model) -> None:
         self.db.session.delete(model)
         self.db.session.commit()
@@ -0,0 +1,19 @@
+from typing import Any, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session, scoped_session
+
+
+def insert_missing(
+    session: Session | scoped_session[Session], table: Table, rows: Sequence[dict[str, Any]]
+) -> None:
+    # The rows that violate a unique constraint, because they were saved before or by a
+    # concurrent transaction, are skipped instead of failing the whole insert
+    if session.get_bind().dialect.name in ('mysql', 'mariadb'):
+        (id_column,) = table.primary_key.columns
+        statement = mysql.insert(table).on_duplicate_key_update({id_column.name: id_column})
+    else:
+        statement = sqlite.insert(table).on_conflict_do_nothing()
+
+    session.execute(statement, rows)
@@ -0,0 +1,14 @@
+from typing import Any
+
+from flask_sqlalchemy.pagination import Pagination
+
+
+class ListPagination(Pagination):
+    def __init__(self, items: list[Any], *, page: int, per_page: int, total: int) -> None:
+        super().__init__(page, per_page, max_per_page=None, items=items, total=total)
+
+    def _query_items(self) -> list[Any]:
+        return self._query_args['items']
+
+    def _query_count(self) -> int:
+        return self._query_args['total']
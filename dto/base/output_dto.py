@@ -1,22 +1,44 @@
-from typing import Any, Sequence
+from functools import cache
+from typing import Any, Collection, Sequence
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, create_model
 
 from model.base import Model
+from utils.timing import RequestTiming
 
 
 class OutputDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     @classmethod
-    def dump(cls, model: Model) -> dict[str, Any]:
-        dto = cls(**model.__dict__)
-        serialization = dto.model_dump()
+    def dump(cls, model: Model, fields: Collection[str] | None = None) -> dict[str, Any]:
+        dto_class = cls if fields is None else cls._get_partial_dto(frozenset(fields))
+
+        with RequestTiming.measure_serialization():
+            dto = dto_class.model_validate(model)
+            serialization = dto.model_dump()
 
         return serialization
 
     @classmethod
-    def dump_many(cls, models: Sequence[Model]) -> list[dict[str, Any]]:
-        serialization = [cls.dump(model) for model in models]
+    def dump_many(
+        cls, models: Sequence[Model], fields: Collection[str] | None = None
+    ) -> list[dict[str, Any]]:
+        with RequestTiming.measure_serialization():
+            serialization = [cls.dump(model, fields) for model in models]
 
         return serialization
+
+    @classmethod
+    @cache
+    def _get_partial_dto(cls, fields: frozenset[str]) -> type['OutputDTO']:
+        # Only the selected attributes are read from the model, so unloaded relationships stay unloaded
+        return create_model(
+            f'Partial{cls.__name__}',
+            __base__=OutputDTO,
+            **{
+                name: (field.annotation, ...)
+                for name, field in cls.model_fields.items()
+                if name in fields
+            },
+        )
@@ -1,10 +1,15 @@
+from .book_fields_input_dto import BookFieldsInputDTO
 from .book_genre_input_dto import BookGenreInputDTO
+from .book_ids_input_dto import BookIdsInputDTO
 from .book_img_input_dto import BookImgInputDTO
 from .book_keyword_input_dto import BookKeywordInputDTO
 from .book_kind_input_dto import BookKindInputDTO
+from .book_sort_input_dto import BookSortInputDTO
 from .create_book_input_dto import CreateBookInputDTO
 from .create_user_input_dto import CreateUserInputDTO
 from .login_input_dto import LoginInputDTO
+from .search_facets_input_dto import SearchFacetsInputDTO
 from .search_input_dto import SearchInputDTO
+from .search_suggest_input_dto import SearchSuggestInputDTO
 from .update_book_input_dto import UpdateBookInputDTO
 from .update_user_input_dto import UpdateUserInputDTO
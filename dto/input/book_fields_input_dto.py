@@ -0,0 +1,24 @@
+from typing import Literal, Optional, get_args
+
+from dto.base import InputDTO
+
+book_field = Literal['id', 'name', 'price', 'author', 'release_year']
+book_relationship = Literal['book_genre', 'book_kind', 'book_keywords', 'book_imgs']
+
+
+class BookFieldsInputDTO(InputDTO):
+    fields: Optional[list[book_field]] = None
+    include: Optional[list[book_relationship]] = None
+
+    @property
+    def relationships(self) -> list[str]:
+        return list(get_args(book_relationship) if self.include is None else self.include)
+
+    @property
+    def output_fields(self) -> list[str] | None:
+        if self.fields is None and self.include is None:
+            return None
+
+        fields = get_args(book_field) if self.fields is None else ('id', *self.fields)
+
+        return [*fields, *self.relationships]
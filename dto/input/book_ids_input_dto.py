@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from flask import current_app
+from pydantic import Field, field_validator
+
+from dto.base import InputDTO
+from exception import BookException
+
+
+class BookIdsInputDTO(InputDTO):
+    ids: list[Annotated[int, Field(gt=0)]]
+
+    @field_validator('ids')
+    @classmethod
+    def validate_ids(cls, ids: list[int]) -> list[int]:
+        max_qty: int = current_app.config['BOOK_MULTI_GET_MAX_IDS']
+
+        if not ids:
+            raise BookException.BookIdListTooShort()
+
+        if len(ids) > max_qty:
+            raise BookException.BookIdListTooLong(max_qty)
+
+        return ids
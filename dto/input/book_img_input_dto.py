@@ -24,11 +24,19 @@ class BookImgInputDTO(InputDTO):
         if not BookImageValidator.has_valid_extension(img):
             raise ImageException.FileIsNotAnImage
 
+        dimensions = BookImageValidator.get_dimensions(img)
+
+        if dimensions is None:
+            raise ImageException.FileIsNotAnImage()
+
         if not BookImageValidator.has_valid_size(img):
             max_file_size: int = current_app.config["BOOK_PHOTOS_MAX_SIZE"] // int(1e6)
 
             raise ImageException.ImageIsTooLarge(max_file_size)
 
+        if not BookImageValidator.has_valid_dimensions(dimensions):
+            raise ImageException.ImageHasTooManyPixels(current_app.config['IMAGE_MAX_PIXELS'])
+
         return BookImageUploader(img)
 
     def __init__(self, **data: FileStorage | Any) -> None:
@@ -0,0 +1,10 @@
+from typing import Literal, Optional
+
+from dto.base import InputDTO
+
+book_sort = Literal['id', 'name', 'newest', 'price_asc', 'price_desc', 'release_year', 'relevance']
+
+
+class BookSortInputDTO(InputDTO):
+    sort: Optional[book_sort] = None
+    after: Optional[str] = None
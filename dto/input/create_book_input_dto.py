@@ -17,11 +17,19 @@ def validate_img(img_uploader: BookImageUploader) -> BookImageUploader:
     if not BookImageValidator.has_valid_extension(img_uploader.file):
         raise ImageException.FileIsNotAnImage()
 
+    dimensions = BookImageValidator.get_dimensions(img_uploader.file)
+
+    if dimensions is None:
+        raise ImageException.FileIsNotAnImage()
+
     if not BookImageValidator.has_valid_size(img_uploader.file):
         max_file_size: int = current_app.config["BOOK_PHOTOS_MAX_SIZE"] // int(1e6)
 
         raise ImageException.ImageIsTooLarge(max_file_size)
 
+    if not BookImageValidator.has_valid_dimensions(dimensions):
+        raise ImageException.ImageHasTooManyPixels(current_app.config['IMAGE_MAX_PIXELS'])
+
     return img_uploader
 
 
@@ -64,11 +64,19 @@ class CreateUserInputDTO(InputDTO):
         if not UserImageValidator.has_valid_extension(img):
             raise ImageException.FileIsNotAnImage
 
+        dimensions = UserImageValidator.get_dimensions(img)
+
+        if dimensions is None:
+            raise ImageException.FileIsNotAnImage()
+
         if not UserImageValidator.has_valid_size(img):
             max_file_size: int = current_app.config["USER_PHOTOS_MAX_SIZE"] // int(1e6)
 
             raise ImageException.ImageIsTooLarge(max_file_size)
 
+        if not UserImageValidator.has_valid_dimensions(dimensions):
+            raise ImageException.ImageHasTooManyPixels(current_app.config['IMAGE_MAX_PIXELS'])
+
         return UserImageUploader(img)
 
     def __init__(self, **data: str | FileStorage) -> None:
@@ -0,0 +1,9 @@
+from typing import Literal, Optional
+
+from dto.base import InputDTO
+
+search_facet = Literal['book_genre', 'book_kind', 'release_year', 'price']
+
+
+class SearchFacetsInputDTO(InputDTO):
+    facets: Optional[list[search_facet]] = None
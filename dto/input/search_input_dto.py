@@ -1,9 +1,20 @@
 from decimal import Decimal
-from typing import Annotated, Any, Optional
+from typing import Annotated, Any, Mapping, Optional
 
 from pydantic import Field
 
 from dto.base import InputDTO
+from exception import GeneralException
+
+# Payload field -> query string argument, in the canonical order of the query string search
+query_arg_names = {
+    'query': 'q',
+    'id_book_kind': 'kind',
+    'id_book_genre': 'genre',
+    'release_year': 'year',
+    'min_price': 'min_price',
+    'max_price': 'max_price',
+}
 
 
 class SearchInputDTO(InputDTO):
@@ -16,3 +27,28 @@ class SearchInputDTO(InputDTO):
 
     def __init__(self, **data: str | int | float | Any) -> None:
         super().__init__(**data)
+
+    @classmethod
+    def from_query_args(cls, args: Mapping[str, str]) -> 'SearchInputDTO':
+        data = {field: args[arg] for field, arg in query_arg_names.items() if arg in args}
+
+        if not data:
+            raise GeneralException.NoDataSent()
+
+        return cls(**data)
+
+    def to_query_args(self) -> dict[str, str]:
+        args: dict[str, str] = {}
+
+        for field, arg in query_arg_names.items():
+            value = getattr(self, field)
+
+            if isinstance(value, str):
+                # The search is case insensitive, so the query's case doesn't change its results
+                args[arg] = value.strip().lower()
+            elif isinstance(value, Decimal):
+                args[arg] = format(value.normalize(), 'f')
+            elif value is not None:
+                args[arg] = str(value)
+
+        return args
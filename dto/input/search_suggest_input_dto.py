@@ -0,0 +1,15 @@
+from typing import Annotated, Any
+
+from pydantic import Field, StringConstraints
+
+from dto.base import InputDTO
+
+
+class SearchSuggestInputDTO(InputDTO):
+    q: Annotated[
+        str, StringConstraints(strict=True, strip_whitespace=True, min_length=1, max_length=80)
+    ]
+    limit: Annotated[int, Field(gt=0, le=20)] = 10
+
+    def __init__(self, **data: str | int | Any) -> None:
+        super().__init__(**data)
@@ -16,6 +16,14 @@ class BookException:
                 status=404,
             )
 
+    class BookIdListTooShort(ValidationException):
+        def __init__(self) -> None:
+            super().__init__('At least 1 book ID must be provided')
+
+    class BookIdListTooLong(ValidationException):
+        def __init__(self, max_qty: int) -> None:
+            super().__init__(f'At most {max_qty} book IDs can be provided')
+
     class BookImageListTooShort(ValidationException):
         def __init__(self, min_qty: int) -> None:
             super().__init__(f'Book must contains at least {min_qty} image')
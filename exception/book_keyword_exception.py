@@ -16,6 +16,13 @@ class BookKeywordException:
                 status=403,
             )
 
+    class BookAlreadyHasThisKeyword(ApiException):
+        def __init__(self, keyword: str, id_book: str) -> None:
+            super().__init__(
+                message=f'The book {id_book} already has the keyword {keyword}',
+                status=409,
+            )
+
     class BookMustHaveAtLeastOneKeyword(ApiException):
         def __init__(self, id_book: str) -> None:
             super().__init__(
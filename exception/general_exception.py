@@ -53,3 +53,17 @@ class GeneralException:
                 message=f'The page {page} does not exist',
                 status=400,
             )
+
+    class InvalidPaginationPerPage(ApiException):
+        def __init__(self, max_per_page: int) -> None:
+            super().__init__(
+                message=f'The items per page must be between 1 and {max_per_page}',
+                status=400,
+            )
+
+    class InvalidPaginationCursor(ApiException):
+        def __init__(self) -> None:
+            super().__init__(
+                message='The pagination cursor is invalid',
+                status=400,
+            )
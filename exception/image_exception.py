@@ -24,3 +24,7 @@ class ImageException:
     class ImageIsTooLarge(ValidationException):
         def __init__(self, max_size_mb: int) -> None:
             super().__init__(f'The provided image is larger than {max_size_mb}MB')
+
+    class ImageHasTooManyPixels(ValidationException):
+        def __init__(self, max_pixels: int) -> None:
+            super().__init__(f'The provided image has more than {max_pixels} pixels')
@@ -3,5 +3,7 @@ from .book_img_model import BookImg
 from .book_keyword_model import BookKeyword
 from .book_kind_model import BookKind
 from .book_model import Book
+from .keyword_model import Keyword
+from .reference_data_version_model import ReferenceDataVersion
 from .saved_book_model import SavedBook
 from .user_model import User
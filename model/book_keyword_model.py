@@ -1,18 +1,32 @@
-from sqlalchemy import ForeignKey, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db import int_pk
 
 from .base import Model
+from .keyword_model import Keyword
 
 
 class BookKeyword(Model):
     __tablename__ = 'book_keywords'
+    # The keywords are shared by the books, so the search by keyword probes the keyword first
+    __table_args__ = (
+        UniqueConstraint('id_book', 'id_keyword', name='uq_book_keywords_id_book_id_keyword'),
+        Index('ix_book_keywords_id_keyword_id_book', 'id_keyword', 'id_book'),
+    )
 
     id: Mapped[int_pk]
-    keyword: Mapped[str] = mapped_column(String(20), nullable=False)
 
     id_book: Mapped[int] = mapped_column(ForeignKey("books.id", ondelete="CASCADE"), nullable=False)
+    id_keyword: Mapped[int] = mapped_column(
+        ForeignKey("keywords.id", ondelete="restrict"), nullable=False
+    )
 
-    def __init__(self, keyword: str) -> None:
-        self.keyword = keyword
+    dictionary_keyword: Mapped[Keyword] = relationship(lazy="joined")
+
+    def __init__(self, keyword: Keyword) -> None:
+        self.dictionary_keyword = keyword
+
+    @property
+    def keyword(self) -> str:
+        return self.dictionary_keyword.keyword
@@ -1,20 +1,28 @@
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.dialects.mysql import DECIMAL
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from db import int_pk
 from model import BookGenre, BookImg, BookKeyword, BookKind
+from utils.text import fold_text
 
 from .base import Model
 
 
 class Book(Model):
     __tablename__ = 'books'
+    # Back the sort options, whose ties are broken by id in the same direction
+    __table_args__ = (
+        Index('ix_books_price_id', 'price', 'id'),
+        Index('ix_books_release_year_id', 'release_year', 'id'),
+    )
 
     id: Mapped[int_pk]
     name: Mapped[str] = mapped_column(String(80), nullable=False, unique=True)
+    # Names are unique regardless of case and accents, which a plain index can check
+    name_normalized: Mapped[str] = mapped_column(String(80), nullable=False, unique=True)
     price: Mapped[Decimal] = mapped_column(DECIMAL(6, 2), nullable=False)
     author: Mapped[str] = mapped_column(String(40), nullable=False)
     release_year: Mapped[int] = mapped_column(nullable=False)
@@ -28,13 +36,13 @@ class Book(Model):
         nullable=False,
     )
 
-    book_genre: Mapped[BookGenre] = relationship(lazy="immediate")
-    book_kind: Mapped[BookKind] = relationship(lazy="immediate")
+    book_genre: Mapped[BookGenre] = relationship(lazy="selectin")
+    book_kind: Mapped[BookKind] = relationship(lazy="selectin")
     book_keywords: Mapped[list[BookKeyword]] = relationship(
-        cascade='all, delete, delete-orphan', lazy="immediate"
+        cascade='all, delete, delete-orphan', lazy="selectin", order_by=BookKeyword.id
     )
     book_imgs: Mapped[list[BookImg]] = relationship(
-        cascade='all, delete, delete-orphan', lazy="immediate"
+        cascade='all, delete, delete-orphan', lazy="selectin"
     )
 
     def __init__(self, name: str, price: Decimal, author: str, release_year: int) -> None:
@@ -46,6 +54,12 @@ class Book(Model):
     def update_name(self, name: str) -> None:
         self.name = name
 
+    @validates('name')
+    def _normalize_name(self, key: str, name: str) -> str:
+        self.name_normalized = fold_text(name)
+
+        return name
+
     def update_price(self, price: Decimal) -> None:
         self.price = price
 
@@ -54,3 +68,6 @@ class Book(Model):
 
     def update_release_year(self, release_year: int) -> None:
         self.release_year = release_year
+
+    def get_search_terms(self) -> list[str]:
+        return [self.name, self.author, *(keyword.keyword for keyword in self.book_keywords)]
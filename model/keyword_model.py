@@ -0,0 +1,16 @@
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db import int_pk
+
+from .base import Model
+
+
+class Keyword(Model):
+    __tablename__ = 'keywords'
+
+    id: Mapped[int_pk]
+    keyword: Mapped[str] = mapped_column(String(20), nullable=False, unique=True)
+
+    def __init__(self, keyword: str) -> None:
+        self.keyword = keyword
@@ -0,0 +1,11 @@
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Model
+
+
+class ReferenceDataVersion(Model):
+    __tablename__ = 'reference_data_versions'
+
+    table_name: Mapped[str] = mapped_column(String(30), primary_key=True)
+    version: Mapped[int] = mapped_column(nullable=False)
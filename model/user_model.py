@@ -1,9 +1,10 @@
 from sqlalchemy import String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from werkzeug.security import check_password_hash, generate_password_hash
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from db import int_pk
 from model import SavedBook
+from utils.hashing import PasswordHasher
+from utils.text import fold_text
 
 from .base import Model
 
@@ -13,6 +14,8 @@ class User(Model):
 
     id: Mapped[int_pk]
     username: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
+    # Usernames are unique regardless of case and accents, which a plain index can check
+    username_normalized: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
     password: Mapped[str] = mapped_column(String(255), nullable=False)
     img_url: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
 
@@ -20,17 +23,26 @@ class User(Model):
 
     def __init__(self, username: str, password: str, img_url: str) -> None:
         self.username = username
-        self.password = generate_password_hash(password)
+        self.password = PasswordHasher.hash(password)
         self.img_url = img_url
 
     def check_password(self, password: str) -> bool:
-        return check_password_hash(self.password, password)
+        return PasswordHasher.check(self.password, password)
+
+    def needs_password_rehash(self) -> bool:
+        return PasswordHasher.needs_rehash(self.password)
 
     def update_username(self, username: str) -> None:
         self.username = username
 
+    @validates('username')
+    def _normalize_username(self, key: str, username: str) -> str:
+        self.username_normalized = fold_text(username)
+
+        return username
+
     def update_password(self, password: str) -> None:
-        self.password = generate_password_hash(password)
+        self.password = PasswordHasher.hash(password)
 
     def update_img_url(self, img_url: str) -> None:
         self.img_url = img_url
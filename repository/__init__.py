@@ -4,5 +4,6 @@ from .i_book_keyword_repository import IBookKeywordRepository
 from .i_book_kind_repository import IBookKindRepository
 from .i_book_repository import IBookRepository
 from .i_saved_book_repository import ISavedBookRepository
+from .i_search_index_repository import ISearchIndexRepository
 from .i_search_repository import ISearchRepository
 from .i_user_repository import IUserRepository
@@ -7,11 +7,11 @@ from model import BookGenre
 
 class IBookGenreRepository(ABC):
     @abstractmethod
-    def get_all(self, page: int) -> Pagination:
+    def get_all(self, page: int, per_page: int) -> Pagination:
         pass
 
     @abstractmethod
-    def get_by_id(self, id: str) -> BookGenre:
+    def get_by_id(self, id: str, cached: bool = True) -> BookGenre:
         pass
 
     @abstractmethod
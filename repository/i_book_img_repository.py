@@ -8,6 +8,10 @@ class IBookImgRepository(ABC):
     def get_by_id(self, id: str) -> BookImg:
         pass
 
+    @abstractmethod
+    def count_by_book(self, id_book: int) -> int:
+        pass
+
     @abstractmethod
     def add(self, book_img: BookImg) -> None:
         pass
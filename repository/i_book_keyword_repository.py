@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
-from model import BookKeyword
+from model import BookKeyword, Keyword
 
 
 class IBookKeywordRepository(ABC):
@@ -8,6 +9,18 @@ class IBookKeywordRepository(ABC):
     def get_by_id(self, id: str) -> BookKeyword:
         pass
 
+    @abstractmethod
+    def count_by_book(self, id_book: int) -> int:
+        pass
+
+    @abstractmethod
+    def book_has_keyword(self, id_book: int, keyword: str) -> bool:
+        pass
+
+    @abstractmethod
+    def get_or_create_keywords(self, keywords: Sequence[str]) -> list[Keyword]:
+        pass
+
     @abstractmethod
     def add(self, book_keyword: BookKeyword) -> None:
         pass
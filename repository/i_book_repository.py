@@ -1,17 +1,32 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 from flask_sqlalchemy.pagination import Pagination
 
+from db import CursorPagination
 from model import Book
 
 
 class IBookRepository(ABC):
     @abstractmethod
-    def get_all(self, page: int) -> Pagination:
+    def get_all(
+        self,
+        page: int,
+        per_page: int,
+        relationships: Sequence[str] | None = None,
+        sort: str | None = None,
+        after: str | None = None,
+    ) -> Pagination | CursorPagination:
         pass
 
     @abstractmethod
-    def get_by_id(self, id: str) -> Book:
+    def get_by_id(self, id: str, relationships: Sequence[str] | None = None) -> Book:
+        pass
+
+    @abstractmethod
+    def get_many_by_ids(
+        self, ids: Sequence[int], relationships: Sequence[str] | None = None
+    ) -> list[Book | None]:
         pass
 
     @abstractmethod
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class ISearchIndexRepository(ABC):
+    @abstractmethod
+    def suggest(self, prefix: str, limit: int) -> list[str]:
+        pass
+
+    @abstractmethod
+    def correct_query(self, query: str) -> str | None:
+        pass
+
+    @abstractmethod
+    def add_terms(self, terms: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    def remove_terms(self, terms: Iterable[str]) -> None:
+        pass
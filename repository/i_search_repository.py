@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
+from typing import Any, Sequence
 
 from flask_sqlalchemy.pagination import Pagination
 
+from db import CursorPagination
+
 
 class ISearchRepository(ABC):
     @abstractmethod
@@ -10,11 +13,29 @@ class ISearchRepository(ABC):
         self,
         *,
         page: int,
+        per_page: int,
+        query: str | None,
+        id_book_kind: int | None,
+        id_book_genre: int | None,
+        release_year: int | None,
+        min_price: Decimal | None,
+        max_price: Decimal | None,
+        relationships: Sequence[str] | None = None,
+        sort: str | None = None,
+        after: str | None = None,
+    ) -> Pagination | CursorPagination:
+        pass
+
+    @abstractmethod
+    def get_facets(
+        self,
+        *,
         query: str | None,
         id_book_kind: int | None,
         id_book_genre: int | None,
         release_year: int | None,
         min_price: Decimal | None,
         max_price: Decimal | None,
-    ) -> Pagination:
+        facets: Sequence[str],
+    ) -> dict[str, list[dict[str, Any]]]:
         pass
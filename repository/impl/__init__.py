@@ -4,5 +4,6 @@ from .book_keyword_repository import BookKeywordRepository
 from .book_kind_repository import BookKindRepository
 from .book_repository import BookRepository
 from .saved_book_repository import SavedBookRepository
+from .search_index_repository import SearchIndexRepository
 from .search_repository import SearchRepository
 from .user_repository import UserRepository
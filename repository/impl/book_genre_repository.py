@@ -2,25 +2,35 @@ from flask_sqlalchemy.pagination import Pagination
 from injector import inject
 from sqlalchemy import select
 
-from db import IDbSession
-from exception import BookGenreException
+from db import IDbSession, ListPagination
+from exception import BookGenreException, GeneralException
 from model import Book, BookGenre
+from utils.cache import CatalogVersion
 
 from .. import IBookGenreRepository
+from .reference_data_cache import ReferenceDataCache
 
 
 @inject
 class BookGenreRepository(IBookGenreRepository):
+    _unique_columns = ('genre',)
+
     def __init__(self, session: IDbSession) -> None:
         self.session = session
+        self.cache = ReferenceDataCache(BookGenre, session)
+
+    def get_all(self, page: int, per_page: int) -> Pagination:
+        book_genres = self.cache.get_all()
+        start = (page - 1) * per_page
+        items = book_genres[start : start + per_page]
 
-    def get_all(self, page: int) -> Pagination:
-        query = select(BookGenre).order_by(BookGenre.id)
+        if not items and page != 1:
+            raise GeneralException.PaginationPageDoesntExist(page)
 
-        return self.session.paginate(query, page=page)
+        return ListPagination(items, page=page, per_page=per_page, total=len(book_genres))
 
-    def get_by_id(self, id: str) -> BookGenre:
-        book_genre = self.session.get_by_id(BookGenre, id)
+    def get_by_id(self, id: str, cached: bool = True) -> BookGenre:
+        book_genre = self.cache.get_by_id(id) if cached else self.cache.load_by_id(id)
 
         if book_genre is None:
             raise BookGenreException.BookGenreDoesntExist(str(id))
@@ -28,35 +38,32 @@ class BookGenreRepository(IBookGenreRepository):
         return book_genre
 
     def add(self, book_genre: BookGenre) -> None:
-        if self._book_genre_already_exists(book_genre):
-            raise BookGenreException.BookGenreAlreadyExists(book_genre.genre)
-
-        self.session.add(book_genre)
-
-    def _book_genre_already_exists(self, book_genre: BookGenre) -> bool:
-        query = (
-            select(BookGenre)
-            .filter_by(genre=book_genre.genre)
-            .where((BookGenre.id != book_genre.id))
+        self.session.add_unique(
+            book_genre,
+            BookGenreException.BookGenreAlreadyExists(book_genre.genre),
+            self._unique_columns,
         )
-
-        return bool(self.session.get_one(query))
+        self.cache.invalidate()
 
     def delete(self, id: str) -> None:
-        book_genre = self.get_by_id(id)
+        book_genre = self.get_by_id(id, cached=False)
 
         if self._are_there_linked_books(book_genre):
             raise BookGenreException.ThereAreLinkedBooksWithThisBookGenre(id)
 
         self.session.delete(book_genre)
+        self.cache.invalidate()
+        CatalogVersion.bump()
 
     def _are_there_linked_books(self, book_genre: BookGenre) -> bool:
-        query = select(Book).filter_by(id_genre=book_genre.id)
+        query = select(Book.id).filter_by(id_genre=book_genre.id)
 
-        return bool(self.session.get_many(query))
+        return self.session.exists(query)
 
     def update(self, book_genre: BookGenre) -> None:
-        if self._book_genre_already_exists(book_genre):
-            raise BookGenreException.BookGenreAlreadyExists(book_genre.genre)
-
-        self.session.update()
+        self.session.update_unique(
+            book_genre,
+            BookGenreException.BookGenreAlreadyExists(book_genre.genre),
+            self._unique_columns,
+        )
+        self.cache.invalidate()
@@ -1,4 +1,5 @@
 from injector import inject
+from sqlalchemy import select
 
 from db import IDbSession
 from exception import BookImgException
@@ -21,6 +22,11 @@ class BookImgRepository(IBookImgRepository):
 
         return book_img
 
+    def count_by_book(self, id_book: int) -> int:
+        query = select(BookImg.id).filter_by(id_book=id_book)
+
+        return self.session.count(query)
+
     def add(self, book_img: BookImg) -> None:
         self.session.add(book_img)
 
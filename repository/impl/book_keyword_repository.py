@@ -1,14 +1,20 @@
+from typing import Sequence
+
 from injector import inject
+from sqlalchemy import select
 
 from db import IDbSession
 from exception import BookKeywordException
-from model import BookKeyword
+from model import BookKeyword, Keyword
+from utils.cache import CatalogVersion
 
 from .. import IBookKeywordRepository
 
 
 @inject
 class BookKeywordRepository(IBookKeywordRepository):
+    _unique_columns = ('id_book', 'id_keyword')
+
     def __init__(self, session: IDbSession) -> None:
         self.session = session
 
@@ -20,8 +26,55 @@ class BookKeywordRepository(IBookKeywordRepository):
 
         return book_keyword
 
+    def count_by_book(self, id_book: int) -> int:
+        query = select(BookKeyword.id).filter_by(id_book=id_book)
+
+        return self.session.count(query)
+
+    def book_has_keyword(self, id_book: int, keyword: str) -> bool:
+        query = (
+            select(BookKeyword.id)
+            .join(BookKeyword.dictionary_keyword)
+            .where(BookKeyword.id_book == id_book, Keyword.keyword == keyword)
+        )
+
+        return self.session.exists(query)
+
+    def get_or_create_keywords(self, keywords: Sequence[str]) -> list[Keyword]:
+        query = select(Keyword).where(Keyword.keyword.in_(set(keywords)))
+        entries = {keyword.keyword: keyword for keyword in self.session.get_many(query)}
+        missing_keywords = [
+            keyword for keyword in dict.fromkeys(keywords) if keyword not in entries
+        ]
+
+        if missing_keywords:
+            # The insert waits for the transactions inserting the same keywords, in the same order
+            # so they don't deadlock. Only a locking read sees the ones they committed, since the
+            # plain ones keep reading the snapshot from the start of the transaction
+            self.session.add_missing(
+                Keyword, [{'keyword': keyword} for keyword in sorted(missing_keywords)]
+            )
+            query = query.with_for_update(read=True)
+            entries = {keyword.keyword: keyword for keyword in self.session.get_many(query)}
+
+        return [entries.get(keyword) or self._get_equal_keyword(keyword) for keyword in keywords]
+
+    def _get_equal_keyword(self, keyword: str) -> Keyword:
+        # The database collation can match a keyword saved with other accents or case
+        query = select(Keyword).filter_by(keyword=keyword).with_for_update(read=True)
+
+        return self.session.get_one(query)
+
     def add(self, book_keyword: BookKeyword) -> None:
-        self.session.add(book_keyword)
+        self.session.add_unique(
+            book_keyword,
+            BookKeywordException.BookAlreadyHasThisKeyword(
+                book_keyword.keyword, str(book_keyword.id_book)
+            ),
+            self._unique_columns,
+        )
+        CatalogVersion.bump()
 
     def delete(self, book_keyword: BookKeyword) -> None:
         self.session.delete(book_keyword)
+        CatalogVersion.bump()
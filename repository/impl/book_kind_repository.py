@@ -2,25 +2,35 @@ from flask_sqlalchemy.pagination import Pagination
 from injector import inject
 from sqlalchemy import select
 
-from db import IDbSession
-from exception import BookKindException
+from db import IDbSession, ListPagination
+from exception import BookKindException, GeneralException
 from model import Book, BookKind
+from utils.cache import CatalogVersion
 
 from .. import IBookKindRepository
+from .reference_data_cache import ReferenceDataCache
 
 
 @inject
 class BookKindRepository(IBookKindRepository):
+    _unique_columns = ('kind',)
+
     def __init__(self, session: IDbSession) -> None:
         self.session = session
+        self.cache = ReferenceDataCache(BookKind, session)
+
+    def get_all(self, page: int, per_page: int) -> Pagination:
+        book_kinds = self.cache.get_all()
+        start = (page - 1) * per_page
+        items = book_kinds[start : start + per_page]
 
-    def get_all(self, page: int) -> Pagination:
-        query = select(BookKind).order_by(BookKind.id)
+        if not items and page != 1:
+            raise GeneralException.PaginationPageDoesntExist(page)
 
-        return self.session.paginate(query, page=page)
+        return ListPagination(items, page=page, per_page=per_page, total=len(book_kinds))
 
-    def get_by_id(self, id: str) -> BookKind:
-        book_kind = self.session.get_by_id(BookKind, id)
+    def get_by_id(self, id: str, cached: bool = True) -> BookKind:
+        book_kind = self.cache.get_by_id(id) if cached else self.cache.load_by_id(id)
 
         if book_kind is None:
             raise BookKindException.BookKindDoesntExist(str(id))
@@ -28,30 +38,28 @@ class BookKindRepository(IBookKindRepository):
         return book_kind
 
     def add(self, book_kind: BookKind) -> None:
-        if self._book_kind_already_exists(book_kind):
-            raise BookKindException.BookKindAlreadyExists(book_kind.kind)
-
-        self.session.add(book_kind)
-
-    def _book_kind_already_exists(self, book_kind: BookKind) -> bool:
-        query = select(BookKind).filter_by(kind=book_kind.kind).where((BookKind.id != book_kind.id))
-
-        return bool(self.session.get_one(query))
+        self.session.add_unique(
+            book_kind, BookKindException.BookKindAlreadyExists(book_kind.kind), self._unique_columns
+        )
+        self.cache.invalidate()
 
     def delete(self, id: str) -> None:
-        book_kind = self.get_by_id(id)
+        book_kind = self.get_by_id(id, cached=False)
 
         if self._are_there_linked_books(book_kind):
             raise BookKindException.ThereAreLinkedBooksWithThisBookKind(id)
 
         self.session.delete(book_kind)
+        self.cache.invalidate()
+        CatalogVersion.bump()
 
     def _are_there_linked_books(self, book_kind: BookKind) -> bool:
-        query = select(Book).filter_by(id_kind=book_kind.id)
-        return bool(self.session.get_many(query))
+        query = select(Book.id).filter_by(id_kind=book_kind.id)
 
-    def update(self, book_kind: BookKind) -> None:
-        if self._book_kind_already_exists(book_kind):
-            raise BookKindException.BookKindAlreadyExists(book_kind.kind)
+        return self.session.exists(query)
 
-        self.session.update()
+    def update(self, book_kind: BookKind) -> None:
+        self.session.update_unique(
+            book_kind, BookKindException.BookKindAlreadyExists(book_kind.kind), self._unique_columns
+        )
+        self.cache.invalidate()
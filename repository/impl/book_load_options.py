@@ -0,0 +1,17 @@
+from typing import Collection
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import lazyload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from model import Book
+
+
+def get_book_load_options(relationships: Collection[str]) -> list[LoaderOption]:
+    options: list[LoaderOption] = []
+
+    for relationship in inspect(Book).relationships:
+        loader = selectinload if relationship.key in relationships else lazyload
+        options.append(loader(relationship.class_attribute))
+
+    return options
@@ -0,0 +1,83 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, case, func, tuple_
+
+from db import CursorPagination, IDbSession
+from exception import GeneralException
+from model import Book
+
+select_book = Select[tuple[Book]]
+
+
+class BookOrdering:
+    def __init__(self, sort: str | None, search_query: str | None = None) -> None:
+        self.sort = sort or 'id'
+        self.descending = self.sort in ('newest', 'price_desc')
+        # Every ordering ends with the id, so the rows' order is total and a seek is exact
+        self.columns = [*self._get_sort_columns(search_query), Book.id]
+
+    def order(self, sql_query: select_book) -> select_book:
+        return sql_query.order_by(
+            None,
+            *(column.desc() if self.descending else column.asc() for column in self.columns),
+        )
+
+    def paginate_by_cursor(
+        self, session: IDbSession, sql_query: select_book, *, per_page: int, after: str
+    ) -> CursorPagination:
+        sql_query = self.order(sql_query)
+
+        if after:
+            keys = tuple_(*self.columns)
+            values = tuple_(*self._decode_cursor(after))
+            sql_query = sql_query.where(keys < values if self.descending else keys > values)
+
+        rows = session.get_rows(sql_query.add_columns(*self.columns).limit(per_page + 1))
+        next_cursor = (
+            self._encode_cursor(list(rows[per_page - 1][1:])) if len(rows) > per_page else None
+        )
+
+        return CursorPagination(
+            [row[0] for row in rows[:per_page]], per_page=per_page, next_cursor=next_cursor
+        )
+
+    def _get_sort_columns(self, search_query: str | None) -> list[ColumnElement[Any]]:
+        if self.sort == 'relevance' and search_query is not None:
+            return [self._get_relevance(search_query.strip())]
+
+        return {
+            'name': [Book.name],
+            'newest': [Book.release_year],
+            'price_asc': [Book.price],
+            'price_desc': [Book.price],
+            'release_year': [Book.release_year],
+        }.get(self.sort, [])
+
+    def _get_relevance(self, search_query: str) -> ColumnElement[int]:
+        return case(
+            (func.lower(Book.name) == search_query.lower(), 0),
+            (Book.name.istartswith(search_query), 1),
+            (Book.name.icontains(search_query), 2),
+            (Book.author.icontains(search_query), 3),
+            else_=4,
+        )
+
+    def _encode_cursor(self, values: list[Any]) -> str:
+        payload = json.dumps({'sort': self.sort, 'values': values}, default=str)
+
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _decode_cursor(self, cursor: str) -> list[Any]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            values = payload['values']
+
+            if payload['sort'] != self.sort or len(values) != len(self.columns):
+                raise ValueError()
+
+            return [column.type.python_type(value) for column, value in zip(self.columns, values)]
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError, ArithmeticError):
+            raise GeneralException.InvalidPaginationCursor()
@@ -1,43 +1,79 @@
+from typing import Mapping, Sequence
+
 from flask_sqlalchemy.pagination import Pagination
 from injector import inject
 from sqlalchemy import select
 
-from db import IDbSession
-from exception import BookException
+from db import CursorPagination, IDbSession
+from exception import BookException, BookGenreException, BookKindException
+from exception.base import ApiException
 from model import Book
+from utils.cache import CatalogVersion
 from utils.file.uploader import BookImageUploader
 
 from .. import IBookRepository
+from .book_load_options import get_book_load_options
+from .book_ordering import BookOrdering
 
 
 @inject
 class BookRepository(IBookRepository):
+    _unique_columns = ('name', 'name_normalized')
+
     def __init__(self, session: IDbSession) -> None:
         self.session = session
 
-    def get_all(self, page: int) -> Pagination:
-        query = select(Book).order_by(Book.id)
+    def get_all(
+        self,
+        page: int,
+        per_page: int,
+        relationships: Sequence[str] | None = None,
+        sort: str | None = None,
+        after: str | None = None,
+    ) -> Pagination | CursorPagination:
+        ordering = BookOrdering(sort)
+        query = select(Book)
+
+        if relationships is not None:
+            query = query.options(*get_book_load_options(relationships))
 
-        return self.session.paginate(query, page=page)
+        if after is not None:
+            return ordering.paginate_by_cursor(self.session, query, per_page=per_page, after=after)
 
-    def get_by_id(self, id: str) -> Book:
-        book = self.session.get_by_id(Book, id)
+        return self.session.paginate(ordering.order(query), page=page, per_page=per_page)
+
+    def get_by_id(self, id: str, relationships: Sequence[str] | None = None) -> Book:
+        if relationships is None:
+            book = self.session.get_by_id(Book, id)
+        else:
+            query = select(Book).filter_by(id=id).options(*get_book_load_options(relationships))
+            book = self.session.get_one(query)
 
         if book is None:
             raise BookException.BookDoesntExist(str(id))
 
         return book
 
-    def add(self, book: Book) -> None:
-        if self._book_already_exists(book):
-            raise BookException.BookAlreadyExists(book.name)
+    def get_many_by_ids(
+        self, ids: Sequence[int], relationships: Sequence[str] | None = None
+    ) -> list[Book | None]:
+        query = select(Book).where(Book.id.in_(set(ids)))
 
-        self.session.add(book)
+        if relationships is not None:
+            query = query.options(*get_book_load_options(relationships))
 
-    def _book_already_exists(self, book: Book) -> bool:
-        query = select(Book).where(Book.name.ilike(book.name.lower())).where((Book.id != book.id))
+        books = {book.id: book for book in self.session.get_many(query)}
 
-        return bool(self.session.get_one(query))
+        return [books.get(id) for id in ids]
+
+    def add(self, book: Book) -> None:
+        self.session.add_unique(
+            book,
+            BookException.BookAlreadyExists(book.name),
+            self._unique_columns,
+            self._get_missing_references(book),
+        )
+        CatalogVersion.bump()
 
     def delete(self, id: str) -> None:
         book = self.get_by_id(id)
@@ -46,15 +82,21 @@ class BookRepository(IBookRepository):
             BookImageUploader.delete(book_img.img_url)
 
         self.session.delete(book)
+        CatalogVersion.bump()
 
     def update(self, book: Book) -> None:
-        if self._was_name_modified(book) and self._book_already_exists(book):
-            raise BookException.BookAlreadyExists(book.name)
-
-        self.session.update()
-
-    def _was_name_modified(self, updated_book: Book) -> bool:
-        query = select(Book.name).filter_by(id=updated_book.id)
-        old_name = self.session.get_one(query)
-
-        return updated_book.name != old_name
+        self.session.update_unique(
+            book,
+            BookException.BookAlreadyExists(book.name),
+            self._unique_columns,
+            self._get_missing_references(book),
+        )
+        CatalogVersion.bump()
+
+    def _get_missing_references(self, book: Book) -> Mapping[str, ApiException]:
+        # The kind and genre come from the snapshot, so the foreign keys reject the ones that
+        # another worker deleted in the meantime
+        return {
+            'id_kind': BookKindException.BookKindDoesntExist(str(book.book_kind.id)),
+            'id_genre': BookGenreException.BookGenreDoesntExist(str(book.book_genre.id)),
+        }
@@ -0,0 +1,102 @@
+import time
+from typing import Any, Generic, TypeVar
+
+from flask import current_app, g
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import make_transient_to_detached
+
+from db import IDbSession
+from model import ReferenceDataVersion
+from model.base import Model
+
+TModel = TypeVar('TModel', bound=Model)
+column_values = dict[str, Any]
+table_version = int
+expires_at = float
+snapshot_entry = tuple[dict[str, column_values], table_version, expires_at]
+
+
+class ReferenceDataCache(Generic[TModel]):
+    def __init__(self, model: type[TModel], session: IDbSession) -> None:
+        self.model = model
+        self.session = session
+
+    def get_all(self) -> list[TModel]:
+        return [self._attach(values) for values in self._get_snapshot().values()]
+
+    def get_by_id(self, id: str) -> TModel | None:
+        values = self._get_snapshot().get(str(id))
+
+        return self._attach(values) if values is not None else None
+
+    def load_by_id(self, id: str) -> TModel | None:
+        # The snapshot can still have a row that was deleted since its version was checked, so
+        # the writes read the row itself, and drop the snapshot when the row is gone
+        instance = self.session.get_one(select(self.model).filter_by(id=id))
+
+        if instance is None:
+            self._drop_snapshot()
+
+        return instance
+
+    def invalidate(self) -> None:
+        # The other workers find the new version before serving their snapshot
+        self._drop_snapshot()
+        self.session.add_missing(
+            ReferenceDataVersion, [{'table_name': self.model.__tablename__, 'version': 0}]
+        )
+        reference_data_version = self.session.get_by_id(
+            ReferenceDataVersion, self.model.__tablename__
+        )
+        reference_data_version.version = ReferenceDataVersion.version + 1
+        self.session.update()
+        g.pop('reference_data_versions', None)
+
+    def _drop_snapshot(self) -> None:
+        self._get_snapshots().pop(self.model.__tablename__, None)
+
+    def _get_snapshot(self) -> dict[str, column_values]:
+        snapshots = self._get_snapshots()
+        entry = snapshots.get(self.model.__tablename__)
+        version = self._get_version()
+
+        # The writes bump the version of their table, so a snapshot of another version misses
+        # the changes made by the other workers. The TTL covers the ones made outside the api
+        if entry is None or entry[1] != version or entry[2] <= time.monotonic():
+            ttl: float = current_app.config['REFERENCE_DATA_CACHE_TTL']
+            entry = self._load_snapshot(), version, time.monotonic() + ttl
+            snapshots[self.model.__tablename__] = entry
+
+        return entry[0]
+
+    def _get_version(self) -> int:
+        # The versions of every table are read once per request
+        if 'reference_data_versions' not in g:
+            query = select(ReferenceDataVersion.table_name, ReferenceDataVersion.version)
+            g.reference_data_versions = dict(self.session.get_rows(query))
+
+        return g.reference_data_versions.get(self.model.__tablename__, 0)
+
+    def _get_snapshots(self) -> dict[str, snapshot_entry]:
+        return current_app.extensions.setdefault('reference_data_cache', {})
+
+    def _load_snapshot(self) -> dict[str, column_values]:
+        columns = [column.key for column in inspect(self.model).column_attrs]
+        query = select(self.model).order_by(self.model.id)
+
+        return {
+            str(row.id): {column: getattr(row, column) for column in columns}
+            for row in self.session.get_many(query)
+        }
+
+    def _attach(self, values: column_values) -> TModel:
+        # A detached copy is merged without loading it, so the session gets a persistent
+        # instance without emitting any query
+        instance = inspect(self.model).class_manager.new_instance()
+
+        for column, value in values.items():
+            setattr(instance, column, value)
+
+        make_transient_to_detached(instance)
+
+        return self.session.attach(instance)
@@ -1,13 +1,17 @@
+from typing import Sequence
+
 from flask_jwt_extended import current_user
 from flask_sqlalchemy.pagination import Pagination
 from injector import inject
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from db import IDbSession
 from exception import SavedBookException
 from model import Book, SavedBook
 
 from .. import ISavedBookRepository
+from .book_load_options import get_book_load_options
 
 
 @inject
@@ -15,9 +19,17 @@ class SavedBookRepository(ISavedBookRepository):
     def __init__(self, session: IDbSession) -> None:
         self.session = session
 
-    def get_all(self, page: int) -> Pagination:
+    def get_all(
+        self, page: int, per_page: int, relationships: Sequence[str] | None = None
+    ) -> Pagination:
         query = select(SavedBook).filter_by(id_user=current_user.id).order_by(SavedBook.id)
-        pagination = self.session.paginate(query, page=page)
+
+        if relationships is not None:
+            query = query.options(
+                selectinload(SavedBook.book).options(*get_book_load_options(relationships))
+            )
+
+        pagination = self.session.paginate(query, page=page, per_page=per_page)
         pagination.items = [saved_book.book for saved_book in pagination.items]
 
         return pagination
@@ -29,9 +41,9 @@ class SavedBookRepository(ISavedBookRepository):
         self.session.add(saved_book)
 
     def _saved_book_already_exists(self, saved_book: Book) -> bool:
-        query = select(SavedBook).filter_by(id_user=current_user.id)
+        query = select(SavedBook.id).filter_by(id_user=current_user.id, id_book=saved_book.id)
 
-        return saved_book in [saved_book.book for saved_book in self.session.get_many(query)]
+        return self.session.exists(query)
 
     def delete(self, saved_book: SavedBook) -> None:
         self.session.delete(saved_book)
@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import Iterable
+
+from flask import current_app
+from injector import inject
+from sqlalchemy import select
+
+from db import IDbSession
+from model import Book, BookKeyword, Keyword
+from utils.search import CompressedTrie, TrigramIndex
+
+from .. import ISearchIndexRepository
+
+expires_at = float
+search_indexes = tuple[CompressedTrie, TrigramIndex]
+search_index_entry = tuple[CompressedTrie, TrigramIndex, expires_at]
+
+
+@inject
+class SearchIndexRepository(ISearchIndexRepository):
+    _build_lock = threading.Lock()
+
+    def __init__(self, session: IDbSession) -> None:
+        self.session = session
+
+    def suggest(self, prefix: str, limit: int) -> list[str]:
+        trie, _ = self._get_indexes()
+
+        return trie.complete(prefix, limit)
+
+    def correct_query(self, query: str) -> str | None:
+        _, trigram_index = self._get_indexes()
+
+        return trigram_index.correct(
+            query, min_similarity=current_app.config['SEARCH_FUZZY_MIN_SIMILARITY']
+        )
+
+    def add_terms(self, terms: Iterable[str]) -> None:
+        entry = self._get_entry()
+
+        if entry is not None:
+            for term in terms:
+                for index in entry[:2]:
+                    index.add(term)
+
+    def remove_terms(self, terms: Iterable[str]) -> None:
+        entry = self._get_entry()
+
+        if entry is not None:
+            for term in terms:
+                for index in entry[:2]:
+                    index.remove(term)
+
+    def _get_indexes(self) -> search_indexes:
+        entry = self._get_entry()
+
+        # Every worker keeps its own indexes, so they're rebuilt from time to time to pick up
+        # the changes made by the others. Only one request rebuilds them, while the others keep
+        # serving the expired ones, so the requests only wait when there are no indexes yet
+        if (entry is None or entry[2] <= time.monotonic()) and self._build_lock.acquire(
+            blocking=entry is None
+        ):
+            try:
+                entry = self._get_entry()
+
+                if entry is None or entry[2] <= time.monotonic():
+                    indexes = self._build_indexes()
+                    ttl: float = current_app.config['SEARCH_INDEX_TTL']
+                    entry = *indexes, time.monotonic() + ttl
+                    current_app.extensions['search_index'] = entry
+            finally:
+                self._build_lock.release()
+
+        return entry[0], entry[1]
+
+    def _get_entry(self) -> search_index_entry | None:
+        return current_app.extensions.get('search_index')
+
+    def _build_indexes(self) -> search_indexes:
+        terms: list[str] = []
+
+        for name, author in self.session.get_rows(select(Book.name, Book.author)):
+            terms += [name, author]
+
+        terms += self.session.get_many(select(Keyword.keyword).join_from(BookKeyword, Keyword))
+
+        return CompressedTrie(terms), TrigramIndex(terms)
@@ -1,26 +1,37 @@
 from decimal import Decimal
+from typing import Any, Sequence
 
+from flask import current_app
 from flask_sqlalchemy.pagination import Pagination
 from injector import inject
-from sqlalchemy import Select, select
+from sqlalchemy import Select, Subquery, case, func, select
 
-from db import IDbSession
-from model import Book
-from repository import IBookGenreRepository, IBookKindRepository
+from db import CursorPagination, IDbSession, ListPagination
+from model import Book, BookGenre, BookKeyword, BookKind, Keyword
+from repository import IBookGenreRepository, IBookKindRepository, IBookRepository
+from utils.cache import CatalogVersion, TTLCache
 
 from .. import ISearchRepository
+from .book_load_options import get_book_load_options
+from .book_ordering import BookOrdering
 
 select_book = Select[tuple[Book]]
+facet_counts = dict[str, list[dict[str, Any]]]
+search_cache_key = tuple[Any, ...]
+book_ids = list[int]
+total_books = int
 
 
 @inject
 class SearchRepository(ISearchRepository):
     def __init__(
         self,
+        book_repository: IBookRepository,
         book_kind_repository: IBookKindRepository,
         book_genre_repository: IBookGenreRepository,
         session: IDbSession,
     ) -> None:
+        self.book_repository = book_repository
         self.book_kind_repository = book_kind_repository
         self.book_genre_repository = book_genre_repository
         self.session = session
@@ -29,18 +40,189 @@ class SearchRepository(ISearchRepository):
         self,
         *,
         page: int,
+        per_page: int,
         query: str | None,
         id_book_kind: int | None,
         id_book_genre: int | None,
         release_year: int | None,
         min_price: Decimal | None,
         max_price: Decimal | None,
-    ) -> Pagination:
+        relationships: Sequence[str] | None = None,
+        sort: str | None = None,
+        after: str | None = None,
+    ) -> Pagination | CursorPagination:
+        ordering = BookOrdering(sort, query)
         sql_query = self._build_query(
             query, id_book_kind, id_book_genre, release_year, min_price, max_price
         )
 
-        return self.session.paginate(sql_query, page=page)
+        if relationships is not None:
+            sql_query = sql_query.options(*get_book_load_options(relationships))
+
+        if after is not None:
+            return ordering.paginate_by_cursor(
+                self.session, sql_query, per_page=per_page, after=after
+            )
+
+        # Only the page's ids are cached, so the books are always loaded fresh by primary key
+        key = self._get_cache_key(
+            query, id_book_kind, id_book_genre, release_year, min_price, max_price
+        ) + (ordering.sort, page, per_page)
+
+        cache = self._get_results_cache()
+        results = cache.get(key)
+
+        if results is not None:
+            ids, total = results
+            # A cached search that found nothing, like a misspelled one, runs no query at all
+            books = self.book_repository.get_many_by_ids(ids, relationships) if ids else []
+
+            return ListPagination(
+                [book for book in books if book is not None],
+                page=page,
+                per_page=per_page,
+                total=total,
+            )
+
+        pagination = self.session.paginate(ordering.order(sql_query), page=page, per_page=per_page)
+        cache.set(key, ([book.id for book in pagination.items], pagination.total))
+
+        return pagination
+
+    def get_facets(
+        self,
+        *,
+        query: str | None,
+        id_book_kind: int | None,
+        id_book_genre: int | None,
+        release_year: int | None,
+        min_price: Decimal | None,
+        max_price: Decimal | None,
+        facets: Sequence[str],
+    ) -> facet_counts:
+        normalized_facets = tuple(sorted(set(facets)))
+        key = self._get_cache_key(
+            query, id_book_kind, id_book_genre, release_year, min_price, max_price
+        ) + (normalized_facets,)
+
+        cache = self._get_facets_cache()
+        counts = cache.get(key)
+
+        if counts is None:
+            books = self._build_query(
+                query, id_book_kind, id_book_genre, release_year, min_price, max_price
+            )
+            counts = self._count_facets(books.subquery(), normalized_facets)
+            cache.set(key, counts)
+
+        return counts
+
+    def _count_facets(self, books: Subquery, facets: Sequence[str]) -> facet_counts:
+        return {facet: getattr(self, f'_count_by_{facet}')(books) for facet in facets}
+
+    def _count_by_book_genre(self, books: Subquery) -> list[dict[str, Any]]:
+        query = (
+            select(BookGenre.id, BookGenre.genre, func.count())
+            .join(books, books.c.id_genre == BookGenre.id)
+            .group_by(BookGenre.id, BookGenre.genre)
+            .order_by(BookGenre.id)
+        )
+
+        return [
+            {'id': id, 'genre': genre, 'count': count}
+            for id, genre, count in self.session.get_rows(query)
+        ]
+
+    def _count_by_book_kind(self, books: Subquery) -> list[dict[str, Any]]:
+        query = (
+            select(BookKind.id, BookKind.kind, func.count())
+            .join(books, books.c.id_kind == BookKind.id)
+            .group_by(BookKind.id, BookKind.kind)
+            .order_by(BookKind.id)
+        )
+
+        return [
+            {'id': id, 'kind': kind, 'count': count}
+            for id, kind, count in self.session.get_rows(query)
+        ]
+
+    def _count_by_release_year(self, books: Subquery) -> list[dict[str, Any]]:
+        query = (
+            select(books.c.release_year, func.count())
+            .group_by(books.c.release_year)
+            .order_by(books.c.release_year)
+        )
+
+        return [
+            {'release_year': release_year, 'count': count}
+            for release_year, count in self.session.get_rows(query)
+        ]
+
+    def _count_by_price(self, books: Subquery) -> list[dict[str, Any]]:
+        bounds: list[int] = current_app.config['SEARCH_PRICE_FACET_BOUNDS']
+        bucket = case(
+            *[(books.c.price < bound, index) for index, bound in enumerate(bounds)],
+            else_=len(bounds),
+        )
+        query = select(bucket, func.count()).group_by(bucket).order_by(bucket)
+
+        return [
+            {
+                'min_price': bounds[index - 1] if index > 0 else 0,
+                'max_price': bounds[index] if index < len(bounds) else None,
+                'count': count,
+            }
+            for index, count in self.session.get_rows(query)
+        ]
+
+    def _get_cache_key(
+        self,
+        query: str | None,
+        id_book_kind: int | None,
+        id_book_genre: int | None,
+        release_year: int | None,
+        min_price: Decimal | None,
+        max_price: Decimal | None,
+    ) -> search_cache_key:
+        # The search query matching is case insensitive, so its normalized form is a safe key,
+        # and the catalog version leaves every entry cached before a book write behind
+        return (
+            CatalogVersion.get(),
+            query.strip().lower() if query is not None else None,
+            id_book_kind,
+            id_book_genre,
+            release_year,
+            min_price.normalize() if min_price is not None else None,
+            max_price.normalize() if max_price is not None else None,
+        )
+
+    def _get_results_cache(self) -> TTLCache[search_cache_key, tuple[book_ids, total_books]]:
+        cache = current_app.extensions.get('search_results_cache')
+
+        if cache is None:
+            cache = current_app.extensions.setdefault(
+                'search_results_cache',
+                TTLCache(
+                    max_size=current_app.config['SEARCH_RESULTS_CACHE_MAX_SIZE'],
+                    ttl=current_app.config['SEARCH_RESULTS_CACHE_TTL'],
+                ),
+            )
+
+        return cache
+
+    def _get_facets_cache(self) -> TTLCache[search_cache_key, facet_counts]:
+        cache = current_app.extensions.get('search_facets_cache')
+
+        if cache is None:
+            cache = current_app.extensions.setdefault(
+                'search_facets_cache',
+                TTLCache(
+                    max_size=current_app.config['SEARCH_FACETS_CACHE_MAX_SIZE'],
+                    ttl=current_app.config['SEARCH_FACETS_CACHE_TTL'],
+                ),
+            )
+
+        return cache
 
     def _build_query(
         self,
@@ -51,7 +233,7 @@ class SearchRepository(ISearchRepository):
         min_price: Decimal | None,
         max_price: Decimal | None,
     ) -> select_book:
-        sql_query = select(Book).order_by(Book.id)
+        sql_query = select(Book)
 
         if search_query is not None:
             sql_query = self._apply_search_query(sql_query, search_query)
@@ -82,7 +264,11 @@ class SearchRepository(ISearchRepository):
         return sql_query.where(
             Book.name.icontains(search_query)
             | Book.author.icontains(search_query)
-            | Book.book_keywords.any(keyword=search_query.lower())
+            | Book.id.in_(
+                select(BookKeyword.id_book)
+                .join(BookKeyword.dictionary_keyword)
+                .where(Keyword.keyword == search_query.lower())
+            )
         )
 
     def _apply_kind(self, sql_query: select_book, id_kind: int) -> select_book:
@@ -4,45 +4,34 @@ from sqlalchemy import select
 from db import IDbSession
 from exception import UserException
 from model import User
+from security import invalidate_cached_user
 from utils.file.uploader import UserImageUploader
+from utils.text import fold_text
 
 from .. import IUserRepository
 
 
 @inject
 class UserRepository(IUserRepository):
+    _unique_columns = ('username', 'username_normalized')
+
     def __init__(self, session: IDbSession) -> None:
         self.session = session
 
     def add(self, user: User) -> None:
-        if self._user_already_exists(user.username):
-            raise UserException.UserAlreadyExists()
-
-        self.session.add(user)
-
-    def _user_already_exists(self, username: str) -> bool:
-        query = select(User).where(User.username.ilike(username))
-
-        return bool(self.session.get_one(query))
+        self.session.add_unique(user, UserException.UserAlreadyExists(), self._unique_columns)
 
     def update(self, user: User) -> None:
-        if self._was_username_modified(user) and self._user_already_exists(user.username):
-            raise UserException.UserAlreadyExists()
-
-        self.session.update()
-
-    def _was_username_modified(self, updated_user: User) -> bool:
-        query = select(User.username).filter_by(id=updated_user.id)
-        old_username = self.session.get_one(query)
-
-        return updated_user.username != old_username
+        self.session.update_unique(user, UserException.UserAlreadyExists(), self._unique_columns)
+        invalidate_cached_user(user.id)
 
     def get_by_username(self, username: str) -> User | None:
-        query = select(User).filter_by(username=username)
+        query = select(User).filter_by(username_normalized=fold_text(username))
 
         return self.session.get_one(query)
 
     def delete(self, user: User) -> None:
         self.session.delete(user)
+        invalidate_cached_user(user.id)
 
         UserImageUploader.delete(user.img_url)
@@ -1 +1,2 @@
 from .jwt import jwt
+from .user_cache import invalidate_cached_user
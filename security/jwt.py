@@ -3,6 +3,8 @@ from flask_jwt_extended import JWTManager
 from db import db
 from model import User
 
+from .user_cache import cache_user, get_cached_user
+
 jwt = JWTManager()
 
 
@@ -15,4 +17,12 @@ def user_identity_lookup(user: User) -> int:
 def user_lookup_callback(_jwt_header: dict, jwt_data: dict) -> User | None:
     identity = jwt_data["sub"]
 
-    return db.session.get(User, identity)
+    user = get_cached_user(identity)
+
+    if user is None:
+        user = db.session.get(User, identity)
+
+        if user is not None:
+            cache_user(user)
+
+    return user
@@ -0,0 +1,54 @@
+from typing import Any
+
+from flask import current_app
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from db import db
+from model import User
+from utils.cache import TTLCache
+
+user_data = dict[str, Any]
+
+
+def get_cached_user(id: int) -> User | None:
+    data = _get_cache().get(id)
+
+    if data is None:
+        return None
+
+    user: User = inspect(User).class_manager.new_instance()
+
+    for key, value in data.items():
+        set_committed_value(user, key, value)
+
+    # Attaches the cached row to the request's session without a SELECT
+    make_transient_to_detached(user)
+
+    return db.session.merge(user, load=False)
+
+
+def cache_user(user: User) -> None:
+    data = {column.key: getattr(user, column.key) for column in inspect(User).column_attrs}
+
+    _get_cache().set(user.id, data)
+
+
+def invalidate_cached_user(id: int) -> None:
+    _get_cache().delete(id)
+
+
+def _get_cache() -> TTLCache[int, user_data]:
+    cache = current_app.extensions.get('user_cache')
+
+    if cache is None:
+        cache = current_app.extensions.setdefault(
+            'user_cache',
+            TTLCache(
+                max_size=current_app.config['JWT_USER_CACHE_MAX_SIZE'],
+                ttl=current_app.config['JWT_USER_CACHE_TTL'],
+            ),
+        )
+
+    return cache
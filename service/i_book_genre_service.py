@@ -8,7 +8,7 @@ from model import BookGenre
 
 class IBookGenreService(ABC):
     @abstractmethod
-    def get_all_book_genres(self, page: int) -> Pagination:
+    def get_all_book_genres(self, page: int, per_page: int) -> Pagination:
         pass
 
     @abstractmethod
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 from flask_sqlalchemy.pagination import Pagination
 
@@ -7,7 +8,9 @@ from model import Book
 
 class ISavedBookService(ABC):
     @abstractmethod
-    def get_all_saved_books(self, page: int) -> Pagination:
+    def get_all_saved_books(
+        self, page: int, per_page: int, relationships: Sequence[str] | None = None
+    ) -> Pagination:
         pass
 
     @abstractmethod
@@ -25,6 +25,10 @@ class AuthService(IAuthService):
         if user is None or not user.check_password(input_dto.password):
             raise AuthException.InvalidLogin()
 
+        if user.needs_password_rehash():
+            user.update_password(input_dto.password)
+            self.repository.update(user)
+
         access_token = create_access_token(user)
 
         return user, access_token
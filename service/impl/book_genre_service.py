@@ -13,8 +13,8 @@ class BookGenreService(IBookGenreService):
     def __init__(self, repository: IBookGenreRepository) -> None:
         self.repository = repository
 
-    def get_all_book_genres(self, page: int) -> Pagination:
-        return self.repository.get_all(page)
+    def get_all_book_genres(self, page: int, per_page: int) -> Pagination:
+        return self.repository.get_all(page, per_page)
 
     def get_book_genre_by_id(self, id: str) -> BookGenre:
         return self.repository.get_by_id(id)
@@ -30,7 +30,7 @@ class BookGenreService(IBookGenreService):
         self.repository.delete(id)
 
     def update_book_genre(self, id: str, input_dto: BookGenreInputDTO) -> BookGenre:
-        book_genre = self.repository.get_by_id(id)
+        book_genre = self.repository.get_by_id(id, cached=False)
         book_genre.update_genre(input_dto.genre)
 
         self.repository.update(book_genre)
@@ -1,5 +1,3 @@
-import os
-
 from flask import current_app
 from injector import inject
 
@@ -7,6 +5,7 @@ from dto.input import BookImgInputDTO
 from exception import BookImgException, ImageException
 from model import Book, BookImg
 from repository import IBookImgRepository, IBookRepository
+from utils.file.storage import ImageStorage
 from utils.file.uploader import BookImageUploader
 
 from .. import IBookImgService
@@ -24,18 +23,15 @@ class BookImgService(IBookImgService):
         self.book_img_repository = book_img_repository
 
     def get_book_photo(self, filename: str) -> tuple[file_path, mimetype]:
-        file_path = os.path.join(current_app.config['BOOK_PHOTOS_UPLOAD_DIR'], filename)
+        file_path = ImageStorage.find(current_app.config['BOOK_PHOTOS_UPLOAD_DIR'], filename)
 
-        if not self._is_file_path_valid(file_path):
+        if file_path is None:
             raise ImageException.ImageNotFound(filename)
 
         return file_path, 'image/jpeg'
 
-    def _is_file_path_valid(self, file_path: str) -> bool:
-        return os.path.isfile(file_path)
-
     def create_book_img(self, id_book: str, input_dto: BookImgInputDTO) -> BookImg:
-        book = self.book_repository.get_by_id(id_book)
+        book = self.book_repository.get_by_id(id_book, [])
 
         if self._does_book_already_have_max_qty_imgs(book):
             raise BookImgException.BookAlreadyHaveImageMaxQty(book.name)
@@ -49,10 +45,13 @@ class BookImgService(IBookImgService):
         return book_img
 
     def _does_book_already_have_max_qty_imgs(self, book: Book) -> bool:
-        return len(book.book_imgs) == current_app.config['BOOK_IMG_MAX_QTY']
+        return (
+            self.book_img_repository.count_by_book(book.id)
+            >= current_app.config['BOOK_IMG_MAX_QTY']
+        )
 
     def delete_book_img(self, id_book: str, id_img: str) -> None:
-        book = self.book_repository.get_by_id(id_book)
+        book = self.book_repository.get_by_id(id_book, [])
         book_img = self.book_img_repository.get_by_id(id_img)
 
         if book_img.id_book != book.id:
@@ -64,10 +63,10 @@ class BookImgService(IBookImgService):
         self.book_img_repository.delete(book_img)
 
     def _does_book_have_one_img(self, book: Book) -> bool:
-        return len(book.book_imgs) == 1
+        return self.book_img_repository.count_by_book(book.id) == 1
 
     def update_book_img(self, id_book: str, id_img: str, input_dto: BookImgInputDTO) -> BookImg:
-        book = self.book_repository.get_by_id(id_book)
+        book = self.book_repository.get_by_id(id_book, [])
         book_img = self.book_img_repository.get_by_id(id_img)
 
         if book_img.id_book != book.id:
@@ -3,7 +3,7 @@ from injector import inject
 from dto.input import BookKeywordInputDTO
 from exception import BookKeywordException
 from model import Book, BookKeyword
-from repository import IBookKeywordRepository, IBookRepository
+from repository import IBookKeywordRepository, IBookRepository, ISearchIndexRepository
 
 from .. import IBookKeywordService
 
@@ -11,22 +11,32 @@ from .. import IBookKeywordService
 @inject
 class BookKeywordService(IBookKeywordService):
     def __init__(
-        self, book_repository: IBookRepository, book_keyword_repository: IBookKeywordRepository
+        self,
+        book_repository: IBookRepository,
+        book_keyword_repository: IBookKeywordRepository,
+        search_index_repository: ISearchIndexRepository,
     ) -> None:
         self.book_repository = book_repository
         self.book_keyword_repository = book_keyword_repository
+        self.search_index_repository = search_index_repository
 
     def create_book_keyword(self, id_book: str, input_dto: BookKeywordInputDTO) -> BookKeyword:
-        book = self.book_repository.get_by_id(id_book)
-        book_keyword = BookKeyword(input_dto.keyword)
+        book = self.book_repository.get_by_id(id_book, [])
+
+        if self._does_book_have_keyword(book, input_dto.keyword):
+            raise BookKeywordException.BookAlreadyHasThisKeyword(input_dto.keyword, id_book)
+
+        (keyword,) = self.book_keyword_repository.get_or_create_keywords([input_dto.keyword])
+        book_keyword = BookKeyword(keyword)
         book_keyword.id_book = book.id
 
         self.book_keyword_repository.add(book_keyword)
+        self.search_index_repository.add_terms([book_keyword.keyword])
 
         return book_keyword
 
     def delete_book_keyword(self, id_book: str, id_keyword: str) -> None:
-        book = self.book_repository.get_by_id(id_book)
+        book = self.book_repository.get_by_id(id_book, [])
         book_keyword = self.book_keyword_repository.get_by_id(id_keyword)
 
         if book_keyword.id_book != book.id:
@@ -36,6 +46,10 @@ class BookKeywordService(IBookKeywordService):
             raise BookKeywordException.BookMustHaveAtLeastOneKeyword(id_book)
 
         self.book_keyword_repository.delete(book_keyword)
+        self.search_index_repository.remove_terms([book_keyword.keyword])
+
+    def _does_book_have_keyword(self, book: Book, keyword: str) -> bool:
+        return self.book_keyword_repository.book_has_keyword(book.id, keyword)
 
     def _does_book_have_one_keyword(self, book: Book) -> bool:
-        return len(book.book_keywords) == 1
+        return self.book_keyword_repository.count_by_book(book.id) == 1
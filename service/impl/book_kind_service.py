@@ -13,8 +13,8 @@ class BookKindService(IBookKindService):
     def __init__(self, repository: IBookKindRepository) -> None:
         self.repository = repository
 
-    def get_all_book_kinds(self, page: int) -> Pagination:
-        return self.repository.get_all(page)
+    def get_all_book_kinds(self, page: int, per_page: int) -> Pagination:
+        return self.repository.get_all(page, per_page)
 
     def get_book_kind_by_id(self, id: str) -> BookKind:
         return self.repository.get_by_id(id)
@@ -30,7 +30,7 @@ class BookKindService(IBookKindService):
         self.repository.delete(id)
 
     def update_book_kind(self, id: str, input_dto: BookKindInputDTO) -> BookKind:
-        book_kind = self.repository.get_by_id(id)
+        book_kind = self.repository.get_by_id(id, cached=False)
         book_kind.update_kind(input_dto.kind)
 
         self.repository.update(book_kind)
@@ -1,11 +1,18 @@
-from typing import Any
+from typing import Any, Sequence
 
 from flask_sqlalchemy.pagination import Pagination
 from injector import inject
 
+from db import CursorPagination
 from dto.input import CreateBookInputDTO, UpdateBookInputDTO
 from model import Book, BookImg, BookKeyword
-from repository import IBookGenreRepository, IBookKindRepository, IBookRepository
+from repository import (
+    IBookGenreRepository,
+    IBookKeywordRepository,
+    IBookKindRepository,
+    IBookRepository,
+    ISearchIndexRepository,
+)
 
 from .. import IBookService
 
@@ -17,16 +24,32 @@ class BookService(IBookService):
         book_repository: IBookRepository,
         book_genre_repository: IBookGenreRepository,
         book_kind_repository: IBookKindRepository,
+        book_keyword_repository: IBookKeywordRepository,
+        search_index_repository: ISearchIndexRepository,
     ) -> None:
         self.book_repository = book_repository
         self.book_genre_repository = book_genre_repository
         self.book_kind_repository = book_kind_repository
+        self.book_keyword_repository = book_keyword_repository
+        self.search_index_repository = search_index_repository
 
-    def get_all_books(self, page: int) -> Pagination:
-        return self.book_repository.get_all(page)
-
-    def get_book_by_id(self, id: str) -> Book:
-        return self.book_repository.get_by_id(id)
+    def get_all_books(
+        self,
+        page: int,
+        per_page: int,
+        relationships: Sequence[str] | None = None,
+        sort: str | None = None,
+        after: str | None = None,
+    ) -> Pagination | CursorPagination:
+        return self.book_repository.get_all(page, per_page, relationships, sort, after)
+
+    def get_book_by_id(self, id: str, relationships: Sequence[str] | None = None) -> Book:
+        return self.book_repository.get_by_id(id, relationships)
+
+    def get_books_by_ids(
+        self, ids: Sequence[int], relationships: Sequence[str] | None = None
+    ) -> list[Book | None]:
+        return self.book_repository.get_many_by_ids(ids, relationships)
 
     def create_book(self, input_dto: CreateBookInputDTO) -> Book:
         new_book = Book(
@@ -38,7 +61,11 @@ class BookService(IBookService):
 
         book_kind = self.book_kind_repository.get_by_id(str(input_dto.id_book_kind))
         book_genre = self.book_genre_repository.get_by_id(str(input_dto.id_book_genre))
-        book_keywords = [BookKeyword(keyword) for keyword in input_dto.keywords]
+        keywords = self.book_keyword_repository.get_or_create_keywords(
+            list(dict.fromkeys(input_dto.keywords))
+        )
+        # Keywords that differ only in accents or case can be the same row in the database
+        book_keywords = [BookKeyword(keyword) for keyword in dict.fromkeys(keywords)]
         book_imgs = [BookImg(img.get_url()) for img in input_dto.imgs]
 
         new_book.book_kind = book_kind
@@ -47,6 +74,7 @@ class BookService(IBookService):
         new_book.book_imgs = book_imgs
 
         self.book_repository.add(new_book)
+        self.search_index_repository.add_terms(new_book.get_search_terms())
 
         for img in input_dto.imgs:
             img.save()
@@ -54,16 +82,23 @@ class BookService(IBookService):
         return new_book
 
     def delete_book(self, id: str) -> None:
+        book = self.book_repository.get_by_id(id)
+        search_terms = book.get_search_terms()
+
         self.book_repository.delete(id)
+        self.search_index_repository.remove_terms(search_terms)
 
     def update_book(self, id: str, input_dto: UpdateBookInputDTO) -> Book:
         book = self.get_book_by_id(id)
+        old_search_terms = book.get_search_terms()
 
         for key, value in input_dto.items:
             if value is not None:
                 self._update_book_attrs(book, key, value)
 
         self.book_repository.update(book)
+        self.search_index_repository.remove_terms(old_search_terms)
+        self.search_index_repository.add_terms(book.get_search_terms())
 
         return book
 
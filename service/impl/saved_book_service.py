@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from flask_jwt_extended import current_user
 from flask_sqlalchemy.pagination import Pagination
 from injector import inject
@@ -16,8 +18,10 @@ class SavedBookService(ISavedBookService):
         self.book_repository = book_repository
         self.saved_book_repository = saved_book_repository
 
-    def get_all_saved_books(self, page: int) -> Pagination:
-        return self.saved_book_repository.get_all(page)
+    def get_all_saved_books(
+        self, page: int, per_page: int, relationships: Sequence[str] | None = None
+    ) -> Pagination:
+        return self.saved_book_repository.get_all(page, per_page, relationships)
 
     def save_book(self, id: str) -> Book:
         book = self.book_repository.get_by_id(id)
@@ -1,24 +1,73 @@
+from typing import Any, Sequence
+
 from flask_sqlalchemy.pagination import Pagination
 from injector import inject
 
-from dto.input import SearchInputDTO
-from repository import ISearchRepository
+from db import CursorPagination
+from dto.input import SearchInputDTO, SearchSuggestInputDTO
+from repository import ISearchIndexRepository, ISearchRepository
 
 from .. import ISearchService
 
 
 @inject
 class SearchService(ISearchService):
-    def __init__(self, repository: ISearchRepository) -> None:
+    def __init__(
+        self, repository: ISearchRepository, search_index_repository: ISearchIndexRepository
+    ) -> None:
         self.repository = repository
+        self.search_index_repository = search_index_repository
 
-    def search_books(self, page: int, input_dto: SearchInputDTO) -> Pagination:
+    def search_books(
+        self,
+        page: int,
+        per_page: int,
+        input_dto: SearchInputDTO,
+        relationships: Sequence[str] | None = None,
+        sort: str | None = None,
+        after: str | None = None,
+    ) -> Pagination | CursorPagination:
         return self.repository.search(
             page=page,
+            per_page=per_page,
             query=input_dto.query,
             id_book_genre=input_dto.id_book_genre,
             id_book_kind=input_dto.id_book_kind,
             release_year=input_dto.release_year,
             min_price=input_dto.min_price,
             max_price=input_dto.max_price,
+            relationships=relationships,
+            sort=sort,
+            after=after,
         )
+
+    def suggest_search_terms(self, input_dto: SearchSuggestInputDTO) -> list[str]:
+        return self.search_index_repository.suggest(input_dto.q, input_dto.limit)
+
+    def get_search_facets(
+        self, input_dto: SearchInputDTO, facets: Sequence[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        return self.repository.get_facets(
+            query=input_dto.query,
+            id_book_genre=input_dto.id_book_genre,
+            id_book_kind=input_dto.id_book_kind,
+            release_year=input_dto.release_year,
+            min_price=input_dto.min_price,
+            max_price=input_dto.max_price,
+            facets=facets,
+        )
+
+    def get_search_correction(
+        self, input_dto: SearchInputDTO, pagination: Pagination | CursorPagination
+    ) -> str | None:
+        # Only a query that finds nothing is corrected, since a typo is the likely reason. Its
+        # results were already searched, so the ones that find something cost no query
+        if isinstance(pagination, CursorPagination):
+            has_results = bool(pagination.items)
+        else:
+            has_results = bool(pagination.total)
+
+        if input_dto.query is None or has_results:
+            return None
+
+        return self.search_index_repository.correct_query(input_dto.query)
@@ -1,5 +1,3 @@
-import os
-
 from flask import current_app
 from flask_jwt_extended import current_user
 from injector import inject
@@ -8,6 +6,7 @@ from dto.input import CreateUserInputDTO, UpdateUserInputDTO
 from exception import AuthException, ImageException
 from model import User
 from repository import IUserRepository
+from utils.file.storage import ImageStorage
 from utils.file.uploader import UserImageUploader
 
 from .. import IUserService
@@ -39,16 +38,13 @@ class UserService(IUserService):
         return current_user
 
     def get_user_photo(self, filename: str) -> tuple[file_path, mimetype]:
-        file_path = os.path.join(current_app.config['USER_PHOTOS_UPLOAD_DIR'], filename)
+        file_path = ImageStorage.find(current_app.config['USER_PHOTOS_UPLOAD_DIR'], filename)
 
-        if not self._is_file_path_valid(file_path):
+        if file_path is None:
             raise ImageException.ImageNotFound(filename)
 
         return file_path, 'image/jpeg'
 
-    def _is_file_path_valid(self, file_path: str) -> bool:
-        return os.path.isfile(file_path)
-
     def update_user(self, input_dto: UpdateUserInputDTO) -> User:
         for key, value in input_dto.items:
             if value is not None and key != 'img':
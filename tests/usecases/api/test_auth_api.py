@@ -22,16 +22,21 @@ def app():
 
         db.session.execute(
             text(
-                "INSERT INTO users (username, password, img_url) VALUES (:username, :password, :img_url)"
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
             ),
             [
                 {
                     'username': 'test',
+                    'username_normalized': 'test',
                     'password': generate_password_hash('Senha@123'),
                     'img_url': 'http://localhost:5000/users/photos/test.jpg',
                 },
                 {
                     'username': 'lopes',
+                    'username_normalized': 'lopes',
                     'password': generate_password_hash('Senha@123'),
                     'img_url': 'http://localhost:5000/users/photos/test2.jpg',
                 },
@@ -70,6 +75,15 @@ def test_login_with_valid_credentials(client: FlaskClient):
     assert response.status_code == 200
 
 
+def test_login_with_username_in_another_case(client: FlaskClient):
+    credentials = {'username': 'TEST', 'password': 'Senha@123'}
+
+    response = client.post(f'/auth/login', json=credentials)
+
+    assert json.loads(response.data)['username'] == 'test'
+    assert response.status_code == 200
+
+
 def test_when_try_to_login_with_content_type_multipart_form_data_returns_error_response(
     client: FlaskClient,
 ):
@@ -1,6 +1,8 @@
+import io
 import json
 import os
 import shutil
+import struct
 from datetime import datetime
 from decimal import Decimal
 
@@ -8,12 +10,14 @@ import pytest
 from flask import Flask
 from flask.testing import FlaskClient
 from flask_jwt_extended import create_access_token
-from sqlalchemy import text
+from sqlalchemy import event, text
 from werkzeug.security import generate_password_hash
 
 from app import create_app
 from db import db
 from model import Book, BookGenre, BookImg, BookKeyword, BookKind, User
+from utils.file.storage import ImageStorage
+from utils.text import fold_text
 
 
 @pytest.fixture()
@@ -25,10 +29,14 @@ def app():
 
         db.session.execute(
             text(
-                "INSERT INTO users (username, password, img_url) VALUES (:username, :password, :img_url)"
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
             ),
             {
                 'username': 'test',
+                'username_normalized': 'test',
                 'password': generate_password_hash('Senha@123'),
                 'img_url': 'http://localhost:5000/users/photos/test.jpg',
             },
@@ -46,14 +54,15 @@ def app():
             text(
                 """--sql
                 INSERT INTO books
-                    (name, price, author, release_year, id_kind, id_genre)
+                    (name, name_normalized, price, author, release_year, id_kind, id_genre)
                     VALUES
-                        (:name, :price, :author, :release_year, :id_kind, :id_genre)
+                        (:name, :name_normalized, :price, :author, :release_year, :id_kind, :id_genre)
                 """
             ),
             [
                 {
                     'name': 'O Pequeno Príncipe',
+                    'name_normalized': 'o pequeno principe',
                     'price': 10.99,
                     'author': 'Antoine de Saint Exupéry',
                     'release_year': 1943,
@@ -62,6 +71,7 @@ def app():
                 },
                 {
                     'name': 'Herdeiro do Império',
+                    'name_normalized': 'herdeiro do imperio',
                     'price': 89.67,
                     'author': 'Timothy Zhan',
                     'release_year': 1993,
@@ -71,6 +81,7 @@ def app():
                 *[
                     {
                         'name': f'Livro {chr(97 + i)}',
+                        'name_normalized': fold_text(f'Livro {chr(97 + i)}'),
                         'price': 20,
                         'author': 'Autor da Silva',
                         'release_year': 2000,
@@ -97,20 +108,34 @@ def app():
             ],
         )
 
+        book_keywords = [
+            {'keyword': 'infantil', 'id_book': 1},
+            {'keyword': 'dramático', 'id_book': 2},
+            *[
+                {
+                    'keyword': f'palavra {chr(97 + i)}',
+                    'id_book': i + 1,
+                }
+                for i in range(2, 26)
+            ],
+        ]
+
         db.session.execute(
-            text("INSERT INTO book_keywords (keyword, id_book) VALUES (:keyword, :id_book)"),
+            text("INSERT INTO keywords (keyword) VALUES (:keyword)"),
             [
-                {'keyword': 'infantil', 'id_book': 1},
-                {'keyword': 'dramático', 'id_book': 2},
-                *[
-                    {
-                        'keyword': f'palavra {chr(97 + i)}',
-                        'id_book': i + 1,
-                    }
-                    for i in range(2, 26)
-                ],
+                {'keyword': keyword}
+                for keyword in dict.fromkeys(row['keyword'] for row in book_keywords)
             ],
         )
+        db.session.execute(
+            text(
+                """--sql
+                INSERT INTO book_keywords (id_book, id_keyword)
+                    SELECT :id_book, id FROM keywords WHERE keyword = :keyword
+                """
+            ),
+            book_keywords,
+        )
         db.session.commit()
 
     yield app
@@ -124,7 +149,9 @@ def clean_uploads():
     for file in os.listdir(dir):
         path = os.path.join(dir, file)
 
-        if file != 'test.jpg':
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif file != 'test.jpg':
             os.remove(path)
 
     if not os.path.exists('tests/uploads/test2.jpg'):
@@ -338,6 +365,57 @@ def test_when_try_to_get_all_books_with_page_3_return_error_response(client: Fla
     assert response.status_code == 400
 
 
+def test_get_all_books_with_per_page(client: FlaskClient):
+    response = client.get('/books?per_page=2&fields=name&include=&page=2')
+    response_data = json.loads(response.data)
+
+    expected_data = {
+        'data': [
+            {'id': 3, 'name': 'Livro c'},
+            {'id': 4, 'name': 'Livro d'},
+        ],
+        'has_next': True,
+        'has_prev': True,
+        'next_page': '/books?per_page=2&fields=name&include=&page=3',
+        'page': 2,
+        'per_page': 2,
+        'prev_page': '/books?per_page=2&fields=name&include=&page=1',
+        'total_items': 26,
+        'total_pages': 13,
+    }
+
+    assert response_data == expected_data
+    assert response.status_code == 200
+
+    response = client.get('/books?per_page=500')
+    response_data = json.loads(response.data)
+
+    assert len(response_data['data']) == 26
+    assert response_data['per_page'] == 500
+    assert response.status_code == 200
+
+
+def test_when_try_to_get_all_books_with_invalid_per_page_returns_error_response(
+    client: FlaskClient,
+):
+    for per_page in (0, -1, 501):
+        response = client.get(f'/books?per_page={per_page}')
+        response_data = json.loads(response.data)
+
+        expected_data = {
+            'scope': 'GeneralException',
+            'code': 'InvalidPaginationPerPage',
+            'message': 'The items per page must be between 1 and 500',
+            'status': 400,
+        }
+
+        for key, value in expected_data.items():
+            assert response_data[key] == value
+
+        assert datetime.fromisoformat(response_data['timestamp'])
+        assert response.status_code == 400
+
+
 def test_get_book_by_id(client: FlaskClient):
     book_id = 2
 
@@ -360,6 +438,206 @@ def test_get_book_by_id(client: FlaskClient):
     assert response.status_code == 200
 
 
+def test_get_book_by_id_with_fields_and_include(client: FlaskClient):
+    book_id = 2
+
+    response = client.get(f'/books/{book_id}?fields=name,price&include=book_genre')
+    response_data = json.loads(response.data)
+
+    expected_data = {
+        'id': book_id,
+        'name': 'Herdeiro do Império',
+        'price': 89.67,
+        'book_genre': {'genre': 'fábula', 'id': 1},
+    }
+
+    assert response_data == expected_data
+    assert response.status_code == 200
+
+
+def test_get_all_books_with_fields_and_empty_include_does_not_load_relationships(
+    client: FlaskClient, app: Flask
+):
+    statements: list[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', count_statement)
+
+    response = client.get('/books?fields=name&include=')
+    response_data = json.loads(response.data)
+
+    assert response_data['data'][0] == {'id': 1, 'name': 'O Pequeno Príncipe'}
+    assert len(response_data['data']) == 20
+    assert not any(
+        table in statement
+        for statement in statements
+        for table in ('book_genres', 'book_kinds', 'book_keywords', 'book_imgs')
+    )
+    assert response.status_code == 200
+
+
+def test_get_all_books_with_include_returns_all_fields_and_only_included_relationships(
+    client: FlaskClient,
+):
+    response = client.get('/books?include=book_imgs,book_keywords')
+    response_data = json.loads(response.data)
+
+    assert set(response_data['data'][1]) == {
+        'id',
+        'name',
+        'price',
+        'author',
+        'release_year',
+        'book_keywords',
+        'book_imgs',
+    }
+    assert response_data['data'][1]['book_imgs'] == [
+        {'id': 2, 'img_url': 'http://localhost:5000/books/photos/test2.jpg'}
+    ]
+    assert response.status_code == 200
+
+
+def test_get_all_books_with_sort_breaks_ties_by_id(client: FlaskClient):
+    response = client.get('/books?sort=price_desc&fields=id,price&include=&per_page=4')
+    response_data = json.loads(response.data)
+
+    assert [book['id'] for book in response_data['data']] == [2, 26, 25, 24]
+    assert response_data['page'] == 1
+    assert response.status_code == 200
+
+    response = client.get('/books?sort=newest&fields=id&include=&per_page=3&page=9')
+    response_data = json.loads(response.data)
+
+    assert [book['id'] for book in response_data['data']] == [2, 1]
+
+
+def test_get_all_books_using_cursor_walks_every_book_once(client: FlaskClient):
+    for sort in ('id', 'name', 'newest', 'price_asc', 'price_desc', 'release_year'):
+        response = client.get(f'/books?sort={sort}&fields=id&include=&per_page=7&after=')
+        response_data = json.loads(response.data)
+        ids = [book['id'] for book in response_data['data']]
+
+        while response_data['has_next']:
+            assert 'after=' in response_data['next_page']
+
+            response = client.get(response_data['next_page'])
+            response_data = json.loads(response.data)
+            ids += [book['id'] for book in response_data['data']]
+
+        offset_response = client.get(f'/books?sort={sort}&fields=id&include=&per_page=26')
+        offset_data = json.loads(offset_response.data)
+
+        assert ids == [book['id'] for book in offset_data['data']]
+        assert response_data['next_cursor'] is None
+        assert response.status_code == 200
+
+
+def test_when_try_to_get_books_with_invalid_sort_or_cursor_returns_error_response(
+    client: FlaskClient,
+):
+    response = client.get('/books?sort=author')
+    response_data = json.loads(response.data)
+
+    assert response_data['code'] == 'InvalidDataSent'
+    assert response.status_code == 400
+
+    response = client.get('/books?sort=price_asc&per_page=2&after=')
+    next_cursor = json.loads(response.data)['next_cursor']
+
+    for after in ('not-a-cursor', next_cursor):
+        response = client.get(f'/books?sort=name&after={after}')
+        response_data = json.loads(response.data)
+
+        assert response_data['code'] == 'InvalidPaginationCursor'
+        assert response.status_code == 400
+
+
+def test_when_try_to_get_books_with_invalid_fields_returns_error_response(client: FlaskClient):
+    response = client.get('/books?fields=name,password&include=users')
+    response_data = json.loads(response.data)
+
+    expected_data = {
+        'scope': 'GeneralException',
+        'code': 'InvalidDataSent',
+        'message': 'Invalid data sent',
+        'status': 400,
+    }
+
+    for key, value in expected_data.items():
+        assert response_data[key] == value
+
+    assert len(response_data['detail']) == 2
+    assert response.status_code == 400
+
+
+def test_get_books_by_ids(client: FlaskClient):
+    response = client.get('/books?ids=2,100,1&fields=name&include=')
+    response_data = json.loads(response.data)
+
+    expected_data = {
+        'data': [
+            {'id': 2, 'name': 'Herdeiro do Império'},
+            None,
+            {'id': 1, 'name': 'O Pequeno Príncipe'},
+        ],
+        'not_found': [100],
+    }
+
+    assert response_data == expected_data
+    assert response.status_code == 200
+
+
+def test_get_books_by_ids_ignores_pagination_args(client: FlaskClient):
+    response = client.get('/books?ids=1&fields=name&include=&per_page=1000&page=a')
+    response_data = json.loads(response.data)
+
+    assert response_data == {'data': [{'id': 1, 'name': 'O Pequeno Príncipe'}], 'not_found': []}
+    assert response.status_code == 200
+
+
+def test_get_books_by_ids_runs_a_single_query_for_the_books(client: FlaskClient, app: Flask):
+    statements: list[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', count_statement)
+
+    response = client.get(f'/books?ids={",".join(str(i) for i in range(1, 21))}')
+    response_data = json.loads(response.data)
+
+    assert [book['id'] for book in response_data['data']] == list(range(1, 21))
+    assert len([statement for statement in statements if 'FROM books' in statement]) == 1
+    assert len([statement for statement in statements if 'FROM book_imgs' in statement]) == 1
+    assert response.status_code == 200
+
+
+def test_when_try_to_get_books_by_ids_with_invalid_ids_returns_error_response(
+    client: FlaskClient, app: Flask
+):
+    max_qty = app.config['BOOK_MULTI_GET_MAX_IDS']
+
+    for ids in ('', 'a,1', '0', ','.join(['1'] * (max_qty + 1))):
+        response = client.get(f'/books?ids={ids}')
+        response_data = json.loads(response.data)
+
+        expected_data = {
+            'scope': 'GeneralException',
+            'code': 'InvalidDataSent',
+            'message': 'Invalid data sent',
+            'status': 400,
+        }
+
+        for key, value in expected_data.items():
+            assert response_data[key] == value
+
+        assert response.status_code == 400
+
+
 def test_when_try_to_get_book_does_not_exist_return_error_response(client: FlaskClient):
     book_id = 100
 
@@ -456,9 +734,10 @@ def test_create_book(client: FlaskClient, access_token: str, app: Flask):
         ]
 
     dir = 'tests/uploads'
-    for filename in os.listdir(dir):
-        if filename not in ('test.jpg', 'test2.jpg'):
-            assert os.path.isfile(os.path.join(dir, filename))
+    with app.app_context():
+        for book_img in response_data['book_imgs']:
+            filename = os.path.basename(book_img['img_url'])
+            assert os.path.isfile(ImageStorage.get_path(dir, filename))
 
 
 def test_when_try_to_create_book_without_data_returns_error_response(
@@ -1369,6 +1648,55 @@ def test_when_try_to_create_book_with_id_book_genre_from_book_genre_does_not_exi
     assert response.status_code == 404
 
 
+def test_when_try_to_create_book_with_id_book_genre_deleted_by_another_worker_returns_error_response(
+    client: FlaskClient, access_token: str, app: Flask
+):
+    headers = {
+        'Authorization': f'Bearer {access_token}',
+        'Content-Type': 'multipart/form-data',
+    }
+
+    # Loads the snapshot of the book genres before the other worker deletes the row, which also
+    # bumps the version of the book genres
+    assert client.get('/bookGenres/2').status_code == 200
+
+    with app.app_context():
+        db.session.execute(text("DELETE FROM book_genres WHERE id = 2"))
+        db.session.execute(
+            text(
+                "INSERT INTO reference_data_versions (table_name, version) VALUES ('book_genres', 1)"
+            )
+        )
+        db.session.commit()
+
+    invalid_data = {
+        'name': 'O Poderoso Chefão',
+        'price': 49.99,
+        'author': 'Mario Puzo',
+        'release_year': 1969,
+        'id_book_kind': '1',
+        'id_book_genre': '2',
+        'keywords': 'drama;máfia;itália',
+        'imgs': [(open('tests/resources/img-417kb.png', 'rb'), 'image.png')],
+    }
+
+    response = client.post('/books', headers=headers, data=invalid_data)
+    response_data = json.loads(response.data)
+
+    expected_data = {
+        'scope': 'BookGenreException',
+        'code': 'BookGenreDoesntExist',
+        'message': 'The book genre 2 does not exist',
+        'status': 404,
+    }
+
+    for key, value in expected_data.items():
+        assert response_data[key] == value
+
+    assert datetime.fromisoformat(response_data['timestamp'])
+    assert response.status_code == 404
+
+
 def test_when_try_to_create_book_with_invalid_keywords_returns_error_response(
     client: FlaskClient, access_token: str
 ):
@@ -1484,6 +1812,51 @@ def test_when_try_to_create_book_with_invalid_keywords_returns_error_response(
     assert response.status_code == 400
 
 
+def test_when_try_to_create_book_with_invalid_img_content_returns_error_response(
+    client: FlaskClient, access_token: str
+):
+    headers = {
+        'Authorization': f'Bearer {access_token}',
+        'Content-Type': 'multipart/form-data',
+    }
+
+    huge_png_header = b'\x89PNG\r\n\x1a\n' + struct.pack('>I4sII', 13, b'IHDR', 50000, 50000)
+    invalid_imgs = (
+        (open('tests/resources/text-2mb.txt', 'rb'), 'The provided file is not an image'),
+        (io.BytesIO(huge_png_header), 'The provided image has more than 50000000 pixels'),
+    )
+
+    for img, message in invalid_imgs:
+        invalid_data = {
+            'name': 'O Poderoso Chefão',
+            'price': 49.99,
+            'author': 'Mario Puzo',
+            'release_year': 1969,
+            'id_book_kind': '1',
+            'id_book_genre': '1',
+            'keywords': 'drama;máfia;itália',
+            'imgs': [(img, 'image.png')],
+        }
+
+        response = client.post('/books', headers=headers, data=invalid_data)
+        response_data = json.loads(response.data)
+
+        expected_data = {
+            'scope': 'GeneralException',
+            'code': 'InvalidDataSent',
+            'message': 'Invalid data sent',
+            'detail': [
+                {'loc': ['imgs', 0], 'msg': f'Value error, {message}', 'type': 'value_error'}
+            ],
+            'status': 400,
+        }
+
+        for key, value in expected_data.items():
+            assert response_data[key] == value
+
+        assert response.status_code == 400
+
+
 def test_when_try_to_create_book_with_invalid_imgs_returns_error_response(
     client: FlaskClient, access_token: str
 ):
@@ -1773,6 +2146,35 @@ def test_when_try_to_create_book_already_exists_returns_error_response(
     assert response.status_code == 409
 
 
+def test_when_try_to_create_book_already_exists_does_not_save_its_new_keywords(
+    client: FlaskClient, access_token: str, app: Flask
+):
+    headers = {
+        'Authorization': f'Bearer {access_token}',
+        'Content-Type': 'multipart/form-data',
+    }
+
+    data = {
+        'name': 'O Pequeno Príncipe',
+        'price': 49.99,
+        'author': 'Mario Puzo',
+        'release_year': 1969,
+        'id_book_kind': '1',
+        'id_book_genre': '1',
+        'keywords': 'inédita',
+        'imgs': [(open('tests/resources/img-417kb.png', 'rb'), 'image.png')],
+    }
+
+    response = client.post('/books', headers=headers, data=data)
+
+    assert response.status_code == 409
+
+    with app.app_context():
+        query = text("SELECT COUNT(*) FROM keywords WHERE keyword = 'inédita'")
+
+        assert db.session.execute(query).scalar() == 0
+
+
 def test_delete_book(client: FlaskClient, access_token: str, app: Flask):
     headers = {'Authorization': f'Bearer {access_token}'}
 
@@ -2039,6 +2441,13 @@ def test_when_try_to_update_name_with_name_from_existing_book_returns_error_resp
     assert datetime.fromisoformat(response_data['timestamp'])
     assert response.status_code == 409
 
+    update = {'name': 'O Pequeno Principe'}
+
+    response = client.patch(f'/books/{book_id}', headers=headers, data=update)
+
+    assert json.loads(response.data)['code'] == 'BookAlreadyExists'
+    assert response.status_code == 409
+
     update = {'name': '  o pequeno prínCIpe '}
 
     response = client.patch(f'/books/{book_id}', headers=headers, data=update)
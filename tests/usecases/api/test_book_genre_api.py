@@ -1,5 +1,6 @@
 import json
 from datetime import datetime
+from pathlib import Path
 
 import pytest
 from flask import Flask
@@ -22,10 +23,14 @@ def app():
 
         db.session.execute(
             text(
-                "INSERT INTO users (username, password, img_url) VALUES (:username, :password, :img_url)"
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
             ),
             {
                 'username': 'test',
+                'username_normalized': 'test',
                 'password': generate_password_hash('Senha@123'),
                 'img_url': 'http://localhost:5000/users/photos/test.jpg',
             },
@@ -51,6 +56,42 @@ def access_token(app: Flask) -> str:
         return create_access_token(user)
 
 
+@pytest.fixture()
+def workers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Each worker keeps its own snapshot of the book genres, which needs a database they share
+    monkeypatch.setenv('TEST_DATABASE_URI', f'sqlite:///{tmp_path / "test.db"}')
+    workers = create_app(True), create_app(True)
+
+    with workers[0].app_context():
+        db.create_all()
+
+        db.session.execute(
+            text(
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
+            ),
+            {
+                'username': 'test',
+                'username_normalized': 'test',
+                'password': generate_password_hash('Senha@123'),
+                'img_url': 'http://localhost:5000/users/photos/test.jpg',
+            },
+        )
+        db.session.execute(
+            text("INSERT INTO book_genres (genre) VALUES (:genre)"),
+            [{'genre': 'teste a'}, {'genre': 'teste b'}],
+        )
+        db.session.commit()
+
+    yield workers
+
+    for worker in workers:
+        with worker.app_context():
+            db.engine.dispose()
+
+
 def test_get_all_book_genres_without_page(client: FlaskClient):
     response = client.get('/bookGenres')
     response_data = json.loads(response.data)
@@ -71,6 +112,45 @@ def test_get_all_book_genres_without_page(client: FlaskClient):
     assert response.status_code == 200
 
 
+def test_get_all_book_genres_with_per_page(client: FlaskClient):
+    response = client.get('/bookGenres?per_page=10')
+    response_data = json.loads(response.data)
+
+    expected_data = {
+        'data': [{'genre': f'teste {chr(97 + i)}', 'id': i + 1} for i in range(10)],
+        'has_next': True,
+        'has_prev': False,
+        'next_page': '/bookGenres?per_page=10&page=2',
+        'page': 1,
+        'per_page': 10,
+        'prev_page': None,
+        'total_items': 26,
+        'total_pages': 3,
+    }
+
+    assert response_data == expected_data
+    assert response.status_code == 200
+
+
+def test_when_try_to_get_all_book_genres_with_per_page_above_max_returns_error_response(
+    client: FlaskClient,
+):
+    response = client.get('/bookGenres?per_page=101')
+    response_data = json.loads(response.data)
+
+    expected_data = {
+        'scope': 'GeneralException',
+        'code': 'InvalidPaginationPerPage',
+        'message': 'The items per page must be between 1 and 100',
+        'status': 400,
+    }
+
+    for key, value in expected_data.items():
+        assert response_data[key] == value
+
+    assert response.status_code == 400
+
+
 def test_get_all_book_genres_with_page_1(client: FlaskClient):
     response = client.get('/bookGenres?page=1')
     response_data = json.loads(response.data)
@@ -739,12 +819,13 @@ def test_when_try_to_delete_book_genre_have_linked_book_return_error_response(
             text(
                 """--sql
                 INSERT INTO books
-                    (name, price, author, release_year, id_kind, id_genre)
-                    VALUES (:name, :price, :author, :release_year, :id_kind, :id_genre)
+                    (name, name_normalized, price, author, release_year, id_kind, id_genre)
+                    VALUES (:name, :name_normalized, :price, :author, :release_year, :id_kind, :id_genre)
                 """
             ),
             {
                 'name': 'O Pequeno Príncipe',
+                'name_normalized': 'o pequeno principe',
                 'price': 10.99,
                 'author': 'Antoine de Saint Exupéry',
                 'release_year': 1943,
@@ -799,6 +880,66 @@ def test_when_try_to_delete_book_genre_does_not_exist_return_error_message(
     assert response.status_code == 404
 
 
+@pytest.mark.parametrize('method', ['delete', 'patch'])
+def test_when_try_to_write_book_genre_deleted_by_another_worker_return_error_response(
+    client: FlaskClient, access_token: str, app: Flask, method: str
+):
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    book_genre_id = 26
+
+    # Loads the snapshot of the book genres before the row is deleted behind it
+    assert client.get(f'/bookGenres/{book_genre_id}').status_code == 200
+
+    with app.app_context():
+        db.session.execute(text("DELETE FROM book_genres WHERE id = :id"), {'id': book_genre_id})
+        db.session.commit()
+
+    response = getattr(client, method)(
+        f'/bookGenres/{book_genre_id}', headers=headers, json={'genre': 'teste'}
+    )
+    response_data = json.loads(response.data)
+
+    expected_data = {
+        'scope': 'BookGenreException',
+        'code': 'BookGenreDoesntExist',
+        'message': f'The book genre {book_genre_id} does not exist',
+        'status': 404,
+    }
+
+    for key, value in expected_data.items():
+        assert response_data[key] == value
+
+    assert datetime.fromisoformat(response_data['timestamp'])
+    assert response.status_code == 404
+    assert client.get(f'/bookGenres/{book_genre_id}').status_code == 404
+
+
+def test_book_genres_written_by_another_worker_are_not_served_from_the_snapshot(
+    workers: tuple[Flask, Flask]
+):
+    worker, other_worker = workers
+
+    with other_worker.app_context():
+        headers = {'Authorization': f'Bearer {create_access_token(db.session.get(User, 1))}'}
+
+    client, other_client = worker.test_client(), other_worker.test_client()
+
+    # Loads the snapshot of the book genres before the other worker writes them
+    assert client.get('/bookGenres/1').status_code == 200
+    assert client.get('/bookGenres/2').status_code == 200
+
+    response = other_client.patch('/bookGenres/1', headers=headers, json={'genre': 'renomeado'})
+    assert response.status_code == 200
+
+    response = other_client.delete('/bookGenres/2', headers=headers)
+    assert response.status_code == 204
+
+    response = client.get('/bookGenres/1')
+    assert json.loads(response.data)['genre'] == 'renomeado'
+    assert client.get('/bookGenres/2').status_code == 404
+
+
 def test_when_try_to_delete_book_genre_without_auth_return_error_response(client: FlaskClient):
     response = client.delete('/bookGenres/1')
     response_data = json.loads(response.data)
@@ -1,6 +1,8 @@
+import io
 import json
 import os
 import shutil
+import struct
 from datetime import datetime
 
 import pytest
@@ -13,6 +15,7 @@ from werkzeug.security import generate_password_hash
 from app import create_app
 from db import db
 from model import BookImg, User
+from utils.file.storage import ImageStorage
 
 
 @pytest.fixture()
@@ -24,10 +27,14 @@ def app():
 
         db.session.execute(
             text(
-                "INSERT INTO users (username, password, img_url) VALUES (:username, :password, :img_url)"
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
             ),
             {
                 'username': 'test',
+                'username_normalized': 'test',
                 'password': generate_password_hash('Senha@123'),
                 'img_url': 'http://localhost:5000/users/photos/test.jpg',
             },
@@ -42,13 +49,14 @@ def app():
             text(
                 """--sql
                 INSERT INTO books
-                    (name, price, author, release_year, id_kind, id_genre)
-                    VALUES (:name, :price, :author, :release_year, :id_kind, :id_genre)
+                    (name, name_normalized, price, author, release_year, id_kind, id_genre)
+                    VALUES (:name, :name_normalized, :price, :author, :release_year, :id_kind, :id_genre)
                 """
             ),
             [
                 {
                     'name': 'O Pequeno Príncipe',
+                    'name_normalized': 'o pequeno principe',
                     'price': 10.99,
                     'author': 'Antoine de Saint Exupéry',
                     'release_year': 1943,
@@ -57,6 +65,7 @@ def app():
                 },
                 {
                     'name': 'O Poderoso Chefão',
+                    'name_normalized': 'o poderoso chefao',
                     'price': 20.99,
                     'author': 'Mario Puzo',
                     'release_year': 1969,
@@ -65,6 +74,7 @@ def app():
                 },
                 {
                     'name': 'Livro',
+                    'name_normalized': 'livro',
                     'price': 20,
                     'author': 'Autor da Silva',
                     'release_year': 2000,
@@ -100,7 +110,9 @@ def clean_uploads():
     for file in os.listdir(dir):
         path = os.path.join(dir, file)
 
-        if file != 'test.jpg':
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif file != 'test.jpg':
             os.remove(path)
 
     if not os.path.exists('tests/uploads/test2.jpg'):
@@ -342,9 +354,9 @@ def test_update_book_img(client: FlaskClient, access_token: str, app: Flask):
 
     assert 'test2.jpg' not in os.listdir(dir)
 
-    for filename in os.listdir(dir):
-        if filename != 'test.jpg':
-            assert os.path.isfile(os.path.join(dir, filename))
+    with app.app_context():
+        filename = os.path.basename(response_data['img_url'])
+        assert os.path.isfile(ImageStorage.get_path(dir, filename))
 
     with app.app_context():
         book_img = db.session.get(BookImg, img_id)
@@ -652,9 +664,9 @@ def test_add_book_img(client: FlaskClient, access_token: str, app: Flask):
     assert response.status_code == 201
 
     dir = 'tests/uploads'
-    for filename in os.listdir(dir):
-        if filename not in ('test.jpg', 'test2.jpg'):
-            assert os.path.isfile(os.path.join(dir, filename))
+    with app.app_context():
+        filename = os.path.basename(response_data['img_url'])
+        assert os.path.isfile(ImageStorage.get_path(dir, filename))
 
     with app.app_context():
         book_img = db.session.get(BookImg, expected_data['id'])
@@ -858,6 +870,38 @@ def test_when_try_to_create_book_img_with_invalid_data_returns_error_response(
     assert response.status_code == 400
 
 
+def test_when_try_to_create_book_img_with_invalid_img_content_returns_error_response(
+    client: FlaskClient, access_token: str
+):
+    headers = {'Authorization': f'Bearer {access_token}'}
+    book_id = 1
+
+    huge_png_header = b'\x89PNG\r\n\x1a\n' + struct.pack('>I4sII', 13, b'IHDR', 50000, 50000)
+    invalid_imgs = (
+        (open('tests/resources/text-2mb.txt', 'rb'), 'The provided file is not an image'),
+        (io.BytesIO(huge_png_header), 'The provided image has more than 50000000 pixels'),
+    )
+
+    for img, message in invalid_imgs:
+        data = {'img': (img, 'image.png')}
+
+        response = client.post(f'/books/{book_id}/photos', headers=headers, data=data)
+        response_data = json.loads(response.data)
+
+        expected_data = {
+            'scope': 'GeneralException',
+            'code': 'InvalidDataSent',
+            'message': 'Invalid data sent',
+            'detail': [{'loc': ['img'], 'msg': f'Value error, {message}', 'type': 'value_error'}],
+            'status': 400,
+        }
+
+        for key, value in expected_data.items():
+            assert response_data[key] == value
+
+        assert response.status_code == 400
+
+
 def test_when_try_to_create_book_img_without_auth_returns_error_response(client: FlaskClient):
     book_id = 1
 
@@ -5,12 +5,12 @@ import pytest
 from flask import Flask
 from flask.testing import FlaskClient
 from flask_jwt_extended import create_access_token
-from sqlalchemy import text
+from sqlalchemy import select, text
 from werkzeug.security import generate_password_hash
 
 from app import create_app
 from db import db
-from model import BookKeyword, User
+from model import BookKeyword, Keyword, User
 
 
 @pytest.fixture()
@@ -22,10 +22,14 @@ def app():
 
         db.session.execute(
             text(
-                "INSERT INTO users (username, password, img_url) VALUES (:username, :password, :img_url)"
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
             ),
             {
                 'username': 'test',
+                'username_normalized': 'test',
                 'password': generate_password_hash('Senha@123'),
                 'img_url': 'http://localhost:5000/users/photos/test.jpg',
             },
@@ -40,13 +44,14 @@ def app():
             text(
                 """--sql
                 INSERT INTO books
-                    (name, price, author, release_year, id_kind, id_genre)
-                    VALUES (:name, :price, :author, :release_year, :id_kind, :id_genre)
+                    (name, name_normalized, price, author, release_year, id_kind, id_genre)
+                    VALUES (:name, :name_normalized, :price, :author, :release_year, :id_kind, :id_genre)
                 """
             ),
             [
                 {
                     'name': 'O Pequeno Príncipe',
+                    'name_normalized': 'o pequeno principe',
                     'price': 10.99,
                     'author': 'Antoine de Saint Exupéry',
                     'release_year': 1943,
@@ -55,6 +60,7 @@ def app():
                 },
                 {
                     'name': 'O Poderoso Chefão',
+                    'name_normalized': 'o poderoso chefao',
                     'price': 20.99,
                     'author': 'Mario Puzo',
                     'release_year': 1969,
@@ -64,14 +70,28 @@ def app():
             ],
         )
 
+        book_keywords = [
+            {'keyword': 'dramático', 'id_book': 1},
+            {'keyword': 'infantil', 'id_book': 1},
+            {'keyword': 'máfia', 'id_book': 2},
+        ]
+
         db.session.execute(
-            text("INSERT INTO book_keywords (keyword, id_book) VALUES (:keyword, :id_book)"),
+            text("INSERT INTO keywords (keyword) VALUES (:keyword)"),
             [
-                {'keyword': 'dramático', 'id_book': 1},
-                {'keyword': 'infantil', 'id_book': 1},
-                {'keyword': 'máfia', 'id_book': 2},
+                {'keyword': keyword}
+                for keyword in dict.fromkeys(row['keyword'] for row in book_keywords)
             ],
         )
+        db.session.execute(
+            text(
+                """--sql
+                INSERT INTO book_keywords (id_book, id_keyword)
+                    SELECT :id_book, id FROM keywords WHERE keyword = :keyword
+                """
+            ),
+            book_keywords,
+        )
 
         db.session.commit()
 
@@ -114,6 +134,93 @@ def test_add_book_keyword_in_lowercase(client: FlaskClient, access_token: str, a
         assert book_keyword.id_book == book_id
 
 
+def test_add_book_keyword_reuses_the_keyword_of_other_books(
+    client: FlaskClient, access_token: str, app: Flask
+):
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    response = client.post('/books/2/keywords', headers=headers, json={'keyword': 'Infantil'})
+
+    assert json.loads(response.data) == {'id': 4, 'keyword': 'infantil'}
+    assert response.status_code == 201
+
+    with app.app_context():
+        keywords = db.session.scalars(select(Keyword).filter_by(keyword='infantil')).all()
+        book_keyword = db.session.get(BookKeyword, 4)
+
+        assert len(keywords) == 1
+        assert book_keyword is not None
+        assert book_keyword.id_keyword == keywords[0].id
+
+    response = client.get('/search', json={'query': 'infantil'})
+
+    assert [book['id'] for book in json.loads(response.data)['data']] == [1, 2]
+
+
+def test_when_try_to_add_a_keyword_the_book_already_has_returns_error_response(
+    client: FlaskClient, access_token: str
+):
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    response = client.post('/books/1/keywords', headers=headers, json={'keyword': 'infantil'})
+    response_data = json.loads(response.data)
+
+    assert response_data['code'] == 'BookAlreadyHasThisKeyword'
+    assert response_data['scope'] == 'BookKeywordException'
+    assert response_data['message'] == 'The book 1 already has the keyword infantil'
+    assert response.status_code == 409
+
+
+def test_added_book_keyword_is_suggested_by_search(client: FlaskClient, access_token: str):
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    response = client.get('/search/suggest?q=emo')
+
+    assert json.loads(response.data) == {'suggestions': []}
+
+    response = client.post('/books/1/keywords', headers=headers, json={'keyword': 'emocionante'})
+
+    assert response.status_code == 201
+
+    response = client.get('/search/suggest?q=emo')
+
+    assert json.loads(response.data) == {'suggestions': ['emocionante']}
+
+
+def test_added_book_keyword_corrects_misspelled_searches(client: FlaskClient, access_token: str):
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    response = client.get('/search', json={'query': 'emosionante'})
+
+    assert 'did_you_mean' not in json.loads(response.data)
+
+    client.post('/books/1/keywords', headers=headers, json={'keyword': 'emocionante'})
+
+    response = client.get('/search', json={'query': 'emosionante'})
+    response_data = json.loads(response.data)
+
+    assert response_data['did_you_mean'] == 'emocionante'
+    assert [book['id'] for book in response_data['data']] == [1]
+
+
+def test_added_book_keyword_invalidates_cached_search_results(
+    client: FlaskClient, access_token: str
+):
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    response = client.get('/search', json={'query': 'emocionante'})
+
+    assert json.loads(response.data)['data'] == []
+
+    response = client.post('/books/1/keywords', headers=headers, json={'keyword': 'emocionante'})
+
+    assert response.status_code == 201
+
+    response = client.get('/search', json={'query': 'emocionante'})
+
+    assert [book['id'] for book in json.loads(response.data)['data']] == [1]
+
+
 def test_add_book_keyword_with_space_and_in_uppercase(
     client: FlaskClient, access_token: str, app: Flask
 ):
@@ -429,6 +536,22 @@ def test_delete_book_keyword(client: FlaskClient, access_token: str, app: Flask)
         assert book_keyword is None
 
 
+def test_deleted_book_keyword_is_not_suggested_by_search(client: FlaskClient, access_token: str):
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    response = client.get('/search/suggest?q=inf')
+
+    assert json.loads(response.data) == {'suggestions': ['infantil']}
+
+    response = client.delete('/books/1/keywords/2', headers=headers)
+
+    assert response.status_code == 204
+
+    response = client.get('/search/suggest?q=inf')
+
+    assert json.loads(response.data) == {'suggestions': []}
+
+
 def test_when_try_to_delete_book_keyword_without_auth_return_error_response(client: FlaskClient):
     headers = {'Content-Type': 'application/json'}
 
@@ -1,5 +1,6 @@
 import json
 from datetime import datetime
+from pathlib import Path
 
 import pytest
 from flask import Flask
@@ -22,10 +23,14 @@ def app():
 
         db.session.execute(
             text(
-                "INSERT INTO users (username, password, img_url) VALUES (:username, :password, :img_url)"
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
             ),
             {
                 'username': 'test',
+                'username_normalized': 'test',
                 'password': generate_password_hash('Senha@123'),
                 'img_url': 'http://localhost:5000/users/photos/test.jpg',
             },
@@ -51,6 +56,42 @@ def access_token(app: Flask) -> str:
         return create_access_token(user)
 
 
+@pytest.fixture()
+def workers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Each worker keeps its own snapshot of the book kinds, which needs a database they share
+    monkeypatch.setenv('TEST_DATABASE_URI', f'sqlite:///{tmp_path / "test.db"}')
+    workers = create_app(True), create_app(True)
+
+    with workers[0].app_context():
+        db.create_all()
+
+        db.session.execute(
+            text(
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
+            ),
+            {
+                'username': 'test',
+                'username_normalized': 'test',
+                'password': generate_password_hash('Senha@123'),
+                'img_url': 'http://localhost:5000/users/photos/test.jpg',
+            },
+        )
+        db.session.execute(
+            text("INSERT INTO book_kinds (kind) VALUES (:kind)"),
+            [{'kind': 'teste a'}, {'kind': 'teste b'}],
+        )
+        db.session.commit()
+
+    yield workers
+
+    for worker in workers:
+        with worker.app_context():
+            db.engine.dispose()
+
+
 def test_get_all_book_kinds_without_page(client: FlaskClient):
     response = client.get('/bookKinds')
     response_data = json.loads(response.data)
@@ -745,12 +786,13 @@ def test_when_try_to_delete_book_kind_have_linked_book_return_error_response(
             text(
                 """--sql
                 INSERT INTO books
-                    (name, price, author, release_year, id_kind, id_genre)
-                    VALUES (:name, :price, :author, :release_year, :id_kind, :id_genre)
+                    (name, name_normalized, price, author, release_year, id_kind, id_genre)
+                    VALUES (:name, :name_normalized, :price, :author, :release_year, :id_kind, :id_genre)
                 """
             ),
             {
                 'name': 'O Pequeno Príncipe',
+                'name_normalized': 'o pequeno principe',
                 'price': 10.99,
                 'author': 'Antoine de Saint Exupéry',
                 'release_year': 1943,
@@ -804,6 +846,31 @@ def test_when_try_to_delete_book_kind_does_not_exist_return_error_message(
     assert response.status_code == 404
 
 
+def test_book_kinds_written_by_another_worker_are_not_served_from_the_snapshot(
+    workers: tuple[Flask, Flask]
+):
+    worker, other_worker = workers
+
+    with other_worker.app_context():
+        headers = {'Authorization': f'Bearer {create_access_token(db.session.get(User, 1))}'}
+
+    client, other_client = worker.test_client(), other_worker.test_client()
+
+    # Loads the snapshot of the book kinds before the other worker writes them
+    assert client.get('/bookKinds/1').status_code == 200
+    assert client.get('/bookKinds/2').status_code == 200
+
+    response = other_client.patch('/bookKinds/1', headers=headers, json={'kind': 'renomeado'})
+    assert response.status_code == 200
+
+    response = other_client.delete('/bookKinds/2', headers=headers)
+    assert response.status_code == 204
+
+    response = client.get('/bookKinds/1')
+    assert json.loads(response.data)['kind'] == 'renomeado'
+    assert client.get('/bookKinds/2').status_code == 404
+
+
 def test_when_try_to_delete_book_kind_without_auth_return_error_response(client: FlaskClient):
     response = client.delete('/bookKinds/1')
     response_data = json.loads(response.data)
@@ -0,0 +1,234 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+from flask import Flask
+from flask_jwt_extended import create_access_token
+from sqlalchemy import text
+from werkzeug.security import generate_password_hash
+
+from app import create_app
+from db import db
+from model import User
+
+CONCURRENT_REQUESTS = 8
+
+
+@pytest.fixture()
+def app(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Each thread needs its own connection, which an in-memory database can't give
+    monkeypatch.setenv('TEST_DATABASE_URI', f'sqlite:///{tmp_path / "test.db"}')
+    app = create_app(True)
+    app.config['USER_PHOTOS_UPLOAD_DIR'] = str(tmp_path / 'users_photos')
+    app.config['BOOK_PHOTOS_UPLOAD_DIR'] = str(tmp_path / 'books_photos')
+
+    with app.app_context():
+        db.create_all()
+
+        db.session.execute(text("INSERT INTO book_genres (genre) VALUES ('fábula')"))
+        db.session.execute(text("INSERT INTO book_kinds (kind) VALUES ('físico')"))
+        db.session.execute(text("INSERT INTO keywords (keyword) VALUES ('aventura')"))
+
+        db.session.execute(
+            text(
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
+            ),
+            {
+                'username': 'test',
+                'username_normalized': 'test',
+                'password': generate_password_hash('Senha@123'),
+                'img_url': 'http://localhost:5000/users/photos/test.jpg',
+            },
+        )
+        db.session.commit()
+
+    yield app
+
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture()
+def access_token(app: Flask) -> str:
+    with app.app_context():
+        user = db.session.get(User, 1)
+        return create_access_token(user)
+
+
+def create_book_data(name: str = 'Novo Livro', keywords: str = 'aventura') -> dict[str, Any]:
+    return {
+        'data': {
+            'name': name,
+            'price': 49.99,
+            'author': 'Autor',
+            'release_year': 2000,
+            'id_book_kind': '1',
+            'id_book_genre': '1',
+            'keywords': keywords,
+            'imgs': [(open('tests/resources/img-417kb.png', 'rb'), 'image.png')],
+        }
+    }
+
+
+def create_user_data() -> dict[str, Any]:
+    return {
+        'data': {
+            'username': 'novo_usuario',
+            'password': 'Senha@123',
+            'img': (open('tests/resources/img-417kb.png', 'rb'), 'image.png'),
+        }
+    }
+
+
+def send_concurrently(
+    app: Flask, method: str, headers: dict, create_request: Callable[[int], tuple[str, dict]]
+) -> list[tuple[int, dict]]:
+    barrier = threading.Barrier(CONCURRENT_REQUESTS)
+    responses: list[tuple[int, dict]] = []
+
+    def send(i: int) -> None:
+        client = app.test_client()
+        # Each request reads its own files
+        url, body = create_request(i)
+        barrier.wait()
+        response = client.open(url, method=method, headers=headers, **body)
+        responses.append((response.status_code, json.loads(response.data)))
+
+    threads = [threading.Thread(target=send, args=(i,)) for i in range(CONCURRENT_REQUESTS)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return responses
+
+
+@pytest.mark.parametrize(
+    'url, create_body, error_code, table, authenticated',
+    [
+        (
+            '/bookGenres',
+            lambda: {'json': {'genre': 'novo gênero'}},
+            'BookGenreAlreadyExists',
+            'book_genres',
+            True,
+        ),
+        (
+            '/bookKinds',
+            lambda: {'json': {'kind': 'novo tipo'}},
+            'BookKindAlreadyExists',
+            'book_kinds',
+            True,
+        ),
+        ('/books', create_book_data, 'BookAlreadyExists', 'books', True),
+        ('/users', create_user_data, 'UserAlreadyExists', 'users', False),
+    ],
+)
+def test_concurrent_duplicate_creates_only_create_once(
+    app: Flask,
+    access_token: str,
+    url: str,
+    create_body: Callable[[], dict[str, Any]],
+    error_code: str,
+    table: str,
+    authenticated: bool,
+):
+    headers = {'Authorization': f'Bearer {access_token}'} if authenticated else {}
+    rows_before = get_rows(app, table)
+
+    responses = send_concurrently(app, 'POST', headers, lambda i: (url, create_body()))
+    status_codes = sorted(status_code for status_code, _ in responses)
+
+    assert status_codes == [201] + [409] * (CONCURRENT_REQUESTS - 1)
+    assert all(data['code'] == error_code for status_code, data in responses if status_code == 409)
+
+    assert get_rows(app, table) == rows_before + 1
+
+
+def get_rows(app: Flask, table: str) -> int:
+    with app.app_context():
+        return db.session.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+
+
+def test_concurrent_renames_to_the_same_name_only_rename_once(app: Flask, access_token: str):
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    with app.app_context():
+        db.session.execute(
+            text("INSERT INTO book_genres (genre) VALUES (:genre)"),
+            [{'genre': f'gênero {i}'} for i in range(CONCURRENT_REQUESTS)],
+        )
+        db.session.commit()
+
+    # The genre 1 is the fixture one, so each request renames another genre
+    responses = send_concurrently(
+        app,
+        'PATCH',
+        headers,
+        lambda i: (f'/bookGenres/{i + 2}', {'json': {'genre': 'mesmo gênero'}}),
+    )
+    status_codes = sorted(status_code for status_code, _ in responses)
+
+    assert status_codes == [200] + [409] * (CONCURRENT_REQUESTS - 1)
+    assert all(
+        data['code'] == 'BookGenreAlreadyExists'
+        for status_code, data in responses
+        if status_code == 409
+    )
+
+
+def test_concurrent_creates_with_the_same_new_keyword_create_it_once(app: Flask, access_token: str):
+    headers = {'Authorization': f'Bearer {access_token}'}
+    names = ['Livro ' + chr(ord('a') + i) for i in range(CONCURRENT_REQUESTS)]
+
+    responses = send_concurrently(
+        app,
+        'POST',
+        headers,
+        lambda i: ('/books', create_book_data(names[i], 'aventura;inédita')),
+    )
+
+    assert [status_code for status_code, _ in responses] == [201] * CONCURRENT_REQUESTS
+
+    with app.app_context():
+        keywords = db.session.execute(text("SELECT keyword FROM keywords ORDER BY id")).scalars()
+
+        assert list(keywords) == ['aventura', 'inédita']
+
+
+def test_concurrent_adds_of_the_same_book_keyword_only_add_once(app: Flask, access_token: str):
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    response = app.test_client().post('/books', headers=headers, **create_book_data())
+    assert response.status_code == 201
+
+    responses = send_concurrently(
+        app, 'POST', headers, lambda i: ('/books/1/keywords', {'json': {'keyword': 'nova'}})
+    )
+    status_codes = sorted(status_code for status_code, _ in responses)
+
+    assert status_codes == [201] + [409] * (CONCURRENT_REQUESTS - 1)
+    assert all(
+        data['code'] == 'BookAlreadyHasThisKeyword'
+        for status_code, data in responses
+        if status_code == 409
+    )
+
+    with app.app_context():
+        query = text(
+            """--sql
+            SELECT keywords.keyword FROM book_keywords
+                JOIN keywords ON keywords.id = book_keywords.id_keyword
+                WHERE book_keywords.id_book = 1
+                ORDER BY keywords.keyword
+            """
+        )
+
+        assert list(db.session.execute(query).scalars()) == ['aventura', 'nova']
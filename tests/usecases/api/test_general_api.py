@@ -1,3 +1,4 @@
+import gzip
 import json
 import os
 from datetime import datetime
@@ -116,3 +117,65 @@ def test_request_OPTIONS_HTTP_METHOD(client: FlaskClient):
 
     assert not response.data
     assert response.status_code == 204
+
+
+@pytest.fixture()
+def genres_client(test_app: Flask) -> FlaskClient:
+    test_app.config['COMPRESSION_MIN_SIZE'] = 512
+
+    with test_app.app_context():
+        db.create_all()
+        db.session.execute(
+            text("INSERT INTO book_genres (genre) VALUES (:genre)"),
+            [{'genre': f'gênero de teste {i}'} for i in range(1, 21)],
+        )
+        db.session.commit()
+
+    return test_app.test_client()
+
+
+def test_when_accept_gzip_returns_compressed_json_response(genres_client: FlaskClient):
+    response = genres_client.get('/bookGenres', headers={'Accept-Encoding': 'gzip'})
+    response_data = json.loads(gzip.decompress(response.data))
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert len(response_data['data']) == 20
+    assert response.status_code == 200
+
+
+def test_when_do_not_accept_compression_returns_identity_json_response(
+    genres_client: FlaskClient,
+):
+    response = genres_client.get('/bookGenres', headers={'Accept-Encoding': 'identity'})
+    response_data = json.loads(response.data)
+
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert len(response_data['data']) == 20
+
+
+def test_when_accept_gzip_with_quality_0_returns_identity_json_response(
+    genres_client: FlaskClient,
+):
+    response = genres_client.get('/bookGenres', headers={'Accept-Encoding': 'gzip;q=0'})
+
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_when_response_is_smaller_than_min_size_returns_identity_json_response(
+    genres_client: FlaskClient,
+):
+    response = genres_client.get('/bookGenres/1', headers={'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_when_request_the_same_payload_twice_reuses_compressed_body(
+    test_app: Flask, genres_client: FlaskClient
+):
+    first_response = genres_client.get('/bookGenres', headers={'Accept-Encoding': 'gzip'})
+    second_response = genres_client.get('/bookGenres', headers={'Accept-Encoding': 'gzip'})
+
+    assert first_response.data == second_response.data
+    assert test_app.extensions['compression_cache'].hits == 1
@@ -0,0 +1,144 @@
+import json
+import os
+import time
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import text
+from werkzeug.datastructures import FileStorage
+
+from app import create_app
+from db import db
+from utils.file.storage import ImageStorage
+
+
+@pytest.fixture()
+def app():
+    app = create_app(True)
+
+    with app.app_context():
+        db.create_all()
+
+        db.session.execute(
+            text("INSERT INTO book_genres (genre) VALUES (:genre)"),
+            [{'genre': f'teste {chr(97 + i)}'} for i in range(3)],
+        )
+        db.session.commit()
+
+    yield app
+
+
+@pytest.fixture()
+def client(app: Flask) -> FlaskClient:
+    return app.test_client()
+
+
+def get_samples(client: FlaskClient) -> dict[str, float]:
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.content_type == 'text/plain; version=0.0.4; charset=utf-8'
+
+    return {
+        sample: float(value)
+        for sample, value in (
+            line.rsplit(' ', 1) for line in response.data.decode().splitlines() if line[0] != '#'
+        )
+    }
+
+
+def test_get_metrics_counts_requests_by_endpoint_and_status(client: FlaskClient):
+    client.get('/bookGenres')
+    client.get('/bookGenres')
+    client.get('/bookGenres/100')
+
+    samples = get_samples(client)
+    labels = 'blueprint="book_genres",endpoint="book_genres.get_all_book_genres",method="GET"'
+
+    assert samples[f'http_requests_total{{{labels},status="200"}}'] == 2
+    assert (
+        samples[
+            'http_requests_total{blueprint="book_genres",'
+            'endpoint="book_genres.get_book_genre_by_id",method="GET",status="404"}'
+        ]
+        == 1
+    )
+    assert samples[f'http_request_duration_seconds_count{{{labels}}}'] == 2
+    assert samples[f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'] == 2
+    assert samples[f'http_request_duration_seconds_sum{{{labels}}}'] > 0
+
+
+def test_get_metrics_has_cache_hits_and_misses(client: FlaskClient):
+    client.get('/search?q=teste')
+    client.get('/search?q=teste')
+
+    samples = get_samples(client)
+
+    assert samples['cache_misses_total{cache="search_results_cache"}'] == 1
+    assert samples['cache_hits_total{cache="search_results_cache"}'] == 1
+
+
+def test_get_metrics_has_uploaded_bytes(app: Flask, client: FlaskClient, tmp_path: Path):
+    with app.test_request_context():
+        file = FileStorage(BytesIO(b'0' * 10), 'photo.jpg')
+        ImageStorage.save(file, str(tmp_path / 'books_photos'), 'photo.jpg')
+
+    samples = get_samples(client)
+
+    assert samples['upload_bytes_total{dir="books_photos"}'] == 10
+
+
+def test_get_metrics_adds_up_the_worker_processes(app: Flask, client: FlaskClient, tmp_path: Path):
+    app.config['METRICS_MULTIPROCESS_DIR'] = str(tmp_path)
+    labels = [
+        ['blueprint', 'book_genres'],
+        ['endpoint', 'book_genres.get_all_book_genres'],
+        ['method', 'GET'],
+    ]
+    buckets = app.config['METRICS_LATENCY_BUCKETS']
+    histogram = [1] + [0] * len(buckets) + [0.002, 1]
+
+    for pid, age in ((1, 0), (2, 60)):
+        worker_file = tmp_path / f'{pid}.json'
+        worker_file.write_text(
+            json.dumps(
+                {
+                    'buckets': buckets,
+                    'counters': [['http_requests_total', [*labels, ['status', '200']], 3]],
+                    'histograms': [['http_request_duration_seconds', labels, histogram]],
+                    'gauges': [['db_pool_checked_out_connections', [], 2]],
+                }
+            )
+        )
+        os.utime(worker_file, (time.time() - age, time.time() - age))
+
+    client.get('/bookGenres')
+
+    samples = get_samples(client)
+    sample_labels = ','.join(f'{name}="{value}"' for name, value in labels)
+
+    assert samples[f'http_requests_total{{{sample_labels},status="200"}}'] == 7
+    assert samples[f'http_request_duration_seconds_count{{{sample_labels}}}'] == 3
+    assert samples[f'http_request_duration_seconds_bucket{{{sample_labels},le="0.005"}}'] >= 2
+    # The worker that stopped writing its file long ago no longer has connections
+    assert samples['db_pool_checked_out_connections'] == 2
+    assert (tmp_path / f'{os.getpid()}.json').is_file()
+
+
+def test_get_metrics_has_connection_pool_gauges(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv('TEST_DATABASE_URI', f'sqlite:///{tmp_path / "test.db"}')
+    app = create_app(True)
+
+    with app.app_context():
+        db.create_all()
+
+    samples = get_samples(app.test_client())
+
+    assert samples['db_pool_checked_out_connections'] >= 0
+    assert samples['db_pool_overflow_connections'] >= 0
+
+    with app.app_context():
+        db.engine.dispose()
@@ -0,0 +1,105 @@
+import os
+import pstats
+import re
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import text
+
+from app import create_app
+from db import db
+from utils.profiling import RequestProfiler
+
+
+@pytest.fixture()
+def app(tmp_path: Path):
+    app = create_app(True)
+    app.config['PROFILING_ENABLED'] = True
+    app.config['PROFILING_DIR'] = str(tmp_path)
+
+    with app.app_context():
+        db.create_all()
+
+        db.session.execute(
+            text("INSERT INTO book_genres (genre) VALUES (:genre)"),
+            [{'genre': f'teste {chr(97 + i)}'} for i in range(3)],
+        )
+        db.session.commit()
+
+    yield app
+
+
+@pytest.fixture()
+def client(app: Flask) -> FlaskClient:
+    return app.test_client()
+
+
+@pytest.fixture()
+def token(app: Flask) -> str:
+    with app.app_context():
+        return RequestProfiler.create_token()
+
+
+def test_profile_request_with_token(client: FlaskClient, token: str, tmp_path: Path):
+    response = client.get('/bookGenres/1', headers={'X-Profile': token})
+
+    assert response.status_code == 200
+
+    filename = response.headers['X-Profile-File']
+    (profile_file,) = tmp_path.iterdir()
+
+    assert profile_file.name == filename
+    assert re.fullmatch(
+        rf'\d{{8}}T\d{{6}}-{os.getpid()}-[0-9a-f]{{8}}-GET-bookGenres_id-\d+ms\.prof', filename
+    )
+
+    functions = {function for _, _, function in pstats.Stats(str(profile_file)).stats}
+
+    assert 'get_book_genre_by_id' in functions
+
+
+def test_profiles_of_the_same_route_do_not_overwrite_each_other(
+    client: FlaskClient, token: str, tmp_path: Path
+):
+    filenames = {
+        client.get('/bookGenres/1', headers={'X-Profile': token}).headers['X-Profile-File']
+        for _ in range(3)
+    }
+
+    assert len(filenames) == 3
+    assert {profile_file.name for profile_file in tmp_path.iterdir()} == filenames
+
+
+def test_when_token_is_invalid_does_not_profile_request(client: FlaskClient, tmp_path: Path):
+    response = client.get('/bookGenres', headers={'X-Profile': 'invalid'})
+
+    assert response.status_code == 200
+    assert 'X-Profile-File' not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profile_sampled_requests(app: Flask, client: FlaskClient, tmp_path: Path):
+    app.config['PROFILING_SAMPLE_RATE'] = 1
+
+    client.get('/bookGenres')
+    client.get('/unknown')
+
+    filenames = sorted(path.name.split('-', 3)[3] for path in tmp_path.iterdir())
+
+    assert [filename.rsplit('-', 1)[0] for filename in filenames] == [
+        'GET-bookGenres',
+        'GET-unknown',
+    ]
+
+
+def test_when_profiling_is_disabled_does_not_profile_request(
+    app: Flask, client: FlaskClient, token: str, tmp_path: Path
+):
+    app.config['PROFILING_ENABLED'] = False
+
+    response = client.get('/bookGenres', headers={'X-Profile': token})
+
+    assert 'X-Profile-File' not in response.headers
+    assert list(tmp_path.iterdir()) == []
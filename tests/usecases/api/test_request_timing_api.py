@@ -0,0 +1,70 @@
+import json
+import re
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import text
+
+from app import create_app
+from db import db
+
+
+@pytest.fixture()
+def app():
+    app = create_app(True)
+
+    with app.app_context():
+        db.create_all()
+
+        db.session.execute(
+            text("INSERT INTO book_genres (genre) VALUES (:genre)"),
+            [{'genre': f'teste {chr(97 + i)}'} for i in range(3)],
+        )
+        db.session.commit()
+
+    yield app
+
+
+@pytest.fixture()
+def client(app: Flask) -> FlaskClient:
+    return app.test_client()
+
+
+def test_response_has_server_timing_header(client: FlaskClient):
+    response = client.get('/bookGenres')
+
+    assert response.status_code == 200
+    assert re.fullmatch(
+        r'db;dur=\d+\.\d;desc="\d+ queries", serialization;dur=\d+\.\d, total;dur=\d+\.\d',
+        response.headers['Server-Timing'],
+    )
+
+
+def test_response_has_sql_debug_header_with_the_statements(client: FlaskClient):
+    response = client.get('/bookGenres')
+    statements = json.loads(response.headers['X-Debug-SQL'])
+
+    queries = int(re.search(r'"(\d+) queries"', response.headers['Server-Timing']).group(1))
+
+    assert statements[0] == 'SELECT 1'
+    assert any(statement.startswith('SELECT book_genres.id') for statement in statements)
+    assert len(statements) == queries
+
+
+def test_error_response_has_server_timing_header(client: FlaskClient):
+    response = client.get('/bookGenres/100')
+
+    assert response.status_code == 404
+    assert 'Server-Timing' in response.headers
+
+
+def test_timing_headers_can_be_disabled(app: Flask, client: FlaskClient):
+    app.config['SERVER_TIMING'] = False
+    app.config['SQL_DEBUG_HEADER'] = False
+
+    response = client.get('/bookGenres')
+
+    assert response.status_code == 200
+    assert 'Server-Timing' not in response.headers
+    assert 'X-Debug-SQL' not in response.headers
@@ -11,6 +11,7 @@ from werkzeug.security import generate_password_hash
 from app import create_app
 from db import db
 from model import Book, SavedBook, User
+from utils.text import fold_text
 
 
 @pytest.fixture()
@@ -22,10 +23,14 @@ def app():
 
         db.session.execute(
             text(
-                "INSERT INTO users (username, password, img_url) VALUES (:username, :password, :img_url)"
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
             ),
             {
                 'username': 'test',
+                'username_normalized': 'test',
                 'password': generate_password_hash('Senha@123'),
                 'img_url': 'http://localhost:5000/users/photos/test.jpg',
             },
@@ -43,14 +48,15 @@ def app():
             text(
                 """--sql
                 INSERT INTO books
-                    (name, price, author, release_year, id_kind, id_genre)
+                    (name, name_normalized, price, author, release_year, id_kind, id_genre)
                     VALUES
-                        (:name, :price, :author, :release_year, :id_kind, :id_genre)
+                        (:name, :name_normalized, :price, :author, :release_year, :id_kind, :id_genre)
                 """
             ),
             [
                 {
                     'name': f'Livro {chr(97 + i)}',
+                    'name_normalized': fold_text(f'Livro {chr(97 + i)}'),
                     'price': 20,
                     'author': 'Autor da Silva',
                     'release_year': 2000,
@@ -118,6 +124,25 @@ def test_return_all_saved_books_without_page(client: FlaskClient, access_token:
     assert response.status_code == 200
 
 
+def test_return_all_saved_books_with_fields_and_include(client: FlaskClient, access_token: str):
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    response = client.get('/books/saved?fields=name&include=book_genre', headers=headers)
+    response_data = json.loads(response.data)
+
+    expected_data = [
+        {
+            'id': i + 1,
+            'name': f'Livro {chr(97 + i)}',
+            'book_genre': {'genre': 'fábula', 'id': 1},
+        }
+        for i in range(20)
+    ]
+
+    assert response_data['data'] == expected_data
+    assert response.status_code == 200
+
+
 def test_return_all_saved_books_with_page_1(client: FlaskClient, access_token: str):
     headers = {'Authorization': f'Bearer {access_token}'}
 
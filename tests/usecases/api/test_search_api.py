@@ -34,14 +34,15 @@ def app():
             text(
                 """--sql
                 INSERT INTO books
-                    (name, price, author, release_year, id_kind, id_genre)
+                    (name, name_normalized, price, author, release_year, id_kind, id_genre)
                     VALUES
-                        (:name, :price, :author, :release_year, :id_kind, :id_genre)
+                        (:name, :name_normalized, :price, :author, :release_year, :id_kind, :id_genre)
                 """
             ),
             [
                 {
                     'name': 'O Poderoso Chefão',
+                    'name_normalized': 'o poderoso chefao',
                     'price': 50,
                     'author': 'Mario Puzo',
                     'release_year': 1962,
@@ -50,6 +51,7 @@ def app():
                 },
                 {
                     'name': 'O Pequeno Príncipe',
+                    'name_normalized': 'o pequeno principe',
                     'price': 9.99,
                     'author': 'Antoine de Saint Exupéry',
                     'release_year': 1943,
@@ -58,6 +60,7 @@ def app():
                 },
                 {
                     'name': 'O Mundo Perdido',
+                    'name_normalized': 'o mundo perdido',
                     'price': 115.47,
                     'author': 'Árthur Conan Doyle',
                     'release_year': 1912,
@@ -66,6 +69,7 @@ def app():
                 },
                 {
                     'name': '1984',
+                    'name_normalized': '1984',
                     'price': 45.99,
                     'author': 'George Orwell',
                     'release_year': 1949,
@@ -74,6 +78,7 @@ def app():
                 },
                 {
                     'name': 'A Revolução dos Bichos',
+                    'name_normalized': 'a revolucao dos bichos',
                     'price': 5,
                     'author': 'George Orwell',
                     'release_year': 1945,
@@ -82,27 +87,41 @@ def app():
                 },
             ],
         )
+        book_keywords = [
+            {'keyword': 'máfia', 'id_book': 1},
+            {'keyword': 'tiro', 'id_book': 1},
+            {'keyword': 'família', 'id_book': 1},
+            {'keyword': 'itália', 'id_book': 1},
+            {'keyword': 'filosófico', 'id_book': 2},
+            {'keyword': 'infantil', 'id_book': 2},
+            {'keyword': 'clássico', 'id_book': 2},
+            {'keyword': 'fantástico', 'id_book': 3},
+            {'keyword': 'animais', 'id_book': 3},
+            {'keyword': 'ditadura', 'id_book': 4},
+            {'keyword': 'comunismo', 'id_book': 4},
+            {'keyword': 'governo', 'id_book': 4},
+            {'keyword': 'ditadura', 'id_book': 5},
+            {'keyword': 'comunismo', 'id_book': 5},
+            {'keyword': 'governo', 'id_book': 5},
+            {'keyword': 'animais', 'id_book': 5},
+        ]
+
         db.session.execute(
-            text("INSERT INTO book_keywords (keyword, id_book) VALUES (:keyword, :id_book)"),
+            text("INSERT INTO keywords (keyword) VALUES (:keyword)"),
             [
-                {'keyword': 'máfia', 'id_book': 1},
-                {'keyword': 'tiro', 'id_book': 1},
-                {'keyword': 'família', 'id_book': 1},
-                {'keyword': 'itália', 'id_book': 1},
-                {'keyword': 'filosófico', 'id_book': 2},
-                {'keyword': 'infantil', 'id_book': 2},
-                {'keyword': 'clássico', 'id_book': 2},
-                {'keyword': 'fantástico', 'id_book': 3},
-                {'keyword': 'animais', 'id_book': 3},
-                {'keyword': 'ditadura', 'id_book': 4},
-                {'keyword': 'comunismo', 'id_book': 4},
-                {'keyword': 'governo', 'id_book': 4},
-                {'keyword': 'ditadura', 'id_book': 5},
-                {'keyword': 'comunismo', 'id_book': 5},
-                {'keyword': 'governo', 'id_book': 5},
-                {'keyword': 'animais', 'id_book': 5},
+                {'keyword': keyword}
+                for keyword in dict.fromkeys(row['keyword'] for row in book_keywords)
             ],
         )
+        db.session.execute(
+            text(
+                """--sql
+                INSERT INTO book_keywords (id_book, id_keyword)
+                    SELECT :id_book, id FROM keywords WHERE keyword = :keyword
+                """
+            ),
+            book_keywords,
+        )
 
         db.session.commit()
 
@@ -189,6 +208,231 @@ def test_search_books_by_name_using_query(client: FlaskClient):
     assert response.status_code == 200
 
 
+def test_search_books_with_fields_and_include(client: FlaskClient):
+    search = {'query': 'príncipe'}
+
+    response = client.get('/search?fields=name,price&include=book_kind', json=search)
+    response_data = json.loads(response.data)
+
+    expected_data = [
+        {
+            'id': 2,
+            'name': 'O Pequeno Príncipe',
+            'price': 9.99,
+            'book_kind': {'kind': 'ebook', 'id': 1},
+        }
+    ]
+
+    assert response_data['data'] == expected_data
+    assert response.status_code == 200
+
+
+def test_search_books_with_facets(client: FlaskClient):
+    search = {'query': 'george'}
+
+    response = client.get(
+        '/search?fields=name&facets=book_genre,book_kind,release_year,price', json=search
+    )
+    response_data = json.loads(response.data)
+
+    expected_facets = {
+        'book_genre': [{'id': 3, 'genre': 'suspense', 'count': 2}],
+        'book_kind': [
+            {'id': 2, 'kind': 'físico', 'count': 1},
+            {'id': 3, 'kind': 'kindle', 'count': 1},
+        ],
+        'release_year': [
+            {'release_year': 1945, 'count': 1},
+            {'release_year': 1949, 'count': 1},
+        ],
+        'price': [
+            {'min_price': 0, 'max_price': 25, 'count': 1},
+            {'min_price': 25, 'max_price': 50, 'count': 1},
+        ],
+    }
+
+    assert response_data['facets'] == expected_facets
+    assert response_data['total_items'] == 2
+    assert response.status_code == 200
+
+
+def test_search_books_without_facets_does_not_return_facets(client: FlaskClient):
+    response = client.get('/search', json={'query': 'george'})
+    response_data = json.loads(response.data)
+
+    assert 'facets' not in response_data
+    assert response.status_code == 200
+
+
+def test_search_books_with_facets_caches_them_per_normalized_filters(
+    client: FlaskClient, app: Flask
+):
+    client.get('/search?facets=book_kind,book_genre', json={'query': 'George'})
+    response = client.get('/search?facets=book_genre,book_kind', json={'query': ' george '})
+    response_data = json.loads(response.data)
+
+    assert response_data['facets']['book_genre'] == [{'id': 3, 'genre': 'suspense', 'count': 2}]
+    assert app.extensions['search_facets_cache'].hits == 1
+
+
+def test_search_books_caches_results_per_normalized_filters(client: FlaskClient, app: Flask):
+    first_response = client.get('/search', json={'query': 'George', 'max_price': 50})
+    second_response = client.get('/search', json={'query': ' george ', 'max_price': 50.0})
+
+    assert json.loads(first_response.data) == json.loads(second_response.data)
+    assert [book['id'] for book in json.loads(second_response.data)['data']] == [4, 5]
+    assert app.extensions['search_results_cache'].hits == 1
+
+
+def test_search_books_using_query_string(client: FlaskClient):
+    response = client.get('/search?q=george&genre=3&max_price=10')
+    response_data = json.loads(response.data)
+
+    assert [book['id'] for book in response_data['data']] == [5]
+    assert response.headers['Cache-Control'] == 'public, max-age=60'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert response.status_code == 200
+
+    json_response = client.get('/search', json={'query': 'george', 'id_book_genre': 3})
+
+    assert json_response.headers['Cache-Control'] == 'no-store'
+
+
+def test_search_books_using_query_string_redirects_to_canonical_url(client: FlaskClient):
+    response = client.get('/search?page=1&include=book_kind,book_genre&max_price=10.50&q=%20GEORGE')
+
+    assert response.status_code == 301
+    assert response.headers['Location'] == (
+        '/search?q=george&max_price=10.5&include=book_genre,book_kind&page=1'
+    )
+    assert response.headers['Cache-Control'] == 'public, max-age=60'
+
+    response = client.get(response.headers['Location'])
+
+    assert response.status_code == 200
+
+
+def test_search_books_using_query_string_keeps_pagination_urls_canonical(client: FlaskClient):
+    response = client.get('/search?q=o&per_page=2')
+    response_data = json.loads(response.data)
+
+    assert response_data['next_page'] == '/search?q=o&per_page=2&page=2'
+
+    response = client.get(response_data['next_page'])
+
+    assert response.status_code == 200
+
+
+def test_search_books_sorted_by_relevance(client: FlaskClient):
+    response = client.get('/search?q=o&fields=id&include=&sort=relevance')
+    response_data = json.loads(response.data)
+
+    assert [book['id'] for book in response_data['data']] == [1, 2, 3, 5, 4]
+
+    response = client.get('/search?q=george&fields=id&include=&sort=price_desc')
+    response_data = json.loads(response.data)
+
+    assert [book['id'] for book in response_data['data']] == [4, 5]
+
+
+def test_search_books_using_cursor_keeps_the_filters_and_sort(client: FlaskClient):
+    response = client.get('/search?q=o&fields=id&include=&sort=price_asc&after=&per_page=2')
+    response_data = json.loads(response.data)
+    ids = [book['id'] for book in response_data['data']]
+
+    while response_data['has_next']:
+        response = client.get(response_data['next_page'])
+        response_data = json.loads(response.data)
+        ids += [book['id'] for book in response_data['data']]
+
+    assert ids == [5, 2, 4, 1, 3]
+
+    response = client.get('/search?sort=name&q=O')
+
+    assert response.headers['Location'] == '/search?q=o&sort=name'
+
+
+def test_search_books_with_misspelled_query_returns_corrected_results(client: FlaskClient):
+    response = client.get('/search?q=jorge%20orwel&fields=id&include=')
+    response_data = json.loads(response.data)
+
+    assert [book['id'] for book in response_data['data']] == [4, 5]
+    assert response_data['did_you_mean'] == 'george orwell'
+    assert response.status_code == 200
+
+    response = client.get('/search', json={'query': 'pequino'})
+    response_data = json.loads(response.data)
+
+    assert [book['id'] for book in response_data['data']] == [2]
+    assert response_data['did_you_mean'] == 'pequeno'
+
+    response = client.get('/search?q=orwell&fields=id&include=')
+    response_data = json.loads(response.data)
+
+    assert 'did_you_mean' not in response_data
+
+
+def test_search_books_using_cursor_past_the_last_result_is_not_corrected(
+    client: FlaskClient, app: Flask
+):
+    response = client.get('/search?q=orwel&fields=id&include=&sort=price_asc&after=&per_page=1')
+    response_data = json.loads(response.data)
+
+    assert [book['id'] for book in response_data['data']] == [5]
+    assert 'did_you_mean' not in response_data
+
+    # The next page is empty once the only book left stops matching the query
+    with app.app_context():
+        db.session.execute(text("UPDATE books SET author = 'Eric Blair' WHERE id = 4"))
+        db.session.commit()
+
+    response = client.get(response_data['next_page'])
+    response_data = json.loads(response.data)
+
+    assert response_data['data'] == []
+    assert 'did_you_mean' not in response_data
+    assert response.status_code == 200
+
+
+def test_cached_search_books_runs_no_search_query(client: FlaskClient):
+    for path in (
+        '/search?q=orwell&fields=id&include=',
+        '/search?q=jorge%20orwel&fields=id&include=',
+    ):
+        first_response = client.get(path)
+        response = client.get(path)
+        statements = json.loads(response.headers['X-Debug-SQL'])
+
+        assert json.loads(response.data) == json.loads(first_response.data)
+        assert not any('LIKE' in statement for statement in statements)
+
+
+def test_when_try_to_search_books_using_invalid_query_string_returns_error_response(
+    client: FlaskClient,
+):
+    response = client.get('/search?q=george&kind=ebook')
+    response_data = json.loads(response.data)
+
+    assert response_data['code'] == 'InvalidDataSent'
+    assert response.status_code == 400
+
+    response = client.get('/search?page=2')
+    response_data = json.loads(response.data)
+
+    assert response_data['code'] == 'NoDataSent'
+    assert response.status_code == 400
+
+
+def test_when_try_to_search_books_with_invalid_facets_returns_error_response(
+    client: FlaskClient,
+):
+    response = client.get('/search?facets=author', json={'query': 'george'})
+    response_data = json.loads(response.data)
+
+    assert response_data['code'] == 'InvalidDataSent'
+    assert response.status_code == 400
+
+
 def test_search_books_by_author_using_query(client: FlaskClient):
     search = {'query': 'orwell'}
 
@@ -1204,6 +1448,48 @@ def test_search_books_by_min_and_max_price_using_min_and_max_price_filter(client
     assert response.status_code == 200
 
 
+def test_suggest_search_terms_by_prefix_ranked_by_popularity(client: FlaskClient):
+    response = client.get('/search/suggest?q=a')
+    response_data = json.loads(response.data)
+
+    expected_data = {
+        'suggestions': ['animais', 'A Revolução dos Bichos', 'Antoine de Saint Exupéry']
+    }
+
+    assert response_data == expected_data
+    assert response.status_code == 200
+
+    response = client.get('/search/suggest?q=%20GEO&limit=1')
+    response_data = json.loads(response.data)
+
+    assert response_data == {'suggestions': ['George Orwell']}
+    assert response.status_code == 200
+
+    response = client.get('/search/suggest?q=o%20p')
+    response_data = json.loads(response.data)
+
+    assert response_data == {'suggestions': ['O Pequeno Príncipe', 'O Poderoso Chefão']}
+    assert response.status_code == 200
+
+    response = client.get('/search/suggest?q=xyz')
+    response_data = json.loads(response.data)
+
+    assert response_data == {'suggestions': []}
+    assert response.status_code == 200
+
+
+def test_when_try_to_suggest_search_terms_with_invalid_data_returns_error_response(
+    client: FlaskClient,
+):
+    for query_string in ('', '?q=%20', '?q=a&limit=21'):
+        response = client.get(f'/search/suggest{query_string}')
+        response_data = json.loads(response.data)
+
+        assert response_data['scope'] == 'GeneralException'
+        assert response_data['code'] == 'InvalidDataSent'
+        assert response.status_code == 400
+
+
 def test_when_try_to_search_books_with_invalid_data_returns_error_response(
     client: FlaskClient,
 ):
@@ -1,6 +1,8 @@
+import io
 import json
 import os
 import shutil
+import struct
 from datetime import datetime
 
 import pytest
@@ -13,6 +15,7 @@ from werkzeug.security import generate_password_hash
 from app import create_app
 from db import db
 from model import User
+from utils.file.storage import ImageStorage
 
 
 @pytest.fixture()
@@ -24,16 +27,21 @@ def app():
 
         db.session.execute(
             text(
-                "INSERT INTO users (username, password, img_url) VALUES (:username, :password, :img_url)"
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
             ),
             [
                 {
                     'username': 'test',
+                    'username_normalized': 'test',
                     'password': generate_password_hash('Senha@123'),
                     'img_url': 'http://localhost:5000/users/photos/test.jpg',
                 },
                 {
                     'username': 'lopes',
+                    'username_normalized': 'lopes',
                     'password': generate_password_hash('Senha@123'),
                     'img_url': 'http://localhost:5000/users/photos/test2.jpg',
                 },
@@ -52,7 +60,9 @@ def clean_uploads():
     for file in os.listdir(dir):
         path = os.path.join(dir, file)
 
-        if file != 'test.jpg':
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif file != 'test.jpg':
             os.remove(path)
 
     if not os.path.exists('tests/uploads/test2.jpg'):
@@ -103,9 +113,9 @@ def test_create_user(client: FlaskClient, app: Flask):
         assert new_user.img_url.endswith('.jpg')
 
     dir = 'tests/uploads'
-    for filename in os.listdir(dir):
-        if filename not in ('test.jpg', 'test2.jpg'):
-            assert os.path.isfile(os.path.join(dir, filename))
+    with app.app_context():
+        filename = os.path.basename(response_data['img_url'])
+        assert os.path.isfile(ImageStorage.get_path(dir, filename))
 
 
 def test_when_try_to_create_user_already_authenticated_returns_error_response(
@@ -390,6 +400,35 @@ def test_when_try_to_create_user_with_invalid_password_returns_error_response(cl
     assert response.status_code == 400
 
 
+def test_when_try_to_create_user_with_invalid_img_content_returns_error_response(
+    client: FlaskClient,
+):
+    huge_png_header = b'\x89PNG\r\n\x1a\n' + struct.pack('>I4sII', 13, b'IHDR', 50000, 50000)
+    invalid_imgs = (
+        (open('tests/resources/text-2mb.txt', 'rb'), 'The provided file is not an image'),
+        (io.BytesIO(huge_png_header), 'The provided image has more than 50000000 pixels'),
+    )
+
+    for img, message in invalid_imgs:
+        invalid_data = {'username': 'frigatto', 'password': 'SEnha#45', 'img': (img, 'image.png')}
+
+        response = client.post('/users', data=invalid_data)
+        response_data = json.loads(response.data)
+
+        expected_data = {
+            'scope': 'GeneralException',
+            'code': 'InvalidDataSent',
+            'message': 'Invalid data sent',
+            'detail': [{'loc': ['img'], 'msg': f'Value error, {message}', 'type': 'value_error'}],
+            'status': 400,
+        }
+
+        for key, value in expected_data.items():
+            assert response_data[key] == value
+
+        assert response.status_code == 400
+
+
 def test_when_try_to_create_user_with_invalid_img_returns_error_response(client: FlaskClient):
     invalid_data = {
         'username': 'frigatto',
@@ -697,6 +736,18 @@ def test_update_username(client: FlaskClient, access_token: str, app: Flask):
         assert updated_user.img_url == expected_data['img_url']
 
 
+def test_update_username_case(client: FlaskClient, access_token: str):
+    headers = {
+        'Authorization': f'Bearer {access_token}',
+        'Content-Type': 'multipart/form-data',
+    }
+
+    response = client.patch('/users', headers=headers, data={'username': 'Test'})
+
+    assert json.loads(response.data)['username'] == 'Test'
+    assert response.status_code == 200
+
+
 def test_when_try_to_update_user_without_auth_returns_error_response(client: FlaskClient):
     headers = {'Content-Type': 'multipart/form-data'}
 
@@ -904,6 +955,11 @@ def test_when_try_to_update_username_to_username_already_exists_return_error_res
     assert datetime.fromisoformat(response_data['timestamp'])
     assert response.status_code == 409
 
+    response = client.patch('/users', headers=headers, data={'username': 'LOPES'})
+
+    assert json.loads(response.data)['code'] == 'UserAlreadyExists'
+    assert response.status_code == 409
+
 
 def test_update_password(client: FlaskClient, access_token: str, app: Flask):
     user_id = 1
@@ -1126,9 +1182,41 @@ def test_update_image(client: FlaskClient, app: Flask):
 
     assert 'test2.jpg' not in os.listdir(dir)
 
-    for filename in os.listdir(dir):
-        if filename != 'test.jpg':
-            assert os.path.isfile(os.path.join(dir, filename))
+    with app.app_context():
+        filename = os.path.basename(response_data['img_url'])
+        assert os.path.isfile(ImageStorage.get_path(dir, filename))
+
+
+def test_when_try_to_update_image_with_invalid_img_content_returns_error_response(
+    client: FlaskClient, access_token: str
+):
+    headers = {
+        'Authorization': f'Bearer {access_token}',
+        'Content-Type': 'multipart/form-data',
+    }
+
+    huge_png_header = b'\x89PNG\r\n\x1a\n' + struct.pack('>I4sII', 13, b'IHDR', 50000, 50000)
+    invalid_imgs = (
+        (open('tests/resources/text-2mb.txt', 'rb'), 'The provided file is not an image'),
+        (io.BytesIO(huge_png_header), 'The provided image has more than 50000000 pixels'),
+    )
+
+    for img, message in invalid_imgs:
+        response = client.patch('/users', headers=headers, data={'img': (img, 'image.png')})
+        response_data = json.loads(response.data)
+
+        expected_data = {
+            'scope': 'GeneralException',
+            'code': 'InvalidDataSent',
+            'message': 'Invalid data sent',
+            'detail': [{'loc': ['img'], 'msg': f'Value error, {message}', 'type': 'value_error'}],
+            'status': 400,
+        }
+
+        for key, value in expected_data.items():
+            assert response_data[key] == value
+
+        assert response.status_code == 400
 
 
 def test_when_try_to_update_image_with_invalid_data_returns_error_response(
@@ -0,0 +1,69 @@
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from app import create_app
+from db import db
+
+
+@pytest.fixture
+def app() -> Flask:
+    app = create_app(True)
+
+    with app.app_context():
+        # The book keywords table between the schema expansion and the migration
+        db.session.execute(
+            text(
+                """--sql
+                CREATE TABLE book_keywords (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    keyword VARCHAR(20) NOT NULL,
+                    id_book INTEGER NOT NULL,
+                    id_keyword INTEGER NULL
+                )
+                """
+            )
+        )
+        db.create_all()
+
+        db.session.execute(
+            text("INSERT INTO keywords (keyword) VALUES (:keyword)"), {'keyword': 'máfia'}
+        )
+        db.session.execute(
+            text("INSERT INTO book_keywords (keyword, id_book) VALUES (:keyword, :id_book)"),
+            [
+                {'keyword': 'infantil', 'id_book': 1},
+                {'keyword': 'Infantil ', 'id_book': 1},
+                {'keyword': 'infantil', 'id_book': 2},
+                {'keyword': 'máfia', 'id_book': 2},
+                {'keyword': 'clássico', 'id_book': 2},
+            ],
+        )
+        db.session.commit()
+
+    return app
+
+
+def test_migrate_keywords(app: Flask):
+    result = app.test_cli_runner().invoke(args=['keywords', 'migrate', '--batch-size', '2'])
+
+    assert result.exit_code == 0
+    assert '2 book keywords linked' in result.output
+    assert 'done (5 book keywords linked, 1 duplicates removed)' in result.output
+
+    with app.app_context():
+        keywords = db.session.execute(text("SELECT id, keyword FROM keywords ORDER BY id")).all()
+        book_keywords = db.session.execute(
+            text("SELECT id, id_book, id_keyword FROM book_keywords ORDER BY id")
+        ).all()
+
+    assert [keyword for _, keyword in keywords] == ['máfia', 'infantil', 'clássico']
+    assert book_keywords == [(1, 1, 2), (3, 2, 2), (4, 2, 1), (5, 2, 3)]
+
+
+def test_migrate_keywords_again_does_nothing(app: Flask):
+    app.test_cli_runner().invoke(args=['keywords', 'migrate'])
+    result = app.test_cli_runner().invoke(args=['keywords', 'migrate'])
+
+    assert result.exit_code == 0
+    assert 'done (0 book keywords linked, 0 duplicates removed)' in result.output
@@ -0,0 +1,75 @@
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from app import create_app
+from db import db
+
+
+@pytest.fixture
+def app() -> Flask:
+    app = create_app(True)
+
+    with app.app_context():
+        # The tables between the schema expansion and the backfill
+        db.session.execute(
+            text(
+                """--sql
+                CREATE TABLE books (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name VARCHAR(80) NOT NULL UNIQUE,
+                    name_normalized VARCHAR(80) NULL
+                )
+                """
+            )
+        )
+        db.session.execute(
+            text(
+                """--sql
+                CREATE TABLE users (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username VARCHAR(50) NOT NULL UNIQUE,
+                    username_normalized VARCHAR(50) NULL
+                )
+                """
+            )
+        )
+
+        db.session.execute(
+            text("INSERT INTO books (name) VALUES (:name)"),
+            [{'name': 'O Pequeno Príncipe'}, {'name': 'O pequeno principe'}, {'name': '1984'}],
+        )
+        db.session.execute(
+            text("INSERT INTO users (username) VALUES (:username)"),
+            [{'username': 'Test'}, {'username': 'lopes'}],
+        )
+        db.session.commit()
+
+    return app
+
+
+def test_normalize_names(app: Flask):
+    result = app.test_cli_runner().invoke(args=['names', 'normalize', '--batch-size', '2'])
+
+    assert result.exit_code == 0
+    assert '2 books normalized' in result.output
+    assert '3 books normalized' in result.output
+    assert '2 users normalized' in result.output
+    assert "books: 2 rows normalize to 'o pequeno principe'" in result.output
+    assert 'users: ' not in result.output
+    assert 'done' in result.output
+
+    with app.app_context():
+        books = db.session.execute(text("SELECT name_normalized FROM books ORDER BY id")).all()
+        users = db.session.execute(text("SELECT username_normalized FROM users ORDER BY id")).all()
+
+    assert [name for name, in books] == ['o pequeno principe', 'o pequeno principe', '1984']
+    assert [username for username, in users] == ['test', 'lopes']
+
+
+def test_normalize_names_again_does_nothing(app: Flask):
+    app.test_cli_runner().invoke(args=['names', 'normalize'])
+    result = app.test_cli_runner().invoke(args=['names', 'normalize'])
+
+    assert result.exit_code == 0
+    assert 'normalized' not in result.output
@@ -0,0 +1,157 @@
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from app import create_app
+from db import db
+from utils.file.storage import ImageStorage
+
+
+@pytest.fixture
+def app(tmp_path: Path) -> Flask:
+    app = create_app(True)
+    app.config['USER_PHOTOS_UPLOAD_DIR'] = str(tmp_path / 'users_photos')
+    app.config['BOOK_PHOTOS_UPLOAD_DIR'] = str(tmp_path / 'books_photos')
+
+    for upload_dir in (app.config['USER_PHOTOS_UPLOAD_DIR'], app.config['BOOK_PHOTOS_UPLOAD_DIR']):
+        os.makedirs(upload_dir)
+
+    return app
+
+
+def test_shard_photos(app: Flask):
+    upload_dir = app.config['BOOK_PHOTOS_UPLOAD_DIR']
+    filenames = [f'{i}.jpg' for i in range(5)]
+
+    for filename in filenames:
+        shutil.copyfile('tests/uploads/test.jpg', os.path.join(upload_dir, filename))
+
+    result = app.test_cli_runner().invoke(args=['photos', 'shard', '--batch-size', '2'])
+
+    assert result.exit_code == 0
+    assert f'{upload_dir}: 2 files moved' in result.output
+    assert f'{upload_dir}: done (5 files moved)' in result.output
+
+    with app.app_context():
+        for filename in filenames:
+            assert not os.path.exists(os.path.join(upload_dir, filename))
+            assert os.path.isfile(ImageStorage.get_path(upload_dir, filename))
+            assert ImageStorage.find(upload_dir, filename) == ImageStorage.get_path(
+                upload_dir, filename
+            )
+
+
+def test_shard_photos_without_flat_photos(app: Flask):
+    result = app.test_cli_runner().invoke(args=['photos', 'shard'])
+
+    assert result.exit_code == 0
+    assert 'done (0 files moved)' in result.output
+
+
+@pytest.fixture
+def gc_app(app: Flask) -> Flask:
+    with app.app_context():
+        db.create_all()
+
+        db.session.execute(
+            text(
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES ('test', 'test', 'pwd', :img_url)
+                """
+            ),
+            {'img_url': 'http://localhost:5000/users/photos/user.jpg'},
+        )
+        db.session.execute(text("INSERT INTO book_genres (genre) VALUES ('fábula')"))
+        db.session.execute(text("INSERT INTO book_kinds (kind) VALUES ('físico')"))
+        db.session.execute(
+            text(
+                """--sql
+                INSERT INTO books
+                    (name, name_normalized, price, author, release_year, id_kind, id_genre)
+                    VALUES ('Livro', 'livro', 10, 'Autor', 2000, 1, 1)
+                """
+            )
+        )
+        db.session.execute(
+            text("INSERT INTO book_imgs (img_url, id_book) VALUES (:img_url, 1)"),
+            {'img_url': 'http://localhost:5000/books/photos/book.jpg'},
+        )
+        db.session.commit()
+
+        old_timestamp = time.time() - 2 * app.config['PHOTOS_GC_MIN_AGE']
+        photos = (
+            ('USER_PHOTOS_UPLOAD_DIR', 'user.jpg', old_timestamp),
+            ('USER_PHOTOS_UPLOAD_DIR', 'orphan_user.jpg', old_timestamp),
+            ('BOOK_PHOTOS_UPLOAD_DIR', 'book.jpg', old_timestamp),
+            ('BOOK_PHOTOS_UPLOAD_DIR', 'orphan_book.jpg', old_timestamp),
+            ('BOOK_PHOTOS_UPLOAD_DIR', 'recent_book.jpg', time.time()),
+        )
+
+        for config_key, filename, timestamp in photos:
+            file_path = ImageStorage.get_path(app.config[config_key], filename)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            shutil.copyfile('tests/uploads/test.jpg', file_path)
+            os.utime(file_path, (timestamp, timestamp))
+
+        flat_orphan = os.path.join(app.config['BOOK_PHOTOS_UPLOAD_DIR'], 'flat_orphan.jpg')
+        shutil.copyfile('tests/uploads/test.jpg', flat_orphan)
+        os.utime(flat_orphan, (old_timestamp, old_timestamp))
+
+    return app
+
+
+def get_existing_photos(app: Flask) -> set[str]:
+    with app.app_context():
+        return {
+            filename
+            for config_key in ('USER_PHOTOS_UPLOAD_DIR', 'BOOK_PHOTOS_UPLOAD_DIR')
+            for filename in (
+                'user.jpg',
+                'orphan_user.jpg',
+                'book.jpg',
+                'orphan_book.jpg',
+                'recent_book.jpg',
+                'flat_orphan.jpg',
+            )
+            if ImageStorage.find(app.config[config_key], filename)
+        }
+
+
+def test_collect_orphan_photos(gc_app: Flask):
+    result = gc_app.test_cli_runner().invoke(args=['photos', 'gc', '--chunk-size', '2'])
+
+    assert result.exit_code == 0
+    assert 'done (1 orphans deleted)' in result.output
+    assert 'done (2 orphans deleted)' in result.output
+    assert get_existing_photos(gc_app) == {'user.jpg', 'book.jpg', 'recent_book.jpg'}
+
+
+def test_collect_orphan_photos_with_dry_run(gc_app: Flask):
+    photos_before = get_existing_photos(gc_app)
+
+    result = gc_app.test_cli_runner().invoke(args=['photos', 'gc', '--dry-run'])
+
+    assert result.exit_code == 0
+    assert 'done (2 orphans found)' in result.output
+    assert get_existing_photos(gc_app) == photos_before
+
+
+def test_collect_orphan_photos_to_quarantine(gc_app: Flask, tmp_path: Path):
+    quarantine_dir = str(tmp_path / 'quarantine')
+
+    result = gc_app.test_cli_runner().invoke(args=['photos', 'gc', '--quarantine', quarantine_dir])
+
+    assert result.exit_code == 0
+    assert 'done (2 orphans quarantined)' in result.output
+    assert get_existing_photos(gc_app) == {'user.jpg', 'book.jpg', 'recent_book.jpg'}
+    assert set(os.listdir(quarantine_dir)) == {
+        'orphan_user.jpg',
+        'orphan_book.jpg',
+        'flat_orphan.jpg',
+    }
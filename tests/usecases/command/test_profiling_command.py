@@ -0,0 +1,15 @@
+from flask import Flask
+
+from app import create_app
+from utils.profiling import RequestProfiler
+
+
+def test_create_profiling_token():
+    app: Flask = create_app(True)
+
+    result = app.test_cli_runner().invoke(args=['profiling', 'token'])
+
+    assert result.exit_code == 0
+
+    with app.app_context():
+        assert RequestProfiler._is_valid_token(result.output.strip())
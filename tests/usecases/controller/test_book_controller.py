@@ -42,7 +42,12 @@ def test_get_all_books(book_controller: BookController, app: Flask, mock_service
         mock_service.get_all_books = Mock(return_value=mock_pagination)
 
         page = 1
-        result = book_controller.get_all_books(page)
+
+        per_page = 20
+        relationships = ['book_genre']
+        sort = 'price_asc'
+        after = None
+        result = book_controller.get_all_books(page, per_page, relationships, sort, after)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -55,7 +60,9 @@ def test_get_all_books(book_controller: BookController, app: Flask, mock_service
         assert result.prev_num == mock_pagination.prev_num
         assert result.next_num == mock_pagination.next_num
 
-        mock_service.get_all_books.assert_called_once_with(page)
+        mock_service.get_all_books.assert_called_once_with(
+            page, per_page, relationships, sort, after
+        )
 
 
 def test_get_book_by_id(book_controller: BookController, app: Flask, mock_service: Mock):
@@ -64,12 +71,27 @@ def test_get_book_by_id(book_controller: BookController, app: Flask, mock_servic
         mock_service.get_book_by_id = Mock(return_value=mock_book)
 
         book_id = '1'
-        result = book_controller.get_book_by_id(book_id)
+        relationships = ['book_genre']
+        result = book_controller.get_book_by_id(book_id, relationships)
 
         assert isinstance(result, Book)
         assert result == mock_book
 
-        mock_service.get_book_by_id.assert_called_once_with(book_id)
+        mock_service.get_book_by_id.assert_called_once_with(book_id, relationships)
+
+
+def test_get_books_by_ids(book_controller: BookController, app: Flask, mock_service: Mock):
+    with app.app_context():
+        mock_books = [Mock(Book), None]
+        mock_service.get_books_by_ids = Mock(return_value=mock_books)
+
+        ids = [1, 2]
+        relationships = ['book_genre']
+        result = book_controller.get_books_by_ids(ids, relationships)
+
+        assert result == mock_books
+
+        mock_service.get_books_by_ids.assert_called_once_with(ids, relationships)
 
 
 def test_create_book(book_controller: BookController, app: Flask, mock_service: Mock):
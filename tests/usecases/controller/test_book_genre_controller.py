@@ -44,7 +44,9 @@ def test_get_all_book_genres(
         mock_service.get_all_book_genres = Mock(return_value=mock_pagination)
 
         page = 1
-        result = book_genre_controller.get_all_book_genres(page)
+
+        per_page = 20
+        result = book_genre_controller.get_all_book_genres(page, per_page)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -57,7 +59,7 @@ def test_get_all_book_genres(
         assert result.prev_num == mock_pagination.prev_num
         assert result.next_num == mock_pagination.next_num
 
-        mock_service.get_all_book_genres.assert_called_once_with(page)
+        mock_service.get_all_book_genres.assert_called_once_with(page, per_page)
 
 
 def test_get_book_genre_by_id(
@@ -44,7 +44,9 @@ def test_get_all_book_kinds(
         mock_service.get_all_book_kinds = Mock(return_value=mock_pagination)
 
         page = 1
-        result = book_kind_controller.get_all_book_kinds(page)
+
+        per_page = 20
+        result = book_kind_controller.get_all_book_kinds(page, per_page)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -57,7 +59,7 @@ def test_get_all_book_kinds(
         assert result.prev_num == mock_pagination.prev_num
         assert result.next_num == mock_pagination.next_num
 
-        mock_service.get_all_book_kinds.assert_called_once_with(page)
+        mock_service.get_all_book_kinds.assert_called_once_with(page, per_page)
 
 
 def test_get_book_kind_by_id(
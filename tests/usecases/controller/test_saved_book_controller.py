@@ -44,7 +44,10 @@ def test_get_all_saved_books(
 
         page = 1
 
-        result = saved_book_controller.get_all_saved_books(page)
+        per_page = 20
+
+        relationships = ['book_genre']
+        result = saved_book_controller.get_all_saved_books(page, per_page, relationships)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -57,7 +60,7 @@ def test_get_all_saved_books(
         assert result.prev_num == mock_pagination.prev_num
         assert result.next_num == mock_pagination.next_num
 
-        mock_service.get_all_saved_books.assert_called_once_with(page)
+        mock_service.get_all_saved_books.assert_called_once_with(page, per_page, relationships)
 
 
 def test_save_book(saved_book_controller: SavedBookController, app: Flask, mock_service: Mock):
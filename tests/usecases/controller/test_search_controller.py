@@ -6,7 +6,7 @@ from flask_sqlalchemy.pagination import Pagination
 
 from app import create_app
 from controller.impl import SearchController
-from dto.input import SearchInputDTO
+from dto.input import SearchInputDTO, SearchSuggestInputDTO
 from model import Book
 from service import ISearchService
 
@@ -42,9 +42,16 @@ def test_search_books(search_controller: SearchController, app: Flask, mock_serv
         mock_service.search_books = Mock(return_value=mock_pagination)
 
         page = 1
+
+        per_page = 20
         mock_dto = create_autospec(SearchInputDTO)
 
-        result = search_controller.search_books(page, mock_dto)
+        relationships = ['book_genre']
+        sort = 'relevance'
+        after = None
+        result = search_controller.search_books(
+            page, per_page, mock_dto, relationships, sort, after
+        )
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -57,4 +64,46 @@ def test_search_books(search_controller: SearchController, app: Flask, mock_serv
         assert result.prev_num == mock_pagination.prev_num
         assert result.next_num == mock_pagination.next_num
 
-        mock_service.search_books.assert_called_once_with(page, mock_dto)
+        mock_service.search_books.assert_called_once_with(
+            page, per_page, mock_dto, relationships, sort, after
+        )
+
+
+def test_get_search_facets(search_controller: SearchController, app: Flask, mock_service: Mock):
+    with app.app_context():
+        mock_facets = {'book_genre': [{'id': 1, 'genre': 'fábula', 'count': 2}]}
+        mock_service.get_search_facets = Mock(return_value=mock_facets)
+
+        mock_dto = create_autospec(SearchInputDTO)
+        facets = ['book_genre']
+        result = search_controller.get_search_facets(mock_dto, facets)
+
+        assert result == mock_facets
+
+        mock_service.get_search_facets.assert_called_once_with(mock_dto, facets)
+
+
+def test_suggest_search_terms(search_controller: SearchController, app: Flask, mock_service: Mock):
+    with app.app_context():
+        mock_suggestions = ['George Orwell', 'governo']
+        mock_service.suggest_search_terms = Mock(return_value=mock_suggestions)
+
+        mock_dto = create_autospec(SearchSuggestInputDTO)
+        result = search_controller.suggest_search_terms(mock_dto)
+
+        assert result == mock_suggestions
+
+        mock_service.suggest_search_terms.assert_called_once_with(mock_dto)
+
+
+def test_get_search_correction(search_controller: SearchController, app: Flask, mock_service: Mock):
+    with app.app_context():
+        mock_service.get_search_correction = Mock(return_value='george orwell')
+
+        mock_dto = create_autospec(SearchInputDTO)
+        mock_pagination = Mock(Pagination)
+        result = search_controller.get_search_correction(mock_dto, mock_pagination)
+
+        assert result == 'george orwell'
+
+        mock_service.get_search_correction.assert_called_once_with(mock_dto, mock_pagination)
@@ -1,17 +1,26 @@
+import sqlite3
 from typing import Sequence
 from unittest.mock import Mock, create_autospec
 
+import pymysql
 import pytest
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.pagination import Pagination
 from sqlalchemy import Select, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import scoped_session
 
 from app import create_app
 from db.impl import DbSession
-from exception import GeneralException
-from model import Book
+from exception import (
+    BookException,
+    BookGenreException,
+    BookKeywordException,
+    BookKindException,
+    GeneralException,
+)
+from model import Book, BookKeyword, Keyword
 
 
 @pytest.fixture
@@ -59,7 +68,9 @@ def test_get_all_models(
         mock_sql_alchemy.paginate = Mock(return_value=mock_pagination)
 
         page = 1
-        result = db_session.paginate(mock_query, page=page)
+
+        per_page = 20
+        result = db_session.paginate(mock_query, page=page, per_page=per_page)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -75,7 +86,7 @@ def test_get_all_models(
         mock_sql_alchemy.paginate.assert_called_once_with(
             mock_query,
             page=page,
-            per_page=20,
+            per_page=per_page,
         )
 
 
@@ -87,11 +98,12 @@ def test_when_try_to_get_all_models_with_page_does_not_exists_raises_PaginationP
 ):
     with app.app_context(), pytest.raises(GeneralException.PaginationPageDoesntExist):
         page = 1
+        per_page = 20
         mock_sql_alchemy.paginate = Mock(
             side_effect=GeneralException.PaginationPageDoesntExist(page)
         )
 
-        db_session.paginate(mock_query, page=page)
+        db_session.paginate(mock_query, page=page, per_page=per_page)
 
 
 def test_get_model_by_id_returns_model(
@@ -210,6 +222,71 @@ def test_get_many_models_returns_empty_sequence(
         mock_all.all.assert_called_once()
 
 
+def test_get_rows_returns_rows(
+    db_session: DbSession, app: Flask, mock_sql_alchemy: Mock, mock_query: Mock
+):
+    with app.app_context():
+        mock_rows = [(i, Mock()) for i in range(4)]
+        mock_result = Mock()
+        mock_result.all = Mock(return_value=mock_rows)
+
+        mock_sql_alchemy.session.execute = Mock(return_value=mock_result)
+
+        result = db_session.get_rows(mock_query)
+
+        assert isinstance(result, Sequence)
+        assert result == mock_rows
+
+        mock_sql_alchemy.session.execute.assert_called_once_with(mock_query)
+        mock_result.all.assert_called_once()
+
+
+def test_exists_returns_bool(
+    db_session: DbSession, app: Flask, mock_sql_alchemy: Mock, mock_query: Mock
+):
+    with app.app_context():
+        mock_result = Mock()
+        mock_result.scalar = Mock(return_value=1)
+        mock_sql_alchemy.session.execute = Mock(return_value=mock_result)
+
+        result = db_session.exists(mock_query)
+
+        assert result is True
+
+        (exists_query,) = mock_sql_alchemy.session.execute.call_args.args
+        assert str(exists_query).startswith('SELECT EXISTS (SELECT')
+
+
+def test_count_returns_int(
+    db_session: DbSession, app: Flask, mock_sql_alchemy: Mock, mock_query: Mock
+):
+    with app.app_context():
+        mock_result = Mock()
+        mock_result.scalar_one = Mock(return_value=3)
+        mock_sql_alchemy.session.execute = Mock(return_value=mock_result)
+
+        result = db_session.count(mock_query.order_by(Book.name))
+
+        assert result == 3
+
+        (count_query,) = mock_sql_alchemy.session.execute.call_args.args
+        assert str(count_query).startswith('SELECT count(*) AS count_1')
+        assert 'ORDER BY' not in str(count_query)
+
+
+def test_attach_model_without_loading_it(db_session: DbSession, app: Flask, mock_sql_alchemy: Mock):
+    with app.app_context():
+        mock_model = Mock(Book)
+        mock_attached_model = Mock(Book)
+        mock_sql_alchemy.session.merge = Mock(return_value=mock_attached_model)
+
+        result = db_session.attach(mock_model)
+
+        assert result == mock_attached_model
+
+        mock_sql_alchemy.session.merge.assert_called_once_with(mock_model, load=False)
+
+
 def test_update_model(db_session: DbSession, app: Flask, mock_sql_alchemy: Mock):
     with app.app_context():
         result = db_session.update()
@@ -230,6 +307,206 @@ def test_add_model(db_session: DbSession, app: Flask, mock_sql_alchemy: Mock, mo
         mock_sql_alchemy.session.commit.assert_called_once()
 
 
+def test_add_missing_models(db_session: DbSession, app: Flask, mock_sql_alchemy: Mock):
+    with app.app_context():
+        result = db_session.add_missing(Keyword, [{'keyword': 'infantil'}])
+
+        assert result is None
+
+        mock_sql_alchemy.session.execute.assert_called_once()
+        mock_sql_alchemy.session.commit.assert_not_called()
+
+
+def test_add_unique_model(db_session: DbSession, app: Flask, mock_sql_alchemy: Mock):
+    with app.app_context():
+        mock_model = Mock(Book)
+        result = db_session.add_unique(
+            mock_model, BookException.BookAlreadyExists('Livro'), ('name', 'name_normalized')
+        )
+
+        assert result is None
+
+        mock_sql_alchemy.session.add.assert_called_once_with(mock_model)
+        mock_sql_alchemy.session.commit.assert_called_once()
+        mock_sql_alchemy.session.rollback.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    'error',
+    [
+        sqlite3.IntegrityError('UNIQUE constraint failed: books.name_normalized'),
+        pymysql.IntegrityError(1062, "Duplicate entry 'livro' for key 'books.name_normalized'"),
+        # MariaDB and MySQL before 8.0.19 don't prefix the index with its table
+        pymysql.IntegrityError(1062, "Duplicate entry 'livro' for key 'name_normalized'"),
+    ],
+)
+def test_when_add_unique_model_violates_its_unique_constraint_raises_the_given_exception(
+    db_session: DbSession, app: Flask, mock_sql_alchemy: Mock, error: Exception
+):
+    with app.app_context():
+        mock_model = Mock(Book)
+        mock_model.__tablename__ = 'books'
+        mock_sql_alchemy.session.commit = Mock(side_effect=IntegrityError('INSERT', {}, error))
+
+        with pytest.raises(BookException.BookAlreadyExists):
+            db_session.add_unique(
+                mock_model, BookException.BookAlreadyExists('Livro'), ('name', 'name_normalized')
+            )
+
+        mock_sql_alchemy.session.rollback.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    'error',
+    [
+        sqlite3.IntegrityError('UNIQUE constraint failed: keywords.keyword'),
+        sqlite3.IntegrityError('UNIQUE constraint failed: books.img_url'),
+        sqlite3.IntegrityError('FOREIGN KEY constraint failed'),
+        pymysql.IntegrityError(1062, "Duplicate entry 'for key 'name'' for key 'img_url'"),
+        pymysql.IntegrityError(1452, 'Cannot add or update a child row'),
+    ],
+)
+def test_when_add_unique_model_violates_other_constraint_raises_IntegrityError(
+    db_session: DbSession, app: Flask, mock_sql_alchemy: Mock, error: Exception
+):
+    with app.app_context():
+        mock_model = Mock(Book)
+        mock_model.__tablename__ = 'books'
+        mock_model.__table__ = Book.__table__
+        mock_sql_alchemy.session.commit = Mock(side_effect=IntegrityError('INSERT', {}, error))
+
+        with pytest.raises(IntegrityError):
+            db_session.add_unique(
+                mock_model, BookException.BookAlreadyExists('Livro'), ('name', 'name_normalized')
+            )
+
+        mock_sql_alchemy.session.rollback.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    'error',
+    [
+        sqlite3.IntegrityError(
+            'UNIQUE constraint failed: book_keywords.id_book, book_keywords.id_keyword'
+        ),
+        pymysql.IntegrityError(
+            1062,
+            "Duplicate entry '1-2' for key 'book_keywords.uq_book_keywords_id_book_id_keyword'",
+        ),
+    ],
+)
+def test_when_add_unique_model_violates_its_named_unique_constraint_raises_the_given_exception(
+    db_session: DbSession, app: Flask, mock_sql_alchemy: Mock, error: Exception
+):
+    with app.app_context():
+        mock_model = Mock(BookKeyword)
+        mock_model.__tablename__ = 'book_keywords'
+        mock_model.__table__ = BookKeyword.__table__
+        mock_sql_alchemy.session.commit = Mock(side_effect=IntegrityError('INSERT', {}, error))
+
+        with pytest.raises(BookKeywordException.BookAlreadyHasThisKeyword):
+            db_session.add_unique(
+                mock_model,
+                BookKeywordException.BookAlreadyHasThisKeyword('aventura', '1'),
+                ('id_book', 'id_keyword'),
+            )
+
+        mock_sql_alchemy.session.rollback.assert_called_once()
+
+
+@pytest.mark.parametrize('method', ['add_unique', 'update_unique'])
+@pytest.mark.parametrize(
+    'column, missing_reference',
+    [
+        ('id_kind', BookKindException.BookKindDoesntExist),
+        ('id_genre', BookGenreException.BookGenreDoesntExist),
+    ],
+)
+def test_when_unique_model_references_a_missing_row_raises_the_given_exception(
+    db_session: DbSession,
+    app: Flask,
+    mock_sql_alchemy: Mock,
+    method: str,
+    column: str,
+    missing_reference: type[Exception],
+):
+    with app.app_context():
+        mock_model = Mock(Book)
+        mock_model.__tablename__ = 'books'
+        mock_model.__table__ = Book.__table__
+        error = pymysql.IntegrityError(
+            1452,
+            'Cannot add or update a child row: a foreign key constraint fails '
+            f'(`frigatto_books`.`books`, CONSTRAINT `books_ibfk_1` FOREIGN KEY (`{column}`) '
+            'REFERENCES `book_kinds` (`id`) ON DELETE RESTRICT)',
+        )
+        mock_sql_alchemy.session.commit = Mock(side_effect=IntegrityError('INSERT', {}, error))
+
+        with pytest.raises(missing_reference):
+            getattr(db_session, method)(
+                mock_model,
+                BookException.BookAlreadyExists('Livro'),
+                ('name', 'name_normalized'),
+                {
+                    'id_kind': BookKindException.BookKindDoesntExist('1'),
+                    'id_genre': BookGenreException.BookGenreDoesntExist('1'),
+                },
+            )
+
+        mock_sql_alchemy.session.rollback.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    'missing_references',
+    [None, {'id_genre': BookGenreException.BookGenreDoesntExist('1')}],
+)
+def test_when_unique_model_references_a_missing_row_not_given_raises_IntegrityError(
+    db_session: DbSession,
+    app: Flask,
+    mock_sql_alchemy: Mock,
+    missing_references: dict[str, Exception] | None,
+):
+    with app.app_context():
+        mock_model = Mock(Book)
+        mock_model.__tablename__ = 'books'
+        mock_model.__table__ = Book.__table__
+        error = pymysql.IntegrityError(
+            1452,
+            'Cannot add or update a child row: a foreign key constraint fails '
+            '(`frigatto_books`.`books`, CONSTRAINT `books_ibfk_1` FOREIGN KEY (`id_kind`) '
+            'REFERENCES `book_kinds` (`id`) ON DELETE RESTRICT)',
+        )
+        mock_sql_alchemy.session.commit = Mock(side_effect=IntegrityError('INSERT', {}, error))
+
+        with pytest.raises(IntegrityError):
+            db_session.add_unique(
+                mock_model,
+                BookException.BookAlreadyExists('Livro'),
+                ('name', 'name_normalized'),
+                missing_references,
+            )
+
+        mock_sql_alchemy.session.rollback.assert_called_once()
+
+
+def test_when_update_unique_model_violates_its_unique_constraint_raises_the_given_exception(
+    db_session: DbSession, app: Flask, mock_sql_alchemy: Mock
+):
+    with app.app_context():
+        mock_model = Mock(Book)
+        mock_model.__tablename__ = 'books'
+        error = pymysql.IntegrityError(1062, "Duplicate entry 'livro' for key 'name'")
+        mock_sql_alchemy.session.commit = Mock(side_effect=IntegrityError('UPDATE', {}, error))
+
+        with pytest.raises(BookException.BookAlreadyExists):
+            db_session.update_unique(
+                mock_model, BookException.BookAlreadyExists('Livro'), ('name', 'name_normalized')
+            )
+
+        mock_sql_alchemy.session.add.assert_not_called()
+        mock_sql_alchemy.session.rollback.assert_called_once()
+
+
 def test_delete_model(db_session: DbSession, app: Flask, mock_sql_alchemy: Mock, mock_query: Mock):
     with app.app_context():
         mock_model = Mock(Book)
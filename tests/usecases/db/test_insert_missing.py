@@ -0,0 +1,35 @@
+from unittest.mock import Mock
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session
+
+from db import insert_missing
+from model import Keyword
+
+
+def test_insert_missing_skips_the_saved_rows():
+    engine = create_engine('sqlite://')
+    Keyword.__table__.create(engine)
+
+    with Session(engine) as session:
+        insert_missing(session, Keyword.__table__, [{'keyword': 'infantil'}])
+        insert_missing(session, Keyword.__table__, [{'keyword': 'infantil'}, {'keyword': 'drama'}])
+
+        assert session.scalars(select(Keyword.keyword).order_by(Keyword.id)).all() == [
+            'infantil',
+            'drama',
+        ]
+
+
+def test_insert_missing_on_mysql_updates_nothing_on_duplicates():
+    session = Mock(Session)
+    session.get_bind.return_value.dialect.name = 'mysql'
+
+    insert_missing(session, Keyword.__table__, [{'keyword': 'infantil'}])
+
+    statement = session.execute.call_args.args[0]
+
+    assert str(statement.compile(dialect=mysql.dialect())).endswith(
+        'ON DUPLICATE KEY UPDATE id = keywords.id'
+    )
@@ -1,12 +1,11 @@
-from unittest.mock import Mock
-
-from model import BookKeyword
+from model import BookKeyword, Keyword
 
 
 def test_instantiate_BookKeyword():
-    mock_keyword = Mock()
+    keyword = Keyword('infantil')
 
-    book_keyword = BookKeyword(mock_keyword)
+    book_keyword = BookKeyword(keyword)
 
     assert book_keyword.id is None
-    assert book_keyword.keyword == mock_keyword
+    assert book_keyword.dictionary_keyword == keyword
+    assert book_keyword.keyword == 'infantil'
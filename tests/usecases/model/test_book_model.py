@@ -7,19 +7,19 @@ from model import Book
 
 @pytest.fixture
 def book() -> Book:
-    return Book(Mock(), Mock(), Mock(), Mock())
+    return Book('Livro', Mock(), Mock(), Mock())
 
 
 def test_instantiate_Book():
-    mock_name = Mock()
     mock_price = Mock()
     mock_author = Mock()
     mock_release_year = Mock()
 
-    book = Book(mock_name, mock_price, mock_author, mock_release_year)
+    book = Book('O Pequeno Príncipe', mock_price, mock_author, mock_release_year)
 
     assert book.id is None
-    assert book.name == mock_name
+    assert book.name == 'O Pequeno Príncipe'
+    assert book.name_normalized == 'o pequeno principe'
     assert book.price == mock_price
     assert book.author == mock_author
     assert book.release_year == mock_release_year
@@ -32,10 +32,10 @@ def test_instantiate_Book():
 
 
 def test_update_Book_name(book: Book):
-    mock_name = Mock()
-    book.update_name(mock_name)
+    book.update_name('Herdeiro do IMPÉRIO')
 
-    assert book.name == mock_name
+    assert book.name == 'Herdeiro do IMPÉRIO'
+    assert book.name_normalized == 'herdeiro do imperio'
 
 
 def test_update_Book_price(book: Book):
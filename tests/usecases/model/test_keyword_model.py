@@ -0,0 +1,12 @@
+from unittest.mock import Mock
+
+from model import Keyword
+
+
+def test_instantiate_Keyword():
+    mock_keyword = Mock()
+
+    keyword = Keyword(mock_keyword)
+
+    assert keyword.id is None
+    assert keyword.keyword == mock_keyword
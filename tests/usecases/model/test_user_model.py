@@ -2,50 +2,52 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from app import create_app
 from model import User
+from utils.hashing import PasswordHasher
 
 
 @pytest.fixture
 def user() -> User:
-    with patch('model.user_model.generate_password_hash', return_value=Mock()):
-        return User(Mock(), Mock(), Mock())
+    with patch('model.user_model.PasswordHasher.hash', return_value=Mock()):
+        return User('test', Mock(), Mock())
 
 
 def test_instantiate_User():
     with patch(
-        'model.user_model.generate_password_hash', return_value='123'
-    ) as mock_generate_password_hash:
-        mock_username = Mock()
+        'model.user_model.PasswordHasher.hash', return_value='123'
+    ) as mock_PasswordHasher_hash:
         mock_password = Mock()
         mock_img_url = Mock()
 
-        user = User(mock_username, mock_password, mock_img_url)
+        user = User('Test', mock_password, mock_img_url)
 
         assert user.id is None
-        assert user.username == mock_username
+        assert user.username == 'Test'
+        assert user.username_normalized == 'test'
         assert user.password == '123'
         assert user.img_url == mock_img_url
 
-        mock_generate_password_hash.assert_called_once_with(mock_password)
+        mock_PasswordHasher_hash.assert_called_once_with(mock_password)
 
 
 def test_update_User_username(user: User):
-    mock_username = Mock()
-    user.update_username(mock_username)
+    user.update_username('New_User')
 
-    assert user.username == mock_username
+    assert user.username == 'New_User'
+    assert user.username_normalized == 'new_user'
 
 
 def test_update_User_password(user: User):
     with patch(
-        'model.user_model.generate_password_hash', return_value='123'
-    ) as mock_generate_password_hash:
+        'model.user_model.PasswordHasher.hash', return_value='123'
+    ) as mock_PasswordHasher_hash:
         mock_password = Mock()
         user.update_password(mock_password)
 
         assert user.password == '123'
 
-        mock_generate_password_hash.assert_called_once_with(mock_password)
+        mock_PasswordHasher_hash.assert_called_once_with(mock_password)
 
 
 def test_update_User_img_url(user: User):
@@ -53,3 +55,42 @@ def test_update_User_img_url(user: User):
     user.update_img_url(mock_img_url)
 
     assert user.img_url == mock_img_url
+
+
+def test_check_User_password(user: User):
+    with patch(
+        'model.user_model.PasswordHasher.check', return_value=True
+    ) as mock_PasswordHasher_check:
+        mock_password = Mock()
+
+        assert user.check_password(mock_password) is True
+
+        mock_PasswordHasher_check.assert_called_once_with(user.password, mock_password)
+
+
+def test_User_needs_password_rehash(user: User):
+    with patch(
+        'model.user_model.PasswordHasher.needs_rehash', return_value=True
+    ) as mock_PasswordHasher_needs_rehash:
+        assert user.needs_password_rehash() is True
+
+        mock_PasswordHasher_needs_rehash.assert_called_once_with(user.password)
+
+
+@pytest.fixture
+def password_hasher_pool():
+    yield
+
+    PasswordHasher.shutdown()
+
+
+def test_User_password_hashed_in_process_pool(password_hasher_pool):
+    app = create_app(True)
+    app.config['PASSWORD_HASH_WORKERS'] = 1
+
+    with app.app_context():
+        user = User('frigatto', 'Senha@123', 'http://localhost/users/photos/test.jpg')
+
+        assert user.password.startswith(app.config['PASSWORD_HASH_METHOD'])
+        assert user.check_password('Senha@123')
+        assert not user.check_password('Another_Pwd123')
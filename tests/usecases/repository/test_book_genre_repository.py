@@ -1,3 +1,4 @@
+from typing import Sequence
 from unittest.mock import Mock, create_autospec
 
 import pytest
@@ -6,11 +7,17 @@ from flask_sqlalchemy.pagination import Pagination
 
 from app import create_app
 from db import IDbSession
-from exception import BookGenreException
-from model import Book, BookGenre
+from exception import BookGenreException, GeneralException
+from model import BookGenre, ReferenceDataVersion
 from repository.impl import BookGenreRepository
 
 
+def raise_already_exists(
+    model: object, already_exists: Exception, unique_columns: Sequence[str]
+) -> None:
+    raise already_exists
+
+
 @pytest.fixture
 def app() -> Flask:
     return create_app(True)
@@ -18,7 +25,20 @@ def app() -> Flask:
 
 @pytest.fixture
 def mock_db_session() -> Mock:
-    return create_autospec(IDbSession)
+    mock_db_session = create_autospec(IDbSession)
+    mock_db_session.attach = Mock(side_effect=lambda model: model)
+
+    return mock_db_session
+
+
+@pytest.fixture
+def book_genres() -> list[BookGenre]:
+    book_genres = [BookGenre(f'gênero {id}') for id in range(1, 4)]
+
+    for id, book_genre in enumerate(book_genres, start=1):
+        book_genre.id = id
+
+    return book_genres
 
 
 @pytest.fixture
@@ -27,60 +47,123 @@ def book_genre_repository(mock_db_session: Mock) -> BookGenreRepository:
 
 
 def test_get_all_book_genres(
-    book_genre_repository: BookGenreRepository, app: Flask, mock_db_session: Mock
+    book_genre_repository: BookGenreRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_genres: list[BookGenre],
 ):
     with app.app_context():
-        mock_pagination = Mock(Pagination)
-        mock_pagination.items = [Mock(BookGenre) for _ in range(10)]
-        mock_pagination.total = len(mock_pagination.items)
-        mock_pagination.page = 1
-        mock_pagination.pages = 1
-        mock_pagination.per_page = 20
-        mock_pagination.has_prev = False
-        mock_pagination.has_next = False
-        mock_pagination.prev_num = None
-        mock_pagination.next_num = None
-
-        mock_db_session.paginate = Mock(return_value=mock_pagination)
-
-        page = 1
-        result = book_genre_repository.get_all(page)
+        mock_db_session.get_many = Mock(return_value=book_genres)
+
+        result = book_genre_repository.get_all(1, 2)
 
         assert isinstance(result, Pagination)
-        assert result.items == mock_pagination.items
-        assert result.total == mock_pagination.total
-        assert result.page == mock_pagination.page
-        assert result.pages == mock_pagination.pages
-        assert result.per_page == mock_pagination.per_page
-        assert result.has_prev == mock_pagination.has_prev
-        assert result.has_next == mock_pagination.has_next
-        assert result.prev_num == mock_pagination.prev_num
-        assert result.next_num == mock_pagination.next_num
+        assert [book_genre.genre for book_genre in result.items] == ['gênero 1', 'gênero 2']
+        assert result.total == 3
+        assert result.page == 1
+        assert result.pages == 2
+        assert result.per_page == 2
+        assert result.has_prev is False
+        assert result.has_next is True
 
-        mock_db_session.paginate.assert_called_once()
+        result = book_genre_repository.get_all(2, 2)
+
+        assert [book_genre.genre for book_genre in result.items] == ['gênero 3']
+
+        mock_db_session.get_many.assert_called_once()
+        mock_db_session.paginate.assert_not_called()
+
+
+def test_when_try_to_get_all_book_genres_with_page_does_not_exists_raises_PaginationPageDoesntExist(
+    book_genre_repository: BookGenreRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_genres: list[BookGenre],
+):
+    with pytest.raises(GeneralException.PaginationPageDoesntExist), app.app_context():
+        mock_db_session.get_many = Mock(return_value=book_genres)
+
+        book_genre_repository.get_all(3, 2)
 
 
 def test_get_book_genre_by_id(
-    book_genre_repository: BookGenreRepository, app: Flask, mock_db_session: Mock
+    book_genre_repository: BookGenreRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_genres: list[BookGenre],
 ):
     with app.app_context():
-        mock_book_genre = Mock(BookGenre)
-        mock_db_session.get_by_id = Mock(return_value=mock_book_genre)
+        mock_db_session.get_many = Mock(return_value=book_genres)
 
-        book_genre_id = '1'
-        result = book_genre_repository.get_by_id(book_genre_id)
+        result = book_genre_repository.get_by_id('2')
 
         assert isinstance(result, BookGenre)
-        assert result == mock_book_genre
+        assert result.id == 2
+        assert result.genre == 'gênero 2'
+        assert result is not book_genres[1]
+
+        book_genre_repository.get_by_id('3')
+
+        mock_db_session.get_many.assert_called_once()
+        mock_db_session.get_by_id.assert_not_called()
+        assert mock_db_session.attach.call_count == 2
+
+
+def test_book_genres_are_reloaded_after_changes(
+    book_genre_repository: BookGenreRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_genres: list[BookGenre],
+):
+    with app.app_context():
+        mock_db_session.get_many = Mock(return_value=book_genres)
+        mock_db_session.exists = Mock(return_value=False)
+
+        book_genre_repository.get_by_id('1')
+        book_genre_repository.update(book_genres[0])
+        book_genre_repository.get_by_id('1')
+
+        assert mock_db_session.get_many.call_count == 2
+
+        mock_db_session.add_missing.assert_called_once_with(
+            ReferenceDataVersion, [{'table_name': 'book_genres', 'version': 0}]
+        )
+        mock_db_session.get_by_id.assert_called_once_with(ReferenceDataVersion, 'book_genres')
+        mock_db_session.update.assert_called_once()
+
+
+def test_book_genres_are_reloaded_when_their_version_changes(
+    book_genre_repository: BookGenreRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_genres: list[BookGenre],
+):
+    mock_db_session.get_many = Mock(return_value=book_genres)
+    mock_db_session.get_rows = Mock(return_value=[('book_genres', 1)])
+
+    with app.app_context():
+        book_genre_repository.get_by_id('1')
+        book_genre_repository.get_by_id('2')
+
+    with app.app_context():
+        book_genre_repository.get_by_id('1')
 
-        mock_db_session.get_by_id.assert_called_once_with(BookGenre, book_genre_id)
+    assert mock_db_session.get_many.call_count == 1
+    assert mock_db_session.get_rows.call_count == 2
+
+    mock_db_session.get_rows = Mock(return_value=[('book_genres', 2)])
+
+    with app.app_context():
+        book_genre_repository.get_by_id('1')
+
+    assert mock_db_session.get_many.call_count == 2
 
 
 def test_when_try_to_get_book_genre_by_id_from_book_genre_does_not_exists_raises_BookGenreDoesntExists(
     book_genre_repository: BookGenreRepository, app: Flask, mock_db_session: Mock
 ):
     with pytest.raises(BookGenreException.BookGenreDoesntExist), app.app_context():
-        mock_db_session.get_by_id = Mock(return_value=None)
+        mock_db_session.get_many = Mock(return_value=[])
 
         book_genre_id = '1'
         book_genre_repository.get_by_id(book_genre_id)
@@ -90,50 +173,61 @@ def test_create_book_genre(
     book_genre_repository: BookGenreRepository, app: Flask, mock_db_session: Mock
 ):
     with app.app_context():
-        mock_db_session.get_one = Mock(return_value=None)
-
         mock_book_genre = Mock(BookGenre)
+        mock_book_genre.genre = 'novo'
         result = book_genre_repository.add(mock_book_genre)
 
         assert result is None
 
-        mock_db_session.get_one.assert_called_once()
-        mock_db_session.add.assert_called_once_with(mock_book_genre)
+        mock_db_session.get_one.assert_not_called()
+        mock_db_session.add_unique.assert_called_once()
+
+        model, already_exists, unique_columns = mock_db_session.add_unique.call_args.args
+        assert model == mock_book_genre
+        assert isinstance(already_exists, BookGenreException.BookGenreAlreadyExists)
+        assert unique_columns == ('genre',)
 
 
 def test_when_try_to_create_book_genre_already_exists_raises_BookGenreAlreadyExists(
     book_genre_repository: BookGenreRepository, app: Flask, mock_db_session: Mock
 ):
     with pytest.raises(BookGenreException.BookGenreAlreadyExists), app.app_context():
-        mock_db_session.get_one = Mock(return_value=Mock(BookGenre))
+        mock_db_session.add_unique = Mock(side_effect=raise_already_exists)
 
-        book_genre_repository.add(Mock(BookGenre))
+        mock_book_genre = Mock(BookGenre)
+        mock_book_genre.genre = 'novo'
+        book_genre_repository.add(mock_book_genre)
 
 
 def test_delete_book_genre(
-    book_genre_repository: BookGenreRepository, app: Flask, mock_db_session: Mock
+    book_genre_repository: BookGenreRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_genres: list[BookGenre],
 ):
     with app.app_context():
-        mock_book_genre = Mock(BookGenre)
-        mock_db_session.get_by_id = Mock(return_value=mock_book_genre)
-        mock_db_session.get_many = Mock(return_value=None)
+        mock_db_session.get_one = Mock(return_value=book_genres[0])
+        mock_db_session.exists = Mock(return_value=False)
 
         book_genre_id = '1'
         result = book_genre_repository.delete(book_genre_id)
 
         assert result is None
 
-        mock_db_session.get_many.assert_called_once()
-        mock_db_session.get_by_id.assert_called_once_with(BookGenre, book_genre_id)
+        mock_db_session.get_one.assert_called_once()
+        mock_db_session.exists.assert_called_once()
         mock_db_session.delete.assert_called_once()
 
 
 def test_when_try_to_delete_book_genre_with_linked_books_raises_ThereAreLinkedBooksWithThisBookGenre(
-    book_genre_repository: BookGenreRepository, app: Flask, mock_db_session: Mock
+    book_genre_repository: BookGenreRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_genres: list[BookGenre],
 ):
     with pytest.raises(BookGenreException.ThereAreLinkedBooksWithThisBookGenre), app.app_context():
-        mock_db_session.get_by_id = Mock(return_value=Mock(BookGenre))
-        mock_db_session.get_many = Mock(return_value=[Mock(Book) for _ in range(2)])
+        mock_db_session.get_one = Mock(return_value=book_genres[0])
+        mock_db_session.exists = Mock(return_value=True)
 
         book_genre_id = '1'
         book_genre_repository.delete(book_genre_id)
@@ -143,21 +237,65 @@ def test_update_book_genre(
     book_genre_repository: BookGenreRepository, app: Flask, mock_db_session: Mock
 ):
     with app.app_context():
-        mock_db_session.get_one = Mock(return_value=None)
-
         mock_book_genre = Mock(BookGenre)
         result = book_genre_repository.update(mock_book_genre)
 
         assert result is None
 
-        mock_db_session.get_one.assert_called_once()
-        mock_db_session.update.assert_called_once()
+        mock_db_session.exists.assert_not_called()
+        mock_db_session.update_unique.assert_called_once()
+
+        model, already_exists, unique_columns = mock_db_session.update_unique.call_args.args
+        assert model == mock_book_genre
+        assert isinstance(already_exists, BookGenreException.BookGenreAlreadyExists)
+        assert unique_columns == ('genre',)
 
 
-def test_when_try_to_update_book_genre_with_genre_already_exists_raises_BookGenreAlreadyExists(
+def test_when_update_book_genre_violates_a_unique_constraint_raises_BookGenreAlreadyExists(
     book_genre_repository: BookGenreRepository, app: Flask, mock_db_session: Mock
 ):
     with pytest.raises(BookGenreException.BookGenreAlreadyExists), app.app_context():
-        mock_db_session.get_one = Mock(return_value=Mock(BookGenre))
+        mock_db_session.update_unique = Mock(side_effect=raise_already_exists)
 
         book_genre_repository.update(Mock(BookGenre))
+
+
+def test_get_book_genre_by_id_without_cache_reads_it_from_the_database(
+    book_genre_repository: BookGenreRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_genres: list[BookGenre],
+):
+    with app.app_context():
+        mock_db_session.get_many = Mock(return_value=book_genres)
+        book_genre_repository.get_by_id('1')
+
+        mock_db_session.get_one = Mock(return_value=book_genres[0])
+        result = book_genre_repository.get_by_id('1', cached=False)
+
+        assert result == book_genres[0]
+
+        mock_db_session.get_one.assert_called_once()
+        mock_db_session.get_many.assert_called_once()
+
+
+def test_when_book_genre_deleted_by_another_worker_is_read_without_cache_raises_BookGenreDoesntExist(
+    book_genre_repository: BookGenreRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_genres: list[BookGenre],
+):
+    with app.app_context():
+        mock_db_session.get_many = Mock(return_value=book_genres)
+        book_genre_repository.get_by_id('1')
+
+        mock_db_session.get_one = Mock(return_value=None)
+
+        with pytest.raises(BookGenreException.BookGenreDoesntExist):
+            book_genre_repository.get_by_id('1', cached=False)
+
+        # The snapshot without the deleted row is loaded again
+        mock_db_session.get_many = Mock(return_value=book_genres[1:])
+
+        with pytest.raises(BookGenreException.BookGenreDoesntExist):
+            book_genre_repository.get_by_id('1')
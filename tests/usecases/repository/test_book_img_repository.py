@@ -51,6 +51,19 @@ def test_when_try_to_get_book_img_does_not_exists_raises_BookImgDoesntExists(
         book_img_repository.get_by_id(book_img_id)
 
 
+def test_count_book_imgs_by_book(
+    book_img_repository: BookImgRepository, app: Flask, mock_db_session: Mock
+):
+    with app.app_context():
+        mock_db_session.count = Mock(return_value=3)
+
+        result = book_img_repository.count_by_book(1)
+
+        assert result == 3
+
+        mock_db_session.count.assert_called_once()
+
+
 def test_add_book_img(book_img_repository: BookImgRepository, app: Flask, mock_db_session: Mock):
     with app.app_context():
         mock_book_img = Mock(BookImg)
@@ -1,3 +1,4 @@
+from typing import Sequence
 from unittest.mock import Mock, create_autospec
 
 import pytest
@@ -6,7 +7,7 @@ from flask import Flask
 from app import create_app
 from db import IDbSession
 from exception import BookKeywordException
-from model import BookKeyword
+from model import BookKeyword, Keyword
 from repository.impl import BookKeywordRepository
 
 
@@ -51,6 +52,86 @@ def test_when_try_to_get_book_keyword_does_not_exists_raises_BookKeywordDoesntEx
         book_keyword_repository.get_by_id(book_keyword_id)
 
 
+def test_get_or_create_keywords(
+    book_keyword_repository: BookKeywordRepository, app: Flask, mock_db_session: Mock
+):
+    with app.app_context():
+        infantil = Keyword('infantil')
+        classico = Keyword('clássico')
+        terror = Keyword('terror')
+        mock_db_session.get_many = Mock(side_effect=[[infantil], [infantil, classico, terror]])
+
+        result = book_keyword_repository.get_or_create_keywords(['terror', 'clássico', 'infantil'])
+
+        assert result == [terror, classico, infantil]
+
+        mock_db_session.add_missing.assert_called_once_with(
+            Keyword, [{'keyword': 'clássico'}, {'keyword': 'terror'}]
+        )
+        mock_db_session.get_one.assert_not_called()
+
+        first_query, second_query = (call.args[0] for call in mock_db_session.get_many.mock_calls)
+        assert first_query._for_update_arg is None
+        assert second_query._for_update_arg.read
+
+
+def test_get_existing_keywords_does_not_insert_them(
+    book_keyword_repository: BookKeywordRepository, app: Flask, mock_db_session: Mock
+):
+    with app.app_context():
+        infantil = Keyword('infantil')
+        mock_db_session.get_many = Mock(return_value=[infantil])
+
+        result = book_keyword_repository.get_or_create_keywords(['infantil'])
+
+        assert result == [infantil]
+
+        mock_db_session.get_many.assert_called_once()
+        mock_db_session.add_missing.assert_not_called()
+
+
+def test_get_or_create_keywords_matched_by_the_database_collation(
+    book_keyword_repository: BookKeywordRepository, app: Flask, mock_db_session: Mock
+):
+    with app.app_context():
+        italia = Keyword('italia')
+        mock_db_session.get_many = Mock(return_value=[italia])
+        mock_db_session.get_one = Mock(return_value=italia)
+
+        result = book_keyword_repository.get_or_create_keywords(['itália'])
+
+        assert result == [italia]
+
+        mock_db_session.add_missing.assert_called_once_with(Keyword, [{'keyword': 'itália'}])
+        mock_db_session.get_one.assert_called_once()
+
+
+def test_count_book_keywords_by_book(
+    book_keyword_repository: BookKeywordRepository, app: Flask, mock_db_session: Mock
+):
+    with app.app_context():
+        mock_db_session.count = Mock(return_value=2)
+
+        result = book_keyword_repository.count_by_book(1)
+
+        assert result == 2
+
+        mock_db_session.count.assert_called_once()
+
+
+def test_book_has_keyword(
+    book_keyword_repository: BookKeywordRepository, app: Flask, mock_db_session: Mock
+):
+    with app.app_context():
+        mock_db_session.exists = Mock(return_value=True)
+
+        result = book_keyword_repository.book_has_keyword(1, 'infantil')
+
+        assert result is True
+
+        mock_db_session.exists.assert_called_once()
+
+
 def test_add_book_keyword(
     book_keyword_repository: BookKeywordRepository, app: Flask, mock_db_session: Mock
 ):
@@ -61,7 +142,27 @@ def test_add_book_keyword(
 
         assert result is None
 
-        mock_db_session.add.assert_called_once_with(mock_book_keyword)
+        mock_db_session.add.assert_not_called()
+        mock_db_session.add_unique.assert_called_once()
+
+        model, already_exists, unique_columns = mock_db_session.add_unique.call_args.args
+        assert model == mock_book_keyword
+        assert isinstance(already_exists, BookKeywordException.BookAlreadyHasThisKeyword)
+        assert unique_columns == ('id_book', 'id_keyword')
+
+
+def test_when_try_to_add_book_keyword_the_book_already_has_raises_BookAlreadyHasThisKeyword(
+    book_keyword_repository: BookKeywordRepository, app: Flask, mock_db_session: Mock
+):
+    def raise_already_exists(
+        model: object, already_exists: Exception, unique_columns: Sequence[str]
+    ) -> None:
+        raise already_exists
+
+    with pytest.raises(BookKeywordException.BookAlreadyHasThisKeyword), app.app_context():
+        mock_db_session.add_unique = Mock(side_effect=raise_already_exists)
+
+        book_keyword_repository.add(Mock(BookKeyword))
 
 
 def test_delete_book_keyword(
@@ -1,3 +1,4 @@
+from typing import Sequence
 from unittest.mock import Mock, create_autospec
 
 import pytest
@@ -6,11 +7,17 @@ from flask_sqlalchemy.pagination import Pagination
 
 from app import create_app
 from db import IDbSession
-from exception import BookKindException
-from model import Book, BookKind
+from exception import BookKindException, GeneralException
+from model import BookKind, ReferenceDataVersion
 from repository.impl import BookKindRepository
 
 
+def raise_already_exists(
+    model: object, already_exists: Exception, unique_columns: Sequence[str]
+) -> None:
+    raise already_exists
+
+
 @pytest.fixture
 def app() -> Flask:
     return create_app(True)
@@ -18,7 +25,20 @@ def app() -> Flask:
 
 @pytest.fixture
 def mock_db_session() -> Mock:
-    return create_autospec(IDbSession)
+    mock_db_session = create_autospec(IDbSession)
+    mock_db_session.attach = Mock(side_effect=lambda model: model)
+
+    return mock_db_session
+
+
+@pytest.fixture
+def book_kinds() -> list[BookKind]:
+    book_kinds = [BookKind(f'tipo {id}') for id in range(1, 4)]
+
+    for id, book_kind in enumerate(book_kinds, start=1):
+        book_kind.id = id
+
+    return book_kinds
 
 
 @pytest.fixture
@@ -27,60 +47,123 @@ def book_kind_repository(mock_db_session: Mock) -> BookKindRepository:
 
 
 def test_get_all_book_kinds(
-    book_kind_repository: BookKindRepository, app: Flask, mock_db_session: Mock
+    book_kind_repository: BookKindRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_kinds: list[BookKind],
 ):
     with app.app_context():
-        mock_pagination = Mock(Pagination)
-        mock_pagination.items = [Mock(BookKind) for _ in range(10)]
-        mock_pagination.total = len(mock_pagination.items)
-        mock_pagination.page = 1
-        mock_pagination.pages = 1
-        mock_pagination.per_page = 20
-        mock_pagination.has_prev = False
-        mock_pagination.has_next = False
-        mock_pagination.prev_num = None
-        mock_pagination.next_num = None
-
-        mock_db_session.paginate = Mock(return_value=mock_pagination)
-
-        page = 1
-        result = book_kind_repository.get_all(page)
+        mock_db_session.get_many = Mock(return_value=book_kinds)
+
+        result = book_kind_repository.get_all(1, 2)
 
         assert isinstance(result, Pagination)
-        assert result.items == mock_pagination.items
-        assert result.total == mock_pagination.total
-        assert result.page == mock_pagination.page
-        assert result.pages == mock_pagination.pages
-        assert result.per_page == mock_pagination.per_page
-        assert result.has_prev == mock_pagination.has_prev
-        assert result.has_next == mock_pagination.has_next
-        assert result.prev_num == mock_pagination.prev_num
-        assert result.next_num == mock_pagination.next_num
+        assert [book_kind.kind for book_kind in result.items] == ['tipo 1', 'tipo 2']
+        assert result.total == 3
+        assert result.page == 1
+        assert result.pages == 2
+        assert result.per_page == 2
+        assert result.has_prev is False
+        assert result.has_next is True
 
-        mock_db_session.paginate.assert_called_once()
+        result = book_kind_repository.get_all(2, 2)
+
+        assert [book_kind.kind for book_kind in result.items] == ['tipo 3']
+
+        mock_db_session.get_many.assert_called_once()
+        mock_db_session.paginate.assert_not_called()
+
+
+def test_when_try_to_get_all_book_kinds_with_page_does_not_exists_raises_PaginationPageDoesntExist(
+    book_kind_repository: BookKindRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_kinds: list[BookKind],
+):
+    with pytest.raises(GeneralException.PaginationPageDoesntExist), app.app_context():
+        mock_db_session.get_many = Mock(return_value=book_kinds)
+
+        book_kind_repository.get_all(3, 2)
 
 
 def test_get_book_kind_by_id(
-    book_kind_repository: BookKindRepository, app: Flask, mock_db_session: Mock
+    book_kind_repository: BookKindRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_kinds: list[BookKind],
 ):
     with app.app_context():
-        mock_book_kind = Mock(BookKind)
-        mock_db_session.get_by_id = Mock(return_value=mock_book_kind)
+        mock_db_session.get_many = Mock(return_value=book_kinds)
 
-        book_kind_id = '1'
-        result = book_kind_repository.get_by_id(book_kind_id)
+        result = book_kind_repository.get_by_id('2')
 
         assert isinstance(result, BookKind)
-        assert result == mock_book_kind
+        assert result.id == 2
+        assert result.kind == 'tipo 2'
+        assert result is not book_kinds[1]
+
+        book_kind_repository.get_by_id('3')
+
+        mock_db_session.get_many.assert_called_once()
+        mock_db_session.get_by_id.assert_not_called()
+        assert mock_db_session.attach.call_count == 2
+
+
+def test_book_kinds_are_reloaded_after_changes(
+    book_kind_repository: BookKindRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_kinds: list[BookKind],
+):
+    with app.app_context():
+        mock_db_session.get_many = Mock(return_value=book_kinds)
+        mock_db_session.exists = Mock(return_value=False)
+
+        book_kind_repository.get_by_id('1')
+        book_kind_repository.update(book_kinds[0])
+        book_kind_repository.get_by_id('1')
+
+        assert mock_db_session.get_many.call_count == 2
+
+        mock_db_session.add_missing.assert_called_once_with(
+            ReferenceDataVersion, [{'table_name': 'book_kinds', 'version': 0}]
+        )
+        mock_db_session.get_by_id.assert_called_once_with(ReferenceDataVersion, 'book_kinds')
+        mock_db_session.update.assert_called_once()
+
+
+def test_book_kinds_are_reloaded_when_their_version_changes(
+    book_kind_repository: BookKindRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_kinds: list[BookKind],
+):
+    mock_db_session.get_many = Mock(return_value=book_kinds)
+    mock_db_session.get_rows = Mock(return_value=[('book_kinds', 1)])
+
+    with app.app_context():
+        book_kind_repository.get_by_id('1')
+        book_kind_repository.get_by_id('2')
+
+    with app.app_context():
+        book_kind_repository.get_by_id('1')
 
-        mock_db_session.get_by_id.assert_called_once_with(BookKind, book_kind_id)
+    assert mock_db_session.get_many.call_count == 1
+    assert mock_db_session.get_rows.call_count == 2
+
+    mock_db_session.get_rows = Mock(return_value=[('book_kinds', 2)])
+
+    with app.app_context():
+        book_kind_repository.get_by_id('1')
+
+    assert mock_db_session.get_many.call_count == 2
 
 
 def test_when_try_to_get_book_kind_by_id_from_book_kind_does_not_exists_raises_BookKindDoesntExists(
     book_kind_repository: BookKindRepository, app: Flask, mock_db_session: Mock
 ):
     with pytest.raises(BookKindException.BookKindDoesntExist), app.app_context():
-        mock_db_session.get_by_id = Mock(return_value=None)
+        mock_db_session.get_many = Mock(return_value=[])
 
         book_kind_id = '1'
         book_kind_repository.get_by_id(book_kind_id)
@@ -90,50 +173,61 @@ def test_create_book_kind(
     book_kind_repository: BookKindRepository, app: Flask, mock_db_session: Mock
 ):
     with app.app_context():
-        mock_db_session.get_one = Mock(return_value=None)
-
         mock_book_kind = Mock(BookKind)
+        mock_book_kind.kind = 'novo'
         result = book_kind_repository.add(mock_book_kind)
 
         assert result is None
 
-        mock_db_session.get_one.assert_called_once()
-        mock_db_session.add.assert_called_once_with(mock_book_kind)
+        mock_db_session.get_one.assert_not_called()
+        mock_db_session.add_unique.assert_called_once()
+
+        model, already_exists, unique_columns = mock_db_session.add_unique.call_args.args
+        assert model == mock_book_kind
+        assert isinstance(already_exists, BookKindException.BookKindAlreadyExists)
+        assert unique_columns == ('kind',)
 
 
 def test_when_try_to_create_book_kind_already_exists_raises_BookKindAlreadyExists(
     book_kind_repository: BookKindRepository, app: Flask, mock_db_session: Mock
 ):
     with pytest.raises(BookKindException.BookKindAlreadyExists), app.app_context():
-        mock_db_session.get_one = Mock(return_value=Mock(BookKind))
+        mock_db_session.add_unique = Mock(side_effect=raise_already_exists)
 
-        book_kind_repository.add(Mock(BookKind))
+        mock_book_kind = Mock(BookKind)
+        mock_book_kind.kind = 'novo'
+        book_kind_repository.add(mock_book_kind)
 
 
 def test_delete_book_kind(
-    book_kind_repository: BookKindRepository, app: Flask, mock_db_session: Mock
+    book_kind_repository: BookKindRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_kinds: list[BookKind],
 ):
     with app.app_context():
-        mock_book_kind = Mock(BookKind)
-        mock_db_session.get_by_id = Mock(return_value=mock_book_kind)
-        mock_db_session.get_many = Mock(return_value=None)
+        mock_db_session.get_one = Mock(return_value=book_kinds[0])
+        mock_db_session.exists = Mock(return_value=False)
 
         book_kind_id = '1'
         result = book_kind_repository.delete(book_kind_id)
 
         assert result is None
 
-        mock_db_session.get_many.assert_called_once()
-        mock_db_session.get_by_id.assert_called_once_with(BookKind, book_kind_id)
+        mock_db_session.get_one.assert_called_once()
+        mock_db_session.exists.assert_called_once()
         mock_db_session.delete.assert_called_once()
 
 
 def test_when_try_to_delete_book_kind_with_linked_books_raises_ThereAreLinkedBooksWithThisBookKind(
-    book_kind_repository: BookKindRepository, app: Flask, mock_db_session: Mock
+    book_kind_repository: BookKindRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_kinds: list[BookKind],
 ):
     with pytest.raises(BookKindException.ThereAreLinkedBooksWithThisBookKind), app.app_context():
-        mock_db_session.get_by_id = Mock(return_value=Mock(BookKind))
-        mock_db_session.get_many = Mock(return_value=[Mock(Book) for _ in range(2)])
+        mock_db_session.get_one = Mock(return_value=book_kinds[0])
+        mock_db_session.exists = Mock(return_value=True)
 
         book_kind_id = '1'
         book_kind_repository.delete(book_kind_id)
@@ -143,21 +237,65 @@ def test_update_book_kind(
     book_kind_repository: BookKindRepository, app: Flask, mock_db_session: Mock
 ):
     with app.app_context():
-        mock_db_session.get_one = Mock(return_value=None)
-
         mock_book_kind = Mock(BookKind)
         result = book_kind_repository.update(mock_book_kind)
 
         assert result is None
 
-        mock_db_session.get_one.assert_called_once()
-        mock_db_session.update.assert_called_once()
+        mock_db_session.exists.assert_not_called()
+        mock_db_session.update_unique.assert_called_once()
+
+        model, already_exists, unique_columns = mock_db_session.update_unique.call_args.args
+        assert model == mock_book_kind
+        assert isinstance(already_exists, BookKindException.BookKindAlreadyExists)
+        assert unique_columns == ('kind',)
 
 
-def test_when_try_to_update_book_kind_with_kind_already_exists_raises_BookKindAlreadyExists(
+def test_when_update_book_kind_violates_a_unique_constraint_raises_BookKindAlreadyExists(
     book_kind_repository: BookKindRepository, app: Flask, mock_db_session: Mock
 ):
     with pytest.raises(BookKindException.BookKindAlreadyExists), app.app_context():
-        mock_db_session.get_one = Mock(return_value=Mock(BookKind))
+        mock_db_session.update_unique = Mock(side_effect=raise_already_exists)
 
         book_kind_repository.update(Mock(BookKind))
+
+
+def test_get_book_kind_by_id_without_cache_reads_it_from_the_database(
+    book_kind_repository: BookKindRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_kinds: list[BookKind],
+):
+    with app.app_context():
+        mock_db_session.get_many = Mock(return_value=book_kinds)
+        book_kind_repository.get_by_id('1')
+
+        mock_db_session.get_one = Mock(return_value=book_kinds[0])
+        result = book_kind_repository.get_by_id('1', cached=False)
+
+        assert result == book_kinds[0]
+
+        mock_db_session.get_one.assert_called_once()
+        mock_db_session.get_many.assert_called_once()
+
+
+def test_when_book_kind_deleted_by_another_worker_is_read_without_cache_raises_BookKindDoesntExist(
+    book_kind_repository: BookKindRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    book_kinds: list[BookKind],
+):
+    with app.app_context():
+        mock_db_session.get_many = Mock(return_value=book_kinds)
+        book_kind_repository.get_by_id('1')
+
+        mock_db_session.get_one = Mock(return_value=None)
+
+        with pytest.raises(BookKindException.BookKindDoesntExist):
+            book_kind_repository.get_by_id('1', cached=False)
+
+        # The snapshot without the deleted row is loaded again
+        mock_db_session.get_many = Mock(return_value=book_kinds[1:])
+
+        with pytest.raises(BookKindException.BookKindDoesntExist):
+            book_kind_repository.get_by_id('1')
@@ -1,3 +1,4 @@
+from typing import Callable, Mapping, Sequence
 from unittest.mock import Mock, create_autospec, patch
 
 import pytest
@@ -6,11 +7,38 @@ from flask_sqlalchemy.pagination import Pagination
 
 from app import create_app
 from db import IDbSession
-from exception import BookException
+from exception import BookException, BookGenreException, BookKindException
 from model import Book, BookGenre, BookImg, BookKind
 from repository.impl import BookRepository
 
 
+def raise_already_exists(
+    model: object,
+    already_exists: Exception,
+    unique_columns: Sequence[str],
+    missing_references: Mapping[str, Exception],
+) -> None:
+    raise already_exists
+
+
+def raise_missing_kind(
+    model: object,
+    already_exists: Exception,
+    unique_columns: Sequence[str],
+    missing_references: Mapping[str, Exception],
+) -> None:
+    raise missing_references['id_kind']
+
+
+def raise_missing_genre(
+    model: object,
+    already_exists: Exception,
+    unique_columns: Sequence[str],
+    missing_references: Mapping[str, Exception],
+) -> None:
+    raise missing_references['id_genre']
+
+
 @pytest.fixture
 def app() -> Flask:
     return create_app(True)
@@ -42,7 +70,9 @@ def test_get_all_books(book_repository: BookRepository, app: Flask, mock_db_sess
         mock_db_session.paginate = Mock(return_value=mock_pagination)
 
         page = 1
-        result = book_repository.get_all(page)
+
+        per_page = 20
+        result = book_repository.get_all(page, per_page)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -72,6 +102,18 @@ def test_get_book_by_id(book_repository: BookRepository, app: Flask, mock_db_ses
         mock_db_session.get_by_id.assert_called_once_with(Book, book_id)
 
 
+def test_get_many_books_by_ids(book_repository: BookRepository, app: Flask, mock_db_session: Mock):
+    with app.app_context():
+        mock_books = [Mock(Book, id=id) for id in (1, 3)]
+        mock_db_session.get_many = Mock(return_value=mock_books)
+
+        result = book_repository.get_many_by_ids([3, 2, 1])
+
+        assert result == [mock_books[1], None, mock_books[0]]
+
+        mock_db_session.get_many.assert_called_once()
+
+
 def test_when_try_to_get_book_by_id_from_book_does_not_exists_raises_BookDoesntExists(
     book_repository: BookRepository, app: Flask, mock_db_session: Mock
 ):
@@ -84,22 +126,52 @@ def test_when_try_to_get_book_by_id_from_book_does_not_exists_raises_BookDoesntE
 
 def test_create_book(book_repository: BookRepository, app: Flask, mock_db_session: Mock):
     with app.app_context():
-        mock_db_session.get_one = Mock(return_value=None)
-
         mock_book = Mock(Book)
+        mock_book.name = 'Livro'
         result = book_repository.add(mock_book)
 
         assert result is None
 
-        mock_db_session.get_one.assert_called_once()
-        mock_db_session.add.assert_called_once_with(mock_book)
+        mock_db_session.get_one.assert_not_called()
+        mock_db_session.add_unique.assert_called_once()
+
+        model, already_exists, unique_columns, missing_references = (
+            mock_db_session.add_unique.call_args.args
+        )
+        assert model == mock_book
+        assert isinstance(already_exists, BookException.BookAlreadyExists)
+        assert unique_columns == ('name', 'name_normalized')
+        assert isinstance(missing_references['id_kind'], BookKindException.BookKindDoesntExist)
+        assert isinstance(missing_references['id_genre'], BookGenreException.BookGenreDoesntExist)
 
 
 def test_when_try_to_create_book_already_exists_raises_BookAlreadyExists(
     book_repository: BookRepository, app: Flask, mock_db_session: Mock
 ):
     with pytest.raises(BookException.BookAlreadyExists), app.app_context():
-        mock_db_session.get_one = Mock(return_value=Mock(Book))
+        mock_db_session.add_unique = Mock(side_effect=raise_already_exists)
+
+        mock_book = Mock(Book)
+        mock_book.name = 'Livro'
+        book_repository.add(mock_book)
+
+
+@pytest.mark.parametrize(
+    'raise_missing_reference, missing_reference',
+    [
+        (raise_missing_kind, BookKindException.BookKindDoesntExist),
+        (raise_missing_genre, BookGenreException.BookGenreDoesntExist),
+    ],
+)
+def test_when_try_to_create_book_whose_kind_or_genre_was_deleted_raises_it_doesnt_exist(
+    book_repository: BookRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    raise_missing_reference: Callable[..., None],
+    missing_reference: type[Exception],
+):
+    with pytest.raises(missing_reference), app.app_context():
+        mock_db_session.add_unique = Mock(side_effect=raise_missing_reference)
 
         book_repository.add(Mock(Book))
 
@@ -129,50 +201,31 @@ def test_delete_book(book_repository: BookRepository, app: Flask, mock_db_sessio
         mock_db_session.delete.assert_called_once()
 
 
-def test_update_book_name(book_repository: BookRepository, app: Flask, mock_db_session: Mock):
-    with app.app_context(), patch(
-        'repository.impl.book_repository.BookRepository._book_already_exists', return_value=False
-    ) as mock_BookRepository_book_already_exists:
-        mock_db_session.get_one = Mock(return_value=Mock(Book))
-
+def test_update_book(book_repository: BookRepository, app: Flask, mock_db_session: Mock):
+    with app.app_context():
         mock_book = Mock(Book)
         mock_book.name = 'Outro Nome'
         result = book_repository.update(mock_book)
 
         assert result is None
 
-        mock_BookRepository_book_already_exists.assert_called_once_with(mock_book)
-        mock_db_session.get_one.assert_called_once()
-        mock_db_session.update.assert_called_once()
-
-
-def test_update_other_book_attrs_without_name(
-    book_repository: BookRepository, app: Flask, mock_db_session: Mock
-):
-    with app.app_context(), patch(
-        'repository.impl.book_repository.BookRepository._book_already_exists', return_value=False
-    ) as mock_BookRepository_book_already_exists:
-        mock_db_session.get_one = Mock(return_value=None)
-
-        mock_book = Mock(Book)
-        result = book_repository.update(mock_book)
-
-        assert result is None
+        mock_db_session.exists.assert_not_called()
+        mock_db_session.update_unique.assert_called_once()
 
-        mock_BookRepository_book_already_exists.assert_called_once_with(mock_book)
-        mock_db_session.get_one.assert_called_once()
-        mock_db_session.update.assert_called_once()
+        model, already_exists, unique_columns, missing_references = (
+            mock_db_session.update_unique.call_args.args
+        )
+        assert model == mock_book
+        assert isinstance(already_exists, BookException.BookAlreadyExists)
+        assert unique_columns == ('name', 'name_normalized')
+        assert isinstance(missing_references['id_kind'], BookKindException.BookKindDoesntExist)
+        assert isinstance(missing_references['id_genre'], BookGenreException.BookGenreDoesntExist)
 
 
-def test_when_try_to_update_book_with_name_from_book_already_exists_raises_BookAlreadyExists(
+def test_when_update_book_violates_a_unique_constraint_raises_BookAlreadyExists(
     book_repository: BookRepository, app: Flask, mock_db_session: Mock
 ):
     with pytest.raises(BookException.BookAlreadyExists), app.app_context():
-        with patch(
-            'repository.impl.book_repository.BookRepository._book_already_exists',
-            return_value=True,
-        ):
-            mock_db_session.get_one = Mock(return_value=None)
-
-            mock_book = Mock(Book)
-            book_repository.update(mock_book)
+        mock_db_session.update_unique = Mock(side_effect=raise_already_exists)
+
+        book_repository.update(Mock(Book))
@@ -60,7 +60,9 @@ def test_get_all_saved_books(
         mock_db_session.paginate = Mock(return_value=mock_pagination)
 
         page = 1
-        result = saved_book_repository.get_all(page)
+
+        per_page = 20
+        result = saved_book_repository.get_all(page, per_page)
 
         assert isinstance(result, Pagination)
         assert all(isinstance(item, Book) for item in result.items)
@@ -80,11 +82,14 @@ def test_add_saved_book(
     saved_book_repository: SavedBookRepository, app: Flask, mock_db_session: Mock, user: User
 ):
     with app.app_context(), patch('flask_jwt_extended.utils.get_current_user', return_value=user):
+        mock_db_session.exists = Mock(return_value=False)
+
         mock_saved_book = Mock(SavedBook)
         result = saved_book_repository.add(mock_saved_book)
 
         assert result is None
 
+        mock_db_session.exists.assert_called_once()
         mock_db_session.add.assert_called_once_with(mock_saved_book)
 
 
@@ -0,0 +1,156 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, create_autospec, patch
+
+import pytest
+from flask import Flask
+
+from app import create_app
+from db import IDbSession
+from repository.impl import SearchIndexRepository
+
+
+@pytest.fixture
+def app() -> Flask:
+    return create_app(True)
+
+
+@pytest.fixture
+def mock_db_session() -> Mock:
+    mock_db_session = create_autospec(IDbSession)
+    mock_db_session.get_rows = Mock(
+        return_value=[('1984', 'George Orwell'), ('A Revolução dos Bichos', 'George Orwell')]
+    )
+    mock_db_session.get_many = Mock(return_value=['governo', 'animais'])
+
+    return mock_db_session
+
+
+@pytest.fixture
+def search_index_repository(mock_db_session: Mock) -> SearchIndexRepository:
+    return SearchIndexRepository(mock_db_session)
+
+
+def test_suggest_builds_the_index_once(
+    search_index_repository: SearchIndexRepository, app: Flask, mock_db_session: Mock
+):
+    with app.app_context():
+        assert search_index_repository.suggest('g', 10) == ['George Orwell', 'governo']
+        assert search_index_repository.suggest('a', 10) == ['A Revolução dos Bichos', 'animais']
+
+        mock_db_session.get_rows.assert_called_once()
+        mock_db_session.get_many.assert_called_once()
+
+
+def test_add_and_remove_terms(
+    search_index_repository: SearchIndexRepository, app: Flask, mock_db_session: Mock
+):
+    with app.app_context():
+        search_index_repository.add_terms(['gótico'])
+        mock_db_session.get_rows.assert_not_called()
+
+        search_index_repository.suggest('g', 10)
+        search_index_repository.add_terms(['gótico'])
+        search_index_repository.remove_terms(['governo'])
+
+        assert search_index_repository.suggest('g', 10) == ['George Orwell', 'gótico']
+
+
+def test_index_is_rebuilt_after_ttl(
+    search_index_repository: SearchIndexRepository, app: Flask, mock_db_session: Mock
+):
+    app.config['SEARCH_INDEX_TTL'] = 10
+
+    with app.app_context():
+        path = 'repository.impl.search_index_repository.time.monotonic'
+
+        with patch(path, return_value=100):
+            search_index_repository.suggest('g', 10)
+
+        with patch(path, return_value=110):
+            search_index_repository.suggest('g', 10)
+
+        assert mock_db_session.get_rows.call_count == 2
+
+
+def test_expired_index_is_served_while_another_request_rebuilds_it(
+    search_index_repository: SearchIndexRepository, app: Flask, mock_db_session: Mock
+):
+    app.config['SEARCH_INDEX_TTL'] = 10
+    rows = mock_db_session.get_rows.return_value
+    rebuilding = threading.Event()
+    served = threading.Event()
+
+    def get_rows(query: object) -> list[tuple[str, str]]:
+        if mock_db_session.get_rows.call_count > 1:
+            rebuilding.set()
+            served.wait(5)
+
+        return rows
+
+    mock_db_session.get_rows = Mock(side_effect=get_rows)
+
+    def suggest() -> None:
+        with app.app_context():
+            search_index_repository.suggest('g', 10)
+
+    with app.app_context():
+        path = 'repository.impl.search_index_repository.time.monotonic'
+
+        with patch(path, return_value=100):
+            search_index_repository.suggest('g', 10)
+
+        with patch(path, return_value=110):
+            rebuild = threading.Thread(target=suggest)
+            rebuild.start()
+            assert rebuilding.wait(5)
+
+            assert search_index_repository.suggest('g', 10) == ['George Orwell', 'governo']
+
+            served.set()
+            rebuild.join(5)
+
+            assert search_index_repository.suggest('a', 10) == [
+                'A Revolução dos Bichos',
+                'animais',
+            ]
+
+        assert mock_db_session.get_rows.call_count == 2
+
+
+def test_concurrent_requests_build_the_index_once(
+    search_index_repository: SearchIndexRepository, app: Flask, mock_db_session: Mock
+):
+    barrier = threading.Barrier(4)
+    rows = mock_db_session.get_rows.return_value
+    mock_db_session.get_rows = Mock(side_effect=lambda query: time.sleep(0.1) or rows)
+
+    def suggest() -> list[str]:
+        barrier.wait(5)
+
+        with app.app_context():
+            return search_index_repository.suggest('g', 10)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: suggest(), range(4)))
+
+    assert results == [['George Orwell', 'governo']] * 4
+
+    mock_db_session.get_rows.assert_called_once()
+
+
+def test_correct_query(
+    search_index_repository: SearchIndexRepository, app: Flask, mock_db_session: Mock
+):
+    with app.app_context():
+        assert search_index_repository.correct_query('george orwel') == 'george orwell'
+        assert search_index_repository.correct_query('governo') is None
+
+        search_index_repository.add_terms(['Revolução Francesa'])
+        search_index_repository.remove_terms(['governo'])
+
+        assert search_index_repository.correct_query('francesca') == 'francesa'
+        assert search_index_repository.correct_query('governo') is None
+
+        mock_db_session.get_rows.assert_called_once()
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest.mock import Mock, create_autospec
 
 import pytest
@@ -5,10 +6,11 @@ from flask import Flask
 from flask_sqlalchemy.pagination import Pagination
 
 from app import create_app
-from db import IDbSession
+from db import IDbSession, ListPagination
 from model import Book
-from repository import IBookGenreRepository, IBookKindRepository
+from repository import IBookGenreRepository, IBookKindRepository, IBookRepository
 from repository.impl import SearchRepository
+from utils.cache import CatalogVersion
 
 
 @pytest.fixture
@@ -21,6 +23,11 @@ def mock_db_session() -> Mock:
     return create_autospec(IDbSession)
 
 
+@pytest.fixture
+def mock_book_repository() -> Mock:
+    return create_autospec(IBookRepository)
+
+
 @pytest.fixture
 def mock_book_kind_repository() -> Mock:
     return create_autospec(IBookKindRepository)
@@ -33,11 +40,13 @@ def mock_book_genre_repository() -> Mock:
 
 @pytest.fixture
 def search_repository(
+    mock_book_repository: Mock,
     mock_book_kind_repository: Mock,
     mock_book_genre_repository: Mock,
     mock_db_session: Mock,
 ) -> SearchRepository:
     return SearchRepository(
+        mock_book_repository,
         mock_book_kind_repository,
         mock_book_genre_repository,
         mock_db_session,
@@ -62,8 +71,11 @@ def test_search_books_by_query(
         mock_db_session.paginate = Mock(return_value=mock_pagination)
 
         page = 1
+
+        per_page = 20
         result = search_repository.search(
             page=page,
+            per_page=per_page,
             query=Mock(),
             id_book_genre=None,
             id_book_kind=None,
@@ -107,8 +119,11 @@ def test_search_books_by_id_book_genre(
         mock_db_session.paginate = Mock(return_value=mock_pagination)
 
         page = 1
+
+        per_page = 20
         result = search_repository.search(
             page=page,
+            per_page=per_page,
             query=None,
             id_book_genre=Mock(),
             id_book_kind=None,
@@ -153,8 +168,11 @@ def test_search_books_by_id_book_kind(
         mock_db_session.paginate = Mock(return_value=mock_pagination)
 
         page = 1
+
+        per_page = 20
         result = search_repository.search(
             page=page,
+            per_page=per_page,
             query=None,
             id_book_genre=None,
             id_book_kind=Mock(),
@@ -196,8 +214,11 @@ def test_search_books_max_price(
         mock_db_session.paginate = Mock(return_value=mock_pagination)
 
         page = 1
+
+        per_page = 20
         result = search_repository.search(
             page=page,
+            per_page=per_page,
             query=None,
             id_book_genre=None,
             id_book_kind=None,
@@ -238,8 +259,11 @@ def test_search_books_min_price(
         mock_db_session.paginate = Mock(return_value=mock_pagination)
 
         page = 1
+
+        per_page = 20
         result = search_repository.search(
             page=page,
+            per_page=per_page,
             query=None,
             id_book_genre=None,
             id_book_kind=None,
@@ -280,8 +304,11 @@ def test_search_books_release_year(
         mock_db_session.paginate = Mock(return_value=mock_pagination)
 
         page = 1
+
+        per_page = 20
         result = search_repository.search(
             page=page,
+            per_page=per_page,
             query=None,
             id_book_genre=None,
             id_book_kind=None,
@@ -302,3 +329,55 @@ def test_search_books_release_year(
         assert result.next_num == mock_pagination.next_num
 
         mock_db_session.paginate.assert_called_once()
+
+
+def test_search_books_caches_page_ids_per_normalized_filters(
+    search_repository: SearchRepository,
+    app: Flask,
+    mock_db_session: Mock,
+    mock_book_repository: Mock,
+):
+    with app.app_context():
+        mock_books = [Mock(Book, id=id) for id in (3, 1, 2)]
+        mock_pagination = Mock(Pagination)
+        mock_pagination.items = mock_books
+        mock_pagination.total = 13
+
+        mock_db_session.paginate = Mock(return_value=mock_pagination)
+        mock_book_repository.get_many_by_ids = Mock(return_value=[*mock_books, None])
+
+        filters = {
+            'id_book_genre': None,
+            'id_book_kind': None,
+            'release_year': None,
+            'min_price': None,
+        }
+
+        search_repository.search(
+            page=2, per_page=3, query='George', max_price=Decimal('10.5'), **filters
+        )
+        result = search_repository.search(
+            page=2,
+            per_page=3,
+            query=' george ',
+            max_price=Decimal('10.50'),
+            relationships=['book_kind'],
+            **filters,
+        )
+
+        assert isinstance(result, ListPagination)
+        assert result.items == mock_books
+        assert result.total == 13
+        assert result.page == 2
+        assert result.per_page == 3
+        assert result.pages == 5
+
+        mock_db_session.paginate.assert_called_once()
+        mock_book_repository.get_many_by_ids.assert_called_once_with([3, 1, 2], ['book_kind'])
+
+        CatalogVersion.bump()
+        search_repository.search(
+            page=2, per_page=3, query='george', max_price=Decimal('10.5'), **filters
+        )
+
+        assert mock_db_session.paginate.call_count == 2
@@ -1,3 +1,4 @@
+from typing import Sequence
 from unittest.mock import Mock, create_autospec, patch
 
 import pytest
@@ -10,6 +11,12 @@ from model import User
 from repository.impl import UserRepository
 
 
+def raise_already_exists(
+    model: object, already_exists: Exception, unique_columns: Sequence[str]
+) -> None:
+    raise already_exists
+
+
 @pytest.fixture
 def app() -> Flask:
     return create_app(True)
@@ -36,37 +43,36 @@ def user(app: Flask) -> User:
 
 
 def test_create_user(user_repository: UserRepository, app: Flask, mock_db_session: Mock):
-    with app.app_context(), patch(
-        'repository.impl.user_repository.UserRepository._user_already_exists',
-        return_value=False,
-    ):
+    with app.app_context():
         mock_user = Mock(User)
         result = user_repository.add(mock_user)
 
         assert result is None
 
-        mock_db_session.add.assert_called_once_with(mock_user)
+        mock_db_session.get_one.assert_not_called()
+        mock_db_session.add_unique.assert_called_once()
+
+        model, already_exists, unique_columns = mock_db_session.add_unique.call_args.args
+        assert model == mock_user
+        assert isinstance(already_exists, UserException.UserAlreadyExists)
+        assert unique_columns == ('username', 'username_normalized')
 
 
 def test_when_try_to_create_user_already_exists_raises_UserAlreadyExists(
     user_repository: UserRepository, app: Flask, mock_db_session: Mock, user: User
 ):
     with app.app_context(), pytest.raises(UserException.UserAlreadyExists):
-        mock_db_session.get_one = Mock(return_value=user)
+        mock_db_session.add_unique = Mock(side_effect=raise_already_exists)
 
         mock_user = Mock(User)
+        mock_user.username = 'Frigatto'
         user_repository.add(mock_user)
 
 
-def test_update_user_username(
-    user_repository: UserRepository, app: Flask, mock_db_session: Mock, user: User
-):
+def test_update_user(user_repository: UserRepository, app: Flask, mock_db_session: Mock):
     with app.app_context(), patch(
-        'repository.impl.user_repository.UserRepository._user_already_exists',
-        return_value=False,
-    ):
-        mock_db_session.get_one = Mock(return_value=user.username)
-
+        'repository.impl.user_repository.invalidate_cached_user'
+    ) as mock_invalidate_cached_user:
         mock_user = Mock(User)
         mock_user.username = 'new_username'
 
@@ -74,23 +80,15 @@ def test_update_user_username(
 
         assert result is None
 
-        mock_db_session.update.assert_called_once()
-
+        mock_db_session.exists.assert_not_called()
+        mock_db_session.update_unique.assert_called_once()
 
-def test_when_try_to_update_user_username_to_already_existing_username_raises_UserAlreadyExists(
-    user_repository: UserRepository, app: Flask, mock_db_session: Mock
-):
-    with pytest.raises(UserException.UserAlreadyExists), app.app_context():
-        with patch(
-            'repository.impl.user_repository.UserRepository._user_already_exists',
-            return_value=True,
-        ):
-            mock_db_session.get_one = Mock(return_value=Mock())
+        model, already_exists, unique_columns = mock_db_session.update_unique.call_args.args
+        assert model == mock_user
+        assert isinstance(already_exists, UserException.UserAlreadyExists)
+        assert unique_columns == ('username', 'username_normalized')
 
-            mock_user = Mock(User)
-            mock_user.username = 'frigatto'
-
-            user_repository.update(mock_user)
+        mock_invalidate_cached_user.assert_called_once_with(mock_user.id)
 
 
 def test_get_user_by_username_returns_User(
@@ -99,7 +97,7 @@ def test_get_user_by_username_returns_User(
     with app.app_context():
         mock_db_session.get_one = Mock(return_value=user)
 
-        result = user_repository.get_by_username(Mock())
+        result = user_repository.get_by_username('Frigatto')
 
         assert isinstance(result, User)
         assert result == user
@@ -113,7 +111,7 @@ def test_get_user_by_username_returns_None(
     with app.app_context():
         mock_db_session.get_one = Mock(return_value=None)
 
-        result = user_repository.get_by_username(Mock())
+        result = user_repository.get_by_username('Frigatto')
 
         assert result is None
 
@@ -131,3 +129,12 @@ def test_delete_user(user_repository: UserRepository, app: Flask, mock_db_sessio
 
         mock_db_session.delete.assert_called_once_with(mock_user)
         mock_UserImageUploader_delete.assert_called_once_with(mock_user.img_url)
+
+
+def test_when_update_user_violates_a_unique_constraint_raises_UserAlreadyExists(
+    user_repository: UserRepository, app: Flask, mock_db_session: Mock
+):
+    with pytest.raises(UserException.UserAlreadyExists), app.app_context():
+        mock_db_session.update_unique = Mock(side_effect=raise_already_exists)
+
+        user_repository.update(Mock(User))
@@ -0,0 +1,100 @@
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from app import create_app
+from db import db
+from model import User
+from security import invalidate_cached_user
+from security.jwt import user_lookup_callback
+
+
+@pytest.fixture
+def app() -> Flask:
+    app = create_app(True)
+
+    with app.app_context():
+        db.create_all()
+
+        db.session.execute(
+            text(
+                """--sql
+                INSERT INTO users (username, username_normalized, password, img_url)
+                    VALUES (:username, :username_normalized, :password, :img_url)
+                """
+            ),
+            {
+                'username': 'test',
+                'username_normalized': 'test',
+                'password': 'hash',
+                'img_url': 'http://localhost:5000/users/photos/test.jpg',
+            },
+        )
+        db.session.commit()
+
+    return app
+
+
+def lookup_user_in_new_request(app: Flask) -> User | None:
+    with app.test_request_context():
+        user = user_lookup_callback({}, {'sub': 1})
+
+        if user is not None:
+            assert user in db.session
+            assert db.session.is_modified(user) is False
+
+        return user
+
+
+def test_user_lookup_is_cached(app: Flask):
+    with patch('security.jwt.db.session.get', wraps=db.session.get) as mock_session_get:
+        user = lookup_user_in_new_request(app)
+        cached_user = lookup_user_in_new_request(app)
+
+        assert user is not None
+        assert cached_user is not None
+        assert cached_user.id == user.id
+        assert cached_user.username == user.username
+        assert cached_user.password == user.password
+        assert cached_user.img_url == user.img_url
+
+        mock_session_get.assert_called_once_with(User, 1)
+
+
+def test_cached_user_can_be_updated(app: Flask):
+    lookup_user_in_new_request(app)
+
+    with app.test_request_context():
+        user = user_lookup_callback({}, {'sub': 1})
+        user.update_username('another_username')
+        db.session.commit()
+        invalidate_cached_user(user.id)
+
+    with app.app_context():
+        assert db.session.get(User, 1).username == 'another_username'
+
+    assert lookup_user_in_new_request(app).username == 'another_username'
+
+
+def test_user_lookup_after_invalidation_hits_database(app: Flask):
+    with patch('security.jwt.db.session.get', wraps=db.session.get) as mock_session_get:
+        lookup_user_in_new_request(app)
+
+        with app.app_context():
+            invalidate_cached_user(1)
+
+        lookup_user_in_new_request(app)
+
+        assert mock_session_get.call_count == 2
+
+
+def test_user_lookup_with_cache_disabled(app: Flask):
+    app.config['JWT_USER_CACHE_TTL'] = 0
+
+    with patch('security.jwt.db.session.get', wraps=db.session.get) as mock_session_get:
+        lookup_user_in_new_request(app)
+        lookup_user_in_new_request(app)
+
+        assert mock_session_get.call_count == 2
@@ -2,6 +2,7 @@ from unittest.mock import Mock, create_autospec, patch
 
 import pytest
 from flask import Flask
+from werkzeug.security import generate_password_hash
 
 from app import create_app
 from dto.input import LoginInputDTO
@@ -69,6 +70,31 @@ def test_login_with_valid_credentials(
             mock_create_access_token.assert_called_once_with(authenticated_user)
             mock_check_password_hash.assert_called_once_with(mock_dto.password)
             mock_repository.get_by_username.assert_called_once_with(mock_dto.username)
+            mock_repository.update.assert_not_called()
+
+
+def test_login_rehashes_password_hashed_with_old_parameters(
+    auth_service: AuthService, app: Flask, mock_repository: Mock
+):
+    with app.app_context():
+        with patch('flask_jwt_extended.utils.get_current_user', return_value=None), patch(
+            'service.impl.auth_service.create_access_token', return_value='new_token'
+        ):
+            user = User('frigatto', 'Senha@123', 'http://localhost/users/photos/test.jpg')
+            user.password = generate_password_hash('Senha@123', 'pbkdf2:sha256:1000')
+            mock_repository.get_by_username = Mock(return_value=user)
+
+            mock_dto = create_autospec(LoginInputDTO)
+            mock_dto.username = 'frigatto'
+            mock_dto.password = 'Senha@123'
+
+            authenticated_user, _ = auth_service.login(mock_dto)
+
+            assert authenticated_user.password.startswith(app.config['PASSWORD_HASH_METHOD'])
+            assert not authenticated_user.needs_password_rehash()
+            assert authenticated_user.check_password('Senha@123')
+
+            mock_repository.update.assert_called_once_with(user)
 
 
 def test_when_try_to_login_with_invalid_username_raises_InvalidLogin(
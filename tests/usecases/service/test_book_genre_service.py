@@ -44,7 +44,9 @@ def test_get_all_book_genres(
         mock_repository.get_all = Mock(return_value=mock_pagination)
 
         page = 1
-        result = book_genre_service.get_all_book_genres(page)
+
+        per_page = 20
+        result = book_genre_service.get_all_book_genres(page, per_page)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -57,7 +59,7 @@ def test_get_all_book_genres(
         assert result.prev_num == mock_pagination.prev_num
         assert result.next_num == mock_pagination.next_num
 
-        mock_repository.get_all.assert_called_once_with(page)
+        mock_repository.get_all.assert_called_once_with(page, per_page)
 
 
 def test_get_book_genre_by_id(
@@ -116,5 +118,5 @@ def test_update_book_genre(book_genre_service: BookGenreService, app: Flask, moc
         assert isinstance(result, BookGenre)
         assert result.genre == mock_dto.genre
 
-        mock_repository.get_by_id.assert_called_once_with(book_genre_id)
+        mock_repository.get_by_id.assert_called_once_with(book_genre_id, cached=False)
         mock_repository.update.assert_called_once_with(result)
@@ -1,3 +1,6 @@
+import os
+import shutil
+from pathlib import Path
 from unittest.mock import Mock, create_autospec, patch
 
 import pytest
@@ -9,6 +12,7 @@ from exception import BookImgException, ImageException
 from model import Book, BookImg
 from repository import IBookImgRepository, IBookRepository
 from service.impl import BookImgService
+from utils.file.storage import ImageStorage
 from utils.file.uploader import BookImageUploader
 
 
@@ -47,6 +51,25 @@ def test_get_book_photo(
         assert mimetype == 'image/jpeg'
 
 
+def test_get_book_photo_stored_in_sharded_dir(
+    book_img_service: BookImgService,
+    app: Flask,
+    tmp_path: Path,
+):
+    app.config['BOOK_PHOTOS_UPLOAD_DIR'] = str(tmp_path)
+
+    with app.app_context():
+        sharded_path = ImageStorage.get_path(str(tmp_path), 'sharded.jpg')
+        os.makedirs(os.path.dirname(sharded_path))
+        shutil.copyfile('tests/uploads/test.jpg', sharded_path)
+
+        file_path, mimetype = book_img_service.get_book_photo('sharded.jpg')
+
+        assert file_path == sharded_path
+        assert os.path.relpath(file_path, tmp_path).count(os.sep) == 2
+        assert mimetype == 'image/jpeg'
+
+
 def test_when_try_to_get_book_photo_with_filename_does_not_exists_raises_ImageNotFound(
     book_img_service: BookImgService,
     app: Flask,
@@ -71,7 +94,7 @@ def test_add_book_img_to_a_book(
 
         mock_book = Mock(Book)
         mock_book.id = int(book_id)
-        mock_book.book_imgs = [Mock(BookImg) for _ in range(3)]
+        mock_book_img_repository.count_by_book = Mock(return_value=3)
 
         mock_book_repository.get_by_id = Mock(return_value=mock_book)
 
@@ -79,7 +102,8 @@ def test_add_book_img_to_a_book(
 
         mock_dto.img.get_url.assert_called_once()
         mock_dto.img.save.assert_called_once()
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, [])
+        mock_book_img_repository.count_by_book.assert_called_once_with(mock_book.id)
         mock_book_img_repository.add.assert_called_once_with(result)
 
         assert isinstance(result, BookImg)
@@ -91,6 +115,7 @@ def test_when_try_to_add_book_img_to_a_book_with_max_qty_imgs_raises_BookAlready
     book_img_service: BookImgService,
     app: Flask,
     mock_book_repository: Mock,
+    mock_book_img_repository: Mock,
 ):
     with pytest.raises(BookImgException.BookAlreadyHaveImageMaxQty), app.app_context():
         mock_dto = create_autospec(BookImgInputDTO)
@@ -101,7 +126,7 @@ def test_when_try_to_add_book_img_to_a_book_with_max_qty_imgs_raises_BookAlready
 
         mock_book = Mock(Book)
         mock_book.id = int(book_id)
-        mock_book.book_imgs = [Mock(BookImg) for _ in range(5)]
+        mock_book_img_repository.count_by_book = Mock(return_value=5)
 
         mock_book_repository.get_by_id = Mock(return_value=mock_book)
 
@@ -119,7 +144,7 @@ def test_delete_book_img_from_a_book(
 
         mock_book = Mock(Book)
         mock_book.id = int(book_id)
-        mock_book.book_imgs = [Mock(BookImg) for _ in range(3)]
+        mock_book_img_repository.count_by_book = Mock(return_value=3)
 
         mock_book_repository.get_by_id = Mock(return_value=mock_book)
 
@@ -133,7 +158,7 @@ def test_delete_book_img_from_a_book(
 
         result = book_img_service.delete_book_img(book_id, book_img_id)
 
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, [])
         mock_book_img_repository.get_by_id.assert_called_once_with(book_img_id)
         mock_book_img_repository.delete.assert_called_once_with(mock_book_img)
 
@@ -176,7 +201,7 @@ def test_when_try_to_delete_the_last_book_img_from_a_book_raises_BookMustHaveAtL
 
         mock_book = Mock(Book)
         mock_book.id = int(book_id)
-        mock_book.book_imgs = [Mock(BookImg)]
+        mock_book_img_repository.count_by_book = Mock(return_value=1)
 
         mock_book_repository.get_by_id = Mock(return_value=mock_book)
 
@@ -226,7 +251,7 @@ def test_update_book_img_from_a_book(
         mock_BookImageUploader_delete.assert_called_once_with(
             'http://localhost/books/photos/old_image.jpg'
         )
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, [])
         mock_book_img_repository.get_by_id.assert_called_once_with(book_img_id)
         mock_book_img_repository.update.assert_called_once()
 
@@ -6,8 +6,8 @@ from flask import Flask
 from app import create_app
 from dto.input import BookKeywordInputDTO
 from exception import BookKeywordException
-from model import Book, BookKeyword
-from repository import IBookKeywordRepository, IBookRepository
+from model import Book, BookKeyword, Keyword
+from repository import IBookKeywordRepository, IBookRepository, ISearchIndexRepository
 from service.impl import BookKeywordService
 
 
@@ -26,11 +26,20 @@ def mock_book_repository() -> Mock:
     return create_autospec(IBookRepository)
 
 
+@pytest.fixture
+def mock_search_index_repository() -> Mock:
+    return create_autospec(ISearchIndexRepository)
+
+
 @pytest.fixture
 def book_keyword_service(
-    mock_book_repository: Mock, mock_book_keyword_repository: Mock
+    mock_book_repository: Mock,
+    mock_book_keyword_repository: Mock,
+    mock_search_index_repository: Mock,
 ) -> BookKeywordService:
-    return BookKeywordService(mock_book_repository, mock_book_keyword_repository)
+    return BookKeywordService(
+        mock_book_repository, mock_book_keyword_repository, mock_search_index_repository
+    )
 
 
 def test_add_book_keyword_to_a_book(
@@ -38,6 +47,7 @@ def test_add_book_keyword_to_a_book(
     app: Flask,
     mock_book_repository: Mock,
     mock_book_keyword_repository: Mock,
+    mock_search_index_repository: Mock,
 ):
     with app.app_context():
         mock_dto = create_autospec(BookKeywordInputDTO)
@@ -49,29 +59,61 @@ def test_add_book_keyword_to_a_book(
         mock_book.id = int(book_id)
 
         mock_book_repository.get_by_id = Mock(return_value=mock_book)
+        mock_book_keyword_repository.book_has_keyword = Mock(return_value=False)
+
+        mock_keyword = Keyword(mock_dto.keyword)
+        mock_book_keyword_repository.get_or_create_keywords = Mock(return_value=[mock_keyword])
 
         result = book_keyword_service.create_book_keyword(book_id, mock_dto)
 
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, [])
+        mock_book_keyword_repository.book_has_keyword.assert_called_once_with(
+            mock_book.id, mock_dto.keyword
+        )
+        mock_book_keyword_repository.get_or_create_keywords.assert_called_once_with(
+            [mock_dto.keyword]
+        )
         mock_book_keyword_repository.add.assert_called_once_with(result)
+        mock_search_index_repository.add_terms.assert_called_once_with([mock_dto.keyword])
 
         assert isinstance(result, BookKeyword)
         assert result.id_book == mock_book.id
+        assert result.dictionary_keyword == mock_keyword
         assert result.keyword == mock_dto.keyword
 
 
+def test_when_try_to_add_a_keyword_the_book_already_has_raises_BookAlreadyHasThisKeyword(
+    book_keyword_service: BookKeywordService,
+    app: Flask,
+    mock_book_repository: Mock,
+    mock_book_keyword_repository: Mock,
+):
+    with pytest.raises(BookKeywordException.BookAlreadyHasThisKeyword), app.app_context():
+        mock_dto = create_autospec(BookKeywordInputDTO)
+        mock_dto.keyword = 'infantil'
+
+        mock_book_repository.get_by_id = Mock(return_value=Mock(Book))
+        mock_book_keyword_repository.book_has_keyword = Mock(return_value=True)
+
+        try:
+            book_keyword_service.create_book_keyword('1', mock_dto)
+        finally:
+            mock_book_keyword_repository.add.assert_not_called()
+
+
 def test_delete_book_keyword_from_a_book(
     book_keyword_service: BookKeywordService,
     app: Flask,
     mock_book_repository: Mock,
     mock_book_keyword_repository: Mock,
+    mock_search_index_repository: Mock,
 ):
     with app.app_context():
         book_id = '1'
 
         mock_book = Mock(Book)
         mock_book.id = int(book_id)
-        mock_book.book_keywords = [Mock(BookKeyword) for _ in range(3)]
+        mock_book_keyword_repository.count_by_book = Mock(return_value=3)
 
         mock_book_repository.get_by_id = Mock(return_value=mock_book)
 
@@ -85,9 +127,12 @@ def test_delete_book_keyword_from_a_book(
 
         result = book_keyword_service.delete_book_keyword(book_id, book_keyword_id)
 
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, [])
         mock_book_keyword_repository.get_by_id.assert_called_once_with(book_keyword_id)
         mock_book_keyword_repository.delete.assert_called_once_with(mock_book_keyword)
+        mock_search_index_repository.remove_terms.assert_called_once_with(
+            [mock_book_keyword.keyword]
+        )
 
         assert result is None
 
@@ -128,7 +173,7 @@ def test_when_try_to_delete_the_last_book_keyword_from_a_book_raises_BookMustHav
 
         mock_book = Mock(Book)
         mock_book.id = int(book_id)
-        mock_book.book_keywords = [Mock(BookKeyword)]
+        mock_book_keyword_repository.count_by_book = Mock(return_value=1)
 
         mock_book_repository.get_by_id = Mock(return_value=mock_book)
 
@@ -42,7 +42,9 @@ def test_get_all_book_kinds(book_kind_service: BookKindService, app: Flask, mock
         mock_repository.get_all = Mock(return_value=mock_pagination)
 
         page = 1
-        result = book_kind_service.get_all_book_kinds(page)
+
+        per_page = 20
+        result = book_kind_service.get_all_book_kinds(page, per_page)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -55,7 +57,7 @@ def test_get_all_book_kinds(book_kind_service: BookKindService, app: Flask, mock
         assert result.prev_num == mock_pagination.prev_num
         assert result.next_num == mock_pagination.next_num
 
-        mock_repository.get_all.assert_called_once_with(page)
+        mock_repository.get_all.assert_called_once_with(page, per_page)
 
 
 def test_get_book_kind_by_id(book_kind_service: BookKindService, app: Flask, mock_repository: Mock):
@@ -112,5 +114,5 @@ def test_update_book_kind(book_kind_service: BookKindService, app: Flask, mock_r
         assert isinstance(result, BookKind)
         assert result.kind == mock_dto.kind
 
-        mock_repository.get_by_id.assert_called_once_with(book_kind_id)
+        mock_repository.get_by_id.assert_called_once_with(book_kind_id, cached=False)
         mock_repository.update.assert_called_once_with(result)
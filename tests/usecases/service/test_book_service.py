@@ -7,8 +7,14 @@ from flask_sqlalchemy.pagination import Pagination
 
 from app import create_app
 from dto.input import CreateBookInputDTO, UpdateBookInputDTO
-from model import Book, BookGenre, BookImg, BookKeyword, BookKind
-from repository import IBookGenreRepository, IBookKindRepository, IBookRepository
+from model import Book, BookGenre, BookImg, BookKeyword, BookKind, Keyword
+from repository import (
+    IBookGenreRepository,
+    IBookKeywordRepository,
+    IBookKindRepository,
+    IBookRepository,
+    ISearchIndexRepository,
+)
 from service.impl import BookService
 from utils.file.uploader import BookImageUploader
 
@@ -33,13 +39,31 @@ def mock_book_kind_repository() -> Mock:
     return create_autospec(IBookKindRepository)
 
 
+@pytest.fixture
+def mock_book_keyword_repository() -> Mock:
+    return create_autospec(IBookKeywordRepository)
+
+
+@pytest.fixture
+def mock_search_index_repository() -> Mock:
+    return create_autospec(ISearchIndexRepository)
+
+
 @pytest.fixture
 def book_service(
     mock_book_repository: Mock,
     mock_book_genre_repository: Mock,
     mock_book_kind_repository: Mock,
+    mock_book_keyword_repository: Mock,
+    mock_search_index_repository: Mock,
 ) -> BookService:
-    return BookService(mock_book_repository, mock_book_genre_repository, mock_book_kind_repository)
+    return BookService(
+        mock_book_repository,
+        mock_book_genre_repository,
+        mock_book_kind_repository,
+        mock_book_keyword_repository,
+        mock_search_index_repository,
+    )
 
 
 def test_get_all_books(book_service: BookService, app: Flask, mock_book_repository: Mock):
@@ -58,7 +82,12 @@ def test_get_all_books(book_service: BookService, app: Flask, mock_book_reposito
         mock_book_repository.get_all = Mock(return_value=mock_pagination)
 
         page = 1
-        result = book_service.get_all_books(page)
+
+        per_page = 20
+        relationships = ['book_genre']
+        sort = 'price_asc'
+        after = None
+        result = book_service.get_all_books(page, per_page, relationships, sort, after)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -71,7 +100,9 @@ def test_get_all_books(book_service: BookService, app: Flask, mock_book_reposito
         assert result.prev_num == mock_pagination.prev_num
         assert result.next_num == mock_pagination.next_num
 
-        mock_book_repository.get_all.assert_called_once_with(page)
+        mock_book_repository.get_all.assert_called_once_with(
+            page, per_page, relationships, sort, after
+        )
 
 
 def test_get_book_by_id(book_service: BookService, app: Flask, mock_book_repository: Mock):
@@ -82,12 +113,27 @@ def test_get_book_by_id(book_service: BookService, app: Flask, mock_book_reposit
 
         mock_book_repository.get_by_id = Mock(return_value=mock_book)
 
-        result = book_service.get_book_by_id(book_id)
+        relationships = ['book_genre']
+        result = book_service.get_book_by_id(book_id, relationships)
 
         assert isinstance(result, Book)
         assert result == mock_book
 
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, relationships)
+
+
+def test_get_books_by_ids(book_service: BookService, app: Flask, mock_book_repository: Mock):
+    with app.app_context():
+        mock_books = [Mock(Book), None]
+        mock_book_repository.get_many_by_ids = Mock(return_value=mock_books)
+
+        ids = [1, 2]
+        relationships = ['book_genre']
+        result = book_service.get_books_by_ids(ids, relationships)
+
+        assert result == mock_books
+
+        mock_book_repository.get_many_by_ids.assert_called_once_with(ids, relationships)
 
 
 def test_create_book(
@@ -96,22 +142,26 @@ def test_create_book(
     mock_book_repository: Mock,
     mock_book_genre_repository: Mock,
     mock_book_kind_repository: Mock,
+    mock_book_keyword_repository: Mock,
+    mock_search_index_repository: Mock,
 ):
     with app.app_context():
         mock_dto = create_autospec(CreateBookInputDTO)
-        mock_dto.name = Mock()
+        mock_dto.name = 'O Pequeno Príncipe'
         mock_dto.price = Mock()
         mock_dto.author = Mock()
         mock_dto.release_year = Mock()
         mock_dto.id_book_kind = Mock()
         mock_dto.id_book_genre = Mock()
-        mock_dto.keywords = [Mock() for _ in range(5)]
+        mock_dto.keywords = ['infantil', 'clássico', 'infantil']
         mock_dto.imgs = [create_autospec(BookImageUploader) for _ in range(3)]
 
         mock_book_kind = Mock(BookKind)
         mock_book_kind_repository.get_by_id = Mock(return_value=mock_book_kind)
         mock_book_genre = Mock(BookGenre)
         mock_book_genre_repository.get_by_id = Mock(return_value=mock_book_genre)
+        mock_keywords = [Keyword('infantil'), Keyword('clássico')]
+        mock_book_keyword_repository.get_or_create_keywords = Mock(return_value=mock_keywords)
 
         result = book_service.create_book(mock_dto)
 
@@ -122,6 +172,12 @@ def test_create_book(
         mock_book_kind_repository.get_by_id.assert_called_once_with(str(mock_dto.id_book_kind))
         mock_book_genre_repository.get_by_id.assert_called_once_with(str(mock_dto.id_book_genre))
         mock_book_repository.add.assert_called_once_with(result)
+        mock_book_keyword_repository.get_or_create_keywords.assert_called_once_with(
+            ['infantil', 'clássico']
+        )
+        mock_search_index_repository.add_terms.assert_called_once_with(
+            [result.name, result.author, 'infantil', 'clássico']
+        )
 
         assert isinstance(result, Book)
         assert result.name == mock_dto.name
@@ -131,29 +187,47 @@ def test_create_book(
         assert result.book_kind == mock_book_kind
         assert result.book_genre == mock_book_genre
         assert all(isinstance(keyword, BookKeyword) for keyword in result.book_keywords)
+        assert [keyword.dictionary_keyword for keyword in result.book_keywords] == mock_keywords
         assert all(isinstance(img, BookImg) for img in result.book_imgs)
 
 
-def test_delete_book(book_service: BookService, app: Flask, mock_book_repository: Mock):
+def test_delete_book(
+    book_service: BookService,
+    app: Flask,
+    mock_book_repository: Mock,
+    mock_search_index_repository: Mock,
+):
     with app.app_context():
         book_id = '1'
 
+        mock_book = Mock(Book)
+        mock_book_repository.get_by_id = Mock(return_value=mock_book)
+
         result = book_service.delete_book(book_id)
 
         assert result is None
 
+        mock_book_repository.get_by_id.assert_called_once_with(book_id)
         mock_book_repository.delete.assert_called_once_with(book_id)
+        mock_search_index_repository.remove_terms.assert_called_once_with(
+            mock_book.get_search_terms.return_value
+        )
 
 
-def test_update_book_name(book_service: BookService, app: Flask, mock_book_repository: Mock):
+def test_update_book_name(
+    book_service: BookService,
+    app: Flask,
+    mock_book_repository: Mock,
+    mock_search_index_repository: Mock,
+):
     with app.app_context():
         book_id = '1'
 
-        book = Book(Mock(), Mock(), Mock(), Mock())
+        book = Book('antigo nome', Mock(), Mock(), Mock())
         book.book_genre = Mock()
         book.book_kind = Mock()
         book.book_imgs = [BookImg(Mock()) for _ in range(3)]
-        book.book_keywords = [BookKeyword(Mock()) for _ in range(3)]
+        book.book_keywords = [BookKeyword(Keyword(Mock())) for _ in range(3)]
 
         mock_book_repository.get_by_id = Mock(return_value=book)
 
@@ -180,19 +254,27 @@ def test_update_book_name(book_service: BookService, app: Flask, mock_book_repos
         assert result.book_imgs == book.book_imgs
         assert result.book_keywords == book.book_keywords
 
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, None)
         mock_book_repository.update.assert_called_once_with(result)
 
+        keywords = [keyword.keyword for keyword in book.book_keywords]
+        mock_search_index_repository.remove_terms.assert_called_once_with(
+            ['antigo nome', book.author, *keywords]
+        )
+        mock_search_index_repository.add_terms.assert_called_once_with(
+            [mock_dto.name, book.author, *keywords]
+        )
+
 
 def test_update_book_price(book_service: BookService, app: Flask, mock_book_repository: Mock):
     with app.app_context():
         book_id = '1'
 
-        book = Book(Mock(), Mock(), Mock(), Mock())
+        book = Book('Livro', Mock(), Mock(), Mock())
         book.book_genre = Mock()
         book.book_kind = Mock()
         book.book_imgs = [BookImg(Mock()) for _ in range(3)]
-        book.book_keywords = [BookKeyword(Mock()) for _ in range(3)]
+        book.book_keywords = [BookKeyword(Keyword(Mock())) for _ in range(3)]
 
         mock_book_repository.get_by_id = Mock(return_value=book)
 
@@ -219,7 +301,7 @@ def test_update_book_price(book_service: BookService, app: Flask, mock_book_repo
         assert result.book_imgs == book.book_imgs
         assert result.book_keywords == book.book_keywords
 
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, None)
         mock_book_repository.update.assert_called_once_with(result)
 
 
@@ -227,11 +309,11 @@ def test_update_book_author(book_service: BookService, app: Flask, mock_book_rep
     with app.app_context():
         book_id = '1'
 
-        book = Book(Mock(), Mock(), Mock(), Mock())
+        book = Book('Livro', Mock(), Mock(), Mock())
         book.book_genre = Mock()
         book.book_kind = Mock()
         book.book_imgs = [BookImg(Mock()) for _ in range(3)]
-        book.book_keywords = [BookKeyword(Mock()) for _ in range(3)]
+        book.book_keywords = [BookKeyword(Keyword(Mock())) for _ in range(3)]
 
         mock_book_repository.get_by_id = Mock(return_value=book)
 
@@ -258,7 +340,7 @@ def test_update_book_author(book_service: BookService, app: Flask, mock_book_rep
         assert result.book_imgs == book.book_imgs
         assert result.book_keywords == book.book_keywords
 
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, None)
         mock_book_repository.update.assert_called_once_with(result)
 
 
@@ -268,11 +350,11 @@ def test_update_book_release_year(
     with app.app_context():
         book_id = '1'
 
-        book = Book(Mock(), Mock(), Mock(), Mock())
+        book = Book('Livro', Mock(), Mock(), Mock())
         book.book_genre = Mock()
         book.book_kind = Mock()
         book.book_imgs = [BookImg(Mock()) for _ in range(3)]
-        book.book_keywords = [BookKeyword(Mock()) for _ in range(3)]
+        book.book_keywords = [BookKeyword(Keyword(Mock())) for _ in range(3)]
 
         mock_book_repository.get_by_id = Mock(return_value=book)
 
@@ -299,7 +381,7 @@ def test_update_book_release_year(
         assert result.book_imgs == book.book_imgs
         assert result.book_keywords == book.book_keywords
 
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, None)
         mock_book_repository.update.assert_called_once_with(result)
 
 
@@ -312,11 +394,11 @@ def test_update_book_book_kind(
     with app.app_context():
         book_id = '1'
 
-        book = Book(Mock(), Mock(), Mock(), Mock())
+        book = Book('Livro', Mock(), Mock(), Mock())
         book.book_genre = Mock()
         book.book_kind = Mock()
         book.book_imgs = [BookImg(Mock()) for _ in range(3)]
-        book.book_keywords = [BookKeyword(Mock()) for _ in range(3)]
+        book.book_keywords = [BookKeyword(Keyword(Mock())) for _ in range(3)]
 
         mock_book_repository.get_by_id = Mock(return_value=book)
 
@@ -347,7 +429,7 @@ def test_update_book_book_kind(
         assert result.book_keywords == book.book_keywords
 
         mock_book_kind_repository.get_by_id.assert_called_once_with(mock_dto.id_book_kind)
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, None)
         mock_book_repository.update.assert_called_once_with(result)
 
 
@@ -360,11 +442,11 @@ def test_update_book_book_genre(
     with app.app_context():
         book_id = '1'
 
-        book = Book(Mock(), Mock(), Mock(), Mock())
+        book = Book('Livro', Mock(), Mock(), Mock())
         book.book_genre = Mock()
         book.book_kind = Mock()
         book.book_imgs = [BookImg(Mock()) for _ in range(3)]
-        book.book_keywords = [BookKeyword(Mock()) for _ in range(3)]
+        book.book_keywords = [BookKeyword(Keyword(Mock())) for _ in range(3)]
 
         mock_book_repository.get_by_id = Mock(return_value=book)
 
@@ -395,5 +477,5 @@ def test_update_book_book_genre(
         assert result.book_keywords == book.book_keywords
 
         mock_book_genre_repository.get_by_id.assert_called_once_with(mock_dto.id_book_genre)
-        mock_book_repository.get_by_id.assert_called_once_with(book_id)
+        mock_book_repository.get_by_id.assert_called_once_with(book_id, None)
         mock_book_repository.update.assert_called_once_with(result)
@@ -62,7 +62,10 @@ def test_get_all_saved_books(
         mock_saved_book_repository.get_all = Mock(return_value=mock_pagination)
 
         page = 1
-        result = saved_book_service.get_all_saved_books(page)
+
+        per_page = 20
+        relationships = ['book_genre']
+        result = saved_book_service.get_all_saved_books(page, per_page, relationships)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -75,7 +78,7 @@ def test_get_all_saved_books(
         assert result.prev_num == mock_pagination.prev_num
         assert result.next_num == mock_pagination.next_num
 
-        mock_saved_book_repository.get_all.assert_called_once_with(page)
+        mock_saved_book_repository.get_all.assert_called_once_with(page, per_page, relationships)
 
 
 def test_save_book(
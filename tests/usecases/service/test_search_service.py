@@ -5,9 +5,10 @@ from flask import Flask
 from flask_sqlalchemy.pagination import Pagination
 
 from app import create_app
-from dto.input import SearchInputDTO
+from db import CursorPagination
+from dto.input import SearchInputDTO, SearchSuggestInputDTO
 from model import Book
-from repository import ISearchRepository
+from repository import ISearchIndexRepository, ISearchRepository
 from service.impl import SearchService
 
 
@@ -22,8 +23,13 @@ def mock_repository() -> Mock:
 
 
 @pytest.fixture
-def search_service(mock_repository: Mock) -> SearchService:
-    return SearchService(mock_repository)
+def mock_search_index_repository() -> Mock:
+    return create_autospec(ISearchIndexRepository)
+
+
+@pytest.fixture
+def search_service(mock_repository: Mock, mock_search_index_repository: Mock) -> SearchService:
+    return SearchService(mock_repository, mock_search_index_repository)
 
 
 def test_search_all_books(search_service: SearchService, app: Flask, mock_repository: Mock):
@@ -50,7 +56,12 @@ def test_search_all_books(search_service: SearchService, app: Flask, mock_reposi
         mock_dto.max_price = Mock()
 
         page = 1
-        result = search_service.search_books(page, mock_dto)
+
+        per_page = 20
+        relationships = ['book_genre']
+        sort = 'relevance'
+        after = None
+        result = search_service.search_books(page, per_page, mock_dto, relationships, sort, after)
 
         assert isinstance(result, Pagination)
         assert result.items == mock_pagination.items
@@ -65,10 +76,128 @@ def test_search_all_books(search_service: SearchService, app: Flask, mock_reposi
 
         mock_repository.search.assert_called_once_with(
             page=page,
+            per_page=per_page,
             query=mock_dto.query,
             id_book_genre=mock_dto.id_book_genre,
             id_book_kind=mock_dto.id_book_kind,
             release_year=mock_dto.release_year,
             min_price=mock_dto.min_price,
             max_price=mock_dto.max_price,
+            relationships=relationships,
+            sort=sort,
+            after=after,
         )
+
+
+def test_get_search_facets(search_service: SearchService, app: Flask, mock_repository: Mock):
+    with app.app_context():
+        mock_facets = {'book_genre': [{'id': 1, 'genre': 'fábula', 'count': 2}]}
+        mock_repository.get_facets = Mock(return_value=mock_facets)
+
+        mock_dto = create_autospec(SearchInputDTO)
+        mock_dto.query = Mock()
+        mock_dto.id_book_genre = Mock()
+        mock_dto.id_book_kind = Mock()
+        mock_dto.release_year = Mock()
+        mock_dto.min_price = Mock()
+        mock_dto.max_price = Mock()
+
+        facets = ['book_genre']
+        result = search_service.get_search_facets(mock_dto, facets)
+
+        assert result == mock_facets
+
+        mock_repository.get_facets.assert_called_once_with(
+            query=mock_dto.query,
+            id_book_genre=mock_dto.id_book_genre,
+            id_book_kind=mock_dto.id_book_kind,
+            release_year=mock_dto.release_year,
+            min_price=mock_dto.min_price,
+            max_price=mock_dto.max_price,
+            facets=facets,
+        )
+
+
+def test_suggest_search_terms(
+    search_service: SearchService, app: Flask, mock_search_index_repository: Mock
+):
+    with app.app_context():
+        mock_suggestions = ['George Orwell', 'governo']
+        mock_search_index_repository.suggest = Mock(return_value=mock_suggestions)
+
+        mock_dto = create_autospec(SearchSuggestInputDTO)
+        mock_dto.q = 'g'
+        mock_dto.limit = 10
+
+        result = search_service.suggest_search_terms(mock_dto)
+
+        assert result == mock_suggestions
+
+        mock_search_index_repository.suggest.assert_called_once_with(mock_dto.q, mock_dto.limit)
+
+
+def test_get_search_correction(
+    search_service: SearchService,
+    app: Flask,
+    mock_repository: Mock,
+    mock_search_index_repository: Mock,
+):
+    with app.app_context():
+        mock_search_index_repository.correct_query = Mock(return_value='george orwell')
+
+        mock_dto = create_autospec(SearchInputDTO)
+        mock_dto.query = 'george orwel'
+
+        mock_pagination = Mock(Pagination)
+        mock_pagination.total = 0
+
+        result = search_service.get_search_correction(mock_dto, mock_pagination)
+
+        assert result == 'george orwell'
+
+        mock_search_index_repository.correct_query.assert_called_once_with(mock_dto.query)
+        mock_repository.assert_not_called()
+
+
+def test_get_search_correction_of_cursor_page_without_items(
+    search_service: SearchService,
+    app: Flask,
+    mock_search_index_repository: Mock,
+):
+    with app.app_context():
+        mock_search_index_repository.correct_query = Mock(return_value='george orwell')
+
+        mock_dto = create_autospec(SearchInputDTO)
+        mock_dto.query = 'george orwel'
+
+        pagination = CursorPagination([], per_page=20, next_cursor=None)
+
+        assert search_service.get_search_correction(mock_dto, pagination) == 'george orwell'
+
+        mock_search_index_repository.correct_query.assert_called_once_with(mock_dto.query)
+
+
+def test_get_search_correction_when_query_has_results(
+    search_service: SearchService,
+    app: Flask,
+    mock_search_index_repository: Mock,
+):
+    with app.app_context():
+        mock_dto = create_autospec(SearchInputDTO)
+        mock_dto.query = 'george orwell'
+
+        mock_pagination = Mock(Pagination)
+        mock_pagination.total = 2
+
+        assert search_service.get_search_correction(mock_dto, mock_pagination) is None
+
+        pagination = CursorPagination([Mock(Book)], per_page=20, next_cursor=None)
+
+        assert search_service.get_search_correction(mock_dto, pagination) is None
+
+        mock_dto.query = None
+        mock_pagination.total = 0
+
+        assert search_service.get_search_correction(mock_dto, mock_pagination) is None
+
+        mock_search_index_repository.correct_query.assert_not_called()
@@ -40,8 +40,8 @@ def user(app: Flask) -> User:
 def test_create_user(user_service: UserService, app: Flask, mock_repository: Mock):
     with app.app_context():
         with patch(
-            'model.user_model.generate_password_hash', return_value='123'
-        ) as mock_generate_password_hash, patch(
+            'model.user_model.PasswordHasher.hash', return_value='123'
+        ) as mock_PasswordHasher_hash, patch(
             'flask_jwt_extended.utils.get_current_user', return_value=None
         ):
             mock_dto = create_autospec(CreateUserInputDTO)
@@ -52,7 +52,7 @@ def test_create_user(user_service: UserService, app: Flask, mock_repository: Moc
 
             result = user_service.create_user(mock_dto)
 
-            mock_generate_password_hash.assert_called_once_with(mock_dto.password)
+            mock_PasswordHasher_hash.assert_called_once_with(mock_dto.password)
             mock_dto.img.save.assert_called_once()
             mock_dto.img.get_url.assert_called_once()
             mock_repository.add.assert_called_once_with(result)
@@ -138,8 +138,8 @@ def test_update_username(user_service: UserService, app: Flask, mock_repository:
 def test_update_password(user_service: UserService, app: Flask, mock_repository: Mock, user: User):
     with app.app_context():
         with patch(
-            'model.user_model.generate_password_hash', return_value='123'
-        ) as mock_generate_password_hash, patch(
+            'model.user_model.PasswordHasher.hash', return_value='123'
+        ) as mock_PasswordHasher_hash, patch(
             'flask_jwt_extended.utils.get_current_user', return_value=user
         ):
             mock_dto = create_autospec(UpdateUserInputDTO)
@@ -158,7 +158,7 @@ def test_update_password(user_service: UserService, app: Flask, mock_repository:
             assert result.password == '123'
             assert result.img_url == user.img_url
 
-            mock_generate_password_hash.assert_called_once_with(mock_dto.password)
+            mock_PasswordHasher_hash.assert_called_once_with(mock_dto.password)
             mock_repository.update.assert_called_once_with(result)
 
 
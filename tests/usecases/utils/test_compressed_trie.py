@@ -0,0 +1,57 @@
+from utils.search import CompressedTrie
+
+
+def test_complete_terms_by_prefix_ranked_by_popularity():
+    trie = CompressedTrie(['romance', 'Romance policial', 'roma', 'terror'])
+    trie.add('Romance policial', count=2)
+
+    assert trie.complete('rom', 10) == ['Romance policial', 'roma', 'romance']
+    assert trie.complete('rom', 1) == ['Romance policial']
+    assert trie.complete('ROMANCE ', 10) == ['Romance policial', 'romance']
+    assert trie.complete('romance  p', 10) == ['Romance policial']
+    assert trie.complete('x', 10) == []
+
+
+def test_terms_are_merged_case_and_space_insensitively():
+    trie = CompressedTrie(['George Orwell', 'george  orwell', 'governo'])
+
+    assert trie.complete('g', 10) == ['George Orwell', 'governo']
+
+
+def test_remove_term():
+    trie = CompressedTrie(['roma', 'romance', 'romance', 'romance'])
+
+    trie.remove('romance')
+    assert trie.complete('rom', 10) == ['romance', 'roma']
+
+    trie.remove('romance', count=1)
+    assert trie.complete('rom', 10) == ['roma', 'romance']
+
+    trie.remove('romance')
+    assert trie.complete('rom', 10) == ['roma']
+
+    trie.remove('roma')
+    trie.remove('inexistente')
+    assert trie.complete('', 10) == []
+
+
+def test_complete_terms_after_many_changes():
+    words = [f'{letter}{number}' for letter in 'abc' for number in range(30)]
+    counts: dict[str, int] = {}
+    trie = CompressedTrie()
+
+    for index, word in enumerate(words * 3):
+        if index % 4 == 3 and counts.get(word):
+            trie.remove(word)
+            counts[word] -= 1
+        else:
+            trie.add(word)
+            counts[word] = counts.get(word, 0) + 1
+
+    for prefix in ('', 'a', 'b1', 'c2', 'c29'):
+        expected = sorted(
+            (word for word, count in counts.items() if count and word.startswith(prefix)),
+            key=lambda word: (-counts[word], word),
+        )[:10]
+
+        assert trie.complete(prefix, 10) == expected
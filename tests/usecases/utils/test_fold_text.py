@@ -0,0 +1,20 @@
+from utils.text import fold_text
+
+
+def test_fold_text():
+    assert fold_text('  O Pequeno Príncipe ') == 'o pequeno principe'
+    assert fold_text('AÇÃO') == 'acao'
+    assert fold_text('1984') == '1984'
+
+
+def test_fold_text_keeps_the_length_of_the_text():
+    assert fold_text('Straße') == 'straße'
+
+
+def test_fold_text_is_never_longer_than_the_text():
+    for text in ('ﬃ', 'Livro ½', '한국어', 'İstanbul', 'x' * 79 + 'ﬁ'):
+        assert len(fold_text(text)) <= len(text)
+
+    assert fold_text('ﬃ') == 'ﬃ'
+    assert fold_text('한국어') == '한국어'
+    assert fold_text('İstanbul') == 'istanbul'
@@ -0,0 +1,68 @@
+import struct
+from io import BytesIO
+
+import pytest
+from flask import Flask
+from werkzeug.datastructures import FileStorage
+
+from app import create_app
+from utils.file.validator import BookImageValidator
+
+
+@pytest.fixture()
+def app():
+    app = create_app(True)
+
+    with app.app_context():
+        yield app
+
+
+def create_jpeg(*segments: bytes, width: int = 640, height: int = 480) -> FileStorage:
+    sof = b'\xff\xc0' + struct.pack('>HBHHB', 8, 8, height, width, 3)
+    content = b'\xff\xd8' + b''.join(segments) + sof + b'\xff\xda'
+
+    return FileStorage(BytesIO(content), 'image.jpg')
+
+
+def test_get_png_dimensions(app: Flask):
+    header = b'\x89PNG\r\n\x1a\n' + struct.pack('>I4sII', 13, b'IHDR', 800, 600)
+
+    file = FileStorage(BytesIO(header), 'image.png')
+
+    assert BookImageValidator.get_dimensions(file) == (800, 600)
+
+
+def test_get_jpeg_dimensions(app: Flask):
+    app0 = b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00' + bytes(9)
+
+    assert BookImageValidator.get_dimensions(create_jpeg(app0)) == (640, 480)
+
+
+def test_get_jpeg_dimensions_skips_fill_bytes_and_standalone_markers(app: Flask):
+    app0 = b'\xff\xff\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00' + bytes(9)
+    restart = b'\xff\xd0'
+
+    file = create_jpeg(app0, restart, b'\xff\xff')
+
+    assert BookImageValidator.get_dimensions(file) == (640, 480)
+    assert file.stream.tell() == 0
+
+
+def test_get_dimensions_of_invalid_content(app: Flask):
+    contents = (
+        b'not an image',
+        b'\x89PNG\r\n\x1a\n' + struct.pack('>I4sII', 13, b'IDAT', 800, 600),
+        b'\xff\xd8\x00\xe0',
+        b'\xff\xd8' + b'\xff' * 2000,
+        b'\xff\xd8\xff\xe0\x00',
+    )
+
+    for content in contents:
+        assert BookImageValidator.get_dimensions(FileStorage(BytesIO(content), 'image.jpg')) is None
+
+
+def test_has_valid_dimensions(app: Flask):
+    max_pixels = app.config['IMAGE_MAX_PIXELS']
+
+    assert BookImageValidator.has_valid_dimensions((max_pixels, 1))
+    assert not BookImageValidator.has_valid_dimensions((max_pixels, 2))
@@ -0,0 +1,35 @@
+from utils.metrics import MetricsRegistry
+
+
+def test_count_samples_by_labels():
+    registry = MetricsRegistry([0.1, 1])
+    registry.inc('requests_total', {'method': 'GET', 'status': '200'})
+    registry.inc('requests_total', {'status': '200', 'method': 'GET'}, 2)
+    registry.inc('requests_total', {'method': 'POST', 'status': '201'})
+
+    assert registry.counters == {
+        ('requests_total', (('method', 'GET'), ('status', '200'))): 3,
+        ('requests_total', (('method', 'POST'), ('status', '201'))): 1,
+    }
+
+
+def test_observe_values_in_buckets():
+    registry = MetricsRegistry([1, 0.1])
+
+    for value in (0.05, 0.1, 0.5, 2):
+        registry.observe('duration_seconds', {}, value)
+
+    assert registry.buckets == (0.1, 1)
+    assert registry.histograms == {('duration_seconds', ()): [2, 1, 1, 2.65, 4]}
+
+
+def test_snapshot():
+    registry = MetricsRegistry([1])
+    registry.inc('requests_total', {'method': 'GET'})
+    registry.observe('duration_seconds', {'method': 'GET'}, 0.5)
+
+    assert registry.snapshot() == {
+        'buckets': [1],
+        'counters': [['requests_total', (('method', 'GET'),), 1]],
+        'histograms': [['duration_seconds', (('method', 'GET'),), [1, 0, 0.5, 1]]],
+    }
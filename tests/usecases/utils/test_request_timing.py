@@ -0,0 +1,27 @@
+from unittest.mock import patch
+
+from flask import Flask, g
+
+from app import create_app
+from utils.timing import RequestTiming
+
+
+def test_nested_serialization_is_timed_once():
+    app: Flask = create_app(True)
+
+    with app.test_request_context(), patch(
+        'utils.timing.request_timing.time.perf_counter', side_effect=[0, 1, 3]
+    ):
+        RequestTiming.start()
+
+        with RequestTiming.measure_serialization():
+            with RequestTiming.measure_serialization():
+                pass
+
+        assert g.request_timing['serialization_time'] == 2
+        assert g.request_timing['serialization_depth'] == 0
+
+
+def test_serialization_outside_a_request_is_not_timed():
+    with RequestTiming.measure_serialization():
+        pass
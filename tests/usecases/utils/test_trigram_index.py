@@ -0,0 +1,43 @@
+from utils.search import TrigramIndex
+
+
+def test_similar_words_ranked_by_similarity():
+    index = TrigramIndex(['George Orwell', 'O Pequeno Príncipe', 'Orwellian'])
+
+    assert [word for word, _ in index.similar('orwel', limit=10, min_similarity=0.3)] == [
+        'orwell',
+        'orwellian',
+    ]
+    assert index.similar('orwell', limit=1, min_similarity=0.3) == [('orwell', 1.0)]
+    assert index.similar('xyz', limit=10, min_similarity=0.3) == []
+
+
+def test_similar_words_tie_broken_by_popularity():
+    index = TrigramIndex(['gato', 'pato', 'pato'])
+
+    assert [word for word, _ in index.similar('fato', limit=10, min_similarity=0.1)] == [
+        'pato',
+        'gato',
+    ]
+
+
+def test_correct_only_unknown_words():
+    index = TrigramIndex(['O Pequeno Príncipe', 'George Orwell'])
+
+    assert index.correct('pequino príncipe', min_similarity=0.3) == 'pequeno príncipe'
+    assert index.correct('Jorge ORWEL', min_similarity=0.3) == 'george orwell'
+    assert index.correct('pequeno', min_similarity=0.3) is None
+    assert index.correct('xyz', min_similarity=0.3) is None
+
+
+def test_remove_term():
+    index = TrigramIndex(['romance', 'Romance policial'])
+
+    index.remove('romance')
+    assert 'romance' in index
+
+    index.remove('Romance policial')
+    index.remove('inexistente')
+    assert 'romance' not in index
+    assert 'policial' not in index
+    assert index.similar('romance', limit=10, min_similarity=0) == []
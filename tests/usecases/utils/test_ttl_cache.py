@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+from utils.cache import TTLCache
+
+
+def test_get_cached_value():
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    cache.set('a', 1)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_cached_value_expires():
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+
+    with patch('utils.cache.ttl_cache.time.monotonic', return_value=100):
+        cache.set('a', 1)
+
+    with patch('utils.cache.ttl_cache.time.monotonic', return_value=110):
+        assert cache.get('a') is None
+
+
+def test_least_recently_used_value_is_evicted():
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_delete_and_clear_cached_values():
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    cache.delete('a')
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+    cache.clear()
+    assert cache.get('b') is None
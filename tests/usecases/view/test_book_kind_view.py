@@ -23,6 +23,7 @@ def mock_controller() -> Mock:
 
 def test_get_all_book_kinds(app: Flask, mock_controller: Mock):
     mock_page = Mock()
+    mock_per_page = Mock()
     mock_serialization = Mock()
 
     mock_json = Mock()
@@ -31,6 +32,8 @@ def test_get_all_book_kinds(app: Flask, mock_controller: Mock):
 
     with app.app_context():
         with patch('view.book_kind_view.Request.get_int_arg', return_value=mock_page), patch(
+            'view.book_kind_view.Request.get_per_page', return_value=mock_per_page
+        ), patch(
             'view.book_kind_view.BookKindOutputDTO.dump_many', return_value=mock_serialization
         ) as mock_BookKindOutputDTO_dump_many, patch(
             'view.book_kind_view.PaginationResponse', return_value=mock_json
@@ -44,7 +47,7 @@ def test_get_all_book_kinds(app: Flask, mock_controller: Mock):
             assert isinstance(result, Response)
             assert result == mock_response
 
-            mock_controller.get_all_book_kinds.assert_called_once_with(mock_page)
+            mock_controller.get_all_book_kinds.assert_called_once_with(mock_page, mock_per_page)
             mock_BookKindOutputDTO_dump_many.assert_called_once_with(mock_pagination.items)
             mock_PaginationResponse.assert_called_once_with(mock_serialization, mock_pagination)
             mock_json.json.assert_called_once()
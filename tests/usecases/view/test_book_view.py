@@ -7,7 +7,8 @@ from werkzeug.datastructures import ImmutableMultiDict
 
 from app import create_app
 from controller import IBookController
-from dto.input import CreateBookInputDTO, UpdateBookInputDTO
+from db import CursorPagination
+from dto.input import BookFieldsInputDTO, BookSortInputDTO, CreateBookInputDTO, UpdateBookInputDTO
 from model import Book
 from view.book_view import BookView
 
@@ -24,14 +25,31 @@ def mock_controller() -> Mock:
 
 def test_get_all_books(app: Flask, mock_controller: Mock):
     mock_page = Mock()
+    mock_per_page = Mock()
     mock_serialization = Mock()
 
+    mock_fields_dto = Mock(BookFieldsInputDTO)
+    mock_fields_dto.relationships = Mock()
+    mock_fields_dto.output_fields = Mock()
+
+    mock_sort_dto = Mock(BookSortInputDTO)
+    mock_sort_dto.sort = Mock()
+    mock_sort_dto.after = None
+
     mock_json = Mock()
     mock_response = Mock(Response)
     mock_json.json = Mock(return_value=mock_response)
 
     with app.app_context():
         with patch('view.book_view.Request.get_int_arg', return_value=mock_page), patch(
+            'view.book_view.Request.get_per_page', return_value=mock_per_page
+        ), patch('view.book_view.BookFieldsInputDTO', return_value=mock_fields_dto), patch(
+            'view.book_view.Request.get_list_arg', return_value=None
+        ), patch(
+            'view.book_view.Request.get_str_arg', return_value=None
+        ), patch(
+            'view.book_view.BookSortInputDTO', return_value=mock_sort_dto
+        ), patch(
             'view.book_view.BookOutputDTO.dump_many', return_value=mock_serialization
         ) as mock_BookOutputDTO_dump_many, patch(
             'view.book_view.PaginationResponse', return_value=mock_json
@@ -45,21 +63,71 @@ def test_get_all_books(app: Flask, mock_controller: Mock):
             assert isinstance(result, Response)
             assert result == mock_response
 
-            mock_controller.get_all_books.assert_called_once_with(mock_page)
-            mock_BookOutputDTO_dump_many.assert_called_once_with(mock_pagination.items)
+            mock_controller.get_all_books.assert_called_once_with(
+                mock_page,
+                mock_per_page,
+                mock_fields_dto.relationships,
+                mock_sort_dto.sort,
+                mock_sort_dto.after,
+            )
+            mock_BookOutputDTO_dump_many.assert_called_once_with(
+                mock_pagination.items, mock_fields_dto.output_fields
+            )
             mock_PaginationResponse.assert_called_once_with(mock_serialization, mock_pagination)
             mock_json.json.assert_called_once()
 
 
+def test_get_all_books_using_cursor(app: Flask, mock_controller: Mock):
+    mock_serialization = Mock()
+
+    mock_fields_dto = Mock(BookFieldsInputDTO)
+    mock_fields_dto.relationships = Mock()
+    mock_fields_dto.output_fields = Mock()
+
+    mock_json = Mock()
+    mock_response = Mock(Response)
+    mock_json.json = Mock(return_value=mock_response)
+
+    with app.app_context():
+        with patch('view.book_view.Request.get_int_arg', return_value=1), patch(
+            'view.book_view.Request.get_per_page', return_value=20
+        ), patch('view.book_view.BookFieldsInputDTO', return_value=mock_fields_dto), patch(
+            'view.book_view.Request.get_list_arg', return_value=None
+        ), patch(
+            'view.book_view.Request.get_str_arg', return_value='price_asc'
+        ), patch(
+            'view.book_view.BookOutputDTO.dump_many', return_value=mock_serialization
+        ), patch(
+            'view.book_view.CursorPaginationResponse', return_value=mock_json
+        ) as mock_CursorPaginationResponse:
+            mock_pagination = Mock(CursorPagination)
+            mock_pagination.items = Mock()
+            mock_controller.get_all_books = Mock(return_value=mock_pagination)
+
+            result = BookView.get_all_books(mock_controller)
+
+            assert result == mock_response
+
+            mock_CursorPaginationResponse.assert_called_once_with(
+                mock_serialization, mock_pagination
+            )
+
+
 def test_get_book_by_id(app: Flask, mock_controller: Mock):
     mock_serialization = Mock()
 
+    mock_fields_dto = Mock(BookFieldsInputDTO)
+    mock_fields_dto.relationships = Mock()
+    mock_fields_dto.output_fields = Mock()
+
     mock_json = Mock()
     mock_response = Mock(Response)
     mock_json.json = Mock(return_value=mock_response)
 
     with app.app_context():
-        with patch(
+        with patch('view.book_view.BookFieldsInputDTO', return_value=mock_fields_dto), patch(
+            'view.book_view.Request.get_list_arg', return_value=None
+        ), patch(
             'view.book_view.BookOutputDTO.dump', return_value=mock_serialization
         ) as mock_BookOutputDTO_dump, patch(
             'view.book_view.OkResponse', return_value=mock_json
@@ -73,8 +141,12 @@ def test_get_book_by_id(app: Flask, mock_controller: Mock):
             assert isinstance(result, Response)
             assert result == mock_response
 
-            mock_controller.get_book_by_id.assert_called_once_with(book_id)
-            mock_BookOutputDTO_dump.assert_called_once_with(mock_book)
+            mock_controller.get_book_by_id.assert_called_once_with(
+                book_id, mock_fields_dto.relationships
+            )
+            mock_BookOutputDTO_dump.assert_called_once_with(
+                mock_book, mock_fields_dto.output_fields
+            )
             mock_OkResponse.assert_called_once_with(mock_serialization)
             mock_json.json.assert_called_once()
 
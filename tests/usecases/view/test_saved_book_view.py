@@ -6,6 +6,7 @@ from flask_sqlalchemy.pagination import Pagination
 
 from app import create_app
 from controller import ISavedBookController
+from dto.input import BookFieldsInputDTO
 from model import SavedBook
 from view.saved_book_view import SavedBookView
 
@@ -52,16 +53,27 @@ def test_save_book(app: Flask, mock_controller: Mock):
 
 def test_get_all_saved_books(app: Flask, mock_controller: Mock):
     mock_page = Mock()
+    mock_per_page = Mock()
     mock_serialization = Mock()
 
     mock_json = Mock()
     mock_response = Mock(Response)
     mock_json.json = Mock(return_value=mock_response)
 
+    mock_fields_dto = Mock(BookFieldsInputDTO)
+    mock_fields_dto.relationships = Mock()
+    mock_fields_dto.output_fields = Mock()
+
     with app.app_context():
         with patch(
             'flask_jwt_extended.view_decorators.verify_jwt_in_request', return_value=Mock()
         ), patch('view.saved_book_view.Request.get_int_arg', return_value=mock_page), patch(
+            'view.saved_book_view.Request.get_per_page', return_value=mock_per_page
+        ), patch(
+            'view.saved_book_view.BookFieldsInputDTO', return_value=mock_fields_dto
+        ), patch(
+            'view.saved_book_view.Request.get_list_arg', return_value=None
+        ), patch(
             'view.saved_book_view.BookOutputDTO.dump_many', return_value=mock_serialization
         ) as mock_BookOutputDTO_dump_many, patch(
             'view.saved_book_view.PaginationResponse', return_value=mock_json
@@ -75,8 +87,12 @@ def test_get_all_saved_books(app: Flask, mock_controller: Mock):
             assert isinstance(result, Response)
             assert result == mock_response
 
-            mock_controller.get_all_saved_books.assert_called_once_with(mock_page)
-            mock_BookOutputDTO_dump_many.assert_called_once_with(mock_pagination.items)
+            mock_controller.get_all_saved_books.assert_called_once_with(
+                mock_page, mock_per_page, mock_fields_dto.relationships
+            )
+            mock_BookOutputDTO_dump_many.assert_called_once_with(
+                mock_pagination.items, mock_fields_dto.output_fields
+            )
             mock_PaginationResponse.assert_called_once_with(mock_serialization, mock_pagination)
             mock_json.json.assert_called_once()
 
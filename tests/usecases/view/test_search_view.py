@@ -1,4 +1,4 @@
-from unittest.mock import Mock, create_autospec, patch
+from unittest.mock import Mock, call, create_autospec, patch
 
 import pytest
 from flask import Flask, Response
@@ -6,7 +6,13 @@ from flask_sqlalchemy.pagination import Pagination
 
 from app import create_app
 from controller import ISearchController
-from dto.input import SearchInputDTO
+from db import CursorPagination
+from dto.input import (
+    BookFieldsInputDTO,
+    SearchFacetsInputDTO,
+    SearchInputDTO,
+    SearchSuggestInputDTO,
+)
 from view.search_view import SearchView
 
 
@@ -22,6 +28,7 @@ def mock_controller() -> Mock:
 
 def test_search_books(app: Flask, mock_controller: Mock):
     mock_page = Mock()
+    mock_per_page = Mock()
     mock_serialization = Mock()
 
     mock_json = Mock()
@@ -29,12 +36,25 @@ def test_search_books(app: Flask, mock_controller: Mock):
     mock_json.json = Mock(return_value=mock_response)
 
     mock_dto = create_autospec(SearchInputDTO)
+    mock_fields_dto = Mock(BookFieldsInputDTO)
+    mock_fields_dto.relationships = Mock()
+    mock_fields_dto.output_fields = Mock()
 
     with app.app_context():
-        with patch('view.search_view.SearchInputDTO', return_value=mock_dto), patch(
+        with patch('view.search_view.Request.has_body', return_value=True), patch(
+            'view.search_view.SearchInputDTO', return_value=mock_dto
+        ), patch(
             'view.search_view.Request.get_json', return_value={'test': Mock()}
         ) as mock_Request_get_json, patch(
             'view.search_view.Request.get_int_arg', return_value=mock_page
+        ), patch(
+            'view.search_view.Request.get_per_page', return_value=mock_per_page
+        ), patch(
+            'view.search_view.BookFieldsInputDTO', return_value=mock_fields_dto
+        ), patch(
+            'view.search_view.Request.get_list_arg', return_value=None
+        ), patch(
+            'view.search_view.Request.get_str_arg', return_value=None
         ), patch(
             'view.search_view.BookOutputDTO.dump_many', return_value=mock_serialization
         ) as mock_BookOutputDTO_dump_many, patch(
@@ -43,14 +63,290 @@ def test_search_books(app: Flask, mock_controller: Mock):
             mock_pagination = Mock(Pagination)
             mock_pagination.items = Mock()
             mock_controller.search_books = Mock(return_value=mock_pagination)
+            mock_controller.get_search_correction = Mock(return_value=None)
 
             result = SearchView.search_books(mock_controller)
 
             assert isinstance(result, Response)
             assert result == mock_response
 
-            mock_controller.search_books.assert_called_once_with(mock_page, mock_dto)
+            mock_controller.search_books.assert_called_once_with(
+                mock_page, mock_per_page, mock_dto, mock_fields_dto.relationships, None, None
+            )
             mock_Request_get_json.assert_called_once()
-            mock_BookOutputDTO_dump_many.assert_called_once_with(mock_pagination.items)
-            mock_PaginationResponse.assert_called_once_with(mock_serialization, mock_pagination)
+            mock_BookOutputDTO_dump_many.assert_called_once_with(
+                mock_pagination.items, mock_fields_dto.output_fields
+            )
+            mock_PaginationResponse.assert_called_once_with(
+                mock_serialization, mock_pagination, None, {'Cache-Control': 'no-store'}
+            )
             mock_json.json.assert_called_once()
+
+
+def test_search_books_with_facets(app: Flask, mock_controller: Mock):
+    mock_page = Mock()
+    mock_per_page = Mock()
+    mock_serialization = Mock()
+    mock_facets = Mock()
+
+    mock_json = Mock()
+    mock_response = Mock(Response)
+    mock_json.json = Mock(return_value=mock_response)
+
+    mock_dto = create_autospec(SearchInputDTO)
+    mock_fields_dto = Mock(BookFieldsInputDTO)
+    mock_fields_dto.relationships = Mock()
+    mock_fields_dto.output_fields = Mock()
+    mock_facets_dto = Mock(SearchFacetsInputDTO)
+    mock_facets_dto.facets = ['book_genre']
+
+    with app.app_context():
+        with patch('view.search_view.Request.has_body', return_value=True), patch(
+            'view.search_view.SearchInputDTO', return_value=mock_dto
+        ), patch('view.search_view.Request.get_json', return_value={'test': Mock()}), patch(
+            'view.search_view.Request.get_int_arg', return_value=mock_page
+        ), patch(
+            'view.search_view.Request.get_per_page', return_value=mock_per_page
+        ), patch(
+            'view.search_view.BookFieldsInputDTO', return_value=mock_fields_dto
+        ), patch(
+            'view.search_view.SearchFacetsInputDTO', return_value=mock_facets_dto
+        ), patch(
+            'view.search_view.Request.get_list_arg', return_value=None
+        ), patch(
+            'view.search_view.Request.get_str_arg', return_value=None
+        ), patch(
+            'view.search_view.BookOutputDTO.dump_many', return_value=mock_serialization
+        ), patch(
+            'view.search_view.PaginationResponse', return_value=mock_json
+        ) as mock_PaginationResponse:
+            mock_pagination = Mock(Pagination)
+            mock_pagination.items = Mock()
+            mock_controller.search_books = Mock(return_value=mock_pagination)
+            mock_controller.get_search_correction = Mock(return_value=None)
+            mock_controller.get_search_facets = Mock(return_value=mock_facets)
+
+            result = SearchView.search_books(mock_controller)
+
+            assert result == mock_response
+
+            mock_controller.get_search_facets.assert_called_once_with(
+                mock_dto, mock_facets_dto.facets
+            )
+            mock_PaginationResponse.assert_called_once_with(
+                mock_serialization,
+                mock_pagination,
+                {'facets': mock_facets},
+                {'Cache-Control': 'no-store'},
+            )
+
+
+def test_search_books_with_misspelled_query(app: Flask, mock_controller: Mock):
+    mock_serialization = Mock()
+
+    mock_json = Mock()
+    mock_response = Mock(Response)
+    mock_json.json = Mock(return_value=mock_response)
+
+    mock_dto = create_autospec(SearchInputDTO)
+    mock_corrected_dto = create_autospec(SearchInputDTO)
+    mock_dto.model_copy = Mock(return_value=mock_corrected_dto)
+    mock_fields_dto = Mock(BookFieldsInputDTO)
+    mock_fields_dto.relationships = Mock()
+    mock_fields_dto.output_fields = Mock()
+
+    with app.app_context():
+        with patch('view.search_view.Request.has_body', return_value=True), patch(
+            'view.search_view.SearchInputDTO', return_value=mock_dto
+        ), patch('view.search_view.Request.get_json', return_value={'test': Mock()}), patch(
+            'view.search_view.Request.get_int_arg', return_value=1
+        ), patch(
+            'view.search_view.Request.get_per_page', return_value=20
+        ), patch(
+            'view.search_view.BookFieldsInputDTO', return_value=mock_fields_dto
+        ), patch(
+            'view.search_view.Request.get_list_arg', return_value=None
+        ), patch(
+            'view.search_view.Request.get_str_arg', return_value=None
+        ), patch(
+            'view.search_view.BookOutputDTO.dump_many', return_value=mock_serialization
+        ), patch(
+            'view.search_view.PaginationResponse', return_value=mock_json
+        ) as mock_PaginationResponse:
+            mock_empty_pagination = Mock(Pagination)
+            mock_pagination = Mock(Pagination)
+            mock_pagination.items = Mock()
+            mock_controller.search_books = Mock(
+                side_effect=[mock_empty_pagination, mock_pagination]
+            )
+            mock_controller.get_search_correction = Mock(return_value='george orwell')
+
+            result = SearchView.search_books(mock_controller)
+
+            assert result == mock_response
+
+            mock_controller.get_search_correction.assert_called_once_with(
+                mock_dto, mock_empty_pagination
+            )
+            mock_dto.model_copy.assert_called_once_with(update={'query': 'george orwell'})
+            assert mock_controller.search_books.call_args_list == [
+                call(1, 20, mock_dto, mock_fields_dto.relationships, None, None),
+                call(1, 20, mock_corrected_dto, mock_fields_dto.relationships, None, None),
+            ]
+            mock_PaginationResponse.assert_called_once_with(
+                mock_serialization,
+                mock_pagination,
+                {'did_you_mean': 'george orwell'},
+                {'Cache-Control': 'no-store'},
+            )
+
+
+def test_search_books_using_cursor_is_not_corrected(app: Flask, mock_controller: Mock):
+    mock_json = Mock()
+    mock_response = Mock(Response)
+    mock_json.json = Mock(return_value=mock_response)
+
+    mock_dto = create_autospec(SearchInputDTO)
+    mock_fields_dto = Mock(BookFieldsInputDTO)
+    mock_fields_dto.relationships = Mock()
+
+    with app.app_context():
+        with patch('view.search_view.Request.has_body', return_value=True), patch(
+            'view.search_view.SearchInputDTO', return_value=mock_dto
+        ), patch('view.search_view.Request.get_json', return_value={'test': Mock()}), patch(
+            'view.search_view.Request.get_int_arg', return_value=1
+        ), patch(
+            'view.search_view.Request.get_per_page', return_value=20
+        ), patch(
+            'view.search_view.BookFieldsInputDTO', return_value=mock_fields_dto
+        ), patch(
+            'view.search_view.Request.get_list_arg', return_value=None
+        ), patch(
+            'view.search_view.Request.get_str_arg',
+            side_effect=lambda name: 'cursor' if name == 'after' else None,
+        ), patch(
+            'view.search_view.BookOutputDTO.dump_many', return_value=Mock()
+        ), patch(
+            'view.search_view.CursorPaginationResponse', return_value=mock_json
+        ):
+            pagination = CursorPagination([], per_page=20, next_cursor=None)
+            mock_controller.search_books = Mock(return_value=pagination)
+
+            result = SearchView.search_books(mock_controller)
+
+            assert result == mock_response
+
+            mock_controller.search_books.assert_called_once_with(
+                1, 20, mock_dto, mock_fields_dto.relationships, None, 'cursor'
+            )
+            mock_controller.get_search_correction.assert_not_called()
+
+
+def test_search_books_using_query_string(app: Flask, mock_controller: Mock):
+    mock_serialization = Mock()
+
+    mock_json = Mock()
+    mock_response = Mock(Response)
+    mock_json.json = Mock(return_value=mock_response)
+
+    mock_dto = create_autospec(SearchInputDTO)
+    mock_args = {'q': 'george'}
+
+    with app.app_context():
+        with patch('view.search_view.Request.has_body', return_value=False), patch(
+            'view.search_view.Request.get_args', return_value=mock_args
+        ), patch(
+            'view.search_view.SearchInputDTO.from_query_args', return_value=mock_dto
+        ) as mock_SearchInputDTO_from_query_args, patch(
+            'view.search_view.Request.get_canonical_url', return_value=None
+        ) as mock_Request_get_canonical_url, patch(
+            'view.search_view.Request.get_int_arg', return_value=1
+        ), patch(
+            'view.search_view.Request.get_per_page', return_value=20
+        ), patch(
+            'view.search_view.Request.get_list_arg', return_value=None
+        ), patch(
+            'view.search_view.Request.get_str_arg', return_value=None
+        ), patch(
+            'view.search_view.BookOutputDTO.dump_many', return_value=mock_serialization
+        ), patch(
+            'view.search_view.PaginationResponse', return_value=mock_json
+        ) as mock_PaginationResponse:
+            mock_pagination = Mock(Pagination)
+            mock_pagination.items = Mock()
+            mock_controller.search_books = Mock(return_value=mock_pagination)
+            mock_controller.get_search_correction = Mock(return_value=None)
+
+            result = SearchView.search_books(mock_controller)
+
+            assert result == mock_response
+
+            mock_SearchInputDTO_from_query_args.assert_called_once_with(mock_args)
+            mock_Request_get_canonical_url.assert_called_once_with(
+                mock_dto.to_query_args.return_value
+            )
+            mock_PaginationResponse.assert_called_once_with(
+                mock_serialization,
+                mock_pagination,
+                None,
+                {'Cache-Control': app.config['SEARCH_CACHE_CONTROL'], 'Vary': 'Accept-Encoding'},
+            )
+
+
+def test_search_books_using_non_canonical_query_string_redirects(app: Flask, mock_controller: Mock):
+    mock_json = Mock()
+    mock_response = Mock(Response)
+    mock_json.json = Mock(return_value=mock_response)
+
+    with app.app_context():
+        with patch('view.search_view.Request.has_body', return_value=False), patch(
+            'view.search_view.Request.get_args', return_value={'q': 'George'}
+        ), patch(
+            'view.search_view.SearchInputDTO.from_query_args',
+            return_value=create_autospec(SearchInputDTO),
+        ), patch(
+            'view.search_view.Request.get_canonical_url', return_value='/search?q=george'
+        ), patch(
+            'view.search_view.RedirectResponse', return_value=mock_json
+        ) as mock_RedirectResponse:
+            result = SearchView.search_books(mock_controller)
+
+            assert result == mock_response
+
+            mock_RedirectResponse.assert_called_once_with(
+                '/search?q=george',
+                {'Cache-Control': app.config['SEARCH_CACHE_CONTROL'], 'Vary': 'Accept-Encoding'},
+            )
+            mock_controller.search_books.assert_not_called()
+
+
+def test_suggest_search_terms(app: Flask, mock_controller: Mock):
+    mock_suggestions = Mock()
+
+    mock_json = Mock()
+    mock_response = Mock(Response)
+    mock_json.json = Mock(return_value=mock_response)
+
+    mock_dto = create_autospec(SearchSuggestInputDTO)
+
+    with app.app_context():
+        with patch(
+            'view.search_view.Request.get_str_arg', return_value='g'
+        ) as mock_get_str_arg, patch(
+            'view.search_view.Request.get_int_arg', return_value=5
+        ) as mock_get_int_arg, patch(
+            'view.search_view.SearchSuggestInputDTO', return_value=mock_dto
+        ) as mock_SearchSuggestInputDTO, patch(
+            'view.search_view.OkResponse', return_value=mock_json
+        ) as mock_OkResponse:
+            mock_controller.suggest_search_terms = Mock(return_value=mock_suggestions)
+
+            result = SearchView.suggest_search_terms(mock_controller)
+
+            assert result == mock_response
+
+            mock_get_str_arg.assert_called_once_with('q')
+            mock_get_int_arg.assert_called_once_with('limit', default=10)
+            mock_SearchSuggestInputDTO.assert_called_once_with(q='g', limit=5)
+            mock_controller.suggest_search_terms.assert_called_once_with(mock_dto)
+            mock_OkResponse.assert_called_once_with({'suggestions': mock_suggestions})
@@ -0,0 +1,2 @@
+from .catalog_version import CatalogVersion
+from .ttl_cache import TTLCache
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Generic, Hashable, TypeVar
+
+TKey = TypeVar('TKey', bound=Hashable)
+TValue = TypeVar('TValue')
+
+
+class Cache(ABC, Generic[TKey, TValue]):
+    @abstractmethod
+    def get(self, key: TKey) -> TValue | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: TKey, value: TValue) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: TKey) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
@@ -0,0 +1,16 @@
+import threading
+
+from flask import current_app
+
+
+class CatalogVersion:
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> int:
+        return current_app.extensions.get('catalog_version', 0)
+
+    @classmethod
+    def bump(cls) -> None:
+        with cls._lock:
+            current_app.extensions['catalog_version'] = cls.get() + 1
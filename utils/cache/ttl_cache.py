@@ -0,0 +1,52 @@
+import threading
+import time
+from collections import OrderedDict
+
+from .base import Cache
+from .base.cache import TKey, TValue
+
+expires_at = float
+
+
+class TTLCache(Cache[TKey, TValue]):
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[TKey, tuple[TValue, expires_at]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: TKey) -> TValue | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[1] <= time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[0]
+
+    def set(self, key: TKey, value: TValue) -> None:
+        if self._max_size <= 0 or self._ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = value, time.monotonic() + self._ttl
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: TKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
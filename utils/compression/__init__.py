@@ -0,0 +1 @@
+from .response_compressor import ResponseCompressor
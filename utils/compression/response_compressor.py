@@ -0,0 +1,113 @@
+import gzip
+import hashlib
+from typing import Callable
+
+import flask
+from flask import current_app, request
+
+from utils.cache import TTLCache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+encoder = Callable[[bytes, int], bytes]
+cache_key = tuple[str, bytes]
+
+
+def _get_available_encoders() -> dict[str, encoder]:
+    encoders: dict[str, encoder] = {
+        'gzip': lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+    }
+
+    if brotli is not None:
+        encoders['br'] = lambda data, level: brotli.compress(data, quality=level)
+
+    if zstandard is not None:
+        encoders['zstd'] = lambda data, level: zstandard.ZstdCompressor(level=level).compress(data)
+
+    return encoders
+
+
+class ResponseCompressor:
+    _encoders = _get_available_encoders()
+
+    @classmethod
+    def compress(cls, response: flask.Response) -> flask.Response:
+        if not cls._is_compressible(response):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = cls._negotiate_encoding()
+
+        if encoding is None:
+            return response
+
+        response.set_data(cls._get_compressed_body(response.get_data(), encoding))
+        response.headers['Content-Encoding'] = encoding
+
+        return response
+
+    @classmethod
+    def _is_compressible(cls, response: flask.Response) -> bool:
+        return (
+            not response.direct_passthrough
+            and not response.is_streamed
+            and 'Content-Encoding' not in response.headers
+            and response.mimetype in current_app.config['COMPRESSION_MIMETYPES']
+            and (response.content_length or 0) >= current_app.config['COMPRESSION_MIN_SIZE']
+        )
+
+    @classmethod
+    def _negotiate_encoding(cls) -> str | None:
+        accepted_encodings = [
+            (request.accept_encodings.quality(encoding), encoding)
+            for encoding in current_app.config['COMPRESSION_LEVELS']
+            if encoding in cls._encoders
+        ]
+        # Ties keep the server's order of preference
+        quality, encoding = max(accepted_encodings, key=lambda item: item[0], default=(0, None))
+
+        return encoding if quality > 0 else None
+
+    @classmethod
+    def _get_compressed_body(cls, body: bytes, encoding: str) -> bytes:
+        level: int = current_app.config['COMPRESSION_LEVELS'][encoding]
+
+        if not cls._is_cacheable():
+            return cls._encoders[encoding](body, level)
+
+        cache = cls._get_cache()
+        key = encoding, hashlib.blake2b(body, digest_size=16).digest()
+        compressed_body = cache.get(key)
+
+        if compressed_body is None:
+            compressed_body = cls._encoders[encoding](body, level)
+            cache.set(key, compressed_body)
+
+        return compressed_body
+
+    @classmethod
+    def _is_cacheable(cls) -> bool:
+        return request.method == 'GET'
+
+    @classmethod
+    def _get_cache(cls) -> TTLCache[cache_key, bytes]:
+        cache = current_app.extensions.get('compression_cache')
+
+        if cache is None:
+            cache = current_app.extensions.setdefault(
+                'compression_cache',
+                TTLCache(
+                    max_size=current_app.config['COMPRESSION_CACHE_MAX_SIZE'],
+                    ttl=current_app.config['COMPRESSION_CACHE_TTL'],
+                ),
+            )
+
+        return cache
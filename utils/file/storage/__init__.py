@@ -0,0 +1 @@
+from .image_storage import ImageStorage
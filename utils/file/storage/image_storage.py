@@ -0,0 +1,93 @@
+import hashlib
+import os
+from typing import Iterator
+
+from flask import current_app
+from werkzeug.datastructures import FileStorage
+
+from utils.metrics import Metrics
+
+
+class ImageStorage:
+    _chars_per_level = 2
+
+    @classmethod
+    def get_path(cls, upload_dir: str, filename: str) -> str:
+        return os.path.join(upload_dir, *cls._get_shard_dirs(filename), filename)
+
+    @classmethod
+    def _get_shard_dirs(cls, filename: str) -> list[str]:
+        digest = hashlib.md5(filename.encode()).hexdigest()
+        depth: int = current_app.config['PHOTOS_UPLOAD_DIR_DEPTH']
+
+        return [
+            digest[level * cls._chars_per_level : (level + 1) * cls._chars_per_level]
+            for level in range(depth)
+        ]
+
+    @classmethod
+    def find(cls, upload_dir: str, filename: str) -> str | None:
+        for file_path in (cls.get_path(upload_dir, filename), os.path.join(upload_dir, filename)):
+            if os.path.isfile(file_path):
+                return file_path
+
+        return None
+
+    @classmethod
+    def save(cls, file: FileStorage, upload_dir: str, filename: str) -> None:
+        file_path = cls.get_path(upload_dir, filename)
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        file.save(file_path)
+
+        Metrics.add_upload_bytes(upload_dir, os.path.getsize(file_path))
+
+    @classmethod
+    def delete(cls, upload_dir: str, filename: str) -> None:
+        file_path = cls.find(upload_dir, filename)
+
+        if file_path is not None:
+            os.remove(file_path)
+
+    @classmethod
+    def list_files(cls, upload_dir: str, chunk_size: int) -> Iterator[list[str]]:
+        chunk: list[str] = []
+
+        for dir_path, _, filenames in os.walk(upload_dir):
+            for filename in filenames:
+                chunk.append(os.path.join(dir_path, filename))
+
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+
+        if chunk:
+            yield chunk
+
+    @classmethod
+    def shard_flat_files(cls, upload_dir: str, batch_size: int) -> Iterator[int]:
+        if current_app.config['PHOTOS_UPLOAD_DIR_DEPTH'] == 0:
+            return
+
+        while batch := cls._get_flat_filenames(upload_dir, batch_size):
+            for filename in batch:
+                file_path = cls.get_path(upload_dir, filename)
+
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                os.replace(os.path.join(upload_dir, filename), file_path)
+
+            yield len(batch)
+
+    @classmethod
+    def _get_flat_filenames(cls, upload_dir: str, limit: int) -> list[str]:
+        filenames: list[str] = []
+
+        with os.scandir(upload_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    filenames.append(entry.name)
+
+                if len(filenames) == limit:
+                    break
+
+        return filenames
@@ -2,6 +2,7 @@ import os
 
 from flask import current_app
 
+from ..storage import ImageStorage
 from .base import ImageUploader
 
 
@@ -10,13 +11,10 @@ class UserImageUploader(ImageUploader):
         return f'{super()._base_url}/users/photos/{self._new_filename}'
 
     def save(self) -> None:
-        filename = os.path.join(current_app.config['USER_PHOTOS_UPLOAD_DIR'], self._new_filename)
-        self._file.save(filename)
+        upload_dir = current_app.config['USER_PHOTOS_UPLOAD_DIR']
+        ImageStorage.save(self._file, upload_dir, self._new_filename)
 
     @classmethod
     def delete(cls, img_url: str) -> None:
         filename = os.path.basename(img_url)
-        file_path = os.path.join(current_app.config['USER_PHOTOS_UPLOAD_DIR'], filename)
-
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        ImageStorage.delete(current_app.config['USER_PHOTOS_UPLOAD_DIR'], filename)
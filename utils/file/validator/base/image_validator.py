@@ -1,11 +1,22 @@
+import struct
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import IO, Any
 
+from flask import current_app
 from werkzeug.datastructures import FileStorage
 
+width = int
+height = int
+
 
 class ImageValidator(ABC):
     _allowed_extensions = '.png', '.jpg', '.jpeg'
+    _png_signature = b'\x89PNG\r\n\x1a\n'
+    _jpeg_signature = b'\xff\xd8'
+    _jpeg_sof_markers = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+    # The markers without a length: TEM and the restart markers
+    _jpeg_standalone_markers = frozenset({0x01, *range(0xD0, 0xD8)})
+    _jpeg_max_fill_bytes = 1024
 
     @classmethod
     def is_a_file(cls, file: Any) -> bool:
@@ -17,6 +28,34 @@ class ImageValidator(ABC):
 
         return isinstance(filename, str) and filename.lower().endswith(cls._allowed_extensions)
 
+    @classmethod
+    def get_dimensions(cls, file: FileStorage) -> tuple[width, height] | None:
+        # None when the file isn't a PNG or a JPEG image
+        stream = file.stream
+
+        try:
+            stream.seek(0)
+            signature = stream.read(len(cls._png_signature))
+
+            if signature == cls._png_signature:
+                return cls._get_png_dimensions(stream)
+
+            if signature.startswith(cls._jpeg_signature):
+                stream.seek(len(cls._jpeg_signature))
+                return cls._get_jpeg_dimensions(stream)
+
+            return None
+        except (OSError, struct.error):
+            return None
+        finally:
+            stream.seek(0)
+
+    @classmethod
+    def has_valid_dimensions(cls, dimensions: tuple[width, height]) -> bool:
+        image_width, image_height = dimensions
+
+        return image_width * image_height <= current_app.config['IMAGE_MAX_PIXELS']
+
     @classmethod
     @abstractmethod
     def has_valid_size(cls, file: FileStorage) -> bool:
@@ -29,3 +68,56 @@ class ImageValidator(ABC):
         file.stream.seek(0)
 
         return file_size
+
+    @classmethod
+    def _get_png_dimensions(cls, stream: IO[bytes]) -> tuple[width, height] | None:
+        _, chunk_type, image_width, image_height = struct.unpack('>I4sII', stream.read(16))
+
+        if chunk_type != b'IHDR' or not image_width or not image_height:
+            return None
+
+        return image_width, image_height
+
+    @classmethod
+    def _get_jpeg_dimensions(cls, stream: IO[bytes]) -> tuple[width, height] | None:
+        max_segments = current_app.config['IMAGE_JPEG_MAX_SEGMENTS']
+
+        # Only the segment headers are read, the segment bodies are skipped with seek
+        for _ in range(max_segments):
+            marker = cls._read_jpeg_marker(stream)
+
+            if marker is None:
+                return None
+
+            if marker in cls._jpeg_standalone_markers:
+                continue
+
+            (segment_length,) = struct.unpack('>H', stream.read(2))
+
+            if segment_length < 2:
+                return None
+
+            if marker in cls._jpeg_sof_markers:
+                _, image_height, image_width = struct.unpack('>BHH', stream.read(5))
+
+                return (image_width, image_height) if image_width and image_height else None
+
+            stream.seek(segment_length - 2, 1)
+
+        return None
+
+    @classmethod
+    def _read_jpeg_marker(cls, stream: IO[bytes]) -> int | None:
+        (prefix,) = struct.unpack('>B', stream.read(1))
+
+        if prefix != 0xFF:
+            return None
+
+        # A marker can be preceded by any number of 0xFF fill bytes
+        for _ in range(cls._jpeg_max_fill_bytes):
+            (marker,) = struct.unpack('>B', stream.read(1))
+
+            if marker != 0xFF:
+                return marker
+
+        return None
@@ -0,0 +1 @@
+from .password_hasher import PasswordHasher
@@ -0,0 +1,65 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, TypeVar
+
+from flask import current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+TResult = TypeVar('TResult')
+
+
+class PasswordHasher:
+    _executor: ProcessPoolExecutor | None = None
+    _executor_lock = threading.Lock()
+
+    @classmethod
+    def hash(cls, password: str) -> str:
+        return cls._run(
+            generate_password_hash,
+            password,
+            current_app.config['PASSWORD_HASH_METHOD'],
+            current_app.config['PASSWORD_HASH_SALT_LENGTH'],
+        )
+
+    @classmethod
+    def check(cls, password_hash: str, password: str) -> bool:
+        return cls._run(check_password_hash, password_hash, password)
+
+    @classmethod
+    def needs_rehash(cls, password_hash: str) -> bool:
+        method, _, salt_and_hash = password_hash.partition('$')
+        salt = salt_and_hash.partition('$')[0]
+
+        return (
+            method != current_app.config['PASSWORD_HASH_METHOD']
+            or len(salt) != current_app.config['PASSWORD_HASH_SALT_LENGTH']
+        )
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown()
+                cls._executor = None
+
+    @classmethod
+    def _run(cls, function: Callable[..., TResult], *args: str | int) -> TResult:
+        workers: int = current_app.config['PASSWORD_HASH_WORKERS']
+
+        if not workers:
+            return function(*args)
+
+        return cls._get_executor(workers).submit(function, *args).result()
+
+    @classmethod
+    def _get_executor(cls, workers: int) -> ProcessPoolExecutor:
+        # Created on first use, so each preforked server worker gets its own pool. Its processes
+        # are spawned, since a fork of a threaded server can inherit locks held by other threads
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+                )
+
+            return cls._executor
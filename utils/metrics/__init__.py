@@ -0,0 +1,2 @@
+from .metrics import Metrics
+from .metrics_registry import MetricsRegistry
@@ -0,0 +1,231 @@
+import json
+import os
+import time
+from typing import Any, Iterator
+
+import flask
+from flask import current_app, request
+
+from db import db
+from utils.cache import TTLCache
+from utils.timing import RequestTiming
+
+from .metrics_registry import MetricsRegistry
+
+snapshot = dict[str, Any]
+
+
+class Metrics:
+    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+
+    _types = {
+        'http_requests_total': 'counter',
+        'http_request_duration_seconds': 'histogram',
+        'upload_bytes_total': 'counter',
+        'cache_hits_total': 'counter',
+        'cache_misses_total': 'counter',
+        'db_pool_checked_out_connections': 'gauge',
+        'db_pool_overflow_connections': 'gauge',
+    }
+
+    @classmethod
+    def observe_request(cls, response: flask.Response) -> flask.Response:
+        elapsed = RequestTiming.get_elapsed()
+        registry = cls._get_registry()
+        labels = {
+            'blueprint': request.blueprint or '',
+            'endpoint': request.endpoint or 'unmatched',
+            'method': request.method,
+        }
+
+        registry.inc('http_requests_total', {**labels, 'status': str(response.status_code)})
+
+        if elapsed is not None:
+            registry.observe('http_request_duration_seconds', labels, elapsed)
+
+        if cls._get_multiprocess_dir() is not None:
+            cls._flush_if_due()
+
+        return response
+
+    @classmethod
+    def add_upload_bytes(cls, upload_dir: str, size: int) -> None:
+        cls._get_registry().inc('upload_bytes_total', {'dir': os.path.basename(upload_dir)}, size)
+
+    @classmethod
+    def render(cls) -> str:
+        if cls._get_multiprocess_dir() is None:
+            snapshots = [cls._get_snapshot()]
+        else:
+            cls._flush()
+            snapshots = list(cls._read_snapshots())
+
+        return cls._format(cls._merge(snapshots))
+
+    @classmethod
+    def _get_registry(cls) -> MetricsRegistry:
+        registry = current_app.extensions.get('metrics')
+
+        if registry is None:
+            registry = current_app.extensions.setdefault(
+                'metrics', MetricsRegistry(current_app.config['METRICS_LATENCY_BUCKETS'])
+            )
+
+        return registry
+
+    @classmethod
+    def _get_snapshot(cls) -> snapshot:
+        current = cls._get_registry().snapshot()
+
+        # The caches and the pool keep their own numbers, which are read when needed
+        for name, extension in current_app.extensions.items():
+            if isinstance(extension, TTLCache):
+                current['counters'].append(['cache_hits_total', [['cache', name]], extension.hits])
+                current['counters'].append(
+                    ['cache_misses_total', [['cache', name]], extension.misses]
+                )
+
+        current['gauges'] = cls._get_pool_gauges()
+
+        return current
+
+    @classmethod
+    def _get_pool_gauges(cls) -> list[list[Any]]:
+        pool = db.engine.pool
+        gauges = []
+
+        # Only the queue pools, used with MySQL, keep track of their connections
+        if hasattr(pool, 'checkedout') and hasattr(pool, 'overflow'):
+            gauges.append(['db_pool_checked_out_connections', [], pool.checkedout()])
+            gauges.append(['db_pool_overflow_connections', [], max(pool.overflow(), 0)])
+
+        return gauges
+
+    @classmethod
+    def _get_multiprocess_dir(cls) -> str | None:
+        return current_app.config['METRICS_MULTIPROCESS_DIR']
+
+    @classmethod
+    def _flush_if_due(cls) -> None:
+        interval: float = current_app.config['METRICS_MULTIPROCESS_FLUSH_INTERVAL']
+        flushed_at = current_app.extensions.get('metrics_flushed_at', 0.0)
+
+        if time.monotonic() - flushed_at >= interval:
+            cls._flush()
+
+    @classmethod
+    def _flush(cls) -> None:
+        # Each worker writes its own file, replaced at once so a reader never sees half of it
+        multiprocess_dir = cls._get_multiprocess_dir()
+        file_path = os.path.join(multiprocess_dir, f'{os.getpid()}.json')
+        temp_file_path = os.path.join(multiprocess_dir, f'.{os.getpid()}.json.tmp')
+
+        os.makedirs(multiprocess_dir, exist_ok=True)
+
+        with open(temp_file_path, 'w') as file:
+            json.dump(cls._get_snapshot(), file)
+
+        os.replace(temp_file_path, file_path)
+        current_app.extensions['metrics_flushed_at'] = time.monotonic()
+
+    @classmethod
+    def _read_snapshots(cls) -> Iterator[snapshot]:
+        multiprocess_dir = cls._get_multiprocess_dir()
+        max_gauge_age = current_app.config['METRICS_MULTIPROCESS_FLUSH_INTERVAL'] * 2
+
+        for filename in os.listdir(multiprocess_dir):
+            if not filename.endswith('.json') or filename.startswith('.'):
+                continue
+
+            file_path = os.path.join(multiprocess_dir, filename)
+
+            try:
+                with open(file_path) as file:
+                    current = json.load(file)
+
+                age = time.time() - os.path.getmtime(file_path)
+            except (OSError, ValueError):
+                continue
+
+            # The counters of the workers that stopped still count, but not their connections
+            if age > max_gauge_age:
+                current['gauges'] = []
+
+            yield current
+
+    @classmethod
+    def _merge(cls, snapshots: list[snapshot]) -> snapshot:
+        buckets = snapshots[0]['buckets'] if snapshots else []
+        merged: dict[str, dict[tuple[str, tuple], Any]] = {
+            'counters': {},
+            'histograms': {},
+            'gauges': {},
+        }
+
+        for current in snapshots:
+            for kind in ('counters', 'gauges'):
+                for name, labels, value in current.get(kind, []):
+                    key = name, tuple(map(tuple, labels))
+                    merged[kind][key] = merged[kind].get(key, 0) + value
+
+            # A worker started with other buckets can't be added up with the rest
+            if current['buckets'] != buckets:
+                continue
+
+            for name, labels, values in current['histograms']:
+                key = name, tuple(map(tuple, labels))
+                total = merged['histograms'].setdefault(key, [0.0] * len(values))
+                merged['histograms'][key] = [a + b for a, b in zip(total, values)]
+
+        return {'buckets': buckets, **merged}
+
+    @classmethod
+    def _format(cls, merged: snapshot) -> str:
+        samples: dict[str, list[str]] = {}
+
+        for kind in ('counters', 'gauges'):
+            for (name, labels), value in sorted(merged[kind].items()):
+                samples.setdefault(name, []).append(
+                    f'{name}{cls._format_labels(labels)} {cls._format_value(value)}'
+                )
+
+        for (name, labels), values in sorted(merged['histograms'].items()):
+            lines = samples.setdefault(name, [])
+            cumulative = 0.0
+
+            for bound, count in zip([*merged['buckets'], '+Inf'], values):
+                cumulative += count
+                le = bound if isinstance(bound, str) else cls._format_value(bound)
+                lines.append(
+                    f'{name}_bucket{cls._format_labels((*labels, ("le", le)))} '
+                    f'{cls._format_value(cumulative)}'
+                )
+
+            lines.append(f'{name}_sum{cls._format_labels(labels)} {cls._format_value(values[-2])}')
+            lines.append(
+                f'{name}_count{cls._format_labels(labels)} {cls._format_value(values[-1])}'
+            )
+
+        output = []
+
+        for name, lines in samples.items():
+            output.append(f'# TYPE {name} {cls._types.get(name, "untyped")}')
+            output.extend(lines)
+
+        return '\n'.join(output) + '\n'
+
+    @classmethod
+    def _format_labels(cls, labels: tuple) -> str:
+        if not labels:
+            return ''
+
+        escaped = (
+            (name, str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'))
+            for name, value in labels
+        )
+
+        return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+    @classmethod
+    def _format_value(cls, value: float) -> str:
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,43 @@
+import threading
+from bisect import bisect_left
+from typing import Any, Sequence
+
+labels = tuple[tuple[str, str], ...]
+sample_key = tuple[str, labels]
+
+
+class MetricsRegistry:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counters: dict[sample_key, float] = {}
+        # The count of each bucket (not cumulative), followed by the sum and the count
+        self.histograms: dict[sample_key, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, labels: dict[str, str], value: float = 1) -> None:
+        key = name, tuple(sorted(labels.items()))
+
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: dict[str, str], value: float) -> None:
+        key = name, tuple(sorted(labels.items()))
+
+        with self._lock:
+            histogram = self.histograms.setdefault(key, [0.0] * (len(self.buckets) + 3))
+            histogram[bisect_left(self.buckets, value)] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                'buckets': list(self.buckets),
+                'counters': [
+                    [name, labels, value] for (name, labels), value in self.counters.items()
+                ],
+                'histograms': [
+                    [name, labels, list(values)]
+                    for (name, labels), values in self.histograms.items()
+                ],
+            }
@@ -0,0 +1 @@
+from .request_profiler import RequestProfiler
@@ -0,0 +1,97 @@
+import cProfile
+import os
+import random
+import re
+import time
+from uuid import uuid4
+
+import flask
+from flask import current_app, g, request
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+
+class RequestProfiler:
+    header = 'X-Profile'
+    _salt = 'request-profiling'
+
+    @classmethod
+    def start(cls) -> None:
+        if not current_app.config['PROFILING_ENABLED'] or not cls._should_profile():
+            return
+
+        profile = cProfile.Profile()
+
+        # Only one profiler can run in a thread at a time
+        try:
+            profile.enable()
+        except ValueError:
+            return
+
+        g.request_profile = profile, time.perf_counter()
+
+    @classmethod
+    def stop(cls, response: flask.Response) -> flask.Response:
+        profile, start = g.pop('request_profile', (None, 0.0))
+
+        if profile is None:
+            return response
+
+        profile.disable()
+        elapsed = time.perf_counter() - start
+
+        profiling_dir: str = current_app.config['PROFILING_DIR']
+        os.makedirs(profiling_dir, exist_ok=True)
+
+        filename = cls._get_filename(elapsed)
+        profile.dump_stats(os.path.join(profiling_dir, filename))
+        response.headers['X-Profile-File'] = filename
+
+        return response
+
+    @classmethod
+    def discard(cls) -> None:
+        # The after request functions are skipped when the request fails, so the profiler would
+        # keep running in this thread
+        profile, _ = g.pop('request_profile', (None, 0.0))
+
+        if profile is not None:
+            profile.disable()
+
+    @classmethod
+    def create_token(cls) -> str:
+        return cls._get_serializer().dumps('profile')
+
+    @classmethod
+    def _should_profile(cls) -> bool:
+        token = request.headers.get(cls.header)
+
+        if token is not None and cls._is_valid_token(token):
+            return True
+
+        return random.random() < current_app.config['PROFILING_SAMPLE_RATE']
+
+    @classmethod
+    def _is_valid_token(cls, token: str) -> bool:
+        try:
+            cls._get_serializer().loads(
+                token, max_age=current_app.config['PROFILING_TOKEN_MAX_AGE']
+            )
+        except BadSignature:
+            return False
+
+        return True
+
+    @classmethod
+    def _get_serializer(cls) -> URLSafeTimedSerializer:
+        return URLSafeTimedSerializer(current_app.config['SECRET_KEY'], salt=cls._salt)
+
+    @classmethod
+    def _get_filename(cls, elapsed: float) -> str:
+        # The route, not the path, so the profiles of the same endpoint are listed together
+        route = request.url_rule.rule if request.url_rule is not None else request.path
+        route = re.sub(r'[^A-Za-z0-9]+', '_', route).strip('_') or 'root'
+        timestamp = time.strftime('%Y%m%dT%H%M%S')
+        # Other workers and threads can profile the same route in the same second
+        unique_id = f'{os.getpid()}-{uuid4().hex[:8]}'
+
+        return f'{timestamp}-{unique_id}-{request.method}-{route}-{elapsed * 1000:.0f}ms.prof'
@@ -1,6 +1,6 @@
 from typing import Any
 
-from flask import request
+from flask import current_app, request, url_for
 from werkzeug.datastructures import FileStorage, ImmutableMultiDict
 
 from exception import GeneralException
@@ -11,6 +11,58 @@ class Request:
     def get_int_arg(cls, arg_name: str, default: int) -> int:
         return request.args.get(arg_name, default=default, type=int)
 
+    @classmethod
+    def get_args(cls) -> dict[str, str]:
+        return request.args.to_dict()
+
+    @classmethod
+    def get_canonical_url(cls, args: dict[str, str]) -> str | None:
+        canonical_args = {**args}
+
+        # The order of these values doesn't change the response
+        for arg_name in ('fields', 'include', 'facets'):
+            values = cls.get_list_arg(arg_name)
+
+            if values is not None:
+                canonical_args[arg_name] = ','.join(sorted(set(values)))
+
+        for arg_name in ('sort', 'after'):
+            if arg_name in request.args:
+                canonical_args[arg_name] = request.args[arg_name]
+
+        # The page goes last, so the pagination URLs, which replace it, stay canonical
+        if 'per_page' in request.args:
+            canonical_args['per_page'] = str(cls.get_per_page())
+
+        if 'page' in request.args:
+            canonical_args['page'] = str(cls.get_int_arg('page', default=1))
+
+        if list(request.args.items(multi=True)) == list(canonical_args.items()):
+            return None
+
+        return url_for(request.endpoint or '', **(request.view_args or {}), **canonical_args)
+
+    @classmethod
+    def get_str_arg(cls, arg_name: str) -> str | None:
+        return request.args.get(arg_name)
+
+    @classmethod
+    def get_per_page(cls) -> int:
+        limits: dict[str, int] = current_app.config['PAGINATION_PER_PAGE'][request.blueprint]
+        per_page = cls.get_int_arg('per_page', default=limits['default'])
+
+        if not 1 <= per_page <= limits['max']:
+            raise GeneralException.InvalidPaginationPerPage(limits['max'])
+
+        return per_page
+
+    @classmethod
+    def get_list_arg(cls, arg_name: str) -> list[str] | None:
+        if arg_name not in request.args:
+            return None
+
+        return [value.strip() for value in request.args[arg_name].split(',') if value.strip()]
+
     @classmethod
     def get_json(cls) -> dict[str, Any]:
         if not cls._are_there_data():
@@ -35,6 +87,10 @@ class Request:
     def get_files(cls) -> ImmutableMultiDict[str, FileStorage]:
         return request.files
 
+    @classmethod
+    def has_body(cls) -> bool:
+        return bool(request.content_length)
+
     @classmethod
     def _are_there_data(cls) -> bool:
         return any(
@@ -1,5 +1,7 @@
 from .created_response import CreatedResponse
+from .cursor_pagination_response import CursorPaginationResponse
 from .error_response import ErrorResponse
 from .no_content_response import NoContentResponse
 from .ok_response import OkResponse
 from .pagination_response import PaginationResponse
+from .redirect_response import RedirectResponse
@@ -4,20 +4,32 @@ from typing import Any
 import flask
 from flask import current_app, jsonify
 
+from utils.timing import RequestTiming
+
 
 class Response(metaclass=ABCMeta):
     @abstractmethod
     def json(self) -> flask.Response:
         pass
 
-    def _make_response(self, *, payload: dict[str, Any] | None, status: int) -> flask.Response:
-        response = jsonify(payload)
+    def _make_response(
+        self,
+        *,
+        payload: dict[str, Any] | None,
+        status: int,
+        headers: dict[str, str] | None = None,
+    ) -> flask.Response:
+        with RequestTiming.measure_serialization():
+            response = jsonify(payload)
 
-        self._add_headers(response)
+        self._add_headers(response, headers)
         response.status = str(status)
 
         return response
 
-    def _add_headers(self, response: flask.Response) -> None:
+    def _add_headers(self, response: flask.Response, headers: dict[str, str] | None = None) -> None:
         for header, value in current_app.config['RESPONSE_HEADERS']:
             response.headers.add(header, value)
+
+        for header, value in (headers or {}).items():
+            response.headers[header] = value
@@ -0,0 +1,46 @@
+from typing import Any
+
+import flask
+from flask import request, url_for
+
+from db import CursorPagination
+
+from .base import Response
+
+
+class CursorPaginationResponse(Response):
+    def __init__(
+        self,
+        data: list[dict[str, Any]],
+        pagination_details: CursorPagination,
+        extra: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self._pagination_details = pagination_details
+        self._data = data
+        self._extra = extra or {}
+        self._headers = headers
+
+    def json(self) -> flask.Response:
+        next_cursor = self._pagination_details.next_cursor
+        next_page = (
+            self._get_page_url(next_cursor)
+            if next_cursor is not None and request.endpoint
+            else None
+        )
+
+        response = {
+            'data': self._data,
+            'per_page': self._pagination_details.per_page,
+            'has_next': self._pagination_details.has_next,
+            'next_cursor': next_cursor,
+            'next_page': next_page,
+            **self._extra,
+        }
+
+        return super()._make_response(payload=response, status=200, headers=self._headers)
+
+    def _get_page_url(self, cursor: str) -> str:
+        args = {**request.args.to_dict(flat=False), 'after': cursor}
+
+        return url_for(request.endpoint or '', **(request.view_args or {}), **args)
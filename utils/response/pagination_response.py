@@ -8,20 +8,28 @@ from .base import Response
 
 
 class PaginationResponse(Response):
-    def __init__(self, data: list[dict[str, Any]], pagination_details: Pagination) -> None:
+    def __init__(
+        self,
+        data: list[dict[str, Any]],
+        pagination_details: Pagination,
+        extra: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         self._pagination_details = pagination_details
         self._data = data
+        self._extra = extra or {}
+        self._headers = headers
 
     def json(self) -> flask.Response:
         total_items = self._pagination_details.total or 0
         actual_page = self._pagination_details.page or 1
         prev_page = (
-            url_for(request.endpoint, page=self._pagination_details.prev_num)
+            self._get_page_url(self._pagination_details.prev_num)
             if self._pagination_details.has_prev and request.endpoint
             else None
         )
         next_page = (
-            url_for(request.endpoint, page=self._pagination_details.next_num)
+            self._get_page_url(self._pagination_details.next_num)
             if self._pagination_details.has_next and request.endpoint
             else None
         )
@@ -36,6 +44,12 @@ class PaginationResponse(Response):
             'has_next': self._pagination_details.has_next,
             'prev_page': prev_page,
             'next_page': next_page,
+            **self._extra,
         }
 
-        return super()._make_response(payload=response, status=200)
+        return super()._make_response(payload=response, status=200, headers=self._headers)
+
+    def _get_page_url(self, page: int | None) -> str:
+        args = {**request.args.to_dict(flat=False), 'page': page}
+
+        return url_for(request.endpoint or '', **(request.view_args or {}), **args)
@@ -0,0 +1,16 @@
+import flask
+from flask import redirect
+
+from .base import Response
+
+
+class RedirectResponse(Response):
+    def __init__(self, location: str, headers: dict[str, str] | None = None) -> None:
+        self._location = location
+        self._headers = headers
+
+    def json(self) -> flask.Response:
+        response = redirect(self._location, code=301)
+        self._add_headers(response, self._headers)
+
+        return response
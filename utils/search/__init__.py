@@ -0,0 +1,2 @@
+from .compressed_trie import CompressedTrie
+from .trigram_index import TrigramIndex
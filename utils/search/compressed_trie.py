@@ -0,0 +1,217 @@
+import heapq
+import itertools
+import threading
+from typing import Iterable
+
+edge = tuple[str, '_Node']
+
+
+class _Node:
+    __slots__ = ('edges', 'term', 'count', 'best_count')
+
+    def __init__(self) -> None:
+        # Keyed by the first character of the edge label
+        self.edges: dict[str, edge] = {}
+        self.term: str | None = None
+        self.count = 0
+        self.best_count = 0
+
+    def refresh_best_count(self) -> None:
+        self.best_count = max(
+            self.count, max((child.best_count for _, child in self.edges.values()), default=0)
+        )
+
+
+class CompressedTrie:
+    def __init__(self, terms: Iterable[str] = ()) -> None:
+        self._root = _Node()
+        self._lock = threading.Lock()
+
+        for term in terms:
+            self.add(term)
+
+    def add(self, term: str, count: int = 1) -> None:
+        key = self._normalize(term)
+
+        if not key:
+            return
+
+        with self._lock:
+            path = self._insert_path(key)
+            node = path[-1]
+
+            if node.count == 0:
+                node.term = term.strip()
+
+            node.count += count
+            self._refresh_best_counts(path)
+
+    def remove(self, term: str, count: int = 1) -> None:
+        key = self._normalize(term)
+
+        with self._lock:
+            path = self._find_path(key)
+
+            if path is None or path[-1].count == 0:
+                return
+
+            node = path[-1]
+            node.count = max(0, node.count - count)
+
+            if node.count == 0:
+                node.term = None
+                self._prune(path, key)
+
+            self._refresh_best_counts(path)
+
+    def complete(self, prefix: str, limit: int) -> list[str]:
+        key = self._normalize(prefix)
+
+        with self._lock:
+            found = self._find_prefix_node(key)
+
+            if found is None:
+                return []
+
+            node, path_key = found
+
+            return self._get_most_popular(node, path_key, limit)
+
+    def _insert_path(self, key: str) -> list[_Node]:
+        node = self._root
+        path = [node]
+        rest = key
+
+        while rest:
+            if rest[0] not in node.edges:
+                child = _Node()
+                node.edges[rest[0]] = rest, child
+                path.append(child)
+
+                break
+
+            label, child = node.edges[rest[0]]
+            common_length = self._get_common_prefix_length(label, rest)
+
+            if common_length < len(label):
+                middle = _Node()
+                middle.edges[label[common_length]] = label[common_length:], child
+                middle.best_count = child.best_count
+                node.edges[rest[0]] = label[:common_length], middle
+                child = middle
+
+            node = child
+            path.append(node)
+            rest = rest[common_length:]
+
+        return path
+
+    def _find_path(self, key: str) -> list[_Node] | None:
+        node = self._root
+        path = [node]
+        rest = key
+
+        while rest:
+            if rest[0] not in node.edges:
+                return None
+
+            label, node = node.edges[rest[0]]
+
+            if not rest.startswith(label):
+                return None
+
+            path.append(node)
+            rest = rest[len(label) :]
+
+        return path
+
+    def _find_prefix_node(self, key: str) -> tuple[_Node, str] | None:
+        node = self._root
+        rest = key
+
+        while rest:
+            if rest[0] not in node.edges:
+                return None
+
+            label, child = node.edges[rest[0]]
+
+            # The prefix may end in the middle of an edge, whose whole subtree matches it
+            if label.startswith(rest):
+                return child, key + label[len(rest) :]
+
+            if not rest.startswith(label):
+                return None
+
+            node = child
+            rest = rest[len(label) :]
+
+        return node, key
+
+    def _prune(self, path: list[_Node], key: str) -> None:
+        labels = self._get_path_labels(path, key)
+
+        for depth in range(len(path) - 1, 0, -1):
+            node, parent = path[depth], path[depth - 1]
+            label = labels[depth - 1]
+
+            if node.count == 0 and not node.edges:
+                del parent.edges[label[0]]
+            elif node.count == 0 and len(node.edges) == 1:
+                child_label, child = next(iter(node.edges.values()))
+                parent.edges[label[0]] = label + child_label, child
+                path[depth] = child
+            else:
+                break
+
+    def _get_path_labels(self, path: list[_Node], key: str) -> list[str]:
+        labels: list[str] = []
+        rest = key
+
+        for node in path[:-1]:
+            label, _ = node.edges[rest[0]]
+            labels.append(label)
+            rest = rest[len(label) :]
+
+        return labels
+
+    def _refresh_best_counts(self, path: list[_Node]) -> None:
+        for node in reversed(path):
+            node.refresh_best_count()
+
+    def _get_most_popular(self, node: _Node, path_key: str, limit: int) -> list[str]:
+        # Best-first walk ordered by (popularity, key): a subtree is keyed by its path, which
+        # sorts before every term below it, so only subtrees that can still win get expanded
+        tiebreaker = itertools.count()
+        heap: list[tuple[int, str, int, _Node | str]] = [
+            (-node.best_count, path_key, next(tiebreaker), node)
+        ]
+        terms: list[str] = []
+
+        while heap and len(terms) < limit:
+            _, key, _, item = heapq.heappop(heap)
+
+            if isinstance(item, str):
+                terms.append(item)
+                continue
+
+            if item.count and item.term is not None:
+                heapq.heappush(heap, (-item.count, key, next(tiebreaker), item.term))
+
+            for label, child in item.edges.values():
+                heapq.heappush(heap, (-child.best_count, key + label, next(tiebreaker), child))
+
+        return terms
+
+    def _get_common_prefix_length(self, first: str, second: str) -> int:
+        length = 0
+
+        for first_char, second_char in zip(first, second):
+            if first_char != second_char:
+                break
+
+            length += 1
+
+        return length
+
+    def _normalize(self, term: str) -> str:
+        return ' '.join(term.lower().split())
@@ -0,0 +1,96 @@
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Iterable
+
+similar_word = tuple[str, float]
+
+
+class TrigramIndex:
+    def __init__(self, terms: Iterable[str] = ()) -> None:
+        # How many indexed terms contain each word, and the words sharing each trigram
+        self._counts: dict[str, int] = {}
+        self._words: defaultdict[str, set[str]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+        for term in terms:
+            self.add(term)
+
+    def __contains__(self, word: str) -> bool:
+        return word.strip().lower() in self._counts
+
+    def add(self, term: str) -> None:
+        with self._lock:
+            for word in get_words(term):
+                if word not in self._counts:
+                    self._counts[word] = 0
+
+                    for trigram in get_trigrams(word):
+                        self._words[trigram].add(word)
+
+                self._counts[word] += 1
+
+    def remove(self, term: str) -> None:
+        with self._lock:
+            for word in get_words(term):
+                if word not in self._counts:
+                    continue
+
+                self._counts[word] -= 1
+
+                if self._counts[word] > 0:
+                    continue
+
+                del self._counts[word]
+
+                for trigram in get_trigrams(word):
+                    self._words[trigram].discard(word)
+
+                    if not self._words[trigram]:
+                        del self._words[trigram]
+
+    def similar(self, word: str, *, limit: int, min_similarity: float) -> list[similar_word]:
+        trigrams = get_trigrams(word.strip().lower())
+
+        with self._lock:
+            shared = Counter(
+                candidate for trigram in trigrams for candidate in self._words.get(trigram, ())
+            )
+            counts = {candidate: self._counts[candidate] for candidate in shared}
+
+        # The similarity is the share of trigrams both words have, like pg_trgm's similarity()
+        candidates = [
+            (candidate, count / (len(trigrams) + len(get_trigrams(candidate)) - count))
+            for candidate, count in shared.items()
+        ]
+        candidates = [candidate for candidate in candidates if candidate[1] >= min_similarity]
+        candidates.sort(key=lambda candidate: (-candidate[1], -counts[candidate[0]], candidate[0]))
+
+        return candidates[:limit]
+
+    def correct(self, text: str, *, min_similarity: float) -> str | None:
+        words = get_words(text)
+        corrected_words = []
+
+        for word in words:
+            candidates = (
+                []
+                if word in self._counts
+                else self.similar(word, limit=1, min_similarity=min_similarity)
+            )
+            corrected_words.append(candidates[0][0] if candidates else word)
+
+        if corrected_words == words:
+            return None
+
+        return ' '.join(corrected_words)
+
+
+def get_words(text: str) -> list[str]:
+    return re.findall(r'\w+', text.lower())
+
+
+def get_trigrams(word: str) -> set[str]:
+    padded = f'  {word} '
+
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
@@ -0,0 +1 @@
+from .fold import fold_text
@@ -0,0 +1,14 @@
+import unicodedata
+
+
+def fold_text(text: str) -> str:
+    folded = []
+
+    for char in text.strip().lower():
+        # Decomposed, the accents become combining marks, which are dropped. A character that
+        # decomposes into several letters is kept, so the text fits in the column of its source
+        decomposed = unicodedata.normalize('NFD', char)
+        base = ''.join(c for c in decomposed if not unicodedata.combining(c))
+        folded.append(base if len(base) <= 1 else char)
+
+    return ''.join(folded)
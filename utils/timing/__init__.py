@@ -0,0 +1 @@
+from .request_timing import RequestTiming
@@ -0,0 +1,112 @@
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import flask
+from flask import current_app, g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+
+class RequestTiming:
+    @classmethod
+    def start(cls) -> None:
+        g.request_timing = {
+            'start': time.perf_counter(),
+            'db_count': 0,
+            'db_time': 0.0,
+            'statements': [],
+            'serialization_time': 0.0,
+            'serialization_depth': 0,
+        }
+
+    @classmethod
+    @contextmanager
+    def measure_serialization(cls) -> Iterator[None]:
+        timing = cls._get_timing()
+
+        # The DTOs dump each other, so only the outermost call is timed
+        if timing is None or timing['serialization_depth'] > 0:
+            yield
+            return
+
+        timing['serialization_depth'] += 1
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            timing['serialization_time'] += time.perf_counter() - start
+            timing['serialization_depth'] -= 1
+
+    @classmethod
+    def get_elapsed(cls) -> float | None:
+        timing = cls._get_timing()
+
+        return time.perf_counter() - timing['start'] if timing is not None else None
+
+    @classmethod
+    def add_headers(cls, response: flask.Response) -> flask.Response:
+        timing = cls._get_timing()
+
+        if timing is None:
+            return response
+
+        if current_app.config['SERVER_TIMING']:
+            total = time.perf_counter() - timing['start']
+            response.headers['Server-Timing'] = ', '.join(
+                [
+                    f'db;dur={timing["db_time"] * 1000:.1f};desc="{timing["db_count"]} queries"',
+                    f'serialization;dur={timing["serialization_time"] * 1000:.1f}',
+                    f'total;dur={total * 1000:.1f}',
+                ]
+            )
+
+        if current_app.config['SQL_DEBUG_HEADER']:
+            response.headers['X-Debug-SQL'] = json.dumps(timing['statements'])
+
+        return response
+
+    @classmethod
+    def _get_timing(cls) -> dict[str, Any] | None:
+        return g.get('request_timing') if has_request_context() else None
+
+    @classmethod
+    def _before_cursor_execute(
+        cls,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info['query_start'] = time.perf_counter()
+
+    @classmethod
+    def _after_cursor_execute(
+        cls,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info['query_start']
+        timing = cls._get_timing()
+
+        if timing is None:
+            return
+
+        timing['db_count'] += 1
+        timing['db_time'] += elapsed
+
+        if current_app.config['SQL_DEBUG_HEADER']:
+            timing['statements'].append(' '.join(statement.split()))
+
+
+# Every engine reports to the request running in its thread, if any
+event.listen(Engine, 'before_cursor_execute', RequestTiming._before_cursor_execute)
+event.listen(Engine, 'after_cursor_execute', RequestTiming._after_cursor_execute)
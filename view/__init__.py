@@ -4,6 +4,7 @@ from .book_img_view import book_img_bp
 from .book_keyword_view import book_keyword_bp
 from .book_kind_view import book_kind_bp
 from .book_view import book_bp
+from .metrics_view import metrics_bp
 from .saved_book_view import saved_book_bp
 from .search_view import search_bp
 from .user_view import user_bp
@@ -15,7 +15,8 @@ class BookGenreView:
     @book_genre_bp.get('')
     def get_all_book_genres(controller: IBookGenreController) -> Response:
         page = Request.get_int_arg('page', default=1)
-        pagination = controller.get_all_book_genres(page)
+        per_page = Request.get_per_page()
+        pagination = controller.get_all_book_genres(page, per_page)
         data = BookGenreOutputDTO.dump_many(pagination.items)
 
         return PaginationResponse(data, pagination).json()
@@ -15,7 +15,8 @@ class BookKindView:
     @book_kind_bp.get('')
     def get_all_book_kinds(controller: IBookKindController) -> Response:
         page = Request.get_int_arg('page', default=1)
-        pagination = controller.get_all_book_kinds(page)
+        per_page = Request.get_per_page()
+        pagination = controller.get_all_book_kinds(page, per_page)
         data = BookKindOutputDTO.dump_many(pagination.items)
 
         return PaginationResponse(data, pagination).json()
@@ -3,10 +3,23 @@ from flask_jwt_extended import jwt_required
 from werkzeug.datastructures import FileStorage
 
 from controller import IBookController
-from dto.input import CreateBookInputDTO, UpdateBookInputDTO
+from db import CursorPagination
+from dto.input import (
+    BookFieldsInputDTO,
+    BookIdsInputDTO,
+    BookSortInputDTO,
+    CreateBookInputDTO,
+    UpdateBookInputDTO,
+)
 from dto.output import BookOutputDTO
 from utils.request import Request
-from utils.response import CreatedResponse, NoContentResponse, OkResponse, PaginationResponse
+from utils.response import (
+    CreatedResponse,
+    CursorPaginationResponse,
+    NoContentResponse,
+    OkResponse,
+    PaginationResponse,
+)
 
 book_bp = Blueprint('book_bp', __name__)
 
@@ -15,17 +28,49 @@ class BookView:
     @staticmethod
     @book_bp.get('')
     def get_all_books(controller: IBookController) -> Response:
+        ids = Request.get_list_arg('ids')
+        fields_dto = BookFieldsInputDTO(
+            fields=Request.get_list_arg('fields'), include=Request.get_list_arg('include')
+        )
+
+        if ids is not None:
+            ids_dto = BookIdsInputDTO(ids=ids)
+            books = controller.get_books_by_ids(ids_dto.ids, fields_dto.relationships)
+            data = {
+                'data': [
+                    BookOutputDTO.dump(book, fields_dto.output_fields) if book else None
+                    for book in books
+                ],
+                'not_found': [id for id, book in zip(ids_dto.ids, books) if book is None],
+            }
+
+            return OkResponse(data).json()
+
+        # The pagination only applies when the books aren't looked up by id
         page = Request.get_int_arg('page', default=1)
-        paginate = controller.get_all_books(page)
-        data = BookOutputDTO.dump_many(paginate.items)
+        per_page = Request.get_per_page()
+        sort_dto = BookSortInputDTO(
+            sort=Request.get_str_arg('sort'), after=Request.get_str_arg('after')
+        )
+        paginate = controller.get_all_books(
+            page, per_page, fields_dto.relationships, sort_dto.sort, sort_dto.after
+        )
+        data = BookOutputDTO.dump_many(paginate.items, fields_dto.output_fields)
+
+        if isinstance(paginate, CursorPagination):
+            return CursorPaginationResponse(data, paginate).json()
 
         return PaginationResponse(data, paginate).json()
 
     @staticmethod
     @book_bp.get('/<id>')
     def get_book_by_id(id: str, controller: IBookController) -> Response:
-        book = controller.get_book_by_id(id)
-        data = BookOutputDTO.dump(book)
+        fields_dto = BookFieldsInputDTO(
+            fields=Request.get_list_arg('fields'), include=Request.get_list_arg('include')
+        )
+
+        book = controller.get_book_by_id(id, fields_dto.relationships)
+        data = BookOutputDTO.dump(book, fields_dto.output_fields)
 
         return OkResponse(data).json()
 
@@ -0,0 +1,12 @@
+from flask import Blueprint, Response
+
+from utils.metrics import Metrics
+
+metrics_bp = Blueprint('metrics_bp', __name__)
+
+
+class MetricsView:
+    @staticmethod
+    @metrics_bp.get('')
+    def get_metrics() -> Response:
+        return Response(Metrics.render(), status=200, content_type=Metrics.content_type)
@@ -2,6 +2,7 @@ from flask import Blueprint, Response
 from flask_jwt_extended import jwt_required
 
 from controller import ISavedBookController
+from dto.input import BookFieldsInputDTO
 from dto.output import BookOutputDTO
 from utils.request import Request
 from utils.response import CreatedResponse, NoContentResponse, PaginationResponse
@@ -24,8 +25,13 @@ class SavedBookView:
     @jwt_required()
     def get_all_saved_books(controller: ISavedBookController) -> Response:
         page = Request.get_int_arg('page', default=1)
-        pagination = controller.get_all_saved_books(page)
-        data = BookOutputDTO.dump_many(pagination.items)
+        per_page = Request.get_per_page()
+        fields_dto = BookFieldsInputDTO(
+            fields=Request.get_list_arg('fields'), include=Request.get_list_arg('include')
+        )
+
+        pagination = controller.get_all_saved_books(page, per_page, fields_dto.relationships)
+        data = BookOutputDTO.dump_many(pagination.items, fields_dto.output_fields)
 
         return PaginationResponse(data, pagination).json()
 
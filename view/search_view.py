@@ -1,10 +1,24 @@
-from flask import Blueprint, Response
+from typing import Any
+
+from flask import Blueprint, Response, current_app
 
 from controller import ISearchController
-from dto.input import SearchInputDTO
+from db import CursorPagination
+from dto.input import (
+    BookFieldsInputDTO,
+    BookSortInputDTO,
+    SearchFacetsInputDTO,
+    SearchInputDTO,
+    SearchSuggestInputDTO,
+)
 from dto.output import BookOutputDTO
 from utils.request import Request
-from utils.response import PaginationResponse
+from utils.response import (
+    CursorPaginationResponse,
+    OkResponse,
+    PaginationResponse,
+    RedirectResponse,
+)
 
 search_bp = Blueprint('search_bp', __name__)
 
@@ -13,10 +27,68 @@ class SearchView:
     @staticmethod
     @search_bp.get('')
     def search_books(controller: ISearchController) -> Response:
-        input_dto = SearchInputDTO(**Request.get_json())
+        # Only the query string form can be cached, since shared caches ignore the request body
+        if Request.has_body():
+            input_dto = SearchInputDTO(**Request.get_json())
+            headers = {'Cache-Control': 'no-store'}
+        else:
+            input_dto = SearchInputDTO.from_query_args(Request.get_args())
+            headers = {
+                'Cache-Control': current_app.config['SEARCH_CACHE_CONTROL'],
+                'Vary': 'Accept-Encoding',
+            }
+            canonical_url = Request.get_canonical_url(input_dto.to_query_args())
+
+            if canonical_url is not None:
+                return RedirectResponse(canonical_url, headers).json()
+
         page = Request.get_int_arg('page', default=1)
+        per_page = Request.get_per_page()
+        fields_dto = BookFieldsInputDTO(
+            fields=Request.get_list_arg('fields'), include=Request.get_list_arg('include')
+        )
+        facets_dto = SearchFacetsInputDTO(facets=Request.get_list_arg('facets'))
+        sort_dto = BookSortInputDTO(
+            sort=Request.get_str_arg('sort'), after=Request.get_str_arg('after')
+        )
+
+        pagination = controller.search_books(
+            page, per_page, input_dto, fields_dto.relationships, sort_dto.sort, sort_dto.after
+        )
+
+        # A misspelled query is answered with the results of its correction, so the user
+        # doesn't have to search again. Only its first page is corrected, since the cursor of the
+        # next ones belongs to the query that found them
+        correction = None
+
+        if not sort_dto.after:
+            correction = controller.get_search_correction(input_dto, pagination)
 
-        pagination = controller.search_books(page, input_dto)
-        data = BookOutputDTO.dump_many(pagination.items)
+        if correction is not None:
+            input_dto = input_dto.model_copy(update={'query': correction})
+            pagination = controller.search_books(
+                page, per_page, input_dto, fields_dto.relationships, sort_dto.sort, sort_dto.after
+            )
+        data = BookOutputDTO.dump_many(pagination.items, fields_dto.output_fields)
+        extra: dict[str, Any] = {}
+
+        if facets_dto.facets:
+            extra['facets'] = controller.get_search_facets(input_dto, facets_dto.facets)
+
+        if correction is not None:
+            extra['did_you_mean'] = correction
+
+        if isinstance(pagination, CursorPagination):
+            return CursorPaginationResponse(data, pagination, extra or None, headers).json()
+
+        return PaginationResponse(data, pagination, extra or None, headers).json()
+
+    @staticmethod
+    @search_bp.get('/suggest')
+    def suggest_search_terms(controller: ISearchController) -> Response:
+        input_dto = SearchSuggestInputDTO(
+            q=Request.get_str_arg('q'), limit=Request.get_int_arg('limit', default=10)
+        )
+        suggestions = controller.suggest_search_terms(input_dto)
 
-        return PaginationResponse(data, pagination).json()
+        return OkResponse({'suggestions': suggestions}).json()